@@ -9,6 +9,7 @@ Last Updated: 2025-03-24
 
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import sys
 import os
 
@@ -36,7 +37,7 @@ from typing import Dict, Any
 import logging
 import json
 import time
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 from datetime import datetime, timezone
 from sqlalchemy.sql import text
 
@@ -46,13 +47,15 @@ from backend.infrastructure.config.settings import settings
 from backend.schemas import HealthCheckResponse
 
 from backend.services.llm import LLMServiceFactory
+from backend.services.llm.concurrency_governor import governor_metrics
 from backend.database import get_db, create_tables
+from backend.services.analysis_progress import get_analysis_progress_store
 from backend.services.processing.persona_formation_service import (
     PersonaFormationService,
 )
 
 # Import SQLAlchemy models using centralized package to avoid registry conflicts
-from backend.models import User, AnalysisResult
+from backend.models import User, AnalysisResult, InterviewData
 
 # Import timezone utilities
 from backend.utils.timezone_utils import format_iso_utc
@@ -95,6 +98,7 @@ from backend.api.endpoints.priority_insights import router as priority_insights_
 from backend.api.export_routes import router as export_router
 from backend.api.routes.prd import router as prd_router
 from backend.api.routes.perpetual_personas import router as perpetual_personas_router
+from backend.api.routes.blobs import router as blobs_router
 from backend.api.axpersona.router import router as axpersona_router
 from backend.api.precall.router import router as precall_router
 
@@ -318,6 +322,8 @@ app.include_router(export_router)
 app.include_router(prd_router)
 
 app.include_router(perpetual_personas_router)
+# Content-addressed media (persona images) referenced from results
+app.include_router(blobs_router)
 # AxPersona research-to-persona pipeline API
 app.include_router(axpersona_router)
 
@@ -378,17 +384,24 @@ try:
     # Use synchronous DB access since we're at module load time
     try:
         from backend.database import SessionLocal
-        from backend.models import PipelineRun
+        from backend.models import JobRecord, PipelineRun
         from datetime import datetime, timedelta
 
         session = SessionLocal()
         try:
             cutoff_time = datetime.utcnow() - timedelta(minutes=30)
 
+            # Runs that still have a live job record are re-queued by the job
+            # queue on startup instead of being failed here
+            queued_job_ids = session.query(JobRecord.job_id).filter(
+                JobRecord.status.in_(["queued", "running"])
+            )
+
             # Find and update stale runs synchronously
             stale_runs = session.query(PipelineRun).filter(
                 PipelineRun.status.in_(["running", "pending"]),
-                PipelineRun.created_at < cutoff_time
+                PipelineRun.created_at < cutoff_time,
+                PipelineRun.job_id.notin_(queued_job_ids),
             ).all()
 
             for run in stale_runs:
@@ -411,6 +424,63 @@ except Exception as e:
         "🔄 Continuing without database (conversation routines will still work)"
     )
 
+
+
+@app.on_event("startup")
+async def start_job_queue():
+    """Start the background job queue and re-queue jobs from a previous run."""
+    from backend.services.jobs import get_job_queue
+
+    # Handlers register themselves on import; load them before recovery so
+    # re-queued jobs of every kind are picked up
+    import backend.services.analysis_service  # noqa: F401
+    import backend.api.axpersona.router  # noqa: F401
+
+    await get_job_queue().start()
+
+
+@app.on_event("shutdown")
+async def stop_job_queue():
+    """Stop the background job queue; running jobs are recovered on restart."""
+    from backend.services.jobs import get_job_queue
+
+    await get_job_queue().stop()
+
+
+@app.on_event("shutdown")
+async def flush_analysis_progress():
+    """Write progress snapshots still waiting for the periodic flush."""
+    await get_analysis_progress_store().close()
+
+
+@app.on_event("startup")
+async def start_security_event_shipper():
+    """Start delivering security events queued by request handlers."""
+    await firebase_logging.start()
+
+
+@app.on_event("shutdown")
+async def stop_security_event_shipper():
+    """Stop event delivery; undelivered events are spilled to disk."""
+    await firebase_logging.stop()
+
+
+@app.on_event("shutdown")
+async def flush_usage_sync():
+    """Send usage metadata updates still waiting for their debounce."""
+    from backend.services.usage_ledger import get_usage_ledger
+
+    await get_usage_ledger().stop()
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    """Release pooled connections of the async database engine."""
+    from backend.database import dispose_async_engine
+
+    await dispose_async_engine()
+
+
 # Add this function definition before the route definitions
 _persona_service = None
 
@@ -526,8 +596,10 @@ async def get_analysis_status(
     )
     try:
         # First try to get the result directly (for development mode or if ownership check is not critical)
+        # The results blob is deferred: progress comes from the progress store
         analysis_result = (
             db.query(AnalysisResult)
+            .options(defer(AnalysisResult.results))
             .filter(AnalysisResult.result_id == result_id)
             .first()
         )
@@ -568,93 +640,107 @@ async def get_analysis_status(
             "completed_at": format_iso_utc(analysis_result.completed_at),
         }
 
-        # Parse results JSON for additional information
-        try:
-            results_data = json.loads(analysis_result.results or "{}")
-
-            # Extract progress information
-            if "progress" in results_data and isinstance(
-                results_data["progress"], (int, float)
-            ):
-                progress = float(results_data["progress"])
-                response_data["progress"] = progress
-
-            # Extract current stage
-            if "current_stage" in results_data:
-                current_stage = results_data["current_stage"]
-                response_data["current_stage"] = current_stage
-
-            # Extract stage states
-            if "stage_states" in results_data and isinstance(
-                results_data["stage_states"], dict
-            ):
-                stage_states = results_data["stage_states"]
-                response_data["stage_states"] = stage_states
-
-            # For failed status, extract error information
+        snapshot = await get_analysis_progress_store().get(result_id)
+        if snapshot is not None and (status != "failed" or snapshot.get("error")):
+            # Progress is tracked out of band, no need to load the results blob
+            response_data["progress"] = (
+                1.0 if status == "completed" else snapshot["progress"]
+            )
+            response_data["current_stage"] = snapshot.get("current_stage")
+            response_data["stage_states"] = snapshot.get("stage_states") or {}
             if status == "failed":
-                error_message = (
-                    results_data.get("error_details")
-                    or results_data.get("message")
-                    or "Analysis failed with an unspecified error."
-                )
-                response_data["error"] = error_message
-                response_data["error_code"] = results_data.get(
-                    "error_code", "ANALYSIS_FAILED"
+                response_data["error"] = snapshot["error"]
+                response_data["error_code"] = (
+                    snapshot.get("error_code") or "ANALYSIS_FAILED"
                 )
+        else:
+            # Parse results JSON for additional information
+            try:
+                results_data = json.loads(analysis_result.results or "{}")
+
+                # Extract progress information
+                if "progress" in results_data and isinstance(
+                    results_data["progress"], (int, float)
+                ):
+                    progress = float(results_data["progress"])
+                    response_data["progress"] = progress
+
+                # Extract current stage
+                if "current_stage" in results_data:
+                    current_stage = results_data["current_stage"]
+                    response_data["current_stage"] = current_stage
+
+                # Extract stage states
+                if "stage_states" in results_data and isinstance(
+                    results_data["stage_states"], dict
+                ):
+                    stage_states = results_data["stage_states"]
+                    response_data["stage_states"] = stage_states
+
+                # For failed status, extract error information
+                if status == "failed":
+                    error_message = (
+                        results_data.get("error_details")
+                        or results_data.get("message")
+                        or "Analysis failed with an unspecified error."
+                    )
+                    response_data["error"] = error_message
+                    response_data["error_code"] = results_data.get(
+                        "error_code", "ANALYSIS_FAILED"
+                    )
 
-            # For processing status, ensure we have a progress value
-            if status == "processing" and "progress" not in response_data:
-                # Estimate progress based on creation time if we don't have explicit progress
-                # Assume analysis takes about 5 minutes on average
-                if analysis_result.analysis_date:
-                    # Handle both naive and timezone-aware datetime objects
-                    current_time = datetime.now(timezone.utc)
-                    if analysis_result.analysis_date.tzinfo is None:
-                        # Naive datetime - assume it's UTC
-                        start_time = analysis_result.analysis_date.replace(
-                            tzinfo=timezone.utc
-                        )
+                # For processing status, ensure we have a progress value
+                if status == "processing" and "progress" not in response_data:
+                    # Estimate progress based on creation time if we don't have explicit progress
+                    # Assume analysis takes about 5 minutes on average
+                    if analysis_result.analysis_date:
+                        # Handle both naive and timezone-aware datetime objects
+                        current_time = datetime.now(timezone.utc)
+                        if analysis_result.analysis_date.tzinfo is None:
+                            # Naive datetime - assume it's UTC
+                            start_time = analysis_result.analysis_date.replace(
+                                tzinfo=timezone.utc
+                            )
+                        else:
+                            start_time = analysis_result.analysis_date
+                        elapsed_seconds = (current_time - start_time).total_seconds()
+                        estimated_progress = min(0.95, elapsed_seconds / 300)  # Cap at 95%
+                        response_data["progress"] = estimated_progress
+                        response_data["progress_estimated"] = True
                     else:
-                        start_time = analysis_result.analysis_date
-                    elapsed_seconds = (current_time - start_time).total_seconds()
-                    estimated_progress = min(0.95, elapsed_seconds / 300)  # Cap at 95%
-                    response_data["progress"] = estimated_progress
-                    response_data["progress_estimated"] = True
-                else:
-                    # Don't add artificial progress - let stage states determine progress
-                    pass
+                        # Don't add artificial progress - let stage states determine progress
+                        pass
 
-            # For completed status, ensure progress is 1.0
-            if status == "completed" and "progress" not in response_data:
-                response_data["progress"] = 1.0
+                # For completed status, ensure progress is 1.0
+                if status == "completed" and "progress" not in response_data:
+                    response_data["progress"] = 1.0
 
-        except json.JSONDecodeError:
-            logger.warning(
-                f"[GetStatus - JSONDecodeError] RequestID: {request_id}, ResultID: {result_id}"
-            )
-            if status == "failed":
-                error_message = (
-                    "Analysis failed, and error details could not be parsed."
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"[GetStatus - JSONDecodeError] RequestID: {request_id}, ResultID: {result_id}"
                 )
-                response_data["error"] = error_message
-                response_data["error_code"] = "JSON_PARSE_ERROR"
-
-            # Add minimal progress information
-            if status == "processing" and "progress" not in response_data:
-                response_data["progress"] = 0.5
-                response_data["progress_estimated"] = True
-            elif status == "completed" and "progress" not in response_data:
-                response_data["progress"] = 1.0
-
-        except Exception as parse_error:
-            logger.error(
-                f"[GetStatus - ParseError] RequestID: {request_id}, ResultID: {result_id}: {str(parse_error)}"
-            )
-            if status == "failed":
-                error_message = "Analysis failed with an unknown error structure."
-                response_data["error"] = error_message
-                response_data["error_code"] = "UNKNOWN_ERROR_STRUCTURE"
+                if status == "failed":
+                    error_message = (
+                        "Analysis failed, and error details could not be parsed."
+                    )
+                    response_data["error"] = error_message
+                    response_data["error_code"] = "JSON_PARSE_ERROR"
+
+                # Add minimal progress information
+                if status == "processing" and "progress" not in response_data:
+                    response_data["progress"] = 0.5
+                    response_data["progress_estimated"] = True
+                elif status == "completed" and "progress" not in response_data:
+                    response_data["progress"] = 1.0
+
+            except Exception as parse_error:
+                logger.error(
+                    f"[GetStatus - ParseError] RequestID: {request_id}, ResultID: {result_id}: {str(parse_error)}"
+                )
+                if status == "failed":
+                    error_message = "Analysis failed with an unknown error structure."
+                    response_data["error"] = error_message
+                    response_data["error_code"] = "UNKNOWN_ERROR_STRUCTURE"
 
         # Add request ID for tracking
         response_data["request_id"] = request_id
@@ -682,6 +768,51 @@ async def get_analysis_status(
         )
 
 
+@app.get(
+    "/api/analysis/{result_id}/progress/stream",
+    tags=["Analysis"],
+    summary="Stream analysis progress",
+    description="Server-Sent Events stream of stage updates for a running analysis.",
+)
+async def stream_analysis_progress(
+    result_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Pushes progress snapshots as ``progress`` events until the analysis
+    completes or fails, so clients do not need to poll the status endpoint.
+    """
+    exists = (
+        db.query(AnalysisResult.result_id)
+        .join(InterviewData, AnalysisResult.data_id == InterviewData.id)
+        .filter(
+            AnalysisResult.result_id == result_id,
+            InterviewData.user_id == current_user.user_id,
+        )
+        .first()
+    )
+    if not exists:
+        raise HTTPException(status_code=404, detail="Analysis result not found")
+
+    store = get_analysis_progress_store()
+
+    async def event_stream():
+        async for snapshot in store.subscribe(
+            result_id, keepalive=settings.analysis_progress_keepalive_seconds
+        ):
+            if snapshot is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: progress\ndata: {json.dumps(snapshot)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get(
     "/health",
     response_model=HealthCheckResponse,
@@ -698,6 +829,22 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
+@app.get(
+    "/api/llm/governor",
+    tags=["System"],
+    summary="LLM concurrency governor metrics",
+    description="Live concurrency limits, queue depths and rate-limit counters per provider and model.",
+)
+async def llm_governor_metrics(user: User = Depends(get_current_user)):
+    """
+    Report the state of the process-wide LLM concurrency governors.
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "governors": governor_metrics(),
+    }
+
+
 @app.get(
     "/api/health",
     tags=["System"],
@@ -15,7 +15,7 @@ from backend.api.research.simulation_bridge.models import SimulationResponse
 from backend.api.research.simulation_bridge.services.orchestrator import (
     SimulationOrchestrator,
 )
-from backend.database import SessionLocal
+from backend.database import SessionLocal, get_async_session_factory
 from backend.infrastructure.persistence.simulation_repository import (
     SimulationRepository,
 )
@@ -32,12 +32,12 @@ orchestrator = SimulationOrchestrator(use_parallel=True, max_concurrent=12)
 async def resolve_simulation(simulation_id: str) -> SimulationResponse:
     """Resolve a completed simulation either from orchestrator cache or DB."""
     # Try in-memory cache first
-    cached = orchestrator.get_completed_simulation(simulation_id)
+    cached = await orchestrator.get_completed_simulation(simulation_id)
     if cached is not None:
         return cached
 
     # Fallback to persisted simulation in the database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = SimulationRepository(uow.session)
         db_simulation = await repo.get_by_simulation_id(simulation_id)
 
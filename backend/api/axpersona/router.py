@@ -39,7 +39,7 @@ from datetime import timezone
 from backend.api.research.simulation_bridge.services.orchestrator import (
     SimulationOrchestrator,
 )
-from backend.database import SessionLocal
+from backend.database import SessionLocal, get_async_session_factory
 from backend.domain.models.production_persona import (
     ProductionPersona,
     PersonaAPIResponse,
@@ -55,6 +55,7 @@ from backend.infrastructure.persistence.unit_of_work import UnitOfWork
 from backend.models import AnalysisResult
 from backend.schemas import DetailedAnalysisResult
 from backend.services.adapters.persona_adapters import from_ssot_to_frontend
+from backend.services.jobs import QueueFullError, get_job_queue
 
 
 router = APIRouter(prefix="/api/axpersona/v1", tags=["AxPersona Pipeline"])
@@ -73,12 +74,12 @@ async def _resolve_simulation(simulation_id: str) -> SimulationResponse:
     """
 
     # 1) Try in-memory cache first (fast path for recently completed runs)
-    cached = orchestrator.get_completed_simulation(simulation_id)
+    cached = await orchestrator.get_completed_simulation(simulation_id)
     if cached is not None:
         return cached
 
     # 2) Fallback to persisted simulation in the database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = SimulationRepository(uow.session)
         db_simulation = await repo.get_by_simulation_id(simulation_id)
 
@@ -669,8 +670,8 @@ class PipelineRunListResponse(BaseModel):
 # backed by a database or external job queue (e.g. Celery, Redis, etc.).
 _pipeline_jobs: Dict[str, PipelineJobStatus] = {}
 
-# Keep references to background tasks to prevent garbage collection
-_background_tasks: set = set()
+# Job queue kind for AxPersona pipeline runs
+PIPELINE_JOB_KIND = "axpersona_pipeline"
 
 
 @router.post("/questionnaires", response_model=QuestionnaireResponse)
@@ -1426,6 +1427,129 @@ async def _execute_pipeline(
 
 
 
+async def _run_pipeline_job(job_id: str, payload: Dict[str, Any]) -> None:
+    """Job queue handler that executes a queued AxPersona pipeline run."""
+
+    context = BusinessContext(**payload["context"])
+    job = _pipeline_jobs.get(job_id)
+    if job is None:
+        # Re-queued after a restart: rebuild the in-memory status entry
+        job = PipelineJobStatus(
+            job_id=job_id,
+            status="pending",
+            created_at=payload.get("created_at") or datetime.utcnow().isoformat(),
+        )
+        _pipeline_jobs[job_id] = job
+
+    logger.info("[AxPersona Pipeline Job %s] started", job_id)
+    job.status = "running"
+    started_at = datetime.utcnow()
+    job.started_at = started_at.isoformat()
+
+    # Update status in database
+    async with UnitOfWork(get_async_session_factory()) as uow:
+        repo = PipelineRunRepository(uow.session)
+        await repo.update_pipeline_run_status(
+            job_id=job_id,
+            status="running",
+            started_at=started_at,
+        )
+        await uow.commit()
+
+    try:
+        result = await _execute_pipeline(context=context, pipeline_id=job_id)
+        job.result = result
+        job.status = "completed"
+        completed_at = datetime.utcnow()
+        job.completed_at = completed_at.isoformat()
+
+        # Extract metadata from result for quick access
+        questionnaire_stakeholder_count = None
+        simulation_id = None
+        analysis_id = None
+        persona_count = None
+        interview_count = None
+
+        for stage in result.execution_trace:
+            if stage.stage_name == "questionnaire_generation" and stage.outputs:
+                questionnaire_stakeholder_count = stage.outputs.get("total_stakeholder_count")
+            elif stage.stage_name == "simulation" and stage.outputs:
+                simulation_id = stage.outputs.get("simulation_id")
+            elif stage.stage_name == "analysis" and stage.outputs:
+                analysis_id = stage.outputs.get("analysis_id")
+                persona_count = stage.outputs.get("persona_count")
+            elif stage.stage_name == "persona_dataset_export" and stage.outputs:
+                interview_count = stage.outputs.get("interview_count")
+                if not persona_count:
+                    persona_count = stage.outputs.get("persona_count")
+
+        # Persist results to database
+        async with UnitOfWork(get_async_session_factory()) as uow:
+            repo = PipelineRunRepository(uow.session)
+            await repo.update_pipeline_run_status(
+                job_id=job_id,
+                status="completed",
+                completed_at=completed_at,
+            )
+            await repo.update_pipeline_run_results(
+                job_id=job_id,
+                execution_trace=[stage.model_dump() if hasattr(stage, "model_dump") else stage.dict() for stage in result.execution_trace],
+                total_duration_seconds=result.total_duration_seconds,
+                dataset=result.dataset.model_dump() if result.dataset and hasattr(result.dataset, "model_dump") else (result.dataset.dict() if result.dataset else None),
+                questionnaire_stakeholder_count=questionnaire_stakeholder_count,
+                simulation_id=simulation_id,
+                analysis_id=analysis_id,
+                persona_count=persona_count,
+                interview_count=interview_count,
+            )
+            await uow.commit()
+
+        logger.info(
+            "[AxPersona Pipeline Job %s] completed successfully", job_id
+        )
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.exception(
+            "[AxPersona Pipeline Job %s] failed: %s", job_id, exc
+        )
+        job.status = "failed"
+        job.error = str(exc)
+        completed_at = datetime.utcnow()
+        job.completed_at = completed_at.isoformat()
+
+        # Persist failure to database
+        async with UnitOfWork(get_async_session_factory()) as uow:
+            repo = PipelineRunRepository(uow.session)
+            await repo.update_pipeline_run_status(
+                job_id=job_id,
+                status="failed",
+                completed_at=completed_at,
+                error=str(exc),
+            )
+            await uow.commit()
+        raise
+
+
+async def _on_pipeline_job_abandoned(
+    job_id: str, payload: Dict[str, Any], error: str
+) -> None:
+    """Mark a pipeline run as failed once the job queue gives up on it."""
+
+    async with UnitOfWork(get_async_session_factory()) as uow:
+        repo = PipelineRunRepository(uow.session)
+        await repo.update_pipeline_run_status(
+            job_id=job_id,
+            status="failed",
+            completed_at=datetime.utcnow(),
+            error=error,
+        )
+        await uow.commit()
+
+
+get_job_queue().register_handler(
+    PIPELINE_JOB_KIND, _run_pipeline_job, on_failure=_on_pipeline_job_abandoned
+)
+
+
 @router.post("/pipeline/run-async", response_model=PipelineJobStatus)
 async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
     """Create a background job for running the full AxPersona pipeline.
@@ -1440,13 +1564,16 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
 
     job_id = str(uuid.uuid4())
     created_at = datetime.utcnow()
+    context_payload = (
+        context.model_dump(mode="json") if hasattr(context, "model_dump") else context.dict()
+    )
 
     # Persist pipeline run to database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
         await repo.create_pipeline_run(
             job_id=job_id,
-            business_context=context.model_dump() if hasattr(context, "model_dump") else context.dict(),
+            business_context=context_payload,
             user_id=None,  # TODO: Extract from auth context when available
         )
         await uow.commit()
@@ -1458,100 +1585,24 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
     )
     _pipeline_jobs[job_id] = job
 
-    async def run_job() -> None:
-        logger.info("[AxPersona Pipeline Job %s] started", job_id)
-        job.status = "running"
-        started_at = datetime.utcnow()
-        job.started_at = started_at.isoformat()
-
-        # Update status in database
-        async with UnitOfWork(SessionLocal) as uow:
-            repo = PipelineRunRepository(uow.session)
-            await repo.update_pipeline_run_status(
-                job_id=job_id,
-                status="running",
-                started_at=started_at,
-            )
-            await uow.commit()
-
-        try:
-            result = await _execute_pipeline(context=context, pipeline_id=job_id)
-            job.result = result
-            job.status = "completed"
-            completed_at = datetime.utcnow()
-            job.completed_at = completed_at.isoformat()
-
-            # Extract metadata from result for quick access
-            questionnaire_stakeholder_count = None
-            simulation_id = None
-            analysis_id = None
-            persona_count = None
-            interview_count = None
-
-            for stage in result.execution_trace:
-                if stage.stage_name == "questionnaire_generation" and stage.outputs:
-                    questionnaire_stakeholder_count = stage.outputs.get("total_stakeholder_count")
-                elif stage.stage_name == "simulation" and stage.outputs:
-                    simulation_id = stage.outputs.get("simulation_id")
-                elif stage.stage_name == "analysis" and stage.outputs:
-                    analysis_id = stage.outputs.get("analysis_id")
-                    persona_count = stage.outputs.get("persona_count")
-                elif stage.stage_name == "persona_dataset_export" and stage.outputs:
-                    interview_count = stage.outputs.get("interview_count")
-                    if not persona_count:
-                        persona_count = stage.outputs.get("persona_count")
-
-            # Persist results to database
-            async with UnitOfWork(SessionLocal) as uow:
-                repo = PipelineRunRepository(uow.session)
-                await repo.update_pipeline_run_status(
-                    job_id=job_id,
-                    status="completed",
-                    completed_at=completed_at,
-                )
-                await repo.update_pipeline_run_results(
-                    job_id=job_id,
-                    execution_trace=[stage.model_dump() if hasattr(stage, "model_dump") else stage.dict() for stage in result.execution_trace],
-                    total_duration_seconds=result.total_duration_seconds,
-                    dataset=result.dataset.model_dump() if result.dataset and hasattr(result.dataset, "model_dump") else (result.dataset.dict() if result.dataset else None),
-                    questionnaire_stakeholder_count=questionnaire_stakeholder_count,
-                    simulation_id=simulation_id,
-                    analysis_id=analysis_id,
-                    persona_count=persona_count,
-                    interview_count=interview_count,
-                )
-                await uow.commit()
-
-            logger.info(
-                "[AxPersona Pipeline Job %s] completed successfully", job_id
-            )
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.exception(
-                "[AxPersona Pipeline Job %s] failed: %s", job_id, exc
-            )
-            job.status = "failed"
-            job.error = str(exc)
-            completed_at = datetime.utcnow()
-            job.completed_at = completed_at.isoformat()
-
-            # Persist failure to database
-            async with UnitOfWork(SessionLocal) as uow:
-                repo = PipelineRunRepository(uow.session)
-                await repo.update_pipeline_run_status(
-                    job_id=job_id,
-                    status="failed",
-                    completed_at=completed_at,
-                    error=str(exc),
-                )
-                await uow.commit()
-
-    # Fire-and-forget background task; in production consider a proper job queue.
-    # Keep a reference to prevent garbage collection
-    task = asyncio.create_task(run_job())
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
+    # Runs on the shared job queue in the batch lane so pipeline runs cannot
+    # starve interactive analyses of workers or LLM quota.
+    try:
+        await get_job_queue().submit(
+            PIPELINE_JOB_KIND,
+            {"context": context_payload, "created_at": job.created_at},
+            lane="batch",
+            job_id=job_id,
+        )
+    except QueueFullError as exc:
+        _pipeline_jobs.pop(job_id, None)
+        await _on_pipeline_job_abandoned(job_id, {}, str(exc))
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pipeline jobs are queued right now. Please try again later.",
+        )
 
-    logger.info("[AxPersona Pipeline] Created background task for job %s", job_id)
+    logger.info("[AxPersona Pipeline] Queued job %s", job_id)
 
     return job
 
@@ -1574,7 +1625,7 @@ async def get_pipeline_job(job_id: str) -> PipelineJobStatus:
         return job
 
     # Fall back to database for historical runs
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
         db_run = await repo.get_by_job_id(job_id)
 
@@ -1631,7 +1682,7 @@ async def list_pipeline_runs(
     # Enforce maximum limit
     limit = min(limit, 100)
 
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
 
         # Get pipeline runs
@@ -1703,7 +1754,7 @@ async def get_pipeline_run_detail(job_id: str) -> PipelineRunDetail:
         GET /api/axpersona/v1/pipeline/runs/502255cd-59ef-40b1-a0bb-68e4a0226fa0
     """
 
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
         db_run = await repo.get_by_job_id(job_id)
 
@@ -14,7 +14,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from backend.api.research.simulation_bridge.models import BusinessContext
-from backend.database import SessionLocal
+from backend.database import get_async_session_factory
 from backend.infrastructure.persistence.pipeline_run_repository import (
     PipelineRunRepository,
 )
@@ -81,7 +81,7 @@ async def create_pipeline_job(context: BusinessContext) -> PipelineJobStatus:
     created_at = datetime.utcnow()
 
     # Persist pipeline run to database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
         await repo.create_pipeline_run(
             job_id=job_id,
@@ -115,7 +115,7 @@ async def get_pipeline_job(job_id: str) -> PipelineJobStatus:
         return _pipeline_jobs[job_id]
 
     # Fallback to database
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
         run = await repo.get_pipeline_run(job_id)
         if run:
@@ -140,7 +140,7 @@ async def _run_pipeline_job(job: PipelineJobStatus, context: BusinessContext, jo
     started_at = datetime.utcnow()
     job.started_at = started_at.isoformat()
 
-    async with UnitOfWork(SessionLocal) as uow:
+    async with UnitOfWork(get_async_session_factory()) as uow:
         repo = PipelineRunRepository(uow.session)
         await repo.update_pipeline_run_status(job_id=job_id, status="running", started_at=started_at)
         await uow.commit()
@@ -6,21 +6,57 @@ It processes video URLs and generates department-specific annotations
 (Security, Marketing, Operations) using Gemini multimodal video understanding.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from difflib import SequenceMatcher
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Segment size in seconds (10 minutes per segment)
+SEGMENT_SIZE = 600
+
+# Segments analyzed at once, shared by all requests of the process
+SEGMENT_CONCURRENCY = int(os.getenv("GEMINI_VIDEO_SEGMENT_CONCURRENCY", "4"))
+
+# Annotations starting this close to a segment boundary may repeat an
+# annotation the previous segment reported up to the boundary
+BOUNDARY_TOLERANCE_SECONDS = 15
+
+# Minimum description similarity for two boundary annotations to be merged
+BOUNDARY_SIMILARITY = 0.8
+
+# Analyzed segments kept in memory, keyed by video, window and prompt
+SEGMENT_CACHE_SIZE = 128
+
+# yt-dlp metadata is reused for this long
+METADATA_CACHE_TTL_SECONDS = 3600
+METADATA_CACHE_SIZE = 256
+
+
+def _extract_video_id(video_url: str) -> Optional[str]:
+    """Extract the video ID of a YouTube URL."""
+    if "youtube.com" in video_url or "youtu.be" in video_url:
+        if "v=" in video_url:
+            return video_url.split("v=")[1].split("&")[0]
+        elif "youtu.be/" in video_url:
+            return video_url.split("youtu.be/")[1].split("?")[0]
+    return None
+
 
 # ============================================================================
 # Gemini Video Analysis Service
@@ -32,6 +68,8 @@ class GeminiVideoAnalyzer:
     def __init__(self):
         self._client = None
         self._available = False
+        self._segment_slots: Optional[asyncio.Semaphore] = None
+        self._segment_cache: "OrderedDict[Tuple[str, int, int, str], List[Dict[str, Any]]]" = OrderedDict()
         self._init_client()
 
     def _init_client(self):
@@ -99,8 +137,6 @@ class GeminiVideoAnalyzer:
         Returns:
             List of annotations for this segment
         """
-        from google.genai import types
-
         start_ts = self._seconds_to_timestamp(start_offset)
         end_ts = self._seconds_to_timestamp(end_offset)
 
@@ -139,6 +175,39 @@ For departments, use this structure:
 Create annotations every 20-40 seconds. For shopping areas, create one annotation per visible store.
 Return ONLY the JSON array, no other text."""
 
+        logger.info(f"[GeminiVideoAnalyzer] Analyzing segment {segment_num}/{total_segments}: {start_ts} - {end_ts}")
+        return await self._generate_segment(video_url, start_offset, end_offset, segment_prompt)
+
+    async def _generate_segment(
+        self,
+        video_url: str,
+        start_offset: int,
+        end_offset: int,
+        segment_prompt: str
+    ) -> List[Dict[str, Any]]:
+        """Run a prompt on one clipped window of a video, reusing cached results.
+
+        Results are cached by (video id, window, prompt hash), so re-analysing
+        the same video skips segments that were already analysed.
+        """
+        from google.genai import types
+
+        model_name = os.getenv("GEMINI_VIDEO_MODEL", "models/gemini-3-flash-preview")
+        prompt_hash = hashlib.sha256(
+            f"{model_name}\n{segment_prompt}".encode("utf-8")
+        ).hexdigest()
+        cache_key = (
+            _extract_video_id(video_url) or video_url,
+            start_offset,
+            end_offset,
+            prompt_hash,
+        )
+        cached = self._segment_cache.get(cache_key)
+        if cached is not None:
+            self._segment_cache.move_to_end(cache_key)
+            logger.info(f"[GeminiVideoAnalyzer] Segment cache hit: {start_offset}s - {end_offset}s")
+            return [dict(annotation) for annotation in cached]
+
         # Create content with video_metadata for segment clipping
         parts = [
             types.Part(
@@ -158,16 +227,155 @@ Return ONLY the JSON array, no other text."""
             response_mime_type="application/json",
         )
 
-        model_name = os.getenv("GEMINI_VIDEO_MODEL", "models/gemini-3-flash-preview")
-        logger.info(f"[GeminiVideoAnalyzer] Analyzing segment {segment_num}/{total_segments}: {start_ts} - {end_ts}")
-
         response = await self._client.aio.models.generate_content(
             model=model_name,
             contents=content,
             config=config,
         )
 
-        return self._parse_annotations(response.text)
+        annotations = self._parse_annotations(response.text)
+        # Empty results are usually parse failures; let the next request retry
+        if annotations:
+            self._segment_cache[cache_key] = [dict(a) for a in annotations]
+            while len(self._segment_cache) > SEGMENT_CACHE_SIZE:
+                self._segment_cache.popitem(last=False)
+        return annotations
+
+    def _segment_windows(self, video_duration_seconds: int) -> List[Tuple[int, int]]:
+        """Split a video into (start, end) windows of SEGMENT_SIZE seconds."""
+        num_segments = (video_duration_seconds + SEGMENT_SIZE - 1) // SEGMENT_SIZE
+        return [
+            (i * SEGMENT_SIZE, min((i + 1) * SEGMENT_SIZE, video_duration_seconds))
+            for i in range(num_segments)
+        ]
+
+    async def iter_segments(
+        self,
+        kind: Literal["annotations", "technical"],
+        video_url: str,
+        video_duration_seconds: int
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Analyze all segments concurrently, yielding each as it finishes.
+
+        At most SEGMENT_CONCURRENCY segments run at once across the process.
+        A failing segment raises and cancels the segments still running.
+
+        Args:
+            kind: "annotations" for department analysis, "technical" for
+                signage and behaviour metrics
+            video_url: YouTube URL or other video URL
+            video_duration_seconds: Total video duration in seconds
+
+        Yields:
+            (segment index, annotations of that segment) in completion order
+        """
+        analyze_segment = (
+            self._analyze_video_segment
+            if kind == "annotations"
+            else self._analyze_technical_segment
+        )
+        windows = self._segment_windows(video_duration_seconds)
+        total_duration = self._seconds_to_timestamp(video_duration_seconds)
+        if self._segment_slots is None:
+            self._segment_slots = asyncio.Semaphore(max(1, SEGMENT_CONCURRENCY))
+
+        async def run(index: int, start_offset: int, end_offset: int):
+            async with self._segment_slots:
+                return index, await analyze_segment(
+                    video_url=video_url,
+                    start_offset=start_offset,
+                    end_offset=end_offset,
+                    segment_num=index + 1,
+                    total_segments=len(windows),
+                    total_duration=total_duration
+                )
+
+        tasks = [
+            asyncio.create_task(run(i, start, end))
+            for i, (start, end) in enumerate(windows)
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _analyze_segments(
+        self,
+        kind: Literal["annotations", "technical"],
+        video_url: str,
+        video_duration_seconds: int
+    ) -> List[Dict[str, Any]]:
+        """Analyze all segments concurrently and stitch them in video order."""
+        windows = self._segment_windows(video_duration_seconds)
+        segments: List[List[Dict[str, Any]]] = [[] for _ in windows]
+        async for index, annotations in self.iter_segments(kind, video_url, video_duration_seconds):
+            segments[index] = annotations
+        return self.stitch_segments(segments, windows)
+
+    def stitch_segments(
+        self,
+        segments: List[List[Dict[str, Any]]],
+        windows: List[Tuple[int, int]]
+    ) -> List[Dict[str, Any]]:
+        """Concatenate segment annotations, merging duplicates at boundaries.
+
+        An event that spans a boundary is often reported by both segments: once
+        ending at the boundary and once starting there. An annotation starting
+        within BOUNDARY_TOLERANCE_SECONDS of its segment start is merged into a
+        similar annotation of the previous segment that reaches the boundary;
+        the kept annotation is extended to cover both time ranges.
+
+        Args:
+            segments: Annotations per segment, in video order
+            windows: (start, end) seconds of each segment
+
+        Returns:
+            Annotations of all segments in video order
+        """
+        stitched: List[Dict[str, Any]] = []
+        tail: List[Dict[str, Any]] = []
+        for (start, end), annotations in zip(windows, segments):
+            current: List[Dict[str, Any]] = []
+            for annotation in annotations:
+                annotation = dict(annotation)
+                if tail and self._annotation_start(annotation) - start <= BOUNDARY_TOLERANCE_SECONDS:
+                    duplicate = next(
+                        (kept for kept in tail if self._same_event(kept, annotation)),
+                        None,
+                    )
+                    if duplicate is not None:
+                        if self._annotation_end(annotation) > self._annotation_end(duplicate):
+                            duplicate["timestamp_end"] = annotation.get("timestamp_end")
+                        continue
+                current.append(annotation)
+            stitched.extend(current)
+            tail = [
+                annotation
+                for annotation in current
+                if end - self._annotation_end(annotation) <= BOUNDARY_TOLERANCE_SECONDS
+            ]
+        return stitched
+
+    def _annotation_start(self, annotation: Dict[str, Any]) -> int:
+        timestamp = annotation.get("timestamp_start", annotation.get("timestamp"))
+        return self._parse_duration_to_seconds(str(timestamp or ""))
+
+    def _annotation_end(self, annotation: Dict[str, Any]) -> int:
+        timestamp = annotation.get("timestamp_end")
+        if not timestamp:
+            return self._annotation_start(annotation)
+        return self._parse_duration_to_seconds(str(timestamp))
+
+    def _same_event(self, first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+        """Whether two annotations describe the same event."""
+        first_text = str(first.get("description") or first.get("summary") or "").lower()
+        second_text = str(second.get("description") or second.get("summary") or "").lower()
+        if not first_text or not second_text:
+            return False
+        return SequenceMatcher(None, first_text, second_text).ratio() >= BOUNDARY_SIMILARITY
 
     async def analyze_video(
         self,
@@ -193,34 +401,15 @@ Return ONLY the JSON array, no other text."""
 
         from google.genai import types
 
-        # Segment size in seconds (10 minutes per segment)
-        SEGMENT_SIZE = 600
-
         # If duration is provided or video is known to be long, use chunked analysis
         if video_duration_seconds and video_duration_seconds > SEGMENT_SIZE:
             logger.info(f"[GeminiVideoAnalyzer] Using chunked analysis for {video_duration_seconds}s video")
 
-            total_duration = self._seconds_to_timestamp(video_duration_seconds)
-            all_annotations = []
-
-            # Calculate segments
-            num_segments = (video_duration_seconds + SEGMENT_SIZE - 1) // SEGMENT_SIZE
-
-            for i in range(num_segments):
-                start_offset = i * SEGMENT_SIZE
-                end_offset = min((i + 1) * SEGMENT_SIZE, video_duration_seconds)
-
-                segment_annotations = await self._analyze_video_segment(
-                    video_url=video_url,
-                    start_offset=start_offset,
-                    end_offset=end_offset,
-                    segment_num=i + 1,
-                    total_segments=num_segments,
-                    total_duration=total_duration
-                )
-                all_annotations.extend(segment_annotations)
+            all_annotations = await self._analyze_segments(
+                "annotations", video_url, video_duration_seconds
+            )
 
-            logger.info(f"[GeminiVideoAnalyzer] Total annotations from {num_segments} segments: {len(all_annotations)}")
+            logger.info(f"[GeminiVideoAnalyzer] Total annotations from {len(self._segment_windows(video_duration_seconds))} segments: {len(all_annotations)}")
             return all_annotations
 
         # For shorter videos or unknown duration, use single-pass analysis
@@ -284,8 +473,6 @@ Return ONLY the JSON array, no other text."""
         Returns:
             List of technical annotations for this segment
         """
-        from google.genai import types
-
         start_ts = self._seconds_to_timestamp(start_offset)
         end_ts = self._seconds_to_timestamp(end_offset)
 
@@ -373,35 +560,8 @@ Calculate these aggregate scores (0-100):
 Create technical annotations every 30-60 seconds throughout this segment.
 Return ONLY a valid JSON array. No additional text."""
 
-        # Create content with video_metadata for segment clipping
-        parts = [
-            types.Part(
-                file_data=types.FileData(file_uri=video_url),
-                video_metadata=types.VideoMetadata(
-                    start_offset=f"{start_offset}s",
-                    end_offset=f"{end_offset}s"
-                )
-            ),
-            types.Part(text=segment_prompt)
-        ]
-
-        content = types.Content(parts=parts)
-        config = types.GenerateContentConfig(
-            temperature=0.2,
-            max_output_tokens=16000,
-            response_mime_type="application/json",
-        )
-
-        model_name = os.getenv("GEMINI_VIDEO_MODEL", "models/gemini-3-flash-preview")
         logger.info(f"[GeminiVideoAnalyzer] Technical segment {segment_num}/{total_segments}: {start_ts} - {end_ts}")
-
-        response = await self._client.aio.models.generate_content(
-            model=model_name,
-            contents=content,
-            config=config,
-        )
-
-        return self._parse_annotations(response.text)
+        return await self._generate_segment(video_url, start_offset, end_offset, segment_prompt)
 
     async def analyze_technical(
         self,
@@ -425,34 +585,15 @@ Return ONLY a valid JSON array. No additional text."""
 
         from google.genai import types
 
-        # Segment size in seconds (10 minutes per segment)
-        SEGMENT_SIZE = 600
-
         # If duration is provided and video is long, use chunked analysis
         if video_duration_seconds and video_duration_seconds > SEGMENT_SIZE:
             logger.info(f"[GeminiVideoAnalyzer] Using chunked technical analysis for {video_duration_seconds}s video")
 
-            total_duration = self._seconds_to_timestamp(video_duration_seconds)
-            all_annotations = []
-
-            # Calculate segments
-            num_segments = (video_duration_seconds + SEGMENT_SIZE - 1) // SEGMENT_SIZE
-
-            for i in range(num_segments):
-                start_offset = i * SEGMENT_SIZE
-                end_offset = min((i + 1) * SEGMENT_SIZE, video_duration_seconds)
-
-                segment_annotations = await self._analyze_technical_segment(
-                    video_url=video_url,
-                    start_offset=start_offset,
-                    end_offset=end_offset,
-                    segment_num=i + 1,
-                    total_segments=num_segments,
-                    total_duration=total_duration
-                )
-                all_annotations.extend(segment_annotations)
+            all_annotations = await self._analyze_segments(
+                "technical", video_url, video_duration_seconds
+            )
 
-            logger.info(f"[GeminiVideoAnalyzer] Total technical annotations from {num_segments} segments: {len(all_annotations)}")
+            logger.info(f"[GeminiVideoAnalyzer] Total technical annotations from {len(self._segment_windows(video_duration_seconds))} segments: {len(all_annotations)}")
             return all_annotations
 
         # For shorter videos or unknown duration, use single-pass analysis
@@ -980,6 +1121,10 @@ class VideoMetadataResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Successful metadata lookups: cache key -> (fetched at, response)
+_metadata_cache: "OrderedDict[str, Tuple[float, VideoMetadataResponse]]" = OrderedDict()
+
+
 @router.post("/video-metadata", response_model=VideoMetadataResponse)
 async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResponse:
     """Fetch video metadata (title, duration, etc.) from a video URL.
@@ -992,48 +1137,51 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
 
     **Output**
     - ``VideoMetadataResponse`` with title, duration, thumbnail, etc.
-    """
-    import subprocess
-    import json as json_module
 
+    Successful lookups are cached per video for METADATA_CACHE_TTL_SECONDS.
+    """
     logger.info(f"[Video Metadata] Fetching metadata for: {request.video_url}")
 
     # Extract video ID if it's a YouTube URL
-    video_id = None
-    if "youtube.com" in request.video_url or "youtu.be" in request.video_url:
-        if "v=" in request.video_url:
-            video_id = request.video_url.split("v=")[1].split("&")[0]
-        elif "youtu.be/" in request.video_url:
-            video_id = request.video_url.split("youtu.be/")[1].split("?")[0]
+    video_id = _extract_video_id(request.video_url)
+
+    cache_key = video_id or request.video_url
+    cached = _metadata_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < METADATA_CACHE_TTL_SECONDS:
+        _metadata_cache.move_to_end(cache_key)
+        return cached[1].model_copy(update={"video_url": request.video_url})
 
     try:
-        # Use yt-dlp to extract metadata (no download)
-        cmd = [
+        # Use yt-dlp to extract metadata (no download); run it as a child
+        # process so the event loop keeps serving other requests meanwhile
+        process = await asyncio.create_subprocess_exec(
             "yt-dlp",
             "--dump-json",
             "--no-download",
             "--no-warnings",
-            request.video_url
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
+            request.video_url,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-
-        if result.returncode != 0:
-            logger.error(f"[Video Metadata] yt-dlp error: {result.stderr}")
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            error_output = stderr.decode("utf-8", errors="replace")
+            logger.error(f"[Video Metadata] yt-dlp error: {error_output}")
             return VideoMetadataResponse(
                 success=False,
                 video_url=request.video_url,
                 video_id=video_id,
-                error=f"Failed to fetch metadata: {result.stderr[:200]}"
+                error=f"Failed to fetch metadata: {error_output[:200]}"
             )
 
         # Parse JSON output
-        metadata = json_module.loads(result.stdout)
+        metadata = json.loads(stdout)
 
         # Extract duration
         duration_seconds = metadata.get("duration")
@@ -1050,7 +1198,7 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
                 seconds = duration_seconds % 60
                 duration_formatted = f"{minutes}:{seconds:02d}"
 
-        return VideoMetadataResponse(
+        response = VideoMetadataResponse(
             success=True,
             video_url=request.video_url,
             video_id=video_id or metadata.get("id"),
@@ -1060,8 +1208,13 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
             thumbnail_url=metadata.get("thumbnail"),
             channel=metadata.get("channel") or metadata.get("uploader"),
         )
+        _metadata_cache[cache_key] = (time.monotonic(), response)
+        _metadata_cache.move_to_end(cache_key)
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+        return response
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logger.error("[Video Metadata] yt-dlp timeout")
         return VideoMetadataResponse(
             success=False,
@@ -1087,6 +1240,159 @@ async def get_video_metadata(request: VideoMetadataRequest) -> VideoMetadataResp
         )
 
 
+def _build_video_annotations(raw_annotations: List[Dict[str, Any]]) -> List[VideoAnnotation]:
+    """Convert raw annotations to typed models, skipping invalid ones."""
+    annotations = []
+    for ann in raw_annotations:
+        try:
+            # Extract department analyses - handle both flat and nested formats
+            security_data = ann.get('security', ann.get('departments', {}).get('security', {}))
+            marketing_data = ann.get('marketing', ann.get('departments', {}).get('marketing', {}))
+            operations_data = ann.get('operations', ann.get('departments', {}).get('operations', {}))
+
+            annotation = VideoAnnotation(
+                id=ann.get('id', str(uuid.uuid4())),
+                timestamp_start=ann.get('timestamp_start', ann.get('timestamp', '00:00')),
+                timestamp_end=ann.get('timestamp_end', '00:05'),
+                coordinates=ann.get('coordinates', [50, 50, 10, 10]),
+                description=ann.get('description', 'Event detected'),
+                departments=DepartmentAnalyses(
+                    security=SecurityAnalysis(
+                        status=security_data.get('status', 'Green'),
+                        label=security_data.get('label', 'Normal'),
+                        detail=security_data.get('detail'),
+                        icon=security_data.get('icon'),
+                    ),
+                    marketing=MarketingAnalysis(
+                        sentiment=marketing_data.get('sentiment', 'Neutral'),
+                        label=marketing_data.get('label', 'Standard'),
+                        detail=marketing_data.get('detail'),
+                        icon=marketing_data.get('icon'),
+                    ),
+                    operations=OperationsAnalysis(
+                        flow_rate=operations_data.get('flow_rate', 'Fast'),
+                        label=operations_data.get('label', 'Normal'),
+                        detail=operations_data.get('detail'),
+                        icon=operations_data.get('icon'),
+                    ),
+                ),
+            )
+            annotations.append(annotation)
+        except Exception as e:
+            logger.warning(f"[Video Analysis] Skipping invalid annotation: {e}")
+            continue
+
+    return annotations
+
+
+def _build_technical_annotations(raw_technical: List[Dict[str, Any]]) -> List[TechnicalAnnotation]:
+    """Convert raw technical annotations to typed models, skipping invalid ones."""
+    technical_annotations: List[TechnicalAnnotation] = []
+    for tech_ann in raw_technical:
+        try:
+            # Parse signs detected
+            signs = []
+            for sign in tech_ann.get('signs_detected', []):
+                signs.append(SignageAnalysis(
+                    sign_text=sign.get('sign_text', 'Unknown'),
+                    sign_type=sign.get('sign_type', 'informational'),
+                    visibility_score=min(10, max(1, sign.get('visibility_score', 5))),
+                    readability=sign.get('readability', 'moderate'),
+                    location_description=sign.get('location_description', 'Unknown'),
+                    issues=sign.get('issues', [])
+                ))
+
+            # Parse agent behavior
+            agent_data = tech_ann.get('agent_behavior', {})
+            agent_behavior = AgentBehaviorAnalysis(
+                agent_count=agent_data.get('agent_count', 0),
+                static_spectators=agent_data.get('static_spectators', 0),
+                transit_passengers=agent_data.get('transit_passengers', 0),
+                avg_velocity=agent_data.get('avg_velocity', 'moderate'),
+                dominant_gaze_target=agent_data.get('dominant_gaze_target'),
+                awe_struck_count=agent_data.get('awe_struck_count', 0),
+                conversion_opportunities=agent_data.get('conversion_opportunities', 0)
+            ) if agent_data else None
+
+            # Parse objects
+            obj_data = tech_ann.get('objects', {})
+            objects = ObjectDetection(
+                luggage_trolleys=obj_data.get('luggage_trolleys', 0),
+                smartphones_cameras=obj_data.get('smartphones_cameras', 0),
+                strollers=obj_data.get('strollers', 0),
+                wheelchairs=obj_data.get('wheelchairs', 0),
+                shopping_bags=obj_data.get('shopping_bags', 0)
+            ) if obj_data else None
+
+            tech_annotation = TechnicalAnnotation(
+                id=tech_ann.get('id', str(uuid.uuid4())),
+                timestamp_start=tech_ann.get('timestamp_start', '00:00'),
+                timestamp_end=tech_ann.get('timestamp_end', '00:30'),
+                linked_annotation_id=tech_ann.get('linked_annotation_id'),
+                signs_detected=signs,
+                agent_behavior=agent_behavior,
+                objects=objects,
+                navigational_stress_score=min(100, max(0, tech_ann.get('navigational_stress_score', 0))),
+                purchase_intent_score=min(100, max(0, tech_ann.get('purchase_intent_score', 0))),
+                attention_availability=min(100, max(0, tech_ann.get('attention_availability', 100))),
+                summary=tech_ann.get('summary', 'Technical analysis')
+            )
+            technical_annotations.append(tech_annotation)
+        except Exception as e:
+            logger.warning(f"[Video Analysis] Skipping invalid technical annotation: {e}")
+            continue
+
+    return technical_annotations
+
+
+def _analysis_response(
+    request: VideoAnalysisRequest,
+    video_id: Optional[str],
+    annotations: List[VideoAnnotation],
+    technical_annotations: List[TechnicalAnnotation],
+) -> VideoAnalysisResponse:
+    """Assemble the analysis response, falling back to demo annotations if empty."""
+    # If no valid annotations, fall back to demo
+    if not annotations:
+        logger.warning("[Video Analysis] No valid annotations, using demo")
+        annotations = DEMO_ANNOTATIONS
+
+    # Calculate duration analyzed
+    duration_analyzed = annotations[-1].timestamp_end
+
+    return VideoAnalysisResponse(
+        success=True,
+        video_url=request.video_url,
+        video_id=video_id,
+        annotations=annotations,
+        technical_annotations=technical_annotations,
+        analysis_metadata=AnalysisMetadata(
+            total_annotations=len(annotations),
+            duration_analyzed=duration_analyzed,
+            model_used=os.getenv("GEMINI_VIDEO_MODEL", "gemini-3-flash-preview"),
+            processed_at=datetime.now(timezone.utc).isoformat(),
+        ),
+    )
+
+
+def _demo_response(
+    request: VideoAnalysisRequest, video_id: Optional[str], mode: str
+) -> VideoAnalysisResponse:
+    """Demo annotations, labelled with why they are used."""
+    return VideoAnalysisResponse(
+        success=True,
+        video_url=request.video_url,
+        video_id=video_id,
+        annotations=DEMO_ANNOTATIONS,
+        analysis_metadata=AnalysisMetadata(
+            total_annotations=len(DEMO_ANNOTATIONS),
+            duration_analyzed="1:00",
+            model_used=f"gemini-3-flash-preview ({mode})",
+            processed_at=datetime.now(timezone.utc).isoformat(),
+        ),
+    )
+
+
 @router.post("/video-analysis", response_model=VideoAnalysisResponse)
 async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
     """Analyze a video for department-specific insights using Gemini multimodal AI.
@@ -1111,12 +1417,7 @@ async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
     logger.info(f"[Video Analysis] Analyzing video: {request.video_url}")
 
     # Extract video ID if it's a YouTube URL
-    video_id = None
-    if "youtube.com" in request.video_url or "youtu.be" in request.video_url:
-        if "v=" in request.video_url:
-            video_id = request.video_url.split("v=")[1].split("&")[0]
-        elif "youtu.be/" in request.video_url:
-            video_id = request.video_url.split("youtu.be/")[1].split("?")[0]
+    video_id = _extract_video_id(request.video_url)
 
     # Check if demo mode is requested or Gemini unavailable
     analyzer = get_video_analyzer()
@@ -1125,18 +1426,7 @@ async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
     if use_demo or not analyzer.is_available():
         mode = "demo (requested)" if use_demo else "demo (Gemini unavailable)"
         logger.info(f"[Video Analysis] Using {mode}")
-        return VideoAnalysisResponse(
-            success=True,
-            video_url=request.video_url,
-            video_id=video_id,
-            annotations=DEMO_ANNOTATIONS,
-            analysis_metadata=AnalysisMetadata(
-                total_annotations=len(DEMO_ANNOTATIONS),
-                duration_analyzed="1:00",
-                model_used=f"gemini-3-flash-preview ({mode})",
-                processed_at=datetime.now(timezone.utc).isoformat(),
-            ),
-        )
+        return _demo_response(request, video_id, mode)
 
     try:
         # Use Gemini multimodal video analysis
@@ -1144,163 +1434,143 @@ async def analyze_video(request: VideoAnalysisRequest) -> VideoAnalysisResponse:
         if request.video_duration_seconds:
             logger.info(f"[Video Analysis] Video duration: {request.video_duration_seconds}s (chunked analysis enabled)")
 
-        raw_annotations = await analyzer.analyze_video(
-            video_url=request.video_url,
-            custom_prompt=request.analysis_prompt,
-            video_duration_seconds=request.video_duration_seconds
+        # Technical analysis for signs & navigation runs alongside; both share
+        # the analyzer's segment concurrency limit
+        logger.info("[Video Analysis] Starting technical analysis for signs & navigation...")
+        technical_task = asyncio.create_task(
+            analyzer.analyze_technical(
+                video_url=request.video_url,
+                video_duration_seconds=request.video_duration_seconds
+            )
         )
-
-        # Convert raw annotations to typed models
-        annotations = []
-        for ann in raw_annotations:
-            try:
-                # Extract department analyses - handle both flat and nested formats
-                security_data = ann.get('security', ann.get('departments', {}).get('security', {}))
-                marketing_data = ann.get('marketing', ann.get('departments', {}).get('marketing', {}))
-                operations_data = ann.get('operations', ann.get('departments', {}).get('operations', {}))
-
-                annotation = VideoAnnotation(
-                    id=ann.get('id', str(uuid.uuid4())),
-                    timestamp_start=ann.get('timestamp_start', ann.get('timestamp', '00:00')),
-                    timestamp_end=ann.get('timestamp_end', '00:05'),
-                    coordinates=ann.get('coordinates', [50, 50, 10, 10]),
-                    description=ann.get('description', 'Event detected'),
-                    departments=DepartmentAnalyses(
-                        security=SecurityAnalysis(
-                            status=security_data.get('status', 'Green'),
-                            label=security_data.get('label', 'Normal'),
-                            detail=security_data.get('detail'),
-                            icon=security_data.get('icon'),
-                        ),
-                        marketing=MarketingAnalysis(
-                            sentiment=marketing_data.get('sentiment', 'Neutral'),
-                            label=marketing_data.get('label', 'Standard'),
-                            detail=marketing_data.get('detail'),
-                            icon=marketing_data.get('icon'),
-                        ),
-                        operations=OperationsAnalysis(
-                            flow_rate=operations_data.get('flow_rate', 'Fast'),
-                            label=operations_data.get('label', 'Normal'),
-                            detail=operations_data.get('detail'),
-                            icon=operations_data.get('icon'),
-                        ),
-                    ),
-                )
-                annotations.append(annotation)
-            except Exception as e:
-                logger.warning(f"[Video Analysis] Skipping invalid annotation: {e}")
-                continue
-
-        # If no valid annotations, fall back to demo
-        if not annotations:
-            logger.warning("[Video Analysis] No valid annotations, using demo")
-            annotations = DEMO_ANNOTATIONS
-
-        # Now run technical analysis for signs & navigation
-        technical_annotations: List[TechnicalAnnotation] = []
         try:
-            logger.info("[Video Analysis] Starting technical analysis for signs & navigation...")
-            raw_technical = await analyzer.analyze_technical(
+            raw_annotations = await analyzer.analyze_video(
                 video_url=request.video_url,
+                custom_prompt=request.analysis_prompt,
                 video_duration_seconds=request.video_duration_seconds
             )
+        except BaseException:
+            technical_task.cancel()
+            raise
 
-            for tech_ann in raw_technical:
-                try:
-                    # Parse signs detected
-                    signs = []
-                    for sign in tech_ann.get('signs_detected', []):
-                        signs.append(SignageAnalysis(
-                            sign_text=sign.get('sign_text', 'Unknown'),
-                            sign_type=sign.get('sign_type', 'informational'),
-                            visibility_score=min(10, max(1, sign.get('visibility_score', 5))),
-                            readability=sign.get('readability', 'moderate'),
-                            location_description=sign.get('location_description', 'Unknown'),
-                            issues=sign.get('issues', [])
-                        ))
-
-                    # Parse agent behavior
-                    agent_data = tech_ann.get('agent_behavior', {})
-                    agent_behavior = AgentBehaviorAnalysis(
-                        agent_count=agent_data.get('agent_count', 0),
-                        static_spectators=agent_data.get('static_spectators', 0),
-                        transit_passengers=agent_data.get('transit_passengers', 0),
-                        avg_velocity=agent_data.get('avg_velocity', 'moderate'),
-                        dominant_gaze_target=agent_data.get('dominant_gaze_target'),
-                        awe_struck_count=agent_data.get('awe_struck_count', 0),
-                        conversion_opportunities=agent_data.get('conversion_opportunities', 0)
-                    ) if agent_data else None
-
-                    # Parse objects
-                    obj_data = tech_ann.get('objects', {})
-                    objects = ObjectDetection(
-                        luggage_trolleys=obj_data.get('luggage_trolleys', 0),
-                        smartphones_cameras=obj_data.get('smartphones_cameras', 0),
-                        strollers=obj_data.get('strollers', 0),
-                        wheelchairs=obj_data.get('wheelchairs', 0),
-                        shopping_bags=obj_data.get('shopping_bags', 0)
-                    ) if obj_data else None
-
-                    tech_annotation = TechnicalAnnotation(
-                        id=tech_ann.get('id', str(uuid.uuid4())),
-                        timestamp_start=tech_ann.get('timestamp_start', '00:00'),
-                        timestamp_end=tech_ann.get('timestamp_end', '00:30'),
-                        linked_annotation_id=tech_ann.get('linked_annotation_id'),
-                        signs_detected=signs,
-                        agent_behavior=agent_behavior,
-                        objects=objects,
-                        navigational_stress_score=min(100, max(0, tech_ann.get('navigational_stress_score', 0))),
-                        purchase_intent_score=min(100, max(0, tech_ann.get('purchase_intent_score', 0))),
-                        attention_availability=min(100, max(0, tech_ann.get('attention_availability', 100))),
-                        summary=tech_ann.get('summary', 'Technical analysis')
-                    )
-                    technical_annotations.append(tech_annotation)
-                except Exception as e:
-                    logger.warning(f"[Video Analysis] Skipping invalid technical annotation: {e}")
-                    continue
+        annotations = _build_video_annotations(raw_annotations)
+
+        technical_annotations: List[TechnicalAnnotation] = []
+        try:
+            raw_technical = await technical_task
+            technical_annotations = _build_technical_annotations(raw_technical)
 
             logger.info(f"[Video Analysis] Generated {len(technical_annotations)} technical annotations")
         except Exception as e:
             logger.warning(f"[Video Analysis] Technical analysis failed: {e}")
             # Continue without technical annotations
 
-        # Calculate duration analyzed
-        if annotations:
-            last_ts = annotations[-1].timestamp_end
-            duration_analyzed = last_ts
-        else:
-            duration_analyzed = "0:00"
+        response = _analysis_response(request, video_id, annotations, technical_annotations)
 
-        response = VideoAnalysisResponse(
-            success=True,
-            video_url=request.video_url,
-            video_id=video_id,
-            annotations=annotations,
-            technical_annotations=technical_annotations,
-            analysis_metadata=AnalysisMetadata(
-                total_annotations=len(annotations),
-                duration_analyzed=duration_analyzed,
-                model_used=os.getenv("GEMINI_VIDEO_MODEL", "gemini-3-flash-preview"),
-                processed_at=datetime.now(timezone.utc).isoformat(),
-            ),
-        )
-
-        logger.info(f"[Video Analysis] Generated {len(annotations)} annotations + {len(technical_annotations)} technical")
+        logger.info(f"[Video Analysis] Generated {len(response.annotations)} annotations + {len(technical_annotations)} technical")
         return response
 
     except Exception as e:
         logger.exception(f"[Video Analysis] Gemini analysis failed: {e}")
         # Return demo data on error with error info
-        return VideoAnalysisResponse(
-            success=True,
-            video_url=request.video_url,
-            video_id=video_id,
-            annotations=DEMO_ANNOTATIONS,
-            analysis_metadata=AnalysisMetadata(
-                total_annotations=len(DEMO_ANNOTATIONS),
-                duration_analyzed="1:00",
-                model_used=f"gemini-3-flash-preview (fallback: {str(e)[:50]})",
-                processed_at=datetime.now(timezone.utc).isoformat(),
-            ),
-        )
+        return _demo_response(request, video_id, f"fallback: {str(e)[:50]}")
 
+
+@router.post("/video-analysis/stream")
+async def stream_video_analysis(request: VideoAnalysisRequest) -> StreamingResponse:
+    """Analyze a video and stream segment results as they finish.
+
+    Same analysis as ``/video-analysis``, as a Server-Sent Events stream. For
+    chunked videos every finished segment is sent as a ``segment`` event
+    (``kind`` is ``annotations`` or ``technical``), in completion order. The
+    last event is ``complete`` with the full ``VideoAnalysisResponse``, whose
+    annotations are stitched in video order with boundary duplicates merged.
+    Short videos, demo mode and failures only send ``complete``.
+    """
+    analyzer = get_video_analyzer()
+    duration = request.video_duration_seconds
+    chunked = bool(duration and duration > SEGMENT_SIZE)
+
+    def sse(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    async def event_stream():
+        if request.use_demo or not analyzer.is_available() or not chunked:
+            response = await analyze_video(request)
+            yield sse("complete", response.model_dump(mode="json"))
+            return
+
+        video_id = _extract_video_id(request.video_url)
+        windows = analyzer._segment_windows(duration)
+        segments = {
+            "annotations": [[] for _ in windows],
+            "technical": [[] for _ in windows],
+        }
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce(kind: str) -> None:
+            try:
+                async for index, raw in analyzer.iter_segments(kind, request.video_url, duration):
+                    segments[kind][index] = raw
+                    await queue.put((kind, index, None))
+                await queue.put((kind, None, None))
+            except Exception as e:
+                await queue.put((kind, None, e))
+
+        producers = [asyncio.create_task(produce(kind)) for kind in segments]
+        try:
+            pending = len(producers)
+            while pending:
+                kind, index, error = await queue.get()
+                if index is None:
+                    pending -= 1
+                    if error is None:
+                        continue
+                    if kind == "annotations":
+                        raise error
+                    logger.warning(f"[Video Analysis] Technical analysis failed: {error}")
+                    segments["technical"] = [[] for _ in windows]
+                    continue
+
+                build = (
+                    _build_video_annotations
+                    if kind == "annotations"
+                    else _build_technical_annotations
+                )
+                start_offset, end_offset = windows[index]
+                yield sse("segment", {
+                    "kind": kind,
+                    "segment": index,
+                    "total_segments": len(windows),
+                    "start_seconds": start_offset,
+                    "end_seconds": end_offset,
+                    "annotations": [
+                        a.model_dump(mode="json") for a in build(segments[kind][index])
+                    ],
+                })
+
+            response = _analysis_response(
+                request,
+                video_id,
+                _build_video_annotations(
+                    analyzer.stitch_segments(segments["annotations"], windows)
+                ),
+                _build_technical_annotations(
+                    analyzer.stitch_segments(segments["technical"], windows)
+                ),
+            )
+        except Exception as e:
+            logger.exception(f"[Video Analysis] Gemini analysis failed: {e}")
+            response = _demo_response(request, video_id, f"fallback: {str(e)[:50]}")
+        finally:
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+
+        yield sse("complete", response.model_dump(mode="json"))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -15,8 +15,10 @@ from typing import Optional, Dict, Any
 
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
+from pydantic_ai.models import Model
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
+from backend.services.llm.concurrency_governor import governed_model
 
 from backend.api.precall.models import (
     CallIntelligence,
@@ -30,14 +32,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "models/gemini-3-flash-preview"
 
 
-def get_gemini_model() -> GoogleModel:
-    """Get a configured GoogleModel instance using GoogleProvider."""
+def get_gemini_model() -> Model:
+    """Get a configured, governed GoogleModel instance using GoogleProvider."""
     api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Neither GEMINI_API_KEY nor GOOGLE_API_KEY environment variable is set")
 
     provider = GoogleProvider(api_key=api_key)
-    return GoogleModel(DEFAULT_MODEL, provider=provider)
+    return governed_model(GoogleModel(DEFAULT_MODEL, provider=provider))
 
 
 # ============================================================================
@@ -119,7 +121,7 @@ class IntelligenceAgent:
     Accepts flexible input formats (AxPersona, CRM, meeting notes, etc.)
     """
 
-    def __init__(self, model: Optional[GoogleModel] = None):
+    def __init__(self, model: Optional[Model] = None):
         self.model = model or get_gemini_model()
         self.agent = Agent(
             model=self.model,
@@ -235,7 +237,7 @@ class CoachingAgent:
     Provides contextual guidance based on any JSON prospect data and intelligence.
     """
 
-    def __init__(self, model: Optional[GoogleModel] = None):
+    def __init__(self, model: Optional[Model] = None):
         self.model = model or get_gemini_model()
         # For coaching, we use plain text output (no structured type)
         self.agent = Agent(
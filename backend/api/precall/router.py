@@ -27,6 +27,7 @@ from backend.api.precall.models import (
     CallIntelligence,
 )
 from backend.api.precall.agents import IntelligenceAgent, CoachingAgent
+from backend.infrastructure.storage import store_data_uri
 from backend.services.generative.gemini_image_service import GeminiImageService
 from backend.services.generative.gemini_search_service import GeminiSearchService
 
@@ -298,6 +299,7 @@ class PersonaImageResponse(BaseModel):
     """Response containing generated persona image."""
     success: bool = True
     image_data_uri: Optional[str] = Field(None, description="Base64 data URI of the generated image")
+    image_url: Optional[str] = Field(None, description="Cacheable blob URL of the generated image")
     error: Optional[str] = None
 
 
@@ -307,7 +309,8 @@ async def generate_persona_image(request: PersonaImageRequest) -> PersonaImageRe
     Generate an avatar image for a stakeholder persona using Gemini image generation.
 
     Creates a professional workplace portrait based on persona details.
-    Returns a base64 data URI that can be used directly in img src.
+    Returns a base64 data URI that can be used directly in img src, and the
+    URL of the same image in the blob store for clients that persist it.
     """
     try:
         logger.info(f"Generating persona image for: {request.persona_name} ({request.persona_role})")
@@ -448,9 +451,15 @@ async def generate_persona_image(request: PersonaImageRequest) -> PersonaImageRe
         if b64_image:
             data_uri = f"data:image/png;base64,{b64_image}"
             logger.info(f"Successfully generated image for {request.persona_name}")
+            try:
+                image_url = store_data_uri(data_uri)
+            except Exception as e:
+                logger.warning(f"Failed to store persona image blob: {e}")
+                image_url = None
             return PersonaImageResponse(
                 success=True,
-                image_data_uri=data_uri
+                image_data_uri=data_uri,
+                image_url=image_url,
             )
         else:
             logger.warning(f"Image generation returned no data for {request.persona_name}")
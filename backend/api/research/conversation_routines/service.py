@@ -10,8 +10,10 @@ import os
 from typing import Dict, Any, List, Optional
 from pydantic_ai import Agent
 from pydantic_ai.tools import Tool
+from pydantic_ai.models import Model
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
+from backend.services.llm.concurrency_governor import governed_model
 
 from .models import (
     ConversationRoutineRequest,
@@ -49,18 +51,20 @@ class ConversationRoutineService:
         self._pydantic_ai_model = self._create_pydantic_ai_model()
         self.agent = self._create_agent()
 
-    def _create_pydantic_ai_model(self) -> GoogleModel:
+    def _create_pydantic_ai_model(self) -> Model:
         """Create a PydanticAI GoogleModel with proper provider configuration.
 
         Returns:
-            GoogleModel: Configured model for PydanticAI Agent
+            Model: Configured GoogleModel, governed, for PydanticAI Agent
         """
         api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("Neither GEMINI_API_KEY nor GOOGLE_API_KEY environment variable is set")
 
         provider = GoogleProvider(api_key=api_key)
-        model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        model = governed_model(
+            GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        )
         logger.info("[CONVERSATION_ROUTINES] Initialized GoogleModel for PydanticAI agent")
         return model
 
@@ -122,16 +126,6 @@ class ConversationRoutineService:
         ) -> Dict[str, Any]:
             """Generate comprehensive stakeholder-based research questions"""
             try:
-                # Clear LLM cache to prevent stale questionnaire data
-                from backend.services.processing.llm_request_cache import (
-                    LLMRequestCache,
-                )
-
-                LLMRequestCache.clear_cache()
-                logger.info(
-                    "🧹 Cleared LLM request cache to prevent stale questionnaire data"
-                )
-
                 logger.info(
                     f"🎯 Generating stakeholder questions for: {business_idea[:50]}..."
                 )
@@ -336,14 +330,6 @@ JSON array:
     ) -> Dict[str, Any]:
         """Generate comprehensive stakeholder-based research questions"""
         try:
-            # Clear LLM cache to prevent stale questionnaire data
-            from backend.services.processing.llm_request_cache import LLMRequestCache
-
-            LLMRequestCache.clear_cache()
-            logger.info(
-                "🧹 Cleared LLM request cache to prevent stale questionnaire data"
-            )
-
             logger.info(
                 f"🎯 Generating stakeholder questions for: {business_idea[:50]}..."
             )
@@ -31,6 +31,7 @@ from .services.file_processor import (
 )
 from backend.utils.structured_logger import request_start, request_end, request_error
 from pydantic_ai.models.google import GoogleModel
+from backend.services.llm.concurrency_governor import governed_model
 from backend.models import User
 from backend.services.external.auth_middleware import get_current_user
 
@@ -371,9 +372,9 @@ async def get_simulation_progress(
                 from backend.infrastructure.persistence.simulation_repository import (
                     SimulationRepository,
                 )
-                from backend.database import SessionLocal
+                from backend.database import get_async_session_factory
 
-                async with UnitOfWork(SessionLocal) as uow:
+                async with UnitOfWork(get_async_session_factory()) as uow:
                     simulation_repo = SimulationRepository(uow.session)
                     db_simulation = await simulation_repo.get_by_simulation_id(simulation_id)
 
@@ -473,11 +474,11 @@ async def list_completed_simulations() -> Dict[str, Any]:
         from backend.infrastructure.persistence.simulation_repository import (
             SimulationRepository,
         )
-        from backend.database import SessionLocal
+        from backend.database import get_async_session_factory
 
         db_completed = {}
         try:
-            async with UnitOfWork(SessionLocal) as uow:
+            async with UnitOfWork(get_async_session_factory()) as uow:
                 simulation_repo = SimulationRepository(uow.session)
                 db_simulations = await simulation_repo.get_completed_simulations()
 
@@ -580,7 +581,7 @@ async def get_completed_simulation(
     """
     try:
         # First try to get from memory (for recent simulations)
-        result = orchestrator.get_completed_simulation(simulation_id)
+        result = await orchestrator.get_completed_simulation(simulation_id)
 
         if result:
             logger.info(f"Retrieved completed simulation from memory: {simulation_id}")
@@ -597,9 +598,9 @@ async def get_completed_simulation(
             from backend.infrastructure.persistence.simulation_repository import (
                 SimulationRepository,
             )
-            from backend.database import SessionLocal
+            from backend.database import get_async_session_factory
 
-            async with UnitOfWork(SessionLocal) as uow:
+            async with UnitOfWork(get_async_session_factory()) as uow:
                 simulation_repo = SimulationRepository(uow.session)
                 db_simulation = await simulation_repo.get_by_simulation_id(simulation_id)
 
@@ -843,7 +844,9 @@ async def test_persona_generation(
 
         from pydantic_ai.providers.google import GoogleProvider
         provider = GoogleProvider(api_key=api_key)
-        model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        model = governed_model(
+            GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        )
         generator = PersonaGenerator(model)
         personas = await generator.generate_personas(
             stakeholder, business_ctx, sim_config
@@ -888,7 +891,9 @@ async def test_interview_simulation(
 
         from pydantic_ai.providers.google import GoogleProvider
         provider = GoogleProvider(api_key=api_key)
-        model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        model = governed_model(
+            GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        )
         simulator = InterviewSimulator(model)
         interview = await simulator.simulate_interview(
             persona, stakeholder, business_ctx, sim_config
@@ -934,7 +939,9 @@ def get_gemini_model():
     if not api_key:
         raise ValueError("Neither GEMINI_API_KEY nor GOOGLE_API_KEY environment variable is set")
     provider = GoogleProvider(api_key=api_key)
-    return GoogleModel("models/gemini-3-flash-preview", provider=provider)
+    return governed_model(
+        GoogleModel("models/gemini-3-flash-preview", provider=provider)
+    )
 
 
 def get_file_processor():
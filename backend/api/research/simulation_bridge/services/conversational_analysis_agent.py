@@ -31,10 +31,14 @@ from backend.schemas import (
     MultiStakeholderSummary,
 )
 from backend.utils.pydantic_ai_retry import safe_pydantic_ai_call
+from .theme_reduction import reduce_themes, text_windows
 
 
 logger = logging.getLogger(__name__)
 
+# Theme extraction windows of a large file analysed at the same time
+WINDOW_CONCURRENCY = 4
+
 
 # LLM-facing models without recursive structures to keep Gemini JSON Schema simple
 class LLMTheme(BaseModel):
@@ -113,6 +117,12 @@ class AnalysisContext(BaseModel):
         self.current_stage = new_stage
         self.exchange_count += 1
 
+    def complete_stage(self, stage: str):
+        """Record a stage that ran alongside other stages as completed"""
+        if stage not in self.completed_stages:
+            self.completed_stages.append(stage)
+        self.exchange_count += 1
+
     def is_analysis_complete(self) -> bool:
         """Check if analysis workflow is complete"""
         required_stages = [
@@ -132,8 +142,13 @@ class ConversationalAnalysisAgent:
     to generate structured analysis results matching DetailedAnalysisResult schema.
     """
 
-    def __init__(self, gemini_model: GoogleModel):
+    def __init__(
+        self,
+        gemini_model: GoogleModel,
+        max_concurrent_windows: int = WINDOW_CONCURRENCY,
+    ):
         self.model = gemini_model
+        self.max_concurrent_windows = max_concurrent_windows
         # Stage-specific typed agents (PydanticAI v1)
         self.themes_agent = Agent(
             model=self.model,
@@ -295,33 +310,33 @@ class ConversationalAnalysisAgent:
         )
         results.update(themes_result)
 
-        # Stage 2: Pattern Detection
-        context.advance_stage("pattern_detection")
-        patterns_result = await self._detect_patterns_conversational(
-            simulation_text, context
-        )
-        results.update(patterns_result)
+        context.complete_stage("theme_extraction")
 
-        # Stage 3: Stakeholder Analysis
-        context.advance_stage("stakeholder_analysis")
-        stakeholder_result = await self._analyze_stakeholders_conversational(
-            simulation_text, context
-        )
-        results.update(stakeholder_result)
+        # Stages 2-5 only read the simulation text, so they run concurrently
+        stages = {
+            "pattern_detection": self._detect_patterns_conversational,
+            "stakeholder_analysis": self._analyze_stakeholders_conversational,
+            "sentiment_analysis": self._analyze_sentiment_conversational,
+            "persona_generation": self._generate_personas_conversational,
+        }
 
-        # Stage 4: Sentiment Analysis
-        context.advance_stage("sentiment_analysis")
-        sentiment_result = await self._analyze_sentiment_conversational(
-            simulation_text, context
-        )
-        results.update(sentiment_result)
+        async def run_stage(stage: str, analyze) -> Dict[str, Any]:
+            stage_result = await analyze(simulation_text, context)
+            context.complete_stage(stage)
+            return stage_result
 
-        # Stage 5: Persona Generation
-        context.advance_stage("persona_generation")
-        persona_result = await self._generate_personas_conversational(
-            simulation_text, context
-        )
-        results.update(persona_result)
+        tasks = [
+            asyncio.create_task(run_stage(stage, analyze))
+            for stage, analyze in stages.items()
+        ]
+        try:
+            for stage_result in await asyncio.gather(*tasks):
+                results.update(stage_result)
+        finally:
+            # A failed stage fails the analysis; don't keep paying for the rest
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
         # Stage 6: Insight Synthesis
         context.advance_stage("insight_synthesis")
@@ -352,27 +367,24 @@ class ConversationalAnalysisAgent:
             f"Using streaming analysis for large file ({context.data_size} bytes)"
         )
 
-        themes = []
-        enhanced_themes = []
         window_size = 50000  # 50KB windows
         overlap_size = 10000  # 10KB overlap
-        accumulated_themes = {}
+        windows = list(text_windows(simulation_text, window_size, overlap_size))
+        semaphore = asyncio.Semaphore(self.max_concurrent_windows)
+        logger.info(
+            f"Extracting themes from {len(windows)} windows "
+            f"({self.max_concurrent_windows} at a time)"
+        )
 
-        # Process in overlapping windows
-        for start in range(0, len(simulation_text), window_size - overlap_size):
-            end = min(start + window_size, len(simulation_text))
+        async def extract_window(start: int, end: int) -> List[Dict[str, Any]]:
             window_text = simulation_text[start:end]
-
-            # Build conversational prompt with accumulated context
             prompt = f"""
-            Continue theme extraction from simulation data.
-
-            ACCUMULATED THEMES SO FAR: {list(accumulated_themes.keys())}
+            Extract themes from one window of simulation data.
 
             CURRENT DATA WINDOW ({start}-{end}):
             {window_text}
 
-            Extract themes from this window and merge with accumulated themes.
+            Extract the themes present in this window.
             Focus on stakeholder attribution and authentic quote extraction.
 
             Return themes in this JSON format:
@@ -401,21 +413,26 @@ class ConversationalAnalysisAgent:
             """
 
             # Get themes for this window (typed) with retry handling
-            window_result = await safe_pydantic_ai_call(
-                self.themes_agent,
-                prompt,
-                context="themes_streaming_window",
-            )
-            window_themes = [t.model_dump() for t in window_result.themes]
+            async with semaphore:
+                window_result = await safe_pydantic_ai_call(
+                    self.themes_agent,
+                    prompt,
+                    context="themes_streaming_window",
+                )
+            return [t.model_dump() for t in window_result.themes]
 
-            # Merge with accumulated themes
-            accumulated_themes = self._merge_themes(accumulated_themes, window_themes)
+        # Map: windows are independent, so they are analysed concurrently
+        tasks = [asyncio.create_task(extract_window(*window)) for window in windows]
+        try:
+            window_themes = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
-        # Convert accumulated themes to final typed models
-        themes = list(accumulated_themes.values())
-        themes_typed = [
-            t if isinstance(t, Theme) else Theme.model_validate(t) for t in themes
-        ]
+        # Reduce: merge near-duplicate themes found by several windows
+        themes = reduce_themes(window_themes)
+        themes_typed = [Theme.model_validate(t) for t in themes]
 
         return {"themes": themes_typed, "enhanced_themes": []}
 
@@ -727,21 +744,6 @@ class ConversationalAnalysisAgent:
             logger.error(f"Failed to parse stakeholder response: {e}")
             return {"stakeholder_intelligence": None}
 
-    def _merge_themes(self, accumulated: Dict, new_themes: List[Dict]) -> Dict:
-        """Merge new themes with accumulated themes"""
-        for theme in new_themes:
-            theme_name = theme.get("name", "")
-            if theme_name in accumulated:
-                # Merge with existing theme
-                existing = accumulated[theme_name]
-                existing["statements"].extend(theme.get("statements", []))
-                existing["frequency"] = max(
-                    existing["frequency"], theme.get("frequency", 0)
-                )
-            else:
-                accumulated[theme_name] = theme
-        return accumulated
-
     async def _analyze_sentiment_conversational(
         self, simulation_text: str, context: AnalysisContext
     ) -> Dict[str, Any]:
@@ -0,0 +1,79 @@
+"""
+Name reservation for simulated people.
+
+Every simulated person needs a first+last name that is unique across the whole
+simulation. Persona generation used to run one stakeholder at a time so that
+each prompt could list every name used so far. ``NameRegistry`` lets
+stakeholders be generated concurrently instead: prompts still list the names
+reserved so far as a hint, and collisions between stakeholders generated at
+the same time are resolved after generation, when each person's name is
+reserved.
+
+Reservation never awaits, so on one event loop it is atomic: two stakeholders
+finishing at once cannot both claim the same name.
+"""
+
+from typing import Dict, Set
+
+
+class NameRegistry:
+    """Names claimed in one simulation, globally and per stakeholder category."""
+
+    def __init__(self):
+        self.by_category: Dict[str, Set[str]] = {}
+        self.global_names: Set[str] = set()
+
+    @staticmethod
+    def base_name(full_name: str) -> str:
+        """First+last part of ``"First Last, Title"``."""
+        return (full_name or "").split(",")[0].strip()
+
+    def reserve(self, category: str, full_name: str) -> str:
+        """
+        Claim a name for a person of a stakeholder category.
+
+        Returns:
+            The name as given, or a unique variant (middle initial or numeric
+            suffix, title preserved) if its first+last part is already taken
+        """
+        names = self.by_category.setdefault(category, set())
+        base = self.base_name(full_name)
+        if not base:
+            # Fallback: track the full name if parsing failed
+            names.add(full_name)
+            return full_name
+        if base in self.global_names:
+            full_name = self.make_unique(full_name)
+            base = self.base_name(full_name)
+        self.global_names.add(base)
+        names.add(base)
+        return full_name
+
+    def make_unique(self, full_name: str) -> str:
+        """
+        Variant of a name whose first+last part is not taken yet.
+
+        Adds a middle initial (or a numeric suffix when there is no last
+        name) to the part before the comma and keeps the title after it.
+        """
+        base, sep, title = (full_name or "").partition(",")
+        base = base.strip()
+        title = title.strip()
+        suffix_title = f", {title}" if sep and title else ""
+        parts = base.split()
+        # Try adding middle initial variations if we have First and Last
+        if len(parts) >= 2:
+            first, last = parts[0], parts[-1]
+            for i in range(26):
+                candidate_base = f"{first} {chr(65 + i)}. {last}"
+                if candidate_base not in self.global_names:
+                    return f"{candidate_base}{suffix_title}"
+        # Fallback: append a numeric suffix
+        suffix = 2
+        while f"{base} {suffix}" in self.global_names:
+            suffix += 1
+        return f"{base} {suffix}{suffix_title}"
+
+    def clear(self) -> None:
+        self.by_category.clear()
+        self.global_names.clear()
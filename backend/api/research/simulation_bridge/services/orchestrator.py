@@ -6,13 +6,15 @@ Coordinates persona generation, interview simulation, and data formatting.
 import logging
 import uuid
 import asyncio
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 import os
 from pydantic_ai.models import Model
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
+from backend.services.llm.concurrency_governor import governed_model
 
 from ..models import (
     SimulationRequest,
@@ -29,14 +31,18 @@ from .persona_generator import PersonaGenerator
 from .interview_simulator import InterviewSimulator
 from .parallel_interview_simulator import ParallelInterviewSimulator
 from .data_formatter import DataFormatter
+from .simulation_store import SimulationResultStore
 from backend.infrastructure.persistence.simulation_repository import (
     SimulationRepository,
 )
 from backend.infrastructure.persistence.unit_of_work import UnitOfWork
-from backend.database import SessionLocal
+from backend.database import get_async_session_factory
 
 logger = logging.getLogger(__name__)
 
+# Progress of finished simulations kept for late polls; running ones are kept
+FINISHED_PROGRESS_SIZE = 512
+
 
 class SimulationOrchestrator:
     """Orchestrates the complete simulation process."""
@@ -50,12 +56,14 @@ class SimulationOrchestrator:
         api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if api_key:
             provider = GoogleProvider(api_key=api_key)
-            self.model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+            self.model = governed_model(
+                GoogleModel("models/gemini-3-flash-preview", provider=provider)
+            )
         else:
             # Fallback for tests/offline - will fail at runtime if actually used
             self.model = None
             logger.warning("No GEMINI_API_KEY found - model will fail at runtime")
-        self.persona_generator = PersonaGenerator(self.model)
+        self.persona_generator = PersonaGenerator(self.model, max_concurrent)
         self.interview_simulator = InterviewSimulator(self.model)
         self.parallel_interview_simulator = (
             ParallelInterviewSimulator(self.model, max_concurrent)
@@ -64,9 +72,9 @@ class SimulationOrchestrator:
         )
         self.data_formatter = DataFormatter()
         self.active_simulations: Dict[str, SimulationProgress] = {}
-        self.completed_simulations: Dict[str, SimulationResponse] = (
-            {}
-        )  # Keep for backward compatibility
+        self._finished_progress: "OrderedDict[str, None]" = OrderedDict()
+        # Bounded: older results spill to disk and are rehydrated on access
+        self.completed_simulations = SimulationResultStore()
         self.use_parallel = use_parallel
 
     async def parse_raw_questionnaire(self, content: str, config) -> SimulationRequest:
@@ -233,29 +241,16 @@ class SimulationOrchestrator:
             await self._update_progress(
                 simulation_id, "generating_personas", 10, "Generating AI personas"
             )
-            personas = await self.persona_generator.generate_all_personas(
-                request.questions_data.stakeholders,
-                request.business_context,
-                request.config,
-            )
-            logger.info(
-                f"Generated {len(personas)} personas for simulation {simulation_id}"
-            )
 
             # Step 2: Simulate interviews (parallel when enabled)
-            await self._update_progress(
-                simulation_id,
-                "simulating_interviews",
-                30,
-                "Conducting simulated interviews",
-            )
-
             if self.use_parallel and self.parallel_interview_simulator:
                 # Use parallel processing with progress updates
                 def progress_callback(message: str, completed: int, total: int, failed: int):
                     # Map completed count into a 30-70% progress window, mirroring
                     # the enhanced simulate_with_persistence implementation.
-                    progress_pct = 30 + int((completed / max(total, 1)) * 40)
+                    progress_pct = 30 + int(
+                        (completed / max(total, total_personas, 1)) * 40
+                    )
                     asyncio.create_task(
                         self._update_progress_with_counts(
                             simulation_id,
@@ -267,14 +262,22 @@ class SimulationOrchestrator:
                         )
                     )
 
-                interviews = await self.parallel_interview_simulator.simulate_all_interviews_parallel(
-                    personas,
+                # Interviews of a stakeholder start as soon as its personas exist
+                personas, interviews = await self._generate_and_interview(
+                    simulation_id, request, progress_callback
+                )
+            else:
+                personas = await self.persona_generator.generate_all_personas(
                     request.questions_data.stakeholders,
                     request.business_context,
                     request.config,
-                    progress_callback,
                 )
-            else:
+                await self._update_progress(
+                    simulation_id,
+                    "simulating_interviews",
+                    30,
+                    "Conducting simulated interviews",
+                )
                 # Fallback to sequential processing when parallel mode is disabled
                 interviews = await self.interview_simulator.simulate_all_interviews(
                     personas,
@@ -284,7 +287,8 @@ class SimulationOrchestrator:
                 )
 
             logger.info(
-                f"Generated {len(interviews)} interviews for simulation {simulation_id}"
+                f"Generated {len(personas)} personas and {len(interviews)} interviews "
+                f"for simulation {simulation_id}"
             )
 
             # Step 3: Generate insights
@@ -327,7 +331,7 @@ class SimulationOrchestrator:
             )
 
             # Save completed simulation for later retrieval
-            self.completed_simulations[simulation_id] = response
+            await self.completed_simulations.put_async(simulation_id, response)
 
             logger.info(f"Simulation completed successfully: {simulation_id}")
             logger.info(f"Saved simulation results for ID: {simulation_id}")
@@ -379,7 +383,7 @@ class SimulationOrchestrator:
             logger.info(f"📊 Active simulations count: {len(self.active_simulations)}")
 
             # Initialize database connection
-            async with UnitOfWork(SessionLocal) as uow:
+            async with UnitOfWork(get_async_session_factory()) as uow:
                 simulation_repo = SimulationRepository(uow.session)
 
                 # Create simulation record
@@ -406,39 +410,17 @@ class SimulationOrchestrator:
             await self._update_progress(
                 simulation_id, "generating_personas", 10, "Generating AI personas"
             )
-            personas = await self.persona_generator.generate_all_personas(
-                request.questions_data.stakeholders,
-                request.business_context,
-                request.config,
-            )
-
-            # Update progress with completed personas
-            await self._update_progress_with_counts(
-                simulation_id,
-                "generating_personas",
-                25,
-                f"Generated {len(personas)} AI personas",
-                completed_personas=len(personas),
-            )
-
-            logger.info(
-                f"Generated {len(personas)} personas for simulation {simulation_id}"
-            )
 
             # Step 2: Simulate interviews (parallel or sequential)
-            await self._update_progress(
-                simulation_id,
-                "simulating_interviews",
-                30,
-                "Conducting simulated interviews",
-            )
-
             if self.use_parallel and self.parallel_interview_simulator:
                 # Use parallel processing
                 def progress_callback(
                     message: str, completed: int, total: int, failed: int
                 ):
-                    progress = 30 + int((completed / total) * 40)  # 30-70% range
+                    # 30-70% range
+                    progress = 30 + int(
+                        (completed / max(total, total_personas, 1)) * 40
+                    )
                     asyncio.create_task(
                         self._update_progress_with_counts(
                             simulation_id,
@@ -450,14 +432,32 @@ class SimulationOrchestrator:
                         )
                     )
 
-                interviews = await self.parallel_interview_simulator.simulate_all_interviews_parallel(
-                    personas,
+                # Interviews of a stakeholder start as soon as its personas exist
+                personas, interviews = await self._generate_and_interview(
+                    simulation_id, request, progress_callback
+                )
+            else:
+                personas = await self.persona_generator.generate_all_personas(
                     request.questions_data.stakeholders,
                     request.business_context,
                     request.config,
-                    progress_callback,
                 )
-            else:
+
+                # Update progress with completed personas
+                await self._update_progress_with_counts(
+                    simulation_id,
+                    "generating_personas",
+                    25,
+                    f"Generated {len(personas)} AI personas",
+                    completed_personas=len(personas),
+                )
+                await self._update_progress(
+                    simulation_id,
+                    "simulating_interviews",
+                    30,
+                    "Conducting simulated interviews",
+                )
+
                 # Use sequential processing (fallback)
                 interviews = await self.interview_simulator.simulate_all_interviews(
                     personas,
@@ -467,7 +467,8 @@ class SimulationOrchestrator:
                 )
 
             logger.info(
-                f"Generated {len(interviews)} interviews for simulation {simulation_id}"
+                f"Generated {len(personas)} personas and {len(interviews)} interviews "
+                f"for simulation {simulation_id}"
             )
 
             # Step 3: Generate insights
@@ -503,7 +504,7 @@ class SimulationOrchestrator:
                 simulation_id, "saving_results", 95, "Saving results to database"
             )
 
-            async with UnitOfWork(SessionLocal) as uow:
+            async with UnitOfWork(get_async_session_factory()) as uow:
                 simulation_repo = SimulationRepository(uow.session)
                 await simulation_repo.update_simulation_results(
                     simulation_id=simulation_id,
@@ -544,7 +545,7 @@ class SimulationOrchestrator:
             )
 
             # Keep in memory for backward compatibility
-            self.completed_simulations[simulation_id] = response
+            await self.completed_simulations.put_async(simulation_id, response)
 
             logger.info(f"Enhanced simulation completed successfully: {simulation_id}")
             return response
@@ -554,7 +555,7 @@ class SimulationOrchestrator:
 
             # Mark as failed in database
             try:
-                async with UnitOfWork(SessionLocal) as uow:
+                async with UnitOfWork(get_async_session_factory()) as uow:
                     simulation_repo = SimulationRepository(uow.session)
                     await simulation_repo.mark_simulation_failed(simulation_id, str(e))
                     await uow.commit()
@@ -574,7 +575,7 @@ class SimulationOrchestrator:
             )
         finally:
             # Keep progress tracking for a bit longer to allow frontend to read final status
-            # Don't immediately delete - let it be cleaned up later or by explicit calls
+            # Don't immediately delete - _retire_progress drops the oldest finished ones
             pass
 
     async def _generate_insights(
@@ -697,6 +698,60 @@ class SimulationOrchestrator:
 
         return opportunities
 
+    async def _generate_and_interview(
+        self,
+        simulation_id: str,
+        request: SimulationRequest,
+        progress_callback: Callable[[str, int, int, int], None],
+    ) -> Tuple[List[AIPersona], List[SimulatedInterview]]:
+        """Generate personas and interview them as a pipeline.
+
+        Stakeholders are generated concurrently and each stakeholder's
+        interviews start as soon as its personas exist, instead of after all
+        personas are done.
+
+        Returns:
+            Personas in questionnaire stakeholder order and their interviews
+            in the same order
+        """
+        stakeholders = request.questions_data.stakeholders
+        generated: Dict[int, List[AIPersona]] = {}
+
+        async def persona_batches():
+            async for stakeholder, people in self.persona_generator.iter_people(
+                stakeholders, request.business_context, request.config
+            ):
+                if not generated:
+                    await self._update_progress(
+                        simulation_id,
+                        "simulating_interviews",
+                        30,
+                        "Conducting simulated interviews",
+                    )
+                generated[id(stakeholder)] = people
+                progress = self.active_simulations.get(simulation_id)
+                if progress is not None:
+                    progress.completed_people = sum(map(len, generated.values()))
+                yield people
+
+        interviews = await self.parallel_interview_simulator.simulate_interviews_as_ready(
+            persona_batches(),
+            stakeholders,
+            request.business_context,
+            request.config,
+            progress_callback,
+        )
+
+        personas = [
+            persona
+            for stakeholder_list in stakeholders.values()
+            for stakeholder in stakeholder_list
+            for persona in generated.get(id(stakeholder), [])
+        ]
+        position = {persona.id: i for i, persona in enumerate(personas)}
+        interviews.sort(key=lambda i: position.get(i.person_id, len(position)))
+        return personas, interviews
+
     def _calculate_total_personas(self, request: SimulationRequest) -> int:
         """Calculate total number of personas to be generated."""
         total_stakeholders = sum(
@@ -715,9 +770,19 @@ class SimulationOrchestrator:
             progress.progress_percentage = percentage
             progress.current_task = task
             progress.estimated_time_remaining = self._calculate_remaining_time(progress)
+            if stage in ("completed", "failed"):
+                self._retire_progress(simulation_id)
 
             logger.info(f"Simulation {simulation_id}: {percentage}% - {task}")
 
+    def _retire_progress(self, simulation_id: str) -> None:
+        """Keep only the most recent finished progress entries."""
+        self._finished_progress[simulation_id] = None
+        self._finished_progress.move_to_end(simulation_id)
+        while len(self._finished_progress) > FINISHED_PROGRESS_SIZE:
+            old_id, _ = self._finished_progress.popitem(last=False)
+            self.active_simulations.pop(old_id, None)
+
     async def _update_progress_with_counts(
         self,
         simulation_id: str,
@@ -804,36 +869,18 @@ class SimulationOrchestrator:
             return True
         return False
 
-    def get_completed_simulation(
+    async def get_completed_simulation(
         self, simulation_id: str
     ) -> Optional[SimulationResponse]:
         """Get a completed simulation result."""
-        return self.completed_simulations.get(simulation_id)
+        return await self.completed_simulations.get_async(simulation_id)
 
     def list_completed_simulations(self) -> Dict[str, Dict[str, Any]]:
         """List all completed simulations with basic info."""
-        return {
-            sim_id: {
-                "simulation_id": response.simulation_id,
-                "success": response.success,
-                "message": response.message,
-                "created_at": (
-                    response.metadata.get("created_at") if response.metadata else None
-                ),
-                "total_personas": (
-                    response.metadata.get("total_personas") if response.metadata else 0
-                ),
-                "total_interviews": (
-                    response.metadata.get("total_interviews")
-                    if response.metadata
-                    else 0
-                ),
-            }
-            for sim_id, response in self.completed_simulations.items()
-        }
+        return self.completed_simulations.summaries()
 
     def clear_memory_cache(self) -> None:
-        """Clear the in-memory simulation cache."""
+        """Clear the cached simulation results, in memory and spilled to disk."""
         self.completed_simulations.clear()
         logger.info("Cleared orchestrator memory cache")
 
@@ -842,4 +889,5 @@ class SimulationOrchestrator:
         return {
             "cached_simulations": list(self.completed_simulations.keys()),
             "cache_size": len(self.completed_simulations),
+            "store": self.completed_simulations.stats(),
         }
@@ -5,7 +5,8 @@ Parallel Interview Simulator for improved performance and scalability.
 import logging
 import asyncio
 import random
-from typing import List, Dict, Any, Optional, Callable
+from collections import OrderedDict
+from typing import AsyncIterable, List, Dict, Any, Optional, Callable
 from concurrent.futures import ThreadPoolExecutor
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
@@ -21,6 +22,9 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Interviews kept for identical persona/stakeholder/context requests
+INTERVIEW_CACHE_SIZE = 256
+
 
 class ParallelInterviewSimulator:
     """
@@ -36,7 +40,7 @@ class ParallelInterviewSimulator:
             system_prompt=self._get_system_prompt(),
         )
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._response_cache = {}  # Simple in-memory cache
+        self._response_cache: "OrderedDict[str, SimulatedInterview]" = OrderedDict()
 
     def _get_system_prompt(self) -> str:
         return """You are an expert interview simulator that generates realistic customer interview responses.
@@ -102,6 +106,7 @@ Return a complete SimulatedInterview object with all responses and metadata."""
             )
             if cache_key in self._response_cache:
                 logger.info(f"Using cached response for {persona.name}")
+                self._response_cache.move_to_end(cache_key)
                 return self._response_cache[cache_key]
 
             prompt = self._build_interview_prompt(
@@ -156,8 +161,11 @@ Return a complete SimulatedInterview object with all responses and metadata."""
                 interview.responses
             )
 
-            # Cache the result
+            # Cache the result, evicting the least recently used interviews
             self._response_cache[cache_key] = interview
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > INTERVIEW_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
             if progress_callback:
                 progress_callback(f"Completed interview with {persona.name}", 100)
@@ -196,37 +204,51 @@ Return a complete SimulatedInterview object with all responses and metadata."""
             List of completed interviews
         """
 
-        logger.info(
-            f"Starting parallel interview simulation for {len(personas)} personas"
+        async def single_batch():
+            yield personas
+
+        return await self.simulate_interviews_as_ready(
+            single_batch(), stakeholders, business_context, config, progress_callback
         )
 
+    async def simulate_interviews_as_ready(
+        self,
+        persona_batches: AsyncIterable[List[AIPersona]],
+        stakeholders: Dict[str, List[Stakeholder]],
+        business_context: BusinessContext,
+        config: SimulationConfig,
+        progress_callback: Optional[Callable[[str, int, int, int], None]] = None,
+    ) -> List[SimulatedInterview]:
+        """
+        Simulate interviews for batches of personas as the batches arrive.
+
+        Interviews of a batch start as soon as it is yielded, so interviews for
+        one stakeholder can run while personas of other stakeholders are still
+        being generated. Concurrency is still capped by ``max_concurrent``.
+
+        Args:
+            persona_batches: Async iterable of persona lists, e.g. one per stakeholder
+            stakeholders: Stakeholder data
+            business_context: Business context
+            config: Simulation configuration
+            progress_callback: Optional callback for progress updates
+                (message, completed, total, failed); total counts the
+                interviews started so far
+
+        Returns:
+            List of completed interviews, in the order the personas arrived
+        """
+
         # Create stakeholder lookup using stakeholder names
         stakeholder_lookup = {}
         for category, stakeholder_list in stakeholders.items():
             for stakeholder in stakeholder_list:
                 stakeholder_lookup[stakeholder.name] = stakeholder
 
-        # Filter personas that have matching stakeholders
-        valid_personas = []
-        for persona in personas:
-            if persona.stakeholder_type in stakeholder_lookup:
-                valid_personas.append(
-                    (persona, stakeholder_lookup[persona.stakeholder_type])
-                )
-            else:
-                logger.warning(
-                    f"No stakeholder found for persona {persona.name} with type {persona.stakeholder_type}"
-                )
-
-        if not valid_personas:
-            logger.warning("No valid personas found for simulation")
-            return []
-
-        # Create tasks for parallel execution
         tasks = []
         completed_count = 0
         failed_count = 0
-        total_count = len(valid_personas)
+        total_count = 0
 
         def create_progress_callback(persona_name: str):
             def callback(message: str, progress: int):
@@ -240,24 +262,48 @@ Return a complete SimulatedInterview object with all responses and metadata."""
 
             return callback
 
-        for persona, stakeholder in valid_personas:
-            task = self.simulate_interview_with_semaphore(
-                persona,
-                stakeholder,
-                business_context,
-                config,
-                create_progress_callback(persona.name),
-            )
-            tasks.append(task)
+        try:
+            async for personas in persona_batches:
+                logger.info(
+                    f"Starting parallel interview simulation for {len(personas)} personas"
+                )
+                # Filter personas that have matching stakeholders
+                for persona in personas:
+                    if persona.stakeholder_type not in stakeholder_lookup:
+                        logger.warning(
+                            f"No stakeholder found for persona {persona.name} with type {persona.stakeholder_type}"
+                        )
+                        continue
+                    total_count += 1
+                    task = asyncio.create_task(
+                        self.simulate_interview_with_semaphore(
+                            persona,
+                            stakeholder_lookup[persona.stakeholder_type],
+                            business_context,
+                            config,
+                            create_progress_callback(persona.name),
+                        )
+                    )
+                    tasks.append((persona, task))
+        except BaseException:
+            for _, task in tasks:
+                task.cancel()
+            raise
+
+        if not tasks:
+            logger.warning("No valid personas found for simulation")
+            return []
 
         # Execute all tasks with error handling
         results = []
-        completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
+        completed_tasks = await asyncio.gather(
+            *(task for _, task in tasks), return_exceptions=True
+        )
 
-        for i, result in enumerate(completed_tasks):
+        for (persona, _), result in zip(tasks, completed_tasks):
             if isinstance(result, Exception):
                 failed_count += 1
-                persona_name = valid_personas[i][0].name
+                persona_name = persona.name
                 logger.error(
                     f"Interview simulation failed for {persona_name}: {str(result)}"
                 )
@@ -367,5 +413,6 @@ Create a realistic interview that feels like a genuine conversation with this pe
         """Get cache statistics."""
         return {
             "cache_size": len(self._response_cache),
+            "max_cache_size": INTERVIEW_CACHE_SIZE,
             "max_concurrent": self.max_concurrent,
         }
@@ -2,9 +2,10 @@
 AI Persona Generator for Interview Simulation.
 """
 
+import asyncio
 import logging
 import uuid
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
 
@@ -15,6 +16,7 @@ from ..models import (
     Stakeholder,
     SimulationConfig,
 )
+from .name_registry import NameRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +24,24 @@ logger = logging.getLogger(__name__)
 class PersonaGenerator:
     """Generates realistic AI personas for interview simulation."""
 
-    def __init__(self, model: Model):
+    def __init__(self, model: Model, max_concurrent: int = 4):
         self.model = model
+        self.max_concurrent = max(1, max_concurrent)
         self.agent = Agent(
             model=model,
             output_type=List[AIPersona],
             system_prompt=self._get_system_prompt(),
         )
-        self.used_names_by_category = {}  # Track used names per stakeholder category
-        self.used_names_global = set()  # Track used first+last names across entire simulation
+        # Names used in the most recent simulation (per category and global)
+        self.name_registry = NameRegistry()
+
+    @property
+    def used_names_by_category(self) -> Dict[str, Set[str]]:
+        return self.name_registry.by_category
+
+    @property
+    def used_names_global(self) -> Set[str]:
+        return self.name_registry.global_names
 
     def _get_system_prompt(self) -> str:
         return """You are an expert persona generator for customer research simulations.
@@ -54,15 +65,24 @@ Return a list of AIPersona objects with all required fields populated."""
         stakeholder: Stakeholder,
         business_context: BusinessContext,
         config: SimulationConfig,
+        name_registry: Optional[NameRegistry] = None,
     ) -> List[SimulatedPerson]:
-        """Generate individual simulated people for a specific stakeholder type."""
+        """Generate individual simulated people for a specific stakeholder type.
+
+        Names are reserved in ``name_registry`` (the generator's own registry
+        by default); a name already taken by another stakeholder is made
+        unique after generation.
+        """
+        names = name_registry or self.name_registry
 
         try:
             logger.info(
                 f"Generating {config.people_per_stakeholder} people for stakeholder: {stakeholder.name}"
             )
 
-            prompt = self._build_person_prompt(stakeholder, business_context, config)
+            prompt = self._build_person_prompt(
+                stakeholder, business_context, config, names
+            )
             logger.info(f"Person generation prompt: {prompt[:200]}...")
 
             # Try with retry logic for Gemini API issues
@@ -108,10 +128,8 @@ Keep responses concise and realistic."""
                     f"Expected {config.people_per_stakeholder} people, got {len(people)}"
                 )
 
-            # Add IDs and stakeholder type, track names for uniqueness
+            # Add IDs and stakeholder type, reserve names for uniqueness
             stakeholder_key = f"{stakeholder.name}_{stakeholder.description}"
-            if stakeholder_key not in self.used_names_by_category:
-                self.used_names_by_category[stakeholder_key] = set()
 
             for person in people:
                 person.id = str(uuid.uuid4())
@@ -122,26 +140,16 @@ Keep responses concise and realistic."""
                 )
 
                 # Enforce global uniqueness on first+last (before comma)
-                base_name = person.name.split(',')[0].strip() if person.name else ""
-                if base_name and base_name in self.used_names_global:
-                    original = person.name
-                    person.name = self._make_unique_full_name(person.name)
+                original = person.name
+                person.name = names.reserve(stakeholder_key, person.name)
+                if person.name != original:
                     logger.info(f"🔁 Renamed duplicate '{original}' to '{person.name}'")
-                    base_name = person.name.split(',')[0].strip()
-
-                if base_name:
-                    self.used_names_global.add(base_name)
-                    # Track names for uniqueness within stakeholder category too
-                    self.used_names_by_category[stakeholder_key].add(base_name)
-                else:
-                    # Fallback: add full name if parsing failed
-                    self.used_names_by_category[stakeholder_key].add(person.name)
 
             logger.info(
                 f"Successfully generated {len(people)} people for {stakeholder.name}"
             )
             logger.info(
-                f"Used names for {stakeholder.name}: {sorted(self.used_names_by_category[stakeholder_key])}"
+                f"Used names for {stakeholder.name}: {sorted(names.by_category.get(stakeholder_key, ()))}"
             )
             return people
 
@@ -153,44 +161,27 @@ Keep responses concise and realistic."""
         """Create a unique full name by adding a middle initial or numeric suffix.
         Works on the base 'First Last' part before the comma, preserves title after comma.
         """
-        base, sep, title = (full_name or "").partition(',')
-        base = base.strip()
-        title = title.strip()
-        parts = base.split()
-        # Try adding middle initial variations if we have First and Last
-        if len(parts) >= 2:
-            first, last = parts[0], parts[-1]
-            for i in range(26):
-                candidate_base = f"{first} {chr(65 + i)}. {last}"
-                if candidate_base not in getattr(self, 'used_names_global', set()):
-                    return f"{candidate_base}{(', ' + title) if sep and title else ''}"
-        # Fallback: append a numeric suffix
-        suffix = 2
-        while f"{base} {suffix}" in getattr(self, 'used_names_global', set()):
-            suffix += 1
-        candidate_base = f"{base} {suffix}"
-        return f"{candidate_base}{(', ' + title) if sep and title else ''}"
+        return self.name_registry.make_unique(full_name)
 
     def _build_person_prompt(
         self,
         stakeholder: Stakeholder,
         business_context: BusinessContext,
         config: SimulationConfig,
+        name_registry: Optional[NameRegistry] = None,
     ) -> str:
         """Build the prompt for individual person generation."""
+        names = name_registry or self.name_registry
 
         # Include used names to avoid duplicates (category and global)
         used_names_text = ""
         stakeholder_key = f"{stakeholder.name}_{stakeholder.description}"
-        if (
-            stakeholder_key in self.used_names_by_category
-            and self.used_names_by_category[stakeholder_key]
-        ):
-            used_names_text = f"\n\nIMPORTANT: Do NOT use these names (already used for {stakeholder.name}): {', '.join(sorted(self.used_names_by_category[stakeholder_key]))}"
+        if names.by_category.get(stakeholder_key):
+            used_names_text = f"\n\nIMPORTANT: Do NOT use these names (already used for {stakeholder.name}): {', '.join(sorted(names.by_category[stakeholder_key]))}"
 
         used_global_text = ""
-        if getattr(self, 'used_names_global', None):
-            global_list = sorted(list(self.used_names_global))
+        if names.global_names:
+            global_list = sorted(names.global_names)
             if global_list:
                 used_global_text = f"\n\nIMPORTANT: Do NOT reuse these first+last names across ANY stakeholder category in this simulation: {', '.join(global_list)}"
 
@@ -251,42 +242,85 @@ CRITICAL REQUIREMENTS:
 
 The personas should feel like real people who would genuinely interact with this business idea.{used_names_text}{used_global_text}"""
 
-    async def generate_all_people(
+    async def iter_people(
         self,
         stakeholders: Dict[str, List[Stakeholder]],
         business_context: BusinessContext,
         config: SimulationConfig,
-    ) -> List[SimulatedPerson]:
-        """Generate individual people for all stakeholder types."""
+    ) -> AsyncIterator[Tuple[Stakeholder, List[SimulatedPerson]]]:
+        """Generate people for all stakeholder types concurrently.
 
-        # Reset used names for each new simulation
-        self.used_names_by_category.clear()
-        self.used_names_global.clear()
-        all_people = []
+        At most ``max_concurrent`` stakeholders are generated at once. Each
+        call starts a fresh name registry, so names are unique within one
+        simulation. A stakeholder whose generation fails is logged and skipped.
 
-        for stakeholder_category, stakeholder_list in stakeholders.items():
-            logger.info(
-                f"Processing {stakeholder_category} stakeholders: {len(stakeholder_list)} found"
-            )
+        Yields:
+            (stakeholder, people) in completion order
+        """
+        # Reset used names for each new simulation
+        names = NameRegistry()
+        self.name_registry = names
+        slots = asyncio.Semaphore(self.max_concurrent)
 
-            for stakeholder in stakeholder_list:
+        async def run(stakeholder: Stakeholder):
+            async with slots:
                 logger.info(
                     f"Generating people for stakeholder: {stakeholder.name} (ID: {stakeholder.id})"
                 )
                 try:
                     people = await self.generate_people(
-                        stakeholder, business_context, config
-                    )
-                    logger.info(
-                        f"Generated {len(people)} people for {stakeholder.name}"
+                        stakeholder, business_context, config, names
                     )
-                    all_people.extend(people)
                 except Exception as e:
                     logger.error(
                         f"Failed to generate people for {stakeholder.name}: {str(e)}",
                         exc_info=True,
                     )
+                    people = None
+                return stakeholder, people
 
+        tasks = []
+        for stakeholder_category, stakeholder_list in stakeholders.items():
+            logger.info(
+                f"Processing {stakeholder_category} stakeholders: {len(stakeholder_list)} found"
+            )
+            tasks.extend(asyncio.create_task(run(s)) for s in stakeholder_list)
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                stakeholder, people = await next_done
+                if people is None:
+                    continue
+                logger.info(f"Generated {len(people)} people for {stakeholder.name}")
+                yield stakeholder, people
+        finally:
+            # The consumer stopped early: do not leave generations running
+            for task in tasks:
+                task.cancel()
+
+    async def generate_all_people(
+        self,
+        stakeholders: Dict[str, List[Stakeholder]],
+        business_context: BusinessContext,
+        config: SimulationConfig,
+    ) -> List[SimulatedPerson]:
+        """Generate individual people for all stakeholder types.
+
+        Stakeholders are generated concurrently (see ``iter_people``); the
+        result keeps the stakeholder order of the questionnaire.
+        """
+        by_stakeholder: Dict[int, List[SimulatedPerson]] = {}
+        async for stakeholder, people in self.iter_people(
+            stakeholders, business_context, config
+        ):
+            by_stakeholder[id(stakeholder)] = people
+
+        all_people = [
+            person
+            for stakeholder_list in stakeholders.values()
+            for stakeholder in stakeholder_list
+            for person in by_stakeholder.get(id(stakeholder), [])
+        ]
         logger.info(
             f"Generated {len(all_people)} total people across all stakeholder types"
         )
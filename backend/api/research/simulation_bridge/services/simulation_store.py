@@ -0,0 +1,295 @@
+"""
+Bounded store for completed simulation results.
+
+``SimulationOrchestrator`` used to keep every ``SimulationResponse`` (people
+plus every interview transcript) in a plain dict until someone called the
+clear-cache endpoint, so resident memory grew with every simulation the
+process ran.
+
+``SimulationResultStore`` keeps the most recently used results in memory up to
+a byte budget. Results pushed out of memory are compressed into an on-disk
+``SQLiteCacheBackend`` and rehydrated on the next lookup, which also finds
+results spilled before a restart. The async ``put_async``/``get_async`` run
+serialization, compression and disk I/O in a worker thread so multi-MB
+transcripts never block the event loop. Results that were persisted to
+``SimulationData`` are still served from the database by the routers once the
+disk tier has dropped them too.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from backend.infrastructure.config.settings import settings
+from backend.services.llm.response_cache import CacheBackend, SQLiteCacheBackend
+
+from ..models import SimulationResponse
+
+logger = logging.getLogger(__name__)
+
+# Listing summaries kept for resident and spilled simulations
+SUMMARY_INDEX_SIZE = 1024
+
+_KEY_PREFIX = "simulation:"
+
+# (simulation ID, response, its JSON if already serialized)
+_Spill = Tuple[str, SimulationResponse, Optional[Union[str, bytes]]]
+
+
+def summarize(response: SimulationResponse) -> Dict[str, Any]:
+    """Basic info about a completed simulation, as listed by the API."""
+    metadata = response.metadata
+    return {
+        "simulation_id": response.simulation_id,
+        "success": response.success,
+        "message": response.message,
+        "created_at": metadata.get("created_at") if metadata else None,
+        "total_personas": metadata.get("total_personas") if metadata else 0,
+        "total_interviews": metadata.get("total_interviews") if metadata else 0,
+    }
+
+
+class SimulationResultStore:
+    """
+    Completed simulations by ID: a memory LRU over a compressed disk tier.
+
+    Args:
+        max_bytes: Budget for resident results, measured by their JSON size
+        disk: Spill tier; defaults to the SQLite file configured in settings,
+            opened on first use
+    """
+
+    def __init__(
+        self, max_bytes: Optional[int] = None, disk: Optional[CacheBackend] = None
+    ):
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else settings.simulation_store_memory_bytes
+        )
+        self._disk = disk
+        self._disk_unavailable = False
+        self._resident: "OrderedDict[str, Tuple[SimulationResponse, int]]" = (
+            OrderedDict()
+        )
+        self._resident_bytes = 0
+        # Evicted results until their disk write finishes
+        self._spilling: Dict[str, SimulationResponse] = {}
+        self._summaries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.spills = 0
+
+    def __len__(self) -> int:
+        return len(self._resident)
+
+    def put(self, simulation_id: str, response: SimulationResponse) -> None:
+        """Store a completed simulation, spilling older results if needed."""
+        data = response.model_dump_json()
+        self._remember_summary(simulation_id, summarize(response))
+        for spill in self._admit(simulation_id, response, data):
+            self._spilled(spill[0], self._write_spill(*spill))
+
+    async def put_async(self, simulation_id: str, response: SimulationResponse) -> None:
+        """``put`` with serialization and spilling run off the event loop."""
+        data = await asyncio.to_thread(response.model_dump_json)
+        self._remember_summary(simulation_id, summarize(response))
+        for spill in self._admit(simulation_id, response, data):
+            self._spilled(spill[0], await asyncio.to_thread(self._write_spill, *spill))
+
+    def get(self, simulation_id: str) -> Optional[SimulationResponse]:
+        """Return a completed simulation, rehydrating it from disk if spilled."""
+        response = self._get_resident(simulation_id)
+        if response is not None:
+            return response
+        response, spills = self._rehydrated(
+            simulation_id, self._read_spill(simulation_id)
+        )
+        for spill in spills:
+            self._spilled(spill[0], self._write_spill(*spill))
+        return response
+
+    async def get_async(self, simulation_id: str) -> Optional[SimulationResponse]:
+        """``get`` with rehydration and spilling run off the event loop."""
+        response = self._get_resident(simulation_id)
+        if response is not None:
+            return response
+        loaded = await asyncio.to_thread(self._read_spill, simulation_id)
+        response, spills = self._rehydrated(simulation_id, loaded)
+        for spill in spills:
+            self._spilled(spill[0], await asyncio.to_thread(self._write_spill, *spill))
+        return response
+
+    def keys(self) -> List[str]:
+        """IDs of the simulations currently resident in memory."""
+        return list(self._resident)
+
+    def summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Listing info of resident and spilled simulations, oldest first."""
+        return {sim_id: dict(info) for sim_id, info in self._summaries.items()}
+
+    def clear(self) -> int:
+        """Drop every result from memory and disk; returns how many were known."""
+        removed = len(self._summaries.keys() | self._resident.keys())
+        self._resident.clear()
+        self._spilling.clear()
+        self._resident_bytes = 0
+        self._summaries.clear()
+        self._disk_call("clear")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit rates and resident size for monitoring."""
+        lookups = self.hits + self.disk_hits + self.misses
+        disk = self._disk
+        return {
+            "entries": len(self._resident),
+            "resident_bytes": self._resident_bytes,
+            "max_bytes": self.max_bytes,
+            "known_simulations": len(self._summaries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_hit_rate": self.hits / lookups if lookups else 0.0,
+            "spills": self.spills,
+            "disk": disk.stats() if disk is not None else None,
+        }
+
+    @property
+    def disk(self) -> Optional[CacheBackend]:
+        if self._disk is None and not self._disk_unavailable:
+            try:
+                self._disk = SQLiteCacheBackend(
+                    settings.simulation_store_path,
+                    max_bytes=settings.simulation_store_disk_bytes,
+                    ttl=settings.simulation_store_ttl,
+                )
+            except (sqlite3.Error, OSError) as e:
+                # Keep serving from memory; evicted results fall back to the DB
+                logger.warning(f"Simulation result spill storage unavailable: {e}")
+                self._disk_unavailable = True
+        return self._disk
+
+    def _get_resident(self, simulation_id: str) -> Optional[SimulationResponse]:
+        entry = self._resident.get(simulation_id)
+        if entry is not None:
+            self._resident.move_to_end(simulation_id)
+            self.hits += 1
+            return entry[0]
+        response = self._spilling.get(simulation_id)
+        if response is not None:
+            self.hits += 1
+        return response
+
+    def _rehydrated(
+        self,
+        simulation_id: str,
+        loaded: Optional[Tuple[SimulationResponse, bytes]],
+    ) -> Tuple[Optional[SimulationResponse], List[_Spill]]:
+        """Account for a disk lookup; returns the response and what to spill."""
+        if loaded is None:
+            self.misses += 1
+            self._summaries.pop(simulation_id, None)
+            return None, []
+        response, data = loaded
+        self.disk_hits += 1
+        self._remember_summary(simulation_id, summarize(response))
+        return response, self._admit(simulation_id, response, data)
+
+    def _admit(
+        self,
+        simulation_id: str,
+        response: SimulationResponse,
+        data: Union[str, bytes],
+    ) -> List[_Spill]:
+        """Make ``response`` resident; returns the results that must be spilled."""
+        if simulation_id in self._resident:
+            self._resident_bytes -= self._resident.pop(simulation_id)[1]
+        size = len(data)
+        if size > self.max_bytes:
+            # Never let a single oversized result flush everything else
+            self._spilling[simulation_id] = response
+            return [(simulation_id, response, data)]
+        self._resident[simulation_id] = (response, size)
+        self._resident_bytes += size
+        spills: List[_Spill] = []
+        while self._resident_bytes > self.max_bytes:
+            old_id, (old_response, old_size) = self._resident.popitem(last=False)
+            self._resident_bytes -= old_size
+            self._spilling[old_id] = old_response
+            spills.append((old_id, old_response, None))
+        return spills
+
+    def _write_spill(
+        self,
+        simulation_id: str,
+        response: SimulationResponse,
+        data: Optional[Union[str, bytes]] = None,
+    ) -> Optional[int]:
+        """Compress and write one result to disk; returns its size or None."""
+        if data is None:
+            data = response.model_dump_json()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        raw = zlib.compress(data)
+        if not self._disk_call("set", simulation_id, raw):
+            return None
+        return len(raw)
+
+    def _spilled(self, simulation_id: str, written: Optional[int]) -> None:
+        self._spilling.pop(simulation_id, None)
+        if written is None:
+            self._summaries.pop(simulation_id, None)
+            return
+        self.spills += 1
+        logger.info(f"Spilled simulation {simulation_id} to disk ({written} bytes)")
+
+    def _read_spill(
+        self, simulation_id: str
+    ) -> Optional[Tuple[SimulationResponse, bytes]]:
+        """Read and decode a spilled result; unreadable ones are deleted."""
+        raw = self._disk_get(simulation_id)
+        if raw is None:
+            return None
+        try:
+            data = zlib.decompress(raw)
+            return SimulationResponse.model_validate_json(data), data
+        except Exception as e:
+            logger.warning(
+                f"Dropping unreadable spilled simulation {simulation_id}: {e}"
+            )
+            self._disk_call("delete", simulation_id)
+            return None
+
+    def _remember_summary(self, simulation_id: str, summary: Dict[str, Any]):
+        self._summaries[simulation_id] = summary
+        self._summaries.move_to_end(simulation_id)
+        while len(self._summaries) > SUMMARY_INDEX_SIZE:
+            self._summaries.popitem(last=False)
+
+    def _disk_get(self, simulation_id: str) -> Optional[bytes]:
+        disk = self.disk
+        if disk is None:
+            return None
+        try:
+            return disk.get(_KEY_PREFIX + simulation_id)
+        except Exception as e:
+            logger.warning(f"Simulation result disk read failed: {e}")
+            return None
+
+    def _disk_call(self, operation: str, simulation_id: str = "", *args) -> bool:
+        """Run a write operation on the disk tier; returns False on failure."""
+        disk = self.disk
+        if disk is None:
+            return False
+        try:
+            getattr(disk, operation)(_KEY_PREFIX + simulation_id, *args)
+            return True
+        except Exception as e:
+            logger.warning(f"Simulation result disk {operation} failed: {e}")
+            return False
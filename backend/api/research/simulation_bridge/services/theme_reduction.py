@@ -0,0 +1,148 @@
+"""
+Windowing and theme reduction for map-reduce analysis of large simulations.
+
+Large simulation texts are split into overlapping windows whose themes are
+extracted independently (the map step). The same theme usually comes back
+from several windows under slightly different names ("Data Security
+Concerns", "Data security concern", "Concerns about data security"), so the
+reduce step clusters themes whose normalized names are equal or whose name
+token sets are similar enough, and merges their evidence.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# Minimum Jaccard similarity of two theme name token sets to merge them
+THEME_SIMILARITY_THRESHOLD = 0.6
+
+_STOPWORDS = {
+    "a",
+    "about",
+    "an",
+    "and",
+    "as",
+    "at",
+    "by",
+    "for",
+    "from",
+    "in",
+    "of",
+    "on",
+    "or",
+    "the",
+    "to",
+    "with",
+}
+
+
+def text_windows(text: str, size: int, overlap: int) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` of overlapping windows covering ``text``."""
+    step = max(1, size - overlap)
+    for start in range(0, len(text), step):
+        end = min(start + size, len(text))
+        yield start, end
+        if end == len(text):
+            break
+
+
+def theme_tokens(name: str) -> Set[str]:
+    """Normalized content words of a theme name."""
+    tokens = set()
+    for token in re.findall(r"[a-z0-9]+", (name or "").lower()):
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return tokens
+
+
+def theme_similarity(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two theme token sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _unique(items: List[Any]) -> List[Any]:
+    seen = []
+    for item in items:
+        if item not in seen:
+            seen.append(item)
+    return seen
+
+
+def _merge_theme(existing: Dict[str, Any], theme: Dict[str, Any]) -> None:
+    """Fold the evidence of ``theme`` into ``existing`` in place."""
+    old_count = len(existing.get("statements") or []) or 1
+    new_count = len(theme.get("statements") or []) or 1
+    existing["sentiment"] = round(
+        (
+            (existing.get("sentiment") or 0.0) * old_count
+            + (theme.get("sentiment") or 0.0) * new_count
+        )
+        / (old_count + new_count),
+        4,
+    )
+    existing["frequency"] = max(
+        existing.get("frequency") or 0.0, theme.get("frequency") or 0.0
+    )
+    for key in ("statements", "keywords", "codes"):
+        if theme.get(key):
+            existing[key] = _unique((existing.get(key) or []) + theme[key])
+    for key in ("definition", "process", "reliability", "sentiment_distribution"):
+        if existing.get(key) is None and theme.get(key) is not None:
+            existing[key] = theme[key]
+
+    mentions = (theme.get("stakeholder_context") or {}).get("primary_mentions")
+    if mentions:
+        context = dict(existing.get("stakeholder_context") or {})
+        context["primary_mentions"] = _unique(
+            (context.get("primary_mentions") or []) + mentions
+        )
+        existing["stakeholder_context"] = context
+
+
+def _closest_cluster(
+    clusters: List[Tuple[Set[str], Dict[str, Any]]],
+    theme: Dict[str, Any],
+    tokens: Set[str],
+) -> Optional[Dict[str, Any]]:
+    if not tokens:
+        # Nothing to compare, only identical names are the same theme
+        for _, merged in clusters:
+            if merged.get("name") == theme.get("name"):
+                return merged
+        return None
+    best, best_score = None, 0.0
+    for cluster_tokens, merged in clusters:
+        score = theme_similarity(tokens, cluster_tokens)
+        if score > best_score:
+            best, best_score = merged, score
+    return best if best_score >= THEME_SIMILARITY_THRESHOLD else None
+
+
+def reduce_themes(window_themes: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Cluster near-duplicate themes from all windows and merge their evidence.
+
+    Themes are compared with the first theme of each cluster, so a chain of
+    slightly different names cannot drift into one catch-all cluster.
+
+    Args:
+        window_themes: Theme dicts per window, in window order
+
+    Returns:
+        One theme per cluster, named after its first occurrence and in order
+        of first occurrence
+    """
+    clusters: List[Tuple[Set[str], Dict[str, Any]]] = []
+    for themes in window_themes:
+        for theme in themes:
+            tokens = theme_tokens(theme.get("name", ""))
+            merged = _closest_cluster(clusters, theme, tokens)
+            if merged is None:
+                clusters.append((tokens, dict(theme)))
+            else:
+                _merge_theme(merged, theme)
+    return [merged for _, merged in clusters]
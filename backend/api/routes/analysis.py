@@ -14,8 +14,8 @@ Extracted from app.py to improve maintainability.
 """
 
 from fastapi import APIRouter, File, UploadFile, HTTPException, Request, Depends, Form
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.orm import Session, defer
 from typing import Dict, Any, List, Optional, Literal
 import logging
 import os
@@ -33,11 +33,17 @@ from backend.schemas import (
 )
 from backend.infrastructure.config.settings import settings
 from backend.utils.timezone_utils import format_iso_utc
-from backend.api.routes.results_helpers import (
-    build_concat_and_spans,
-    should_hydrate_personas,
-    should_revalidate_personas,
-    hydrate_persona_evidence,
+from backend.services.results.read_view import (
+    etag_for,
+    etag_matches,
+    load_read_view,
+    read_view_stamp,
+)
+from backend.services.results.read_view_builder import (
+    backfill_results_fingerprint_in_thread,
+    format_result,
+    materialize_read_view_in_thread,
+    read_view_options,
 )
 
 logger = logging.getLogger(__name__)
@@ -262,26 +268,55 @@ async def get_results(
 ):
     """
     Retrieves analysis results with optional hydration and revalidation.
+
+    Completed results carry an ETag; a matching If-None-Match gets a 304.
     """
     try:
-        from backend.api.dependencies import get_container
-
-        container = get_container()
-        factory = container.get_results_service()
-        results_service = factory(db, current_user)
-
-        # Get formatted results
-        result = results_service.get_analysis_result(result_id)
-
-        # Optional on-read hydration for personas
-        if should_hydrate_personas() and isinstance(result, dict):
-            _hydrate_result_personas(result)
-
-        # Optional on-read revalidation
-        if should_revalidate_personas() and isinstance(result, dict):
-            _revalidate_result_personas(result)
+        # While the analysis runs, answer from the progress store instead of
+        # loading and formatting the results blob
+        row = (
+            db.query(AnalysisResult)
+            .options(defer(AnalysisResult.results), defer(AnalysisResult.read_view))
+            .join(InterviewData, AnalysisResult.data_id == InterviewData.id)
+            .filter(
+                AnalysisResult.result_id == result_id,
+                InterviewData.user_id == current_user.user_id,
+            )
+            .first()
+        )
+        if row is not None and row.status == "processing":
+            from backend.services.analysis_progress import get_analysis_progress_store
+
+            snapshot = await get_analysis_progress_store().get(result_id)
+            return {"status": "processing", "result_id": result_id, "results": snapshot}
+
+        # Completed results are served from the stored view. The ETag comes
+        # from the stored results fingerprint, so a revalidation neither loads
+        # nor hashes the results blob
+        fingerprint = None
+        if row is not None and row.status == "completed":
+            fingerprint = row.results_fingerprint
+            if not fingerprint:
+                # Stored before fingerprints existed: stamp it once
+                fingerprint = await backfill_results_fingerprint_in_thread(
+                    db, result_id
+                )
+        if fingerprint:
+            stamp = read_view_stamp(fingerprint, read_view_options())
+            headers = {"ETag": etag_for(stamp), "Cache-Control": "private, no-cache"}
+            if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            view = load_read_view(row, stamp)
+            if view is None:
+                # Missing or stale view (results rewritten, algorithm version
+                # bump, flag change): build it once and store it
+                view = await materialize_read_view_in_thread(
+                    db, result_id, current_user
+                )
+            if view is not None:
+                return JSONResponse(view, headers=headers)
 
-        return result
+        return format_result(db, current_user, result_id)
 
     except HTTPException:
         raise
@@ -290,116 +325,6 @@ async def get_results(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-def _hydrate_result_personas(result: Dict[str, Any]) -> None:
-    """Hydrate personas with evidence document IDs and offsets."""
-    try:
-        results_obj = result.get("results") or {}
-        personas = results_obj.get("personas")
-        if not isinstance(personas, list) or not personas:
-            return
-
-        source_payload = results_obj.get("source") or {}
-        transcript = (
-            source_payload.get("transcript")
-            if isinstance(source_payload, dict)
-            else None
-        )
-
-        scoped_text, doc_spans = None, None
-        if isinstance(transcript, list) and transcript:
-            txt, spans = build_concat_and_spans(transcript)
-            if txt and spans:
-                scoped_text, doc_spans = txt, spans
-        if not scoped_text:
-            scoped_text = source_payload.get("original_text") or ""
-
-        if scoped_text:
-            hydrate_persona_evidence(personas, scoped_text, doc_spans)
-
-    except Exception as err:
-        logger.warning(f"[FULL_RESULTS_HYDRATION] Skipped due to error: {err}")
-
-
-def _revalidate_result_personas(result: Dict[str, Any]) -> None:
-    """Revalidate persona evidence on read."""
-    try:
-        from backend.services.validation.persona_evidence_validator import (
-            PersonaEvidenceValidator,
-        )
-
-        results_obj = result.get("results") or {}
-        personas = results_obj.get("personas")
-        if not isinstance(personas, list) or not personas:
-            return
-
-        source_payload = results_obj.get("source") or {}
-        transcript = (
-            source_payload.get("transcript")
-            if isinstance(source_payload, dict)
-            else None
-        )
-        source_text = (
-            source_payload.get("original_text")
-            if isinstance(source_payload, dict)
-            else None
-        )
-
-        validator = PersonaEvidenceValidator()
-        all_matches = []
-        any_cross_trait = False
-        speaker_mismatch_count = 0
-
-        if not (isinstance(transcript, list) and transcript):
-            transcript = None
-
-        for p in personas:
-            if not isinstance(p, dict):
-                continue
-            try:
-                matches = validator.match_evidence(
-                    persona_ssot=p,
-                    source_text=source_text,
-                    transcript=transcript,
-                )
-                all_matches.extend(matches)
-
-                dup = PersonaEvidenceValidator.detect_duplication(p)
-                ctr = dup.get("cross_trait_reuse")
-                if isinstance(ctr, list):
-                    any_cross_trait = any_cross_trait or bool(ctr)
-                elif ctr:
-                    any_cross_trait = True
-
-                sc = PersonaEvidenceValidator.check_speaker_consistency(p, transcript)
-                sm = sc.get("speaker_mismatches")
-                if isinstance(sm, list):
-                    speaker_mismatch_count += len(sm)
-                elif isinstance(sm, int):
-                    speaker_mismatch_count += sm
-            except (TypeError, KeyError, AttributeError):
-                continue
-
-        contamination = PersonaEvidenceValidator.detect_contamination(personas)
-        summary = PersonaEvidenceValidator.summarize(
-            all_matches,
-            {"cross_trait_reuse": any_cross_trait},
-            {"speaker_mismatches": speaker_mismatch_count},
-            contamination,
-        )
-        confidence = PersonaEvidenceValidator.compute_confidence_components(summary)
-
-        # Shape similar to previous payloads
-        results_obj["validation_summary"] = {
-            "counts": summary.get("counts", {}),
-            "method": "persona_evidence_validator_v1",
-            "speaker_mismatches": speaker_mismatch_count,
-            "contamination": contamination,
-            "confidence_components": confidence,
-        }
-    except Exception as err:
-        logger.warning(f"[ON_READ_REVALIDATION] Skipped due to error: {err}")
-
-
 @router.get(
     "/api/results/{result_id}/personas/simplified",
     summary="Get simplified design thinking personas",
@@ -537,11 +462,18 @@ async def list_analyses(
     sortBy: Optional[str] = None,
     sortDirection: Optional[Literal["asc", "desc"]] = "desc",
     status: Optional[Literal["pending", "completed", "failed"]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Retrieves a list of analyses performed by the user.
+
+    When ``limit`` or ``cursor`` is given the response is a page of summary
+    rows ``{"items", "next_cursor", "has_more"}`` that never loads the results
+    JSON; pass ``next_cursor`` back to get the following page. Without them
+    the full legacy list is returned.
     """
     from sqlalchemy.sql import text
 
@@ -564,6 +496,22 @@ async def list_analyses(
         factory = container.get_results_service()
         results_service = factory(db, current_user)
 
+        if limit is not None or cursor is not None:
+            try:
+                page = results_service.list_analyses_page(
+                    sort_by=sortBy,
+                    sort_direction=sortDirection,
+                    status=status,
+                    limit=max(1, min(limit or 50, 100)),
+                    cursor=cursor,
+                )
+            except HTTPException as e:
+                return JSONResponse(
+                    content={"error": e.detail, "type": "request_error"},
+                    status_code=e.status_code,
+                )
+            return JSONResponse(content=page)
+
         analyses = results_service.get_all_analyses(
             sort_by=sortBy, sort_direction=sortDirection, status=status
         )
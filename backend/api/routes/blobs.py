@@ -0,0 +1,110 @@
+"""
+Blob routes serving content-addressed media.
+
+- GET /api/blobs/{key} - Serve a stored blob (ETag, If-None-Match, Range)
+
+Blobs are immutable and keyed by the SHA-256 of their content, so responses
+are cacheable forever. The route is public: images are loaded via ``<img src>``
+which cannot send bearer tokens, and a key is only known to whoever received
+it in a result.
+
+Because blobs are served from the API origin, responses forbid MIME sniffing
+and any active content (``Content-Security-Policy: default-src 'none'``), and
+everything but raster images is sent as an attachment, so a stored SVG or
+HTML file cannot run script on the API origin.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+
+from backend.infrastructure.storage import get_blob_store
+
+router = APIRouter(prefix="/api/blobs", tags=["blobs"])
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Inert image types that may be rendered inline; anything else is downloaded
+_INLINE_CONTENT_TYPES = {
+    "image/avif",
+    "image/bmp",
+    "image/gif",
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+}
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range into an inclusive (first, last) pair.
+
+    Returns None when the header should be ignored (malformed or multi-range).
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+    start, end = match.group(1), match.group(2)
+    if not start:
+        # Suffix range: the last N bytes
+        first, last = max(0, size - int(end)), size - 1
+    else:
+        first = int(start)
+        last = min(int(end), size - 1) if end else size - 1
+    if first >= size or first > last:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return first, last
+
+
+@router.get("/{key}")
+async def get_blob(key: str, request: Request) -> Response:
+    """Serve a blob with strong ETag validation and single-range support."""
+    store = get_blob_store()
+    info = store.head_object(key)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Blob not found")
+
+    headers = {
+        "ETag": info.etag,
+        "Cache-Control": _CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+        "X-Content-Type-Options": "nosniff",
+        "Content-Security-Policy": "default-src 'none'; sandbox",
+    }
+    media_type = (info.content_type or "").split(";")[0].strip().lower()
+    if media_type not in _INLINE_CONTENT_TYPES:
+        headers["Content-Disposition"] = "attachment"
+    if_none_match = request.headers.get("if-none-match", "")
+    if info.etag in [tag.strip() for tag in if_none_match.split(",")] or (
+        if_none_match.strip() == "*"
+    ):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header and request.headers.get("if-range", info.etag) == info.etag:
+        byte_range = _parse_range(range_header, info.size)
+
+    try:
+        data = store.get_object(key, byte_range)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Blob not found")
+
+    if byte_range is None:
+        return Response(content=data, media_type=info.content_type, headers=headers)
+    headers["Content-Range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{info.size}"
+    return Response(
+        content=data,
+        status_code=206,
+        media_type=info.content_type,
+        headers=headers,
+    )
@@ -4,6 +4,7 @@ Perpetual Personas media endpoints (avatars, Berlin profiles, dialogue).
 Design goals:
 - Minimal, self‑contained, safe fallbacks (works without Google SDK)
 - Persist into AnalysisResult.results.personas[] without DB migrations
+- Images live in the content-addressed blob store; results keep only their URLs
 - Unique style: deterministic per persona seed with gradient SVG when SDK unavailable
 - Photorealistic 85mm headshots with consistent camera angle
 """
@@ -19,6 +20,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
 from backend.database import get_db
+from backend.infrastructure.storage import store_data_uri
 from backend.models import AnalysisResult, InterviewData, User
 from backend.services.external.auth_middleware import get_current_user
 from backend.services.generative.helpers import (
@@ -56,6 +58,18 @@ def _food_image_key(meal: str, restaurant: str, dish: str, drink: str = "") -> s
     return "__".join([p for p in parts if p])
 
 
+def _image_url(data_uri: str) -> str:
+    """Move a generated image into the blob store and return its URL.
+
+    Falls back to the data URI itself if the blob store cannot be written.
+    """
+    try:
+        return store_data_uri(data_uri) or data_uri
+    except Exception as e:
+        print(f"[ERROR] Failed to store image blob: {e}")
+        return data_uri
+
+
 def _load_results_obj(ar: AnalysisResult) -> Dict[str, Any]:
     res = ar.results or {}
     if isinstance(res, str):
@@ -197,12 +211,15 @@ async def generate_persona_avatar(
     if not data_uri:
         seed = f"{result_id}:{persona_id}:{persona_name}:{style_desc}"
         data_uri = svg_avatar_data_uri(persona_name, seed=seed)
+    avatar_url = _image_url(data_uri)
 
-    upsert_persona_fields(
+    persona = upsert_persona_fields(
         results,
         persona_id,
-        {"avatar_data_uri": data_uri, "avatar_style_pack": style_pack},
+        {"avatar_url": avatar_url, "avatar_style_pack": style_pack},
     )
+    # Drop the inline image written before avatars moved to the blob store
+    persona.pop("avatar_data_uri", None)
 
     # Persist
     ar.results = results
@@ -213,7 +230,7 @@ async def generate_persona_avatar(
     except Exception as e:
         print(f"[ERROR] Failed to persist avatar for persona {persona_id}: {e}")
 
-    return {"ok": True, "result_id": result_id, "persona_id": persona_id, "avatar_data_uri": data_uri}
+    return {"ok": True, "result_id": result_id, "persona_id": persona_id, "avatar_url": avatar_url}
 
 
 @router.post("/{result_id}/{persona_id}/quote")
@@ -533,7 +550,7 @@ async def generate_food_image(
 
     # Generate image using Gemini
     gimg = GeminiImageService()
-    image_data_uri = None
+    image_url = None
 
     if gimg.is_available() and os.getenv("ENABLE_PERPETUAL_PERSONAS", "true").lower() in {"1", "true", "yes"}:
         # Generate unique identifier to prevent image caching/reuse
@@ -585,19 +602,19 @@ async def generate_food_image(
             # Use temperature=0.9 for more variation in food images
             b64 = gimg.generate_avatar_base64(prompt, temperature=0.9)
             if b64:
-                image_data_uri = f"data:image/png;base64,{b64}"
+                image_url = _image_url(f"data:image/png;base64,{b64}")
         except Exception as e:
             print(f"[ERROR] Food image generation failed: {e}")
 
     # Store the image in the recommendation
-    if image_data_uri:
+    if image_url:
         # Initialize food_images dict if it doesn't exist
         if "food_images" not in persona:
             persona["food_images"] = {}
 
         # Store using content-based deterministic key to avoid stale mismatches
         image_key = _food_image_key(meal_type, restaurant_name, dish, drink)
-        persona["food_images"][image_key] = image_data_uri
+        persona["food_images"][image_key] = image_url
 
         # Update persona
         persona = upsert_persona_fields(results, persona_id, {"food_images": persona["food_images"]})
@@ -619,7 +636,7 @@ async def generate_food_image(
         "restaurant_name": restaurant_name,
         "dish": dish,
         "drink": drink,
-        "image_data_uri": image_data_uri,
+        "image_url": image_url,
         "value_source": value_source
     }
 
@@ -2,15 +2,22 @@
 PRD API routes.
 """
 
+import json
 import logging
+import asyncio
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from backend.database import get_db
+from backend.database import SessionLocal, get_db
 from backend.services.external.auth_middleware import get_current_user
 from backend.models import User
-from backend.services.processing.prd_generation_service import PRDGenerationService
+from backend.services.processing.prd_flights import PRDFlight, get_prd_flights
+from backend.services.processing.prd_generation_service import (
+    PRDGenerationService,
+    prd_input_hash,
+)
 from backend.services.llm import LLMServiceFactory
 
 logger = logging.getLogger(__name__)
@@ -21,6 +28,67 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+PRD_TYPES = ("operational", "technical", "both")
+
+
+def _validate_prd_type(prd_type: str) -> None:
+    if prd_type not in PRD_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid PRD type. Must be 'operational', 'technical', or 'both'",
+        )
+
+
+def _prd_response(result_id: int, prd_type: str, prd_data: Dict[str, Any]):
+    return {
+        "success": True,
+        "result_id": result_id,
+        "prd_type": prd_type,
+        "prd_data": prd_data,
+    }
+
+
+def _generation_runner(
+    results_data: Dict[str, Any],
+    user_id: str,
+    force_regenerate: bool,
+):
+    """
+    Build the coroutine function a PRD flight runs.
+
+    The flight outlives the request that started it and is shared with the
+    requests that join it, so it works on its own database session instead of
+    the session of the first request.
+    """
+
+    async def run(flight: PRDFlight) -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.user_id == user_id).first()
+            llm_service = LLMServiceFactory.create("enhanced_gemini")
+            prd_service = PRDGenerationService(
+                db=db, llm_service=llm_service, user=user
+            )
+            return await prd_service.generate_prd(
+                analysis_results=results_data,
+                prd_type=flight.prd_type,
+                industry=results_data.get("industry"),
+                result_id=flight.result_id,
+                force_regenerate=force_regenerate,
+                on_section=flight.add_section,
+            )
+        finally:
+            db.close()
+
+    return run
+
+
+def _find_flight(result_id: int, prd_type: str, user: User) -> Optional[PRDFlight]:
+    flight = get_prd_flights().latest(result_id, prd_type)
+    if flight is None or flight.user_id != user.user_id:
+        return None
+    return flight
+
 
 @router.get("/{result_id}")
 async def generate_prd(
@@ -32,31 +100,46 @@ async def generate_prd(
     force_regenerate: bool = Query(
         False, description="Whether to force regeneration of the PRD"
     ),
+    background: bool = Query(
+        False,
+        description=(
+            "Return 202 at once and generate in the background; follow progress "
+            "via /status or /stream"
+        ),
+    ),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ) -> Dict[str, Any]:
     """
     Generate a PRD from analysis results.
 
+    A cached PRD is returned before the analysis result is even loaded.
+    Concurrent requests for the same result, PRD type and analysis input share
+    one generation.
+
     Args:
         result_id: ID of the analysis result to generate PRD from
         prd_type: Type of PRD to generate
         force_regenerate: Whether to force regeneration of the PRD
+        background: Whether to generate in the background instead of waiting
         db: Database session
         user: Current authenticated user
 
     Returns:
-        Generated PRD
+        Generated PRD, or the generation status in background mode
     """
     try:
         logger.info(f"Generating PRD for result_id: {result_id}, prd_type: {prd_type}")
 
         # Validate prd_type
-        if prd_type not in ["operational", "technical", "both"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid PRD type. Must be 'operational', 'technical', or 'both'",
-            )
+        _validate_prd_type(prd_type)
+
+        if not force_regenerate:
+            prd_service = PRDGenerationService(db=db, user=user)
+            cached = prd_service.get_cached_prd_data(result_id, prd_type)
+            if cached:
+                logger.info(f"Serving cached PRD for result_id: {result_id}")
+                return _prd_response(result_id, prd_type, cached)
 
         # Resolve ResultsService via DI container (central flag handling)
         from backend.api.dependencies import get_container
@@ -73,33 +156,36 @@ async def generate_prd(
         # Get results data
         results_data = analysis_results.get("results", {})
 
-        # Create PRD generation service with enhanced_gemini provider, database session, and user
-        llm_service = LLMServiceFactory.create("enhanced_gemini")
-        prd_service = PRDGenerationService(db=db, llm_service=llm_service, user=user)
-
-        # Get industry from results if available
-        industry = results_data.get("industry")
-
         # Log whether we're forcing regeneration
         if force_regenerate:
             logger.info(f"Forcing regeneration of PRD for result_id: {result_id}")
 
-        # Generate PRD with caching
-        prd_data = await prd_service.generate_prd(
-            analysis_results=results_data,
-            prd_type=prd_type,
-            industry=industry,
-            result_id=result_id,
-            force_regenerate=force_regenerate,
+        industry = results_data.get("industry")
+        input_hash = prd_input_hash(results_data, prd_type, industry)
+        flight, _ = get_prd_flights().start(
+            result_id,
+            prd_type,
+            input_hash,
+            _generation_runner(results_data, user.user_id, force_regenerate),
+            user_id=user.user_id,
         )
 
+        if background:
+            return JSONResponse(
+                status_code=202,
+                content={
+                    "success": True,
+                    **flight.snapshot(),
+                    "status_url": f"/api/prd/{result_id}/status?prd_type={prd_type}",
+                    "stream_url": f"/api/prd/{result_id}/stream?prd_type={prd_type}",
+                },
+            )
+
+        # Shielded: a disconnecting client must not cancel a shared generation
+        prd_data = await asyncio.shield(flight.task)
+
         # Return PRD data
-        return {
-            "success": True,
-            "result_id": result_id,
-            "prd_type": prd_type,
-            "prd_data": prd_data,
-        }
+        return _prd_response(result_id, prd_type, prd_data)
 
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -107,3 +193,88 @@ async def generate_prd(
     except Exception as e:
         logger.error(f"Error generating PRD: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating PRD: {str(e)}")
+
+
+@router.get("/{result_id}/status")
+async def get_prd_status(
+    result_id: int,
+    prd_type: str = Query("both", description="Type of PRD"),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Poll a PRD generation started in background mode.
+
+    Returns:
+        ``status`` (``running``, ``completed`` or ``failed``), the sections
+        already generated and, once completed, the PRD
+    """
+    _validate_prd_type(prd_type)
+    flight = _find_flight(result_id, prd_type, user)
+    if flight is not None:
+        return flight.snapshot()
+
+    cached = PRDGenerationService(db=db, user=user).get_cached_prd_data(
+        result_id, prd_type
+    )
+    if cached:
+        return {
+            "result_id": result_id,
+            "prd_type": prd_type,
+            "status": "completed",
+            "prd_data": cached,
+        }
+    raise HTTPException(status_code=404, detail="No PRD generation found")
+
+
+@router.get("/{result_id}/stream")
+async def stream_prd(
+    result_id: int,
+    prd_type: str = Query("both", description="Type of PRD"),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Stream the progress of a PRD generation via Server-Sent Events.
+
+    Emits a ``section`` event as each half of a ``both`` PRD is ready and a
+    final ``complete`` (or ``error``) event with the whole PRD.
+    """
+    _validate_prd_type(prd_type)
+    flight = _find_flight(result_id, prd_type, user)
+    cached = None
+    if flight is None:
+        cached = PRDGenerationService(db=db, user=user).get_cached_prd_data(
+            result_id, prd_type
+        )
+        if not cached:
+            raise HTTPException(status_code=404, detail="No PRD generation found")
+
+    async def event_stream():
+        if flight is None:
+            payload = _prd_response(result_id, prd_type, cached)
+            yield f"event: complete\ndata: {json.dumps(payload)}\n\n"
+            return
+
+        sent = set()
+        while True:
+            for section, prd_data in list(flight.sections.items()):
+                if section not in sent:
+                    sent.add(section)
+                    payload = {"section": section, "prd_data": prd_data}
+                    yield f"event: section\ndata: {json.dumps(payload)}\n\n"
+            if flight.done:
+                break
+            await flight.wait_for_change()
+
+        if flight.status == "completed":
+            payload = _prd_response(result_id, prd_type, flight.task.result())
+            yield f"event: complete\ndata: {json.dumps(payload)}\n\n"
+        else:
+            yield f"event: error\ndata: {json.dumps({'error': flight.error})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
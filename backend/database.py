@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import QueuePool
@@ -137,6 +139,102 @@ except Exception as e:
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session factory, created on first use so that importing this
+# module never requires the async drivers
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_database_url(url: str = None) -> str:
+    """
+    Return the async driver variant of a database URL.
+
+    PostgreSQL URLs use asyncpg and SQLite URLs use aiosqlite.
+
+    Args:
+        url: Database URL, defaults to DATABASE_URL
+
+    Returns:
+        URL string with the async driver name
+    """
+    parsed = make_url(url or DATABASE_URL)
+    backend_name = parsed.get_backend_name()
+    if backend_name == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    elif backend_name == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+def get_async_engine():
+    """
+    Get the shared async engine, creating it on first use.
+
+    PostgreSQL uses the same pool sizing as the sync engine (DB_POOL_SIZE,
+    DB_MAX_OVERFLOW, DB_POOL_TIMEOUT).
+
+    Returns:
+        AsyncEngine bound to DATABASE_URL
+
+    Raises:
+        ImportError: If the async driver for the database is not installed
+    """
+    global _async_engine
+    if _async_engine is None:
+        async_url = get_async_database_url()
+        if async_url.startswith("sqlite"):
+            _async_engine = create_async_engine(async_url, pool_pre_ping=True)
+        else:
+            _async_engine = create_async_engine(
+                async_url,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_pre_ping=True,
+                pool_reset_on_return="rollback",
+                connect_args={
+                    "server_settings": {"application_name": "DesignAId Backend"}
+                },
+            )
+        logger.info("Created async database engine")
+    return _async_engine
+
+
+def get_async_session_factory():
+    """
+    Get the factory for async sessions used by UnitOfWork and the repositories.
+
+    Sessions keep loaded attributes after commit (``expire_on_commit=False``),
+    since expired attributes cannot be lazily reloaded outside the event loop
+    context of an async session. Falls back to SessionLocal when the async
+    driver is not installed, which the repositories also support.
+
+    Returns:
+        async_sessionmaker, or SessionLocal as a fallback
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        try:
+            engine_ = get_async_engine()
+        except ImportError as e:
+            logger.warning(
+                f"Async database driver not available, using sync sessions: {e}"
+            )
+            return SessionLocal
+        _async_session_factory = async_sessionmaker(
+            bind=engine_, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def dispose_async_engine():
+    """Close all pooled connections of the async engine, if it was created."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
 
 def get_db():
     """
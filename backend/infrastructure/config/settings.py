@@ -68,6 +68,155 @@ class Settings:
         self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
         self.db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 
+        # LLM response cache configuration
+        # Backend: "memory", "sqlite" or "tiered" (memory in front of sqlite)
+        self.llm_response_cache_backend = os.getenv(
+            "LLM_RESPONSE_CACHE_BACKEND", "tiered"
+        )
+        self.llm_response_cache_path = os.getenv(
+            "LLM_RESPONSE_CACHE_PATH", "/tmp/axwise/llm_response_cache.sqlite3"
+        )
+        self.llm_response_cache_memory_bytes = int(
+            os.getenv("LLM_RESPONSE_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024))
+        )
+        self.llm_response_cache_disk_bytes = int(
+            os.getenv("LLM_RESPONSE_CACHE_DISK_BYTES", str(512 * 1024 * 1024))
+        )
+        self.llm_response_cache_ttl = int(
+            os.getenv("LLM_RESPONSE_CACHE_TTL", str(7 * 24 * 3600))
+        )
+        # Whether analyze() calls use the cache when the payload does not say
+        self.llm_response_cache_default = (
+            os.getenv("LLM_RESPONSE_CACHE_DEFAULT", "false").lower() == "true"
+        )
+
+        # Background job queue configuration
+        self.job_queue_max_workers = int(os.getenv("JOB_QUEUE_MAX_WORKERS", "4"))
+        self.job_queue_per_user_limit = int(
+            os.getenv("JOB_QUEUE_PER_USER_LIMIT", "2")
+        )
+        # Jobs beyond this many waiting entries are rejected (backpressure)
+        self.job_queue_max_pending = int(os.getenv("JOB_QUEUE_MAX_PENDING", "100"))
+        # Share of the worker pool the batch lane may occupy
+        self.job_queue_batch_share = float(
+            os.getenv("JOB_QUEUE_BATCH_SHARE", "0.5")
+        )
+        self.job_queue_heartbeat_seconds = int(
+            os.getenv("JOB_QUEUE_HEARTBEAT_SECONDS", "30")
+        )
+        # Running jobs without a heartbeat for this long are re-queued
+        self.job_queue_stale_seconds = int(
+            os.getenv("JOB_QUEUE_STALE_SECONDS", "300")
+        )
+        self.job_queue_max_attempts = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "2"))
+
+        # Analysis progress: ticks are coalesced and flushed at this interval
+        self.analysis_progress_flush_seconds = float(
+            os.getenv("ANALYSIS_PROGRESS_FLUSH_SECONDS", "1.0")
+        )
+        # SSE keep-alive interval; also how often other workers' progress is re-read
+        self.analysis_progress_keepalive_seconds = float(
+            os.getenv("ANALYSIS_PROGRESS_KEEPALIVE_SECONDS", "15")
+        )
+
+        # Transcript structuring: longer transcripts are structured in chunks
+        self.transcript_chunk_chars = int(os.getenv("TRANSCRIPT_CHUNK_CHARS", "20000"))
+        self.transcript_chunk_concurrency = int(
+            os.getenv("TRANSCRIPT_CHUNK_CONCURRENCY", "4")
+        )
+
+        # Persona formation: speakers whose personas are formed at the same time
+        self.persona_formation_concurrency = int(
+            os.getenv("PERSONA_FORMATION_CONCURRENCY", "4")
+        )
+
+        # Process-wide LLM admission control per provider:model (0 = unlimited)
+        self.llm_governor_rpm = float(os.getenv("LLM_GOVERNOR_RPM", "0"))
+        self.llm_governor_tpm = float(os.getenv("LLM_GOVERNOR_TPM", "0"))
+        self.llm_governor_initial_concurrency = int(
+            os.getenv("LLM_GOVERNOR_INITIAL_CONCURRENCY", "16")
+        )
+        self.llm_governor_min_concurrency = int(
+            os.getenv("LLM_GOVERNOR_MIN_CONCURRENCY", "1")
+        )
+        self.llm_governor_max_concurrency = int(
+            os.getenv("LLM_GOVERNOR_MAX_CONCURRENCY", "48")
+        )
+        # JSON limits per provider or provider:model, e.g.
+        # {"gemini:gemini-2.5-pro": {"requests_per_minute": 150}}
+        self.llm_governor_overrides = os.getenv("LLM_GOVERNOR_OVERRIDES", "")
+        # Threads for blocking Instructor calls when the async client is missing
+        self.instructor_sync_executor_workers = int(
+            os.getenv("INSTRUCTOR_SYNC_EXECUTOR_WORKERS", "8")
+        )
+
+        # Gemini context caching: long texts shared by several analysis stages are
+        # uploaded once per analysis and referenced by later requests
+        self.gemini_context_cache_enabled = (
+            os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "true").lower() == "true"
+        )
+        self.gemini_context_cache_min_tokens = int(
+            os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "4096")
+        )
+        self.gemini_context_cache_ttl_seconds = int(
+            os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "1800")
+        )
+
+        # Blob store for generated images (content-addressed, served by /api/blobs)
+        self.blob_store_dir = os.getenv("BLOB_STORE_DIR", "./data/blobs")
+        # Optional origin prepended to blob URLs, e.g. "https://api.example.com"
+        self.blob_public_base_url = os.getenv("BLOB_PUBLIC_BASE_URL", "").rstrip("/")
+
+        # Security event shipping: request handlers only enqueue, a background
+        # task posts batches and spills them to disk while the sink is down
+        self.security_events_queue_size = int(
+            os.getenv("SECURITY_EVENTS_QUEUE_SIZE", "1000")
+        )
+        self.security_events_batch_size = int(
+            os.getenv("SECURITY_EVENTS_BATCH_SIZE", "50")
+        )
+        self.security_events_flush_seconds = float(
+            os.getenv("SECURITY_EVENTS_FLUSH_SECONDS", "1.0")
+        )
+        self.security_events_timeout_seconds = float(
+            os.getenv("SECURITY_EVENTS_TIMEOUT_SECONDS", "5.0")
+        )
+        self.security_events_spill_path = os.getenv(
+            "SECURITY_EVENTS_SPILL_PATH", "/tmp/axwise/security_events.jsonl"
+        )
+        self.security_events_spill_max_bytes = int(
+            os.getenv("SECURITY_EVENTS_SPILL_MAX_BYTES", str(16 * 1024 * 1024))
+        )
+
+        # Usage ledger: limit checks read counters through a short-TTL cache and
+        # usage is pushed to Clerk metadata by a debounced background flush
+        self.usage_cache_ttl_seconds = float(
+            os.getenv("USAGE_CACHE_TTL_SECONDS", "30")
+        )
+        self.usage_sync_debounce_seconds = float(
+            os.getenv("USAGE_SYNC_DEBOUNCE_SECONDS", "10")
+        )
+
+        # Completed simulation results: memory LRU bounded by bytes, overflow is
+        # compressed into a SQLite file and rehydrated on access
+        self.simulation_store_memory_bytes = int(
+            os.getenv("SIMULATION_STORE_MEMORY_BYTES", str(64 * 1024 * 1024))
+        )
+        self.simulation_store_path = os.getenv(
+            "SIMULATION_STORE_PATH", "/tmp/axwise/simulation_results.sqlite3"
+        )
+        self.simulation_store_disk_bytes = int(
+            os.getenv("SIMULATION_STORE_DISK_BYTES", str(1024 * 1024 * 1024))
+        )
+        self.simulation_store_ttl = int(
+            os.getenv("SIMULATION_STORE_TTL", str(7 * 24 * 3600))
+        )
+
+        # Tool name corrections learned during persona formation (JSON Lines)
+        self.tool_corrections_path = os.getenv(
+            "TOOL_CORRECTIONS_PATH", "/tmp/axwise/tool_corrections.jsonl"
+        )
+
         # LLM Provider Configurations
         self.llm_providers = {
             "openai": {
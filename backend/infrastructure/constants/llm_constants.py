@@ -24,6 +24,12 @@ OPENAI_TEMPERATURE = 0.0
 OPENAI_MAX_TOKENS = 16384
 OPENAI_CONTEXT_WINDOW = 128000
 
+# Prompt template versions, part of the LLM response cache key.
+# Bump the default (or add a per-task entry) whenever prompt templates change
+# so cached responses produced by older prompts are no longer reused.
+PROMPT_TEMPLATE_VERSION = "1"
+PROMPT_TEMPLATE_VERSIONS = {}
+
 # Common constants
 DEFAULT_TEMPERATURE = 0.0  # Default temperature for all models
 DEFAULT_TOP_P = 0.95  # Default top_p for all models
@@ -9,6 +9,7 @@ import json
 import logging
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timezone
 
@@ -100,13 +101,11 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
+            analysis_result = await self._first(
+                select(AnalysisResult).where(
                     AnalysisResult.result_id == result_id,
                     AnalysisResult.user_id == user_id,
                 )
-                .first()
             )
 
             if not analysis_result:
@@ -143,13 +142,12 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for analysis results with user_id filter
-            analysis_results = (
-                self.session.query(AnalysisResult)
-                .filter(AnalysisResult.user_id == user_id)
+            analysis_results = await self._all(
+                select(AnalysisResult)
+                .where(AnalysisResult.user_id == user_id)
                 .order_by(AnalysisResult.analysis_date.desc())
                 .limit(limit)
                 .offset(offset)
-                .all()
             )
 
             # Convert to list of dictionaries
@@ -207,13 +205,11 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
+            analysis_result = await self._first(
+                select(AnalysisResult).where(
                     AnalysisResult.result_id == result_id,
                     AnalysisResult.user_id == user_id,
                 )
-                .first()
             )
 
             if not analysis_result:
@@ -241,12 +237,12 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
             analysis_result.results = results
 
             # Flush changes
-            self.session.flush()
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error updating analysis status: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def update_results(
@@ -265,13 +261,11 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
+            analysis_result = await self._first(
+                select(AnalysisResult).where(
                     AnalysisResult.result_id == result_id,
                     AnalysisResult.user_id == user_id,
                 )
-                .first()
             )
 
             if not analysis_result:
@@ -289,12 +283,12 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
                     analysis_result.completed_at = utc_now()
 
             # Flush changes
-            self.session.flush()
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error updating analysis results: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def delete(self, result_id: int, user_id: str) -> bool:
@@ -310,26 +304,24 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for the analysis result with user_id filter
-            analysis_result = (
-                self.session.query(AnalysisResult)
-                .filter(
+            analysis_result = await self._first(
+                select(AnalysisResult).where(
                     AnalysisResult.result_id == result_id,
                     AnalysisResult.user_id == user_id,
                 )
-                .first()
             )
 
             if not analysis_result:
                 return False
 
             # Delete the analysis result
-            self.session.delete(analysis_result)
-            self.session.flush()
+            await self._delete(analysis_result)
+            await self._flush()
 
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error deleting analysis result: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
 
     async def get_by_data_id(self, data_id: int, user_id: str) -> List[Dict[str, Any]]:
@@ -345,13 +337,12 @@ class AnalysisRepository(BaseRepository[AnalysisResult], IAnalysisRepository):
         """
         try:
             # Query for analysis results with data_id and user_id filters
-            analysis_results = (
-                self.session.query(AnalysisResult)
-                .filter(
+            analysis_results = await self._all(
+                select(AnalysisResult)
+                .where(
                     AnalysisResult.data_id == data_id, AnalysisResult.user_id == user_id
                 )
                 .order_by(AnalysisResult.analysis_date.desc())
-                .all()
             )
 
             # Convert to list of dictionaries
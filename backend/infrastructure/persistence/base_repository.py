@@ -6,10 +6,11 @@ extended by concrete repository implementations.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, inspect, select
 
 # Type variable for SQLAlchemy model
 T = TypeVar('T')
@@ -23,18 +24,78 @@ class BaseRepository(Generic[T]):
     This class provides a base implementation of the repository pattern that can be
     extended by concrete repository implementations. It provides common CRUD operations
     for SQLAlchemy models.
+
+    The session may be a synchronous ``Session`` or an ``AsyncSession``. Concrete
+    repositories build 2.0-style statements and run them through the ``_execute``
+    family of helpers, which await the async session and call the sync one directly,
+    so the same repository works on both.
     """
     
-    def __init__(self, session: Session, model_class: Type[T]):
+    def __init__(self, session: Union[Session, AsyncSession], model_class: Type[T]):
         """
         Initialize the repository.
         
         Args:
-            session: SQLAlchemy session
+            session: SQLAlchemy session (sync or async)
             model_class: SQLAlchemy model class
         """
         self.session = session
         self.model_class = model_class
+        self.is_async = isinstance(session, AsyncSession)
+
+    async def _execute(self, statement):
+        """Execute a statement on the session and return the result."""
+        if self.is_async:
+            return await self.session.execute(statement)
+        return self.session.execute(statement)
+
+    async def _first(self, statement) -> Optional[Any]:
+        """Return the first entity selected by a statement, or None."""
+        result = await self._execute(statement.limit(1))
+        return result.scalars().first()
+
+    async def _all(self, statement) -> List[Any]:
+        """Return all entities selected by a statement."""
+        result = await self._execute(statement)
+        return list(result.scalars().all())
+
+    async def _scalar(self, statement) -> Any:
+        """Return the single scalar value selected by a statement."""
+        result = await self._execute(statement)
+        return result.scalar()
+
+    async def _get(self, entity_id: Any) -> Optional[T]:
+        """Load an entity by primary key through the session identity map."""
+        if self.is_async:
+            return await self.session.get(self.model_class, entity_id)
+        return self.session.get(self.model_class, entity_id)
+
+    async def _flush(self) -> None:
+        """Flush pending changes without committing."""
+        if self.is_async:
+            await self.session.flush()
+        else:
+            self.session.flush()
+
+    async def _rollback(self) -> None:
+        """Roll back the session transaction."""
+        if self.is_async:
+            await self.session.rollback()
+        else:
+            self.session.rollback()
+
+    async def _delete(self, entity: T) -> None:
+        """Mark an entity for deletion."""
+        if self.is_async:
+            await self.session.delete(entity)
+        else:
+            self.session.delete(entity)
+
+    async def _merge(self, entity: T) -> T:
+        """Merge a detached entity into the session."""
+        if self.is_async:
+            return await self.session.merge(entity)
+        return self.session.merge(entity)
     
     def _get_primary_key_name(self) -> str:
         """
@@ -61,11 +122,11 @@ class BaseRepository(Generic[T]):
         """
         try:
             self.session.add(entity)
-            self.session.flush()  # Flush to get the ID without committing
+            await self._flush()  # Flush to get the ID without committing
             return entity
         except SQLAlchemyError as e:
             logger.error(f"Error adding entity: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
     
     async def get_by_id(self, entity_id: Any) -> Optional[T]:
@@ -79,7 +140,7 @@ class BaseRepository(Generic[T]):
             The entity if found, None otherwise
         """
         try:
-            return self.session.query(self.model_class).get(entity_id)
+            return await self._get(entity_id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting entity by ID: {str(e)}")
             raise
@@ -96,7 +157,9 @@ class BaseRepository(Generic[T]):
             List of entities
         """
         try:
-            return self.session.query(self.model_class).limit(limit).offset(offset).all()
+            return await self._all(
+                select(self.model_class).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting all entities: {str(e)}")
             raise
@@ -112,12 +175,12 @@ class BaseRepository(Generic[T]):
             The updated entity
         """
         try:
-            self.session.merge(entity)
-            self.session.flush()
+            await self._merge(entity)
+            await self._flush()
             return entity
         except SQLAlchemyError as e:
             logger.error(f"Error updating entity: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
     
     async def delete(self, entity_id: Any) -> bool:
@@ -133,13 +196,13 @@ class BaseRepository(Generic[T]):
         try:
             entity = await self.get_by_id(entity_id)
             if entity:
-                self.session.delete(entity)
-                self.session.flush()
+                await self._delete(entity)
+                await self._flush()
                 return True
             return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting entity: {str(e)}")
-            self.session.rollback()
+            await self._rollback()
             raise
     
     async def count(self) -> int:
@@ -150,7 +213,9 @@ class BaseRepository(Generic[T]):
             Number of entities
         """
         try:
-            return self.session.query(self.model_class).count()
+            return await self._scalar(
+                select(func.count()).select_from(self.model_class)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error counting entities: {str(e)}")
             raise
@@ -0,0 +1,253 @@
+"""
+Repository for background job queue persistence.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.models import JobRecord
+from backend.infrastructure.persistence.base_repository import BaseRepository
+from backend.utils.timezone_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class JobRepository(BaseRepository[JobRecord]):
+    """Repository for managing durable job queue records."""
+
+    def __init__(self, session):
+        super().__init__(session, JobRecord)
+
+    async def create_job(
+        self,
+        job_id: str,
+        kind: str,
+        payload: Dict[str, Any],
+        user_id: Optional[str] = None,
+        lane: str = "interactive",
+        priority: int = 0,
+        max_attempts: int = 2,
+    ) -> JobRecord:
+        """
+        Create a new queued job record.
+
+        Args:
+            job_id: Unique job identifier
+            kind: Registered handler name
+            payload: JSON serializable handler input
+            user_id: Optional owner of the job
+            lane: Scheduling lane (interactive or batch)
+            priority: Ordering within the lane, lower runs first
+            max_attempts: How many times the job may be started
+
+        Returns:
+            Created job record
+        """
+        try:
+            job = JobRecord(
+                job_id=job_id,
+                kind=kind,
+                user_id=user_id,
+                lane=lane,
+                priority=priority,
+                status="queued",
+                attempts=0,
+                max_attempts=max_attempts,
+                payload=payload,
+                created_at=utc_now(),
+            )
+            await self.add(job)
+            logger.info(f"Created job record: {job_id} ({kind}, lane={lane})")
+            return job
+        except SQLAlchemyError as e:
+            logger.error(f"Error creating job record: {str(e)}")
+            raise
+
+    async def get_by_job_id(self, job_id: str) -> Optional[JobRecord]:
+        """
+        Get a job record by job ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job record or None if not found
+        """
+        try:
+            return await self._first(
+                select(JobRecord).where(JobRecord.job_id == job_id)
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting job by job ID: {str(e)}")
+            raise
+
+    async def claim_job(self, job_id: str, worker_id: str) -> bool:
+        """
+        Atomically move a queued job to running and count the attempt.
+
+        The update only applies while the job is still queued, so when several
+        processes share the table exactly one of them wins the claim.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Identifier of the worker that picked up the job
+
+        Returns:
+            True if this worker now owns the job
+        """
+        try:
+            now = utc_now()
+            result = await self._execute(
+                update(JobRecord)
+                .where(JobRecord.job_id == job_id, JobRecord.status == "queued")
+                .values(
+                    status="running",
+                    worker_id=worker_id,
+                    attempts=JobRecord.attempts + 1,
+                    started_at=now,
+                    heartbeat_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self._flush()
+            return result.rowcount == 1
+        except SQLAlchemyError as e:
+            logger.error(f"Error claiming job: {str(e)}")
+            raise
+
+    async def heartbeat(self, job_ids: List[str]) -> int:
+        """
+        Refresh the heartbeat of running jobs.
+
+        Args:
+            job_ids: Identifiers of jobs owned by the caller
+
+        Returns:
+            Number of job records updated
+        """
+        if not job_ids:
+            return 0
+        try:
+            result = await self._execute(
+                update(JobRecord)
+                .where(JobRecord.job_id.in_(job_ids), JobRecord.status == "running")
+                .values(heartbeat_at=utc_now())
+                .execution_options(synchronize_session=False)
+            )
+            await self._flush()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating job heartbeats: {str(e)}")
+            raise
+
+    async def mark_finished(
+        self, job_id: str, status: str, error: Optional[str] = None
+    ) -> Optional[JobRecord]:
+        """
+        Mark a job as completed or failed.
+
+        Args:
+            job_id: Job identifier
+            status: Final status (completed, failed)
+            error: Optional error message
+
+        Returns:
+            Updated job record or None if not found
+        """
+        try:
+            job = await self.get_by_job_id(job_id)
+            if not job:
+                logger.warning(f"Job record not found: {job_id}")
+                return None
+
+            job.status = status
+            job.completed_at = utc_now()
+            if error:
+                job.error = error
+            await self._flush()
+            logger.info(f"Job {job_id} -> {status}")
+            return job
+        except SQLAlchemyError as e:
+            logger.error(f"Error finishing job: {str(e)}")
+            raise
+
+    async def get_queued_jobs(self) -> List[JobRecord]:
+        """
+        Get all jobs waiting to be picked up, oldest first.
+
+        Returns:
+            List of queued job records
+        """
+        try:
+            return await self._all(
+                select(JobRecord)
+                .where(JobRecord.status == "queued")
+                .order_by(JobRecord.created_at, JobRecord.id)
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting queued jobs: {str(e)}")
+            raise
+
+    async def recover_stalled_jobs(
+        self,
+        stale_threshold_seconds: int,
+        exclude_job_ids: Optional[List[str]] = None,
+    ) -> Tuple[List[JobRecord], List[JobRecord]]:
+        """
+        Re-queue running jobs whose worker stopped sending heartbeats.
+
+        A job whose heartbeat is older than the threshold was interrupted, most
+        likely by a process restart. It is put back in the queue if it has
+        attempts left and marked as failed otherwise.
+
+        Args:
+            stale_threshold_seconds: Heartbeat age after which a job is stalled
+            exclude_job_ids: Jobs known to be alive in this process
+
+        Returns:
+            Tuple of (requeued jobs, failed jobs)
+        """
+        try:
+            cutoff_time = utc_now() - timedelta(seconds=stale_threshold_seconds)
+            query = select(JobRecord).where(
+                JobRecord.status == "running",
+                (
+                    (JobRecord.heartbeat_at.is_(None))
+                    | (JobRecord.heartbeat_at < cutoff_time)
+                ),
+            )
+            if exclude_job_ids:
+                query = query.where(JobRecord.job_id.notin_(list(exclude_job_ids)))
+
+            requeued: List[JobRecord] = []
+            failed: List[JobRecord] = []
+            for job in await self._all(query):
+                job.worker_id = None
+                if (job.attempts or 0) < (job.max_attempts or 1):
+                    job.status = "queued"
+                    requeued.append(job)
+                    logger.info(f"Re-queued stalled job: {job.job_id}")
+                else:
+                    job.status = "failed"
+                    job.completed_at = utc_now()
+                    job.error = (
+                        f"Job stalled after {job.attempts} attempt(s) - "
+                        "worker stopped while job was running"
+                    )
+                    failed.append(job)
+                    logger.info(f"Marked stalled job as failed: {job.job_id}")
+
+            if requeued or failed:
+                await self._flush()
+                logger.info(
+                    f"Recovered stalled jobs: {len(requeued)} re-queued, "
+                    f"{len(failed)} failed"
+                )
+            return requeued, failed
+        except SQLAlchemyError as e:
+            logger.error(f"Error recovering stalled jobs: {str(e)}")
+            raise
@@ -6,7 +6,7 @@ import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
 
 from backend.models import PipelineRun
 from backend.infrastructure.persistence.base_repository import BaseRepository
@@ -89,7 +89,7 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             if error:
                 pipeline_run.error = error
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Updated pipeline run status: {job_id} -> {status}")
             return pipeline_run
             
@@ -141,7 +141,7 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             pipeline_run.persona_count = persona_count
             pipeline_run.interview_count = interview_count
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Updated pipeline run results: {job_id}")
             return pipeline_run
 
@@ -160,9 +160,9 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             Pipeline run or None if not found
         """
         try:
-            return self.session.query(PipelineRun).filter(
-                PipelineRun.job_id == job_id
-            ).first()
+            return await self._first(
+                select(PipelineRun).where(PipelineRun.job_id == job_id)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting pipeline run by job ID: {str(e)}")
             raise
@@ -187,15 +187,17 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             List of pipeline runs ordered by creation date (newest first)
         """
         try:
-            query = self.session.query(PipelineRun)
+            query = select(PipelineRun)
 
             if user_id:
-                query = query.filter(PipelineRun.user_id == user_id)
+                query = query.where(PipelineRun.user_id == user_id)
 
             if status:
-                query = query.filter(PipelineRun.status == status)
+                query = query.where(PipelineRun.status == status)
 
-            return query.order_by(desc(PipelineRun.created_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                query.order_by(desc(PipelineRun.created_at)).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting pipeline runs: {str(e)}")
             raise
@@ -218,14 +220,14 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             List of completed pipeline runs
         """
         try:
-            query = self.session.query(PipelineRun).filter(
-                PipelineRun.status == "completed"
-            )
+            query = select(PipelineRun).where(PipelineRun.status == "completed")
 
             if user_id:
-                query = query.filter(PipelineRun.user_id == user_id)
+                query = query.where(PipelineRun.user_id == user_id)
 
-            return query.order_by(desc(PipelineRun.completed_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                query.order_by(desc(PipelineRun.completed_at)).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting completed pipeline runs: {str(e)}")
             raise
@@ -246,15 +248,15 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
             Count of matching pipeline runs
         """
         try:
-            query = self.session.query(PipelineRun)
+            query = select(func.count()).select_from(PipelineRun)
 
             if user_id:
-                query = query.filter(PipelineRun.user_id == user_id)
+                query = query.where(PipelineRun.user_id == user_id)
 
             if status:
-                query = query.filter(PipelineRun.status == status)
+                query = query.where(PipelineRun.status == status)
 
-            return query.count()
+            return await self._scalar(query)
         except SQLAlchemyError as e:
             logger.error(f"Error counting pipeline runs: {str(e)}")
             raise
@@ -283,14 +285,14 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
 
             # Find stale jobs: status is 'running' or 'pending' AND
             # (started_at is old OR created_at is old for pending jobs)
-            stale_runs = self.session.query(PipelineRun).filter(
+            stale_runs = await self._all(select(PipelineRun).where(
                 PipelineRun.status.in_(["running", "pending"]),
                 # Either started_at is before cutoff, or created_at for pending jobs
                 (
                     (PipelineRun.started_at.isnot(None) & (PipelineRun.started_at < cutoff_time)) |
                     (PipelineRun.started_at.is_(None) & (PipelineRun.created_at < cutoff_time))
                 )
-            ).all()
+            ))
 
             count = 0
             for run in stale_runs:
@@ -301,7 +303,7 @@ class PipelineRunRepository(BaseRepository[PipelineRun]):
                 logger.info(f"Marked stale pipeline run as failed: {run.job_id}")
 
             if count > 0:
-                self.session.flush()
+                await self._flush()
                 logger.info(f"Recovered {count} stale pipeline runs (marked as failed)")
 
             return count
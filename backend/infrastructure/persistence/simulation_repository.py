@@ -7,7 +7,7 @@ import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 
 from backend.models import SimulationData
 from backend.infrastructure.persistence.base_repository import BaseRepository
@@ -97,7 +97,7 @@ class SimulationRepository(BaseRepository[SimulationData]):
             simulation.status = "completed"
             simulation.completed_at = datetime.utcnow()
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Updated simulation results: {simulation_id}")
             return simulation
             
@@ -130,7 +130,7 @@ class SimulationRepository(BaseRepository[SimulationData]):
             simulation.error_message = error_message
             simulation.completed_at = datetime.utcnow()
             
-            self.session.flush()
+            await self._flush()
             logger.info(f"Marked simulation as failed: {simulation_id}")
             return simulation
             
@@ -149,9 +149,11 @@ class SimulationRepository(BaseRepository[SimulationData]):
             Simulation data or None if not found
         """
         try:
-            return self.session.query(SimulationData).filter(
-                SimulationData.simulation_id == simulation_id
-            ).first()
+            return await self._first(
+                select(SimulationData).where(
+                    SimulationData.simulation_id == simulation_id
+                )
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting simulation by ID: {str(e)}")
             raise
@@ -174,9 +176,13 @@ class SimulationRepository(BaseRepository[SimulationData]):
             List of user's simulations
         """
         try:
-            return self.session.query(SimulationData).filter(
-                SimulationData.user_id == user_id
-            ).order_by(desc(SimulationData.created_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                select(SimulationData)
+                .where(SimulationData.user_id == user_id)
+                .order_by(desc(SimulationData.created_at))
+                .limit(limit)
+                .offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting user simulations: {str(e)}")
             raise
@@ -199,14 +205,16 @@ class SimulationRepository(BaseRepository[SimulationData]):
             List of completed simulations
         """
         try:
-            query = self.session.query(SimulationData).filter(
+            query = select(SimulationData).where(
                 SimulationData.status == "completed"
             )
             
             if user_id:
-                query = query.filter(SimulationData.user_id == user_id)
+                query = query.where(SimulationData.user_id == user_id)
             
-            return query.order_by(desc(SimulationData.completed_at)).limit(limit).offset(offset).all()
+            return await self._all(
+                query.order_by(desc(SimulationData.completed_at)).limit(limit).offset(offset)
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error getting completed simulations: {str(e)}")
             raise
@@ -226,8 +234,8 @@ class SimulationRepository(BaseRepository[SimulationData]):
             if not simulation:
                 return False
             
-            self.session.delete(simulation)
-            self.session.flush()
+            await self._delete(simulation)
+            await self._flush()
             logger.info(f"Deleted simulation: {simulation_id}")
             return True
             
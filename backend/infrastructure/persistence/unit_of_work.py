@@ -6,9 +6,10 @@ database transactions.
 """
 
 import logging
-from typing import Callable, Type
+from typing import Callable, Type, Union
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.infrastructure.persistence.interview_repository import InterviewRepository
 from backend.infrastructure.persistence.analysis_repository import AnalysisRepository
@@ -23,14 +24,22 @@ class UnitOfWork:
     This class provides an implementation of the Unit of Work pattern for managing
     database transactions. It creates repositories and manages the transaction
     lifecycle.
+
+    The session factory may produce synchronous sessions or ``AsyncSession``
+    instances (see ``backend.database.get_async_session_factory``). Async sessions
+    are only supported with ``async with``; commit, rollback and close are then
+    awaited instead of blocking the event loop.
     """
 
-    def __init__(self, session_factory: Callable[[], Session]):
+    def __init__(
+        self, session_factory: Callable[[], Union[Session, AsyncSession]]
+    ):
         """
         Initialize the Unit of Work.
 
         Args:
             session_factory: Factory function that creates a new SQLAlchemy session
+                (sync or async)
         """
         self.session_factory = session_factory
         self.session = None
@@ -52,13 +61,26 @@ class UnitOfWork:
             The UnitOfWork instance
         """
         self.session = self.session_factory()
+        if isinstance(self.session, AsyncSession):
+            # Nothing was checked out yet, so the session can simply be dropped
+            self.session = None
+            raise TypeError(
+                "UnitOfWork with an async session factory requires 'async with'"
+            )
+
+        self._init_repositories()
+        return self
 
-        # Initialize repositories with the session
+    def _init_repositories(self):
+        """Initialize repositories with the current session."""
         self.interviews = InterviewRepository(self.session)
         self.analyses = AnalysisRepository(self.session)
         # TODO: Initialize other repositories
 
-        return self
+    @property
+    def is_async(self) -> bool:
+        """Whether the current session is an ``AsyncSession``."""
+        return isinstance(self.session, AsyncSession)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
@@ -94,7 +116,9 @@ class UnitOfWork:
         Returns:
             The UnitOfWork instance
         """
-        return self.__enter__()
+        self.session = self.session_factory()
+        self._init_repositories()
+        return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
@@ -118,7 +142,10 @@ class UnitOfWork:
                 await self.rollback()
                 logger.error(f"Transaction rolled back due to commit error: {str(e)}")
 
-        self.session.close()
+        if self.is_async:
+            await self.session.close()
+        else:
+            self.session.close()
 
     async def commit(self):
         """
@@ -127,7 +154,10 @@ class UnitOfWork:
         This method commits the current transaction, making all changes permanent.
         """
         try:
-            self.session.commit()
+            if self.is_async:
+                await self.session.commit()
+            else:
+                self.session.commit()
             logger.debug("Transaction committed successfully")
         except SQLAlchemyError as e:
             logger.error(f"Error committing transaction: {str(e)}")
@@ -140,7 +170,10 @@ class UnitOfWork:
         This method rolls back the current transaction, discarding all changes.
         """
         try:
-            self.session.rollback()
+            if self.is_async:
+                await self.session.rollback()
+            else:
+                self.session.rollback()
             logger.debug("Transaction rolled back")
         except SQLAlchemyError as e:
             logger.error(f"Error rolling back transaction: {str(e)}")
@@ -0,0 +1,25 @@
+"""
+Storage infrastructure package.
+
+Content-addressed blob storage for generated media such as persona images.
+"""
+
+from backend.infrastructure.storage.blob_store import (
+    BlobInfo,
+    BlobStore,
+    LocalBlobStore,
+    blob_url,
+    extract_embedded_blobs,
+    get_blob_store,
+    store_data_uri,
+)
+
+__all__ = [
+    "BlobInfo",
+    "BlobStore",
+    "LocalBlobStore",
+    "blob_url",
+    "extract_embedded_blobs",
+    "get_blob_store",
+    "store_data_uri",
+]
@@ -0,0 +1,247 @@
+"""
+Content-addressed blob storage for generated media.
+
+Blobs are keyed by the SHA-256 of their bytes, so storing the same image twice
+keeps one copy. The ``BlobStore`` interface mirrors the S3 object calls
+(put/get/head/delete) so an object-storage backend can replace the local
+filesystem one without touching callers. Results JSON only keeps the blob URL
+returned by ``blob_url``; the bytes are served by ``GET /api/blobs/{key}``.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from backend.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+BLOB_URL_PREFIX = "/api/blobs/"
+
+_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+_DATA_URI_RE = re.compile(
+    r"^data:(?P<content_type>[\w.+-]+/[\w.+-]+)(?:;[\w.+-]+=[\w.+-]+)*;base64,",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class BlobInfo:
+    """Metadata of a stored blob."""
+
+    key: str
+    size: int
+    content_type: str
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag; the key already identifies the content."""
+        return f'"{self.key}"'
+
+
+class BlobStore:
+    """
+    Interface for content-addressed blob storage.
+
+    Method names follow the S3 object API so a bucket-backed implementation
+    can be dropped in.
+    """
+
+    def put_object(
+        self, data: bytes, content_type: str = "application/octet-stream"
+    ) -> BlobInfo:
+        """Store bytes and return their metadata; existing blobs are reused."""
+        raise NotImplementedError
+
+    def head_object(self, key: str) -> Optional[BlobInfo]:
+        """Return the metadata of a blob, or None if it does not exist."""
+        raise NotImplementedError
+
+    def get_object(
+        self, key: str, byte_range: Optional[Tuple[int, int]] = None
+    ) -> bytes:
+        """
+        Read a blob.
+
+        Args:
+            key: Blob key
+            byte_range: Optional inclusive (first, last) byte range
+
+        Raises:
+            KeyError: If the blob does not exist
+        """
+        raise NotImplementedError
+
+    def delete_object(self, key: str) -> bool:
+        """Delete a blob; returns False if it did not exist."""
+        raise NotImplementedError
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Blob store on the local filesystem.
+
+    Blobs are written to ``<root>/<key[:2]>/<key>`` with a ``.json`` sidecar
+    holding the content type. Writes go through a temporary file and an atomic
+    rename, so concurrent writers of the same content are safe.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        if not _KEY_RE.match(key or ""):
+            raise KeyError(key)
+        return self.root / key[:2] / key
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def put_object(
+        self, data: bytes, content_type: str = "application/octet-stream"
+    ) -> BlobInfo:
+        key = hashlib.sha256(data).hexdigest()
+        path = self._path(key)
+        if not path.exists():
+            self._write_atomic(
+                path.with_suffix(".json"),
+                json.dumps({"content_type": content_type}).encode("utf-8"),
+            )
+            self._write_atomic(path, data)
+        return BlobInfo(key=key, size=len(data), content_type=content_type)
+
+    def head_object(self, key: str) -> Optional[BlobInfo]:
+        try:
+            path = self._path(key)
+            size = path.stat().st_size
+        except (KeyError, OSError):
+            return None
+        content_type = "application/octet-stream"
+        try:
+            meta = json.loads(path.with_suffix(".json").read_text())
+            content_type = meta.get("content_type") or content_type
+        except (OSError, ValueError):
+            pass
+        return BlobInfo(key=key, size=size, content_type=content_type)
+
+    def get_object(
+        self, key: str, byte_range: Optional[Tuple[int, int]] = None
+    ) -> bytes:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if byte_range is None:
+                    return f.read()
+                first, last = byte_range
+                f.seek(first)
+                return f.read(last - first + 1)
+        except FileNotFoundError:
+            raise KeyError(key)
+
+    def delete_object(self, key: str) -> bool:
+        try:
+            path = self._path(key)
+            path.unlink()
+        except (KeyError, FileNotFoundError):
+            return False
+        try:
+            path.with_suffix(".json").unlink()
+        except FileNotFoundError:
+            pass
+        return True
+
+
+_blob_store: Optional[BlobStore] = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """Get the process-wide blob store configured by ``BLOB_STORE_DIR``."""
+    global _blob_store
+    if _blob_store is None:
+        with _blob_store_lock:
+            if _blob_store is None:
+                _blob_store = LocalBlobStore(settings.blob_store_dir)
+    return _blob_store
+
+
+def blob_url(key: str) -> str:
+    """URL under which a blob is served."""
+    return f"{settings.blob_public_base_url}{BLOB_URL_PREFIX}{key}"
+
+
+def store_data_uri(data_uri: str, store: Optional[BlobStore] = None) -> Optional[str]:
+    """
+    Move a base64 ``data:`` URI into the blob store.
+
+    Args:
+        data_uri: ``data:<type>;base64,<payload>`` string
+        store: Blob store to use (defaults to ``get_blob_store()``)
+
+    Returns:
+        The blob URL, or None if the value is not a decodable base64 data URI
+    """
+    if not isinstance(data_uri, str):
+        return None
+    match = _DATA_URI_RE.match(data_uri)
+    if not match:
+        return None
+    try:
+        data = base64.b64decode(data_uri[match.end() :], validate=True)
+    except (binascii.Error, ValueError):
+        logger.warning("Skipping data URI with invalid base64 payload")
+        return None
+    info = (store or get_blob_store()).put_object(
+        data, match.group("content_type").lower()
+    )
+    return blob_url(info.key)
+
+
+def extract_embedded_blobs(value: Any, store: Optional[BlobStore] = None) -> int:
+    """
+    Replace base64 data URIs nested in a JSON-like value with blob URLs, in place.
+
+    Args:
+        value: Dict or list, e.g. ``AnalysisResult.results``
+        store: Blob store to use (defaults to ``get_blob_store()``)
+
+    Returns:
+        Number of data URIs moved to the blob store
+    """
+    moved = 0
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return 0
+    for k, v in list(items):
+        if isinstance(v, str):
+            url = store_data_uri(v, store)
+            if url:
+                value[k] = url
+                moved += 1
+        else:
+            moved += extract_embedded_blobs(v, store)
+    return moved
@@ -0,0 +1,86 @@
+"""Add job_records table for the background job queue
+
+Revision ID: add_job_records_table
+Revises: add_pipeline_runs_table
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_job_records_table'
+down_revision = 'add_pipeline_runs_table'
+branch_labels = None
+depends_on = None
+
+
+def _is_sqlite():
+    """Check if the database is SQLite."""
+    bind = op.get_bind()
+    return bind.dialect.name == "sqlite"
+
+
+def upgrade() -> None:
+    """Create job_records table for durable background job tracking."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # Choose JSON type appropriate for the backend
+    JSONType = sa.JSON
+    if _is_sqlite():
+        JSONType = sqlite.JSON
+    else:
+        JSONType = postgresql.JSONB
+
+    tables = inspector.get_table_names()
+    if "job_records" in tables:
+        # Already exists - skip creating
+        return
+
+    op.create_table(
+        "job_records",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=True),
+        # Scheduling
+        sa.Column("lane", sa.String(), nullable=False, server_default="interactive"),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="2"),
+        # Handler input
+        sa.Column("payload", JSONType, nullable=False),
+        # Lifecycle
+        sa.Column("worker_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.UniqueConstraint("job_id", name="uq_job_records_job_id"),
+    )
+
+    op.create_index("ix_job_records_job_id", "job_records", ["job_id"], unique=True)
+    op.create_index("ix_job_records_kind", "job_records", ["kind"], unique=False)
+    op.create_index("ix_job_records_user_id", "job_records", ["user_id"], unique=False)
+    op.create_index("ix_job_records_status", "job_records", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop job_records table and indexes."""
+    for index_name in (
+        "ix_job_records_status",
+        "ix_job_records_user_id",
+        "ix_job_records_kind",
+        "ix_job_records_job_id",
+    ):
+        try:
+            op.drop_index(index_name, table_name="job_records")
+        except Exception:
+            pass
+
+    op.drop_table("job_records")
@@ -0,0 +1,65 @@
+"""Add analysis_progress table for out-of-band analysis progress
+
+Revision ID: add_analysis_progress_table
+Revises: add_job_records_table
+Create Date: 2025-11-21 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_analysis_progress_table'
+down_revision = 'add_job_records_table'
+branch_labels = None
+depends_on = None
+
+
+def _is_sqlite():
+    """Check if the database is SQLite."""
+    bind = op.get_bind()
+    return bind.dialect.name == "sqlite"
+
+
+def upgrade() -> None:
+    """Create analysis_progress table holding the latest progress per analysis."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # Choose JSON type appropriate for the backend
+    JSONType = sa.JSON
+    if _is_sqlite():
+        JSONType = sqlite.JSON
+    else:
+        JSONType = postgresql.JSONB
+
+    tables = inspector.get_table_names()
+    if "analysis_progress" in tables:
+        # Already exists - skip creating
+        return
+
+    op.create_table(
+        "analysis_progress",
+        sa.Column("result_id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="processing"),
+        sa.Column("progress", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("current_stage", sa.String(), nullable=True),
+        sa.Column("message", sa.Text(), nullable=True),
+        sa.Column("stage_states", JSONType, nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("error_code", sa.String(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["result_id"],
+            ["analysis_results.result_id"],
+            name="fk_analysis_progress_result_id",
+            ondelete="CASCADE",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop analysis_progress table."""
+    op.drop_table("analysis_progress")
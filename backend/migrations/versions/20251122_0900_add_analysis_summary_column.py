@@ -0,0 +1,47 @@
+"""Add summary column to analysis_results for the analysis history list
+
+Revision ID: add_analysis_summary_column
+Revises: add_analysis_progress_table
+Create Date: 2025-11-22 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_analysis_summary_column'
+down_revision = 'add_analysis_progress_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the precomputed summary column and a listing index."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    columns = {col["name"] for col in inspector.get_columns("analysis_results")}
+    if "summary" not in columns:
+        op.add_column("analysis_results", sa.Column("summary", sa.JSON(), nullable=True))
+
+    indexes = {idx["name"] for idx in inspector.get_indexes("analysis_results")}
+    if "ix_analysis_results_data_id_analysis_date" not in indexes:
+        # Supports the per-user history list ordered by date
+        op.create_index(
+            "ix_analysis_results_data_id_analysis_date",
+            "analysis_results",
+            ["data_id", "analysis_date"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop the summary column and listing index."""
+    try:
+        op.drop_index(
+            "ix_analysis_results_data_id_analysis_date", table_name="analysis_results"
+        )
+    except Exception:
+        pass
+    op.drop_column("analysis_results", "summary")
@@ -0,0 +1,77 @@
+"""Move base64 images embedded in analysis results into the blob store
+
+Revision ID: extract_embedded_images
+Revises: add_analysis_summary_column
+Create Date: 2025-11-23 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import json
+import logging
+
+
+# revision identifiers, used by Alembic.
+revision = 'extract_embedded_images'
+down_revision = 'add_analysis_summary_column'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+analysis_results = sa.table(
+    "analysis_results",
+    sa.column("result_id", sa.Integer),
+    sa.column("results", sa.JSON),
+)
+
+
+def _rename_avatar_fields(results) -> None:
+    """Avatars are stored as ``avatar_url`` now that they are not data URIs."""
+    personas = results.get("personas") if isinstance(results, dict) else None
+    for persona in personas if isinstance(personas, list) else []:
+        if isinstance(persona, dict) and "avatar_data_uri" in persona:
+            value = persona.pop("avatar_data_uri")
+            persona.setdefault("avatar_url", value)
+
+
+def upgrade() -> None:
+    """Extract data URIs from results JSON, one row at a time."""
+    from backend.infrastructure.storage import extract_embedded_blobs
+
+    conn = op.get_bind()
+    candidates = sa.cast(analysis_results.c.results, sa.Text).like("%data:image/%")
+    result_ids = [
+        row[0]
+        for row in conn.execute(
+            sa.select(analysis_results.c.result_id).where(candidates)
+        )
+    ]
+
+    migrated = 0
+    for result_id in result_ids:
+        raw = conn.execute(
+            sa.select(analysis_results.c.results).where(
+                analysis_results.c.result_id == result_id
+            )
+        ).scalar()
+        results = json.loads(raw) if isinstance(raw, str) else raw
+        if not isinstance(results, (dict, list)):
+            continue
+        moved = extract_embedded_blobs(results)
+        _rename_avatar_fields(results)
+        if moved:
+            conn.execute(
+                analysis_results.update()
+                .where(analysis_results.c.result_id == result_id)
+                .values(results=results)
+            )
+            migrated += 1
+            logger.info(f"Moved {moved} embedded images of result {result_id}")
+
+    logger.info(f"Extracted embedded images from {migrated} analysis results")
+
+
+def downgrade() -> None:
+    """Blobs and references are kept; the extraction is not reversed."""
+    pass
@@ -0,0 +1,33 @@
+"""Add read_view column to analysis_results for materialized result views
+
+Revision ID: add_analysis_read_view_column
+Revises: extract_embedded_images
+Create Date: 2025-11-24 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_analysis_read_view_column'
+down_revision = 'extract_embedded_images'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the materialized read view column."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    columns = {col["name"] for col in inspector.get_columns("analysis_results")}
+    if "read_view" not in columns:
+        op.add_column(
+            "analysis_results", sa.Column("read_view", sa.JSON(), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    """Drop the materialized read view column."""
+    op.drop_column("analysis_results", "read_view")
@@ -0,0 +1,51 @@
+"""Add usage_counters table for atomic monthly usage counting
+
+Revision ID: add_usage_counters_table
+Revises: add_analysis_read_view_column
+Create Date: 2025-11-25 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_usage_counters_table'
+down_revision = 'add_analysis_read_view_column'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create usage_counters table with one row per user, month and metric.
+
+    Existing counts in ``users.usage_data`` are not copied here; the ledger
+    seeds each counter from them on its first increment.
+    """
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    tables = inspector.get_table_names()
+    if "usage_counters" in tables:
+        # Already exists - skip creating
+        return
+
+    op.create_table(
+        "usage_counters",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("period", sa.String(length=7), nullable=False),
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "period", "metric"),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            name="fk_usage_counters_user_id",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop usage_counters table."""
+    op.drop_table("usage_counters")
@@ -0,0 +1,34 @@
+"""Add results_fingerprint column to analysis_results
+
+Revision ID: add_results_fingerprint_column
+Revises: add_usage_counters_table
+Create Date: 2025-11-26 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_results_fingerprint_column'
+down_revision = 'add_usage_counters_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the stored results fingerprint used for results ETags."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    columns = {col["name"] for col in inspector.get_columns("analysis_results")}
+    if "results_fingerprint" not in columns:
+        op.add_column(
+            "analysis_results",
+            sa.Column("results_fingerprint", sa.String(length=64), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    """Drop the stored results fingerprint."""
+    op.drop_column("analysis_results", "results_fingerprint")
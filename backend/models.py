@@ -10,7 +10,8 @@ from sqlalchemy import (
     Float,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship, sessionmaker, foreign
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import relationship, sessionmaker, foreign, deferred
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -134,6 +135,19 @@ class AnalysisResult(Base):
     # NEW: Multi-stakeholder intelligence support
     stakeholder_intelligence = Column(JSONB, nullable=True)
 
+    # Small summary (counts, sentiment overview, error) written when the
+    # analysis finishes, so the history list never loads ``results``
+    summary = Column(JSON, nullable=True)
+
+    # Digest of ``results``, kept current on every write of ``results`` so the
+    # results ETag never needs the blob itself
+    results_fingerprint = Column(String(64), nullable=True)
+
+    # Hydrated, revalidated GET /api/results payload stamped with the results
+    # fingerprint and algorithm version it was computed from. Deferred: only
+    # GET /api/results loads it
+    read_view = deferred(Column(JSON, nullable=True))
+
     interview_data = relationship(
         "InterviewData",
         viewonly=True,
@@ -142,6 +156,25 @@ class AnalysisResult(Base):
     cached_prds = relationship("CachedPRD", viewonly=True)
 
 
+@event.listens_for(AnalysisResult, "before_insert")
+@event.listens_for(AnalysisResult, "before_update")
+def _stamp_results_fingerprint(mapper, connection, target):
+    """Refresh the results fingerprint and drop the stale view on a write."""
+    state = sa_inspect(target)
+    if "results" in state.unloaded:
+        return
+    changed = state.attrs.results.history.has_changes()
+    if changed or target.results_fingerprint is None:
+        from backend.services.results.read_view import results_fingerprint
+
+        target.results_fingerprint = (
+            results_fingerprint(target.results) if target.results else None
+        )
+    if changed and not state.attrs.read_view.history.has_changes():
+        # Built for the previous results; the next read rebuilds it
+        target.read_view = None
+
+
 class Persona(Base):
     __tablename__ = "personas"
     __table_args__ = {"extend_existing": True}
@@ -312,3 +345,89 @@ class PipelineRun(Base):
         if self.completed_at and self.created_at:
             return int((self.completed_at - self.created_at).total_seconds() / 60)
         return None
+
+
+class JobRecord(Base):
+    """
+    Durable record of a background job managed by the job queue.
+
+    Every analysis and AxPersona pipeline job is persisted here before it is
+    queued, so jobs that were running or waiting when the process stopped can
+    be re-queued on startup instead of being silently dropped.
+    """
+
+    __tablename__ = "job_records"
+    __table_args__ = {"extend_existing": True}
+    __module__ = "backend.models"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String, unique=True, nullable=False, index=True)
+    kind = Column(String, nullable=False, index=True)  # e.g. analysis, axpersona_pipeline
+    user_id = Column(String, nullable=True, index=True)
+
+    # Scheduling
+    lane = Column(String, nullable=False, default="interactive")  # interactive, batch
+    priority = Column(Integer, nullable=False, default=0)  # lower runs first
+    status = Column(
+        String, nullable=False, default="queued", index=True
+    )  # queued, running, completed, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=2)
+
+    # Handler input, must be JSON serializable so the job can be re-run
+    payload = Column(JSON, nullable=False)
+
+    # Lifecycle
+    worker_id = Column(String, nullable=True)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+
+
+class AnalysisProgress(Base):
+    """
+    Latest progress snapshot of an analysis, kept apart from the results blob.
+
+    Written in coalesced batches by the analysis progress store so that
+    progress ticks and status polling never touch ``AnalysisResult.results``.
+    """
+
+    __tablename__ = "analysis_progress"
+    __table_args__ = {"extend_existing": True}
+    __module__ = "backend.models"
+
+    result_id = Column(
+        Integer,
+        ForeignKey("analysis_results.result_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    status = Column(String, nullable=False, default="processing")
+    progress = Column(Float, nullable=False, default=0.0)
+    current_stage = Column(String, nullable=True)
+    message = Column(Text, nullable=True)
+    stage_states = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    error_code = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=utc_now, nullable=False)
+
+
+class UsageCounter(Base):
+    """
+    Monthly usage counter of one metric for one user.
+
+    Counters are incremented with a single atomic upsert, so concurrent
+    analyses of the same user cannot lose increments the way the previous
+    read-modify-write of ``User.usage_data`` did.
+    """
+
+    __tablename__ = "usage_counters"
+    __table_args__ = {"extend_existing": True}
+    __module__ = "backend.models"
+
+    user_id = Column(String, ForeignKey("users.user_id"), primary_key=True)
+    period = Column(String(7), primary_key=True)  # "YYYY-MM" (UTC)
+    metric = Column(String, primary_key=True)  # analyses_count, prd_generations_count
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
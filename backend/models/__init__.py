@@ -70,6 +70,9 @@ def _get_sqlalchemy_models():
                 "CachedPRD": getattr(backend_models, "CachedPRD", None),
                 "SimulationData": getattr(backend_models, "SimulationData", None),
                 "PipelineRun": getattr(backend_models, "PipelineRun", None),
+                "JobRecord": getattr(backend_models, "JobRecord", None),
+                "AnalysisProgress": getattr(backend_models, "AnalysisProgress", None),
+                "UsageCounter": getattr(backend_models, "UsageCounter", None),
             }
         else:
             _models_cache = {
@@ -80,6 +83,9 @@ def _get_sqlalchemy_models():
                 "CachedPRD": None,
                 "SimulationData": None,
                 "PipelineRun": None,
+                "JobRecord": None,
+                "AnalysisProgress": None,
+                "UsageCounter": None,
             }
 
     except Exception as e:
@@ -96,6 +102,9 @@ def _get_sqlalchemy_models():
             "CachedPRD": None,
             "SimulationData": None,
             "PipelineRun": None,
+            "JobRecord": None,
+            "AnalysisProgress": None,
+            "UsageCounter": None,
         }
 
     return _models_cache
@@ -110,6 +119,9 @@ Persona = _models["Persona"]
 CachedPRD = _models["CachedPRD"]
 SimulationData = _models["SimulationData"]
 PipelineRun = _models["PipelineRun"]
+JobRecord = _models["JobRecord"]
+AnalysisProgress = _models["AnalysisProgress"]
+UsageCounter = _models["UsageCounter"]
 
 
 __all__ = [
@@ -140,4 +152,7 @@ __all__ = [
     "CachedPRD",
     "SimulationData",
     "PipelineRun",
+    "JobRecord",
+    "AnalysisProgress",
+    "UsageCounter",
 ]
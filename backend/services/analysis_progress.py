@@ -0,0 +1,424 @@
+"""
+Out-of-band progress channel for running analyses.
+
+Progress used to be stored inside ``AnalysisResult.results``: every tick loaded
+the whole results JSON, changed a few fields, dumped it back and committed on
+the event loop thread, and every status poll parsed the same blob to read one
+float.
+
+``AnalysisProgressStore`` keeps the live progress of each analysis in memory,
+pushes every update to subscribers (the SSE endpoint), and writes coalesced
+snapshots to the small ``analysis_progress`` table at a fixed interval from a
+worker thread. Readers in other processes fall back to that table.
+"""
+
+import asyncio
+import copy
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+from backend.infrastructure.config.settings import settings
+from backend.utils.timezone_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class AnalysisProgressStore:
+    """
+    In-memory progress state with pub/sub and periodic persistence.
+
+    Snapshots are plain dictionaries with the keys ``result_id``, ``status``,
+    ``progress``, ``current_stage``, ``message``, ``stage_states``, ``error``,
+    ``error_code`` and ``updated_at``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            session_factory: Factory returning a SQLAlchemy session
+            flush_interval: Seconds between coalesced writes to the database
+        """
+        if session_factory is None:
+            from backend.database import SessionLocal
+
+            session_factory = SessionLocal
+
+        self._session_factory = session_factory
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.analysis_progress_flush_seconds
+        )
+        self._states: Dict[int, Dict[str, Any]] = {}
+        self._dirty: Set[int] = set()
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.writes = 0
+
+    def update(
+        self,
+        result_id: int,
+        stage: str,
+        progress: float,
+        message: str,
+        overall: Optional[float] = None,
+        stage_status: str = "in_progress",
+    ) -> Dict[str, Any]:
+        """
+        Record a stage update and notify subscribers.
+
+        Args:
+            result_id: ID of the analysis result
+            stage: Stage name, e.g. ``THEME_EXTRACTION``
+            progress: Progress within the stage from 0.0 to 1.0
+            message: Human readable status message
+            overall: Optional overall progress; it never moves backwards, since
+                concurrent stages may report out of order
+            stage_status: Status of the stage (in_progress, completed)
+
+        Returns:
+            Copy of the updated snapshot
+        """
+        state = self._states.get(result_id)
+        if state is None:
+            state = self._new_state(result_id)
+            self._states[result_id] = state
+
+        state["current_stage"] = stage
+        state["stage_states"][stage] = {
+            "status": stage_status,
+            "progress": progress,
+            "message": message,
+        }
+        if overall is not None:
+            state["progress"] = max(state["progress"], overall)
+        state["message"] = message
+        state["updated_at"] = utc_now().isoformat()
+
+        self._dirty.add(result_id)
+        self._publish(result_id, state)
+        self._ensure_flusher()
+        return copy.deepcopy(state)
+
+    async def finish(
+        self,
+        result_id: int,
+        status: str,
+        message: str,
+        error: Optional[str] = None,
+        error_code: Optional[str] = None,
+        stage_states: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record the final state, persist it immediately and release memory.
+
+        If the write fails the state stays in memory and is retried by the
+        periodic flush, so the terminal snapshot is never lost.
+
+        Args:
+            result_id: ID of the analysis result
+            status: Final status (completed, failed)
+            message: Final status message
+            error: Error details when the analysis failed
+            error_code: Machine readable error code
+            stage_states: Optional final stage states to store
+
+        Returns:
+            Copy of the final snapshot
+        """
+        state = self._states.get(result_id)
+        if state is None:
+            state = self._new_state(result_id)
+            self._states[result_id] = state
+
+        state["status"] = status
+        state["message"] = message
+        state["error"] = error
+        state["error_code"] = error_code
+        if stage_states is not None:
+            state["stage_states"] = copy.deepcopy(stage_states)
+        if status == "completed":
+            state["progress"] = 1.0
+            state["current_stage"] = "COMPLETION"
+        elif state["current_stage"] in state["stage_states"]:
+            state["stage_states"][state["current_stage"]]["status"] = "failed"
+        state["updated_at"] = utc_now().isoformat()
+
+        self._dirty.add(result_id)
+        self._publish(result_id, state)
+        snapshot = copy.deepcopy(state)
+        # The state is released once the terminal snapshot is written; until
+        # then the flush loop keeps retrying it
+        await self.flush()
+        if result_id in self._states:
+            self._ensure_flusher()
+        return snapshot
+
+    def snapshot(self, result_id: int) -> Optional[Dict[str, Any]]:
+        """Return the in-memory snapshot of a running analysis, if any."""
+        state = self._states.get(result_id)
+        return copy.deepcopy(state) if state is not None else None
+
+    async def get(self, result_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Return the latest snapshot, from memory or from the database.
+
+        Args:
+            result_id: ID of the analysis result
+
+        Returns:
+            Snapshot dictionary, or None if no progress was ever recorded
+        """
+        state = self.snapshot(result_id)
+        if state is not None:
+            return state
+        return await asyncio.to_thread(self._load, result_id)
+
+    async def subscribe(
+        self, result_id: int, keepalive: Optional[float] = None
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield snapshots as the analysis progresses until it finishes.
+
+        The current snapshot is yielded first. When ``keepalive`` seconds pass
+        without an update, the database row is re-read (the analysis may run in
+        another process) and ``None`` is yielded if nothing changed, so callers
+        can emit a keep-alive.
+
+        Args:
+            result_id: ID of the analysis result
+            keepalive: Optional idle timeout in seconds
+
+        Yields:
+            Snapshot dictionaries, or None on an idle keep-alive tick
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self._subscribers.setdefault(result_id, set()).add(queue)
+        try:
+            current = await self._get_or_final(result_id)
+            last_update = None
+            if current is not None:
+                last_update = current["updated_at"]
+                yield current
+                if current["status"] in TERMINAL_STATUSES:
+                    return
+
+            while True:
+                try:
+                    state = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    state = await self._get_or_final(result_id)
+                    if state is None or state["updated_at"] == last_update:
+                        yield None
+                        continue
+                last_update = state["updated_at"]
+                yield state
+                if state["status"] in TERMINAL_STATUSES:
+                    return
+        finally:
+            subscribers = self._subscribers.get(result_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    self._subscribers.pop(result_id, None)
+
+    async def flush(self) -> int:
+        """
+        Write dirty snapshots to the database in one transaction.
+
+        Returns:
+            Number of snapshots written
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._dirty:
+                return 0
+            pending = [
+                copy.deepcopy(self._states[result_id])
+                for result_id in self._dirty
+                if result_id in self._states
+            ]
+            self._dirty.clear()
+            try:
+                await asyncio.to_thread(self._write, pending)
+            except Exception as e:
+                logger.error(f"Error flushing analysis progress: {str(e)}")
+                # Retry on the next flush unless newer updates replaced them
+                self._dirty.update(state["result_id"] for state in pending)
+                return 0
+            self.writes += 1
+            for state in pending:
+                result_id = state["result_id"]
+                if (
+                    state["status"] in TERMINAL_STATUSES
+                    and result_id not in self._dirty
+                ):
+                    self._states.pop(result_id, None)
+            return len(pending)
+
+    async def close(self) -> None:
+        """Stop the periodic flush and write the snapshots still pending."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+
+    async def _get_or_final(self, result_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Like ``get``, but ends analyses that never recorded progress.
+
+        Results finished before progress was tracked out of band have no
+        snapshot; a terminal one is derived from the result row so subscribers
+        get a final event instead of waiting forever.
+        """
+        state = await self.get(result_id)
+        if state is not None:
+            return state
+        final = await asyncio.to_thread(self._load_result_status, result_id)
+        if final is not None and final["status"] in TERMINAL_STATUSES:
+            return final
+        return None
+
+    def _new_state(self, result_id: int) -> Dict[str, Any]:
+        return {
+            "result_id": result_id,
+            "status": "processing",
+            "progress": 0.0,
+            "current_stage": None,
+            "message": None,
+            "stage_states": {},
+            "error": None,
+            "error_code": None,
+            "updated_at": utc_now().isoformat(),
+        }
+
+    def _publish(self, result_id: int, state: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(result_id, ()):
+            if queue.full():
+                # Slow consumer: drop the oldest snapshot, the newest wins
+                queue.get_nowait()
+            queue.put_nowait(copy.deepcopy(state))
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while self._states:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _write(self, states) -> None:
+        from backend.models import AnalysisProgress
+
+        session = self._session_factory()
+        try:
+            for state in states:
+                session.merge(
+                    AnalysisProgress(
+                        result_id=state["result_id"],
+                        status=state["status"],
+                        progress=state["progress"],
+                        current_stage=state["current_stage"],
+                        message=state["message"],
+                        stage_states=state["stage_states"],
+                        error=state["error"],
+                        error_code=state["error_code"],
+                        updated_at=datetime.fromisoformat(state["updated_at"]),
+                    )
+                )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _load(self, result_id: int) -> Optional[Dict[str, Any]]:
+        from backend.models import AnalysisProgress
+
+        session = self._session_factory()
+        try:
+            row = session.get(AnalysisProgress, result_id)
+            if row is None:
+                return None
+            return {
+                "result_id": row.result_id,
+                "status": row.status,
+                "progress": row.progress or 0.0,
+                "current_stage": row.current_stage,
+                "message": row.message,
+                "stage_states": row.stage_states or {},
+                "error": row.error,
+                "error_code": row.error_code,
+                "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            }
+        finally:
+            session.close()
+
+
+    def _load_result_status(self, result_id: int) -> Optional[Dict[str, Any]]:
+        """Snapshot derived from the ``AnalysisResult`` row, without its results."""
+        from backend.models import AnalysisResult
+
+        session = self._session_factory()
+        try:
+            row = (
+                session.query(
+                    AnalysisResult.status,
+                    AnalysisResult.error_message,
+                    AnalysisResult.completed_at,
+                )
+                .filter(AnalysisResult.result_id == result_id)
+                .first()
+            )
+        finally:
+            session.close()
+
+        state = self._new_state(result_id)
+        if row is None:
+            state.update(
+                status="failed",
+                message="Analysis result not found",
+                error="Analysis result not found",
+                error_code="NOT_FOUND",
+            )
+            return state
+        status, error_message, completed_at = row
+        if status == "completed":
+            state.update(status="completed", progress=1.0, current_stage="COMPLETION")
+        elif status in ("failed", "error"):
+            state.update(
+                status="failed",
+                message=error_message,
+                error=error_message,
+                error_code="ANALYSIS_FAILED",
+            )
+        else:
+            state["status"] = status or "processing"
+        if completed_at is not None:
+            state["updated_at"] = completed_at.isoformat()
+        return state
+
+
+_progress_store: Optional[AnalysisProgressStore] = None
+
+
+def get_analysis_progress_store() -> AnalysisProgressStore:
+    """Return the process-wide progress store, creating it on first use."""
+    global _progress_store
+    if _progress_store is None:
+        _progress_store = AnalysisProgressStore()
+    return _progress_store
@@ -4,7 +4,7 @@ import json
 import logging
 import asyncio
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 from pydantic import ValidationError
 
 # Import SQLAlchemy models directly from models.py to avoid dynamic import issues
@@ -13,12 +13,17 @@ from backend.services.llm import LLMServiceFactory
 from backend.services.nlp import get_nlp_processor
 from backend.core.processing_pipeline import process_data
 from backend.infrastructure.config.settings import settings
+from backend.services.jobs import QueueFullError, get_job_queue
+from backend.services.analysis_progress import get_analysis_progress_store
+from backend.services.results.formatting.summary import build_analysis_summary
 from backend.schemas import DetailedAnalysisResult, StakeholderIntelligence
 from backend.utils.timezone_utils import utc_now
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+ANALYSIS_JOB_KIND = "analysis"
+
 # We'll import stakeholder analysis service dynamically to avoid circular imports
 StakeholderAnalysisService = None
 STAKEHOLDER_ANALYSIS_AVAILABLE = None  # Will be determined at runtime
@@ -99,9 +104,8 @@ class AnalysisService:
             # Always use enhanced thematic analysis
             logger.info("Using enhanced thematic analysis")
 
-            # Initialize services
-            llm_service = LLMServiceFactory.create(llm_provider)
-            nlp_processor = get_nlp_processor()()
+            # Fail fast on an unknown provider; the job creates its own instance
+            LLMServiceFactory.create(llm_provider)
 
             # Get interview data with user authorization check
             try:
@@ -133,30 +137,37 @@ class AnalysisService:
                 data_id, llm_provider, llm_model, industry
             )
 
-            # Track usage after creating the analysis result
+            # Queue background processing. The payload is persisted with the job
+            # record so the job can be re-run after a restart.
             try:
-                await usage_service.track_analysis(analysis_result.result_id)
-            except Exception as usage_error:
-                # Log the error but continue with the analysis
-                logger.warning(f"Error tracking usage: {str(usage_error)}")
-                # This is non-critical, so we can continue
-
-            # Start background processing task
-            asyncio.create_task(
-                self._process_data_task(
-                    analysis_result.result_id,
-                    nlp_processor,
-                    llm_service,
-                    data,
+                await get_job_queue().submit(
+                    ANALYSIS_JOB_KIND,
                     {
-                        "use_enhanced_theme_analysis": True,  # Always run enhanced analysis
-                        "use_reliability_check": True,  # Always use reliability check
+                        "result_id": analysis_result.result_id,
+                        "data_id": data_id,
+                        "user_id": self.user.user_id,
                         "llm_provider": llm_provider,
                         "llm_model": llm_model,
-                        "industry": industry,  # Pass industry context to the processing pipeline
+                        "is_free_text": is_free_text,
+                        "industry": industry,
                     },
+                    user_id=self.user.user_id,
+                    job_id=f"analysis-{analysis_result.result_id}",
                 )
-            )
+            except QueueFullError as e:
+                await mark_analysis_failed(analysis_result.result_id, str(e))
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many analyses are queued right now. Please try again in a few minutes.",
+                )
+
+            # Track usage after the analysis has been accepted
+            try:
+                await usage_service.track_analysis(analysis_result.result_id)
+            except Exception as usage_error:
+                # Log the error but continue with the analysis
+                logger.warning(f"Error tracking usage: {str(usage_error)}")
+                # This is non-critical, so we can continue
 
             # Return response
             return {
@@ -440,73 +451,23 @@ class AnalysisService:
                 )
                 return  # Exit if record not found
 
-            # Get current results data
-            try:
-                current_results = json.loads(task_result.results)
-            except (json.JSONDecodeError, TypeError):
-                # If there's an issue with the current results, initialize with defaults
-                current_results = {
-                    "status": "processing",
-                    "message": "Analysis in progress",
-                    "progress": 0.0,
-                    "current_stage": "PREPROCESSING",
-                    "stage_states": {},
-                    "started_at": datetime.now(timezone.utc).isoformat(),
-                }
-
-            # Update preprocessing stage to completed and move to analysis stage
-            if "stage_states" not in current_results:
-                current_results["stage_states"] = {}
-
-            # Update preprocessing stage
-            current_results["stage_states"]["PREPROCESSING"] = {
-                "status": "completed",
-                "progress": 1.0,
-                "message": "Data preprocessing completed",
-            }
-
-            # Move to analysis stage
-            current_results["current_stage"] = "ANALYSIS"
-            current_results["stage_states"]["ANALYSIS"] = {
-                "status": "in_progress",
-                "progress": 0.1,
-                "message": "Starting analysis with LLM",
-            }
-
-            # Update overall progress to 10%
-            current_results["progress"] = 0.1
-            current_results["message"] = "Analysis in progress"
-
-            # Save updated status
-            task_result.results = json.dumps(current_results)
-            async_db.commit()
-            logger.info(
-                f"Updated status to 'processing' with detailed progress for result_id: {result_id}"
+            # Progress is tracked out of band so ticks never rewrite the results blob
+            progress_store = get_analysis_progress_store()
+            progress_store.update(
+                result_id,
+                "PREPROCESSING",
+                1.0,
+                "Data preprocessing completed",
+                overall=0.05,
+                stage_status="completed",
+            )
+            progress_store.update(
+                result_id, "ANALYSIS", 0.1, "Starting analysis with LLM", overall=0.1
             )
 
             # Define a progress update function to update the progress during analysis
             async def update_progress(stage: str, progress: float, message: str):
-                nonlocal task_result, async_db, current_results
                 try:
-                    # Get the latest results
-                    try:
-                        current_results = json.loads(task_result.results)
-                        if not isinstance(current_results, dict):
-                            current_results = {}
-                    except (json.JSONDecodeError, TypeError):
-                        current_results = {}
-
-                    # Update stage information
-                    if "stage_states" not in current_results:
-                        current_results["stage_states"] = {}
-
-                    current_results["current_stage"] = stage
-                    current_results["stage_states"][stage] = {
-                        "status": "in_progress",
-                        "progress": progress,
-                        "message": message,
-                    }
-
                     # Simple overall progress calculation
                     # Map stages to simple progress ranges
                     stage_progress_map = {
@@ -529,14 +490,9 @@ class AnalysisService:
                     )  # Each stage can contribute up to 10%
                     overall_progress = min(0.95, base_progress + stage_contribution)
 
-                    current_results["progress"] = overall_progress
-
-                    # Update message
-                    current_results["message"] = message
-
-                    # Save updated status
-                    task_result.results = json.dumps(current_results)
-                    async_db.commit()
+                    progress_store.update(
+                        result_id, stage, progress, message, overall=overall_progress
+                    )
                 except Exception as update_error:
                     logger.error(
                         f"Error updating progress for result_id {result_id}: {str(update_error)}"
@@ -731,11 +687,27 @@ class AnalysisService:
 
             # Now update the status to completed and commit again
             task_result.status = "completed"
+            task_result.summary = build_analysis_summary(current_results, "completed")
             async_db.commit()
             logger.info(
                 f"Successfully set status to 'completed' for result_id: {task_result.result_id}"
             )
 
+            # Materialize the GET /api/results view now, so reads never format
+            from backend.services.results.read_view_builder import (
+                materialize_read_view_in_thread,
+            )
+
+            await materialize_read_view_in_thread(
+                async_db, task_result.result_id, self.user
+            )
+            await progress_store.finish(
+                result_id,
+                "completed",
+                "Analysis completed successfully",
+                stage_states=current_results["stage_states"],
+            )
+
         except Exception as e:
             logger.error(
                 f"Error during analysis task for result_id {result_id}: {str(e)}",
@@ -760,12 +732,16 @@ class AnalysisService:
                     except (json.JSONDecodeError, TypeError):
                         current_results = {}
 
-                    # Determine which stage failed
-                    current_stage = current_results.get("current_stage", "UNKNOWN")
+                    # Determine which stage failed from the live progress
+                    snapshot = get_analysis_progress_store().snapshot(result_id) or {}
+                    current_stage = snapshot.get("current_stage") or current_results.get(
+                        "current_stage", "UNKNOWN"
+                    )
 
                     # Update the stage status to failed
-                    if "stage_states" not in current_results:
-                        current_results["stage_states"] = {}
+                    current_results["stage_states"] = snapshot.get(
+                        "stage_states", current_results.get("stage_states", {})
+                    )
 
                     if current_stage in current_results["stage_states"]:
                         current_results["stage_states"][current_stage][
@@ -792,11 +768,21 @@ class AnalysisService:
                     # Update database record with error
                     task_result.results = json.dumps(current_results)
                     task_result.status = "failed"
+                    task_result.summary = build_analysis_summary(
+                        current_results, "failed"
+                    )
                     task_result.completed_at = datetime.now(timezone.utc)
                     async_db.commit()
                     logger.info(
                         f"Set status to 'failed' with detailed error info for result_id: {result_id}"
                     )
+                    await get_analysis_progress_store().finish(
+                        result_id,
+                        "failed",
+                        error_info["message"],
+                        error=str(e),
+                        error_code="ANALYSIS_PROCESSING_ERROR",
+                    )
                 else:
                     logger.error(
                         f"Could not update status to failed, AnalysisResult record not found for result_id: {result_id}"
@@ -811,3 +797,145 @@ class AnalysisService:
             if async_db:
                 async_db.close()
                 logger.info(f"Closed database session for result_id: {result_id}")
+
+
+async def run_analysis_job(job_id: str, payload: Dict[str, Any]) -> None:
+    """
+    Job queue handler that runs a queued analysis.
+
+    Rebuilds the services and parsed interview data from the persisted payload
+    and hands over to ``AnalysisService._process_data_task``, which records
+    progress and the final status on the analysis result.
+
+    Args:
+        job_id: Job queue identifier
+        payload: Payload stored by ``AnalysisService.start_analysis``
+    """
+    result_id = payload["result_id"]
+    try:
+        # Database reads and transcript parsing stay off the event loop
+        service, data = await asyncio.to_thread(_load_analysis_job, payload)
+        llm_service = LLMServiceFactory.create(payload["llm_provider"])
+        nlp_processor = get_nlp_processor()()
+    except Exception as e:
+        await mark_analysis_failed(result_id, str(getattr(e, "detail", e)))
+        raise
+
+    await service._process_data_task(
+        result_id,
+        nlp_processor,
+        llm_service,
+        data,
+        {
+            "use_enhanced_theme_analysis": True,  # Always run enhanced analysis
+            "use_reliability_check": True,  # Always use reliability check
+            "llm_provider": payload["llm_provider"],
+            "llm_model": payload.get("llm_model"),
+            "industry": payload.get("industry"),
+        },
+    )
+
+
+def _load_analysis_job(payload: Dict[str, Any]) -> Tuple["AnalysisService", Any]:
+    """Load the user and interview data of a queued analysis and parse it."""
+    from backend.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        user = (
+            db.query(models_module.User)
+            .filter(models_module.User.user_id == payload["user_id"])
+            .first()
+        )
+        interview_data = (
+            db.query(models_module.InterviewData)
+            .filter(
+                models_module.InterviewData.id == payload["data_id"],
+                models_module.InterviewData.user_id == payload["user_id"],
+            )
+            .first()
+        )
+        if not user or not interview_data:
+            raise ValueError(
+                f"Interview data {payload['data_id']} is no longer available"
+            )
+        service = AnalysisService(db, user)
+        data = service._parse_interview_data(
+            interview_data, payload.get("is_free_text", False)
+        )
+        return service, data
+    finally:
+        db.close()
+
+
+async def mark_analysis_failed(result_id: int, error: str) -> None:
+    """
+    Mark an analysis result as failed without running it.
+
+    Used when a job cannot be queued or prepared, and as the job queue failure
+    handler when a stalled analysis runs out of attempts.
+
+    Args:
+        result_id: ID of the analysis result record
+        error: Error message to record
+    """
+    try:
+        recorded = await asyncio.to_thread(_record_analysis_failure, result_id, error)
+        if recorded:
+            await get_analysis_progress_store().finish(
+                result_id,
+                "failed",
+                f"Analysis failed: {error}",
+                error=error,
+                error_code="ANALYSIS_JOB_ERROR",
+            )
+    except Exception as e:
+        logger.error(f"Failed to mark analysis {result_id} as failed: {str(e)}")
+
+
+def _record_analysis_failure(result_id: int, error: str) -> bool:
+    """Store the failure on the analysis result; False if there is none."""
+    from backend.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        result = db.query(models_module.AnalysisResult).get(result_id)
+        if not result:
+            return False
+        try:
+            current_results = json.loads(result.results or "{}")
+            if not isinstance(current_results, dict):
+                current_results = {}
+        except (json.JSONDecodeError, TypeError):
+            current_results = {}
+        current_results.update(
+            {
+                "status": "error",
+                "message": f"Analysis failed: {error}",
+                "error_details": error,
+                "error_code": "ANALYSIS_JOB_ERROR",
+                "error_time": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        result.results = json.dumps(current_results)
+        result.status = "failed"
+        result.summary = build_analysis_summary(current_results, "failed")
+        result.completed_at = datetime.now(timezone.utc)
+        db.commit()
+        return True
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def _on_analysis_job_abandoned(
+    job_id: str, payload: Dict[str, Any], error: str
+) -> None:
+    await mark_analysis_failed(payload["result_id"], error)
+
+
+get_job_queue().register_handler(
+    ANALYSIS_JOB_KIND, run_analysis_job, on_failure=_on_analysis_job_abandoned
+)
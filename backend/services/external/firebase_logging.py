@@ -10,9 +10,10 @@ import logging
 import datetime
 import traceback
 from typing import Dict, Any, Optional, List, Union
-import requests
 from pydantic import BaseModel
 
+from backend.services.external.security_event_shipper import SecurityEventShipper
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,30 @@ class FirebaseLoggingService:
                 "Firebase logging is not configured but running in production. "
                 "Set FIREBASE_API_KEY and FIREBASE_PROJECT_ID environment variables."
             )
+        # Events are delivered by a background task; callers only enqueue
+        self.shipper = SecurityEventShipper(
+            f"{FIREBASE_FUNCTIONS_URL}/logSecurityEvent", headers=self._headers
+        )
+
+    @staticmethod
+    def _headers() -> Dict[str, str]:
+        """Request headers, with the authentication token if available."""
+        headers = {
+            "Content-Type": "application/json"
+        }
+        auth_token = os.getenv("FIREBASE_AUTH_TOKEN", "")
+        if auth_token:
+            headers["Authorization"] = f"Bearer {auth_token}"
+        return headers
+
+    async def start(self) -> None:
+        """Start delivering queued security events."""
+        if self.enabled:
+            await self.shipper.start()
+
+    async def stop(self) -> None:
+        """Stop delivery, keeping undelivered events on disk for the next run."""
+        await self.shipper.stop()
     
     def log_security_event(
         self, 
@@ -96,64 +121,44 @@ class FirebaseLoggingService:
         details: Union[SecurityEventDetails, Dict[str, Any]]
     ) -> bool:
         """
-        Log a security event to Firebase.
-        
+        Queue a security event for delivery to Firebase.
+
+        Never waits for the network: the event is handed to the background
+        shipper, which batches, retries and spills it to disk if needed.
+
         Args:
             event_type: The type of security event
             details: Event details as SecurityEventDetails or dict
-            
+
         Returns:
-            True if logged successfully, False otherwise
+            True if queued, False if not configured or the queue is full
         """
         if not self.enabled:
             # Log locally if Firebase is not configured
             logger.info(f"Security event: {event_type} - {details}")
             return False
-        
+
         try:
             # Convert to dict if it's a model
             if isinstance(details, SecurityEventDetails):
                 details_dict = details.dict()
             else:
                 details_dict = details
-            
-            # Call Firebase function
-            url = f"{FIREBASE_FUNCTIONS_URL}/logSecurityEvent"
-            
+
             payload = {
                 "data": {
                     "eventType": event_type,
                     "details": details_dict
                 }
             }
-            
-            # Add authentication token if available
-            auth_token = os.getenv("FIREBASE_AUTH_TOKEN", "")
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            if auth_token:
-                headers["Authorization"] = f"Bearer {auth_token}"
-            
-            response = requests.post(
-                url, 
-                json=payload,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                return True
-            else:
-                logger.error(
-                    f"Failed to log security event to Firebase: {response.status_code} - {response.text}"
-                )
-                return False
-                
+
+            # Drops under a full queue are counted, not logged per event
+            return self.shipper.enqueue(payload)
+
         except Exception as e:
-            logger.error(f"Error logging security event to Firebase: {str(e)}")
+            logger.error(f"Error queueing security event for Firebase: {str(e)}")
             return False
-    
+
     def log_auth_event(
         self, 
         event_type: str, 
@@ -0,0 +1,365 @@
+"""
+Background shipping of security and audit events.
+
+``FirebaseLoggingService`` used to post every event with a blocking
+``requests.post`` from the request path, so a slow logging endpoint stalled
+the event loop for every in-flight request, worst of all during a rate-limit
+storm. ``SecurityEventShipper`` takes that off the request path:
+
+- ``enqueue`` only appends to a bounded in-memory queue; when the queue is
+  full the event is dropped and counted instead of applying backpressure to
+  the request
+- a background task drains the queue in batches and posts them over one
+  keep-alive ``httpx.AsyncClient`` with a timeout
+- events the sink does not accept (network errors, 5xx, 408, 429) are
+  appended to a local JSON Lines spill file and replayed once the sink
+  answers again; events still queued at shutdown are spilled as well
+"""
+
+import asyncio
+import collections
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import httpx
+
+from backend.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Responses that mean "try again later" rather than "bad event"
+_RETRYABLE_STATUS = {408, 429}
+
+# Wait this long after a failed delivery before replaying spilled events
+SPILL_RETRY_SECONDS = 30.0
+
+
+class SecurityEventShipper:
+    """
+    Bounded queue of JSON events posted to an HTTP sink by a background task.
+
+    Every event is posted as its own request body (the sink accepts one event
+    per call); a batch is the set of events sent concurrently over the shared
+    connection pool in one round.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Callable[[], Dict[str, str]]] = None,
+        max_queue: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        spill_path: Optional[str] = None,
+        spill_max_bytes: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the shipper. Unset limits are taken from settings.
+
+        Args:
+            url: Endpoint every event is posted to
+            headers: Returns the request headers; called once per batch
+            max_queue: Maximum number of queued events before dropping
+            batch_size: Maximum number of events sent per round
+            flush_seconds: Idle wait between checks of the queue and spill file
+            timeout_seconds: Timeout of each HTTP request
+            spill_path: JSON Lines file holding undelivered events
+            spill_max_bytes: Size beyond which undelivered events are dropped
+            transport: Optional httpx transport (used by tests)
+        """
+        self.url = url
+        self._headers = headers or (lambda: {"Content-Type": "application/json"})
+        self.max_queue = max(1, max_queue or settings.security_events_queue_size)
+        self.batch_size = max(1, batch_size or settings.security_events_batch_size)
+        self.flush_seconds = flush_seconds or settings.security_events_flush_seconds
+        self.timeout_seconds = (
+            timeout_seconds or settings.security_events_timeout_seconds
+        )
+        self.spill_path = spill_path or settings.security_events_spill_path
+        self.spill_max_bytes = (
+            spill_max_bytes or settings.security_events_spill_max_bytes
+        )
+        self._transport = transport
+
+        self._queue: Deque[Dict[str, Any]] = collections.deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._last_failure = 0.0
+        self._counters = {
+            "enqueued": 0,
+            "sent": 0,
+            "rejected": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "replayed": 0,
+        }
+        self._high_water = 0
+
+    def enqueue(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event for delivery without waiting for the sink.
+
+        Safe to call from the event loop and from worker threads.
+
+        Returns:
+            True if queued, False if the queue was full and the event dropped
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self._counters["dropped"] += 1
+                return False
+            self._queue.append(event)
+            self._counters["enqueued"] += 1
+            self._high_water = max(self._high_water, len(self._queue))
+        self._notify()
+        return True
+
+    async def start(self) -> None:
+        """Start the background task on the running loop."""
+        self._ensure_started(asyncio.get_running_loop())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and spill events that were not delivered.
+
+        Spilled events are replayed by the next process once the sink answers.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        remaining = self._drain(len(self._queue))
+        if remaining:
+            await asyncio.to_thread(self._spill, remaining)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
+        self._wakeup = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return delivery counters and queue occupancy for monitoring."""
+        return {
+            **self._counters,
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "high_water": self._high_water,
+            "sink_down": self._last_failure > 0,
+        }
+
+    def _notify(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._ensure_started(loop)
+        if self._wakeup is None or self._loop is None:
+            # No loop yet: events wait in the queue until start()
+            return
+        if loop is self._loop:
+            self._wakeup.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _ensure_started(self, loop: asyncio.AbstractEventLoop) -> None:
+        running = self._worker is not None and not self._worker.done()
+        if running and self._loop is not None and not self._loop.is_closed():
+            return
+        if self._loop is not loop:
+            # Connections belong to the loop that opened them
+            self._release_client(loop)
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._worker = loop.create_task(self._run())
+        if self._queue:
+            self._wakeup.set()
+
+    def _release_client(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the client of the previous loop so its pool does not leak."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        old_loop = self._loop
+        if old_loop is not None and old_loop is not loop and old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_client(client), old_loop)
+        else:
+            # The old loop is gone: close the transport from the current one
+            loop.create_task(self._close_client(client))
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Sockets of a closed loop cannot be shut down cleanly
+            logger.debug(f"Closing stale security event client failed: {e}")
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            count = min(limit, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=min(self.batch_size, 10),
+                    max_keepalive_connections=min(self.batch_size, 10),
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                batch = self._drain(self.batch_size)
+                if batch:
+                    await self._ship(batch)
+                if self._should_replay():
+                    await self._replay_spill()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Security event shipper iteration failed: {e}")
+
+    async def _ship(self, batch: List[Dict[str, Any]]) -> bool:
+        """Post a batch; spill whatever was not delivered. True if all sent."""
+        try:
+            undelivered = await self._post_batch(batch)
+        except asyncio.CancelledError:
+            # Shutting down mid-batch: keep the events for the next process
+            self._spill(batch)
+            raise
+        if undelivered:
+            self._last_failure = time.monotonic()
+            await asyncio.to_thread(self._spill, undelivered)
+            return False
+        self._last_failure = 0.0
+        return True
+
+    async def _post_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Post every event of a batch; return the ones worth retrying."""
+        client = self._get_client()
+        headers = self._headers()
+        results = await asyncio.gather(
+            *(client.post(self.url, json=event, headers=headers) for event in batch),
+            return_exceptions=True,
+        )
+
+        undelivered = []
+        for event, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                undelivered.append(event)
+            elif result.status_code < 300:
+                self._counters["sent"] += 1
+            elif result.status_code >= 500 or result.status_code in _RETRYABLE_STATUS:
+                undelivered.append(event)
+            else:
+                # The sink refused the event itself; retrying will not help
+                self._counters["rejected"] += 1
+                logger.error(
+                    f"Security event rejected by sink: {result.status_code} - "
+                    f"{result.text[:200]}"
+                )
+        if undelivered:
+            logger.warning(
+                f"Could not deliver {len(undelivered)} security events; "
+                f"spilling to {self.spill_path}"
+            )
+        return undelivered
+
+    def _should_replay(self) -> bool:
+        if not os.path.exists(self.spill_path) and not os.path.exists(
+            self._replay_path
+        ):
+            return False
+        return (
+            self._last_failure == 0.0
+            or time.monotonic() - self._last_failure >= SPILL_RETRY_SECONDS
+        )
+
+    @property
+    def _replay_path(self) -> str:
+        return self.spill_path + ".replay"
+
+    async def _replay_spill(self) -> None:
+        """Resend spilled events; stop at the first batch the sink refuses."""
+        events = await asyncio.to_thread(self._take_spill)
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start : start + self.batch_size]
+            sent_before = self._counters["sent"]
+            delivered = await self._ship(batch)
+            self._counters["replayed"] += self._counters["sent"] - sent_before
+            if not delivered:
+                rest = events[start + self.batch_size :]
+                if rest:
+                    await asyncio.to_thread(self._spill, rest)
+                break
+        await asyncio.to_thread(self._remove_replay_file)
+
+    def _take_spill(self) -> List[Dict[str, Any]]:
+        """Move the spill file aside and read its events."""
+        # A leftover replay file means an earlier replay was interrupted
+        if not os.path.exists(self._replay_path):
+            try:
+                os.replace(self.spill_path, self._replay_path)
+            except FileNotFoundError:
+                return []
+        events = []
+        with open(self._replay_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    # Skip a torn line from an interrupted write
+                    continue
+        return events
+
+    def _remove_replay_file(self) -> None:
+        try:
+            os.remove(self._replay_path)
+        except FileNotFoundError:
+            pass
+
+    def _spill(self, events: List[Dict[str, Any]]) -> None:
+        """Append events to the spill file, dropping them once it is full."""
+        try:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            size = (
+                os.path.getsize(self.spill_path)
+                if os.path.exists(self.spill_path)
+                else 0
+            )
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for event in events:
+                    line = json.dumps(event, default=str) + "\n"
+                    line_bytes = len(line.encode("utf-8"))
+                    if size + line_bytes > self.spill_max_bytes:
+                        self._counters["dropped"] += 1
+                        continue
+                    f.write(line)
+                    size += line_bytes
+                    self._counters["spilled"] += 1
+        except OSError as e:
+            self._counters["dropped"] += len(events)
+            logger.error(f"Could not spill security events: {e}")
@@ -0,0 +1,14 @@
+"""
+Background job queue package.
+
+This package provides the bounded worker pool used to run long-running
+analysis and pipeline jobs with durable records and crash recovery.
+"""
+
+from backend.services.jobs.job_queue import JobQueue, QueueFullError, get_job_queue
+
+__all__ = [
+    "JobQueue",
+    "QueueFullError",
+    "get_job_queue",
+]
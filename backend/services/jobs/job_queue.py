@@ -0,0 +1,409 @@
+"""
+Bounded background job queue.
+
+Long-running work (interview analysis, AxPersona pipeline runs) used to be
+started with a bare ``asyncio.create_task``. Under a burst of uploads every job
+ran at once and competed for the same LLM quota, and a process restart dropped
+running jobs without a trace.
+
+``JobQueue`` replaces that with:
+
+- durable job records (``job_records`` table) written before a job is queued
+- a worker pool with a global cap, a per-user cap and priority lanes
+  (``interactive`` before ``batch``, batch limited to a share of the pool)
+- backpressure: ``submit`` raises ``QueueFullError`` once too many jobs wait
+- heartbeats for running jobs and recovery that re-queues stalled jobs, or
+  marks them failed once their attempts are used up
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.persistence.job_repository import JobRepository
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+from backend.services.llm.concurrency_governor import llm_tenant
+
+logger = logging.getLogger(__name__)
+
+# Lanes in scheduling order; earlier lanes are always served first
+LANES: Tuple[str, ...] = ("interactive", "batch")
+
+JobHandler = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+FailureHandler = Callable[[str, Dict[str, Any], str], Awaitable[None]]
+
+
+class QueueFullError(Exception):
+    """Raised when the queue already holds the maximum number of pending jobs."""
+
+
+@dataclass
+class _QueuedJob:
+    """In-memory view of a job waiting for, or holding, a worker slot."""
+
+    job_id: str
+    kind: str
+    payload: Dict[str, Any]
+    user_id: Optional[str] = None
+    lane: str = "interactive"
+    priority: int = 0
+    seq: int = 0
+
+    def sort_key(self) -> Tuple[int, int, int]:
+        return (LANES.index(self.lane), self.priority, self.seq)
+
+
+@dataclass
+class _Registration:
+    handler: JobHandler
+    on_failure: Optional[FailureHandler] = None
+
+
+class JobQueue:
+    """
+    Worker pool that runs registered job handlers with concurrency limits.
+
+    Handlers are registered per job kind and called as
+    ``await handler(job_id, payload)``. The payload is stored in the database,
+    so it must be JSON serializable and contain everything needed to run the
+    job again after a restart.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        max_workers: Optional[int] = None,
+        per_user_limit: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        batch_share: Optional[float] = None,
+        heartbeat_seconds: Optional[float] = None,
+        stale_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        """
+        Initialize the queue. Unset limits are taken from settings.
+
+        Args:
+            session_factory: Factory returning a SQLAlchemy session (sync or async)
+            max_workers: Maximum number of jobs running at once
+            per_user_limit: Maximum number of running jobs per user
+            max_pending: Maximum number of waiting jobs before rejecting
+            batch_share: Fraction of workers the batch lane may use
+            heartbeat_seconds: Interval of the heartbeat and recovery loop
+            stale_seconds: Heartbeat age after which a running job is stalled
+            max_attempts: How many times a job may be started
+        """
+        if session_factory is None:
+            from backend.database import get_async_session_factory
+
+            session_factory = get_async_session_factory()
+
+        self._session_factory = session_factory
+        self.max_workers = max(1, max_workers or settings.job_queue_max_workers)
+        self.per_user_limit = max(
+            1, per_user_limit or settings.job_queue_per_user_limit
+        )
+        self.max_pending = max_pending or settings.job_queue_max_pending
+        share = batch_share if batch_share is not None else settings.job_queue_batch_share
+        self.lane_limits = {
+            "interactive": self.max_workers,
+            "batch": max(1, int(self.max_workers * share)),
+        }
+        self.heartbeat_seconds = heartbeat_seconds or settings.job_queue_heartbeat_seconds
+        self.stale_seconds = stale_seconds or settings.job_queue_stale_seconds
+        self.max_attempts = max_attempts or settings.job_queue_max_attempts
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._handlers: Dict[str, _Registration] = {}
+        self._pending: List[_QueuedJob] = []
+        self._running: Dict[str, _QueuedJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._monitor: Optional[asyncio.Task] = None
+        self._completed = 0
+        self._failed = 0
+
+    def register_handler(
+        self,
+        kind: str,
+        handler: JobHandler,
+        on_failure: Optional[FailureHandler] = None,
+    ) -> None:
+        """
+        Register the coroutine that runs jobs of a given kind.
+
+        Args:
+            kind: Job kind name
+            handler: ``async (job_id, payload)`` callable executing the job
+            on_failure: Optional ``async (job_id, payload, error)`` callable
+                invoked when recovery gives up on a stalled job, so the owner
+                can mark its own records as failed
+        """
+        self._handlers[kind] = _Registration(handler=handler, on_failure=on_failure)
+
+    async def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        user_id: Optional[str] = None,
+        lane: str = "interactive",
+        priority: int = 0,
+        job_id: Optional[str] = None,
+    ) -> str:
+        """
+        Persist a job and queue it for execution.
+
+        Args:
+            kind: Registered job kind
+            payload: JSON serializable handler input
+            user_id: Owner of the job, used for the per-user cap
+            lane: ``interactive`` or ``batch``
+            priority: Ordering within the lane, lower runs first
+            job_id: Optional identifier, generated when omitted
+
+        Returns:
+            The job identifier
+
+        Raises:
+            ValueError: If the kind or lane is unknown
+            QueueFullError: If the queue has no room for another pending job
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane '{lane}', expected one of {LANES}")
+        if len(self._pending) >= self.max_pending:
+            raise QueueFullError(
+                f"Job queue is full ({len(self._pending)} jobs waiting)"
+            )
+
+        job_id = job_id or str(uuid.uuid4())
+        async with UnitOfWork(self._session_factory) as uow:
+            await JobRepository(uow.session).create_job(
+                job_id=job_id,
+                kind=kind,
+                payload=payload,
+                user_id=user_id,
+                lane=lane,
+                priority=priority,
+                max_attempts=self.max_attempts,
+            )
+            await uow.commit()
+
+        self._enqueue(
+            _QueuedJob(
+                job_id=job_id,
+                kind=kind,
+                payload=payload,
+                user_id=user_id,
+                lane=lane,
+                priority=priority,
+            )
+        )
+        logger.info(
+            f"Queued job {job_id} ({kind}, lane={lane}); "
+            f"{len(self._pending)} pending, {len(self._running)} running"
+        )
+        return job_id
+
+    async def start(self) -> None:
+        """Recover jobs left over by a previous process and start the workers."""
+        try:
+            await self.recover()
+        except Exception as e:
+            logger.warning(f"Job recovery failed on startup (non-critical): {e}")
+        self._ensure_started()
+
+    async def stop(self) -> None:
+        """
+        Stop dispatching and cancel running jobs.
+
+        Cancelled jobs keep their ``running`` record and are re-queued by the
+        next process once their heartbeat goes stale.
+        """
+        background = [t for t in (self._dispatcher, self._monitor) if t]
+        tasks = background + list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._monitor = None
+
+    async def recover(self) -> int:
+        """
+        Re-queue stalled jobs and adopt queued jobs not yet known in memory.
+
+        Returns:
+            Number of jobs added to the in-memory queue
+        """
+        async with UnitOfWork(self._session_factory) as uow:
+            repo = JobRepository(uow.session)
+            _, failed = await repo.recover_stalled_jobs(
+                self.stale_seconds, exclude_job_ids=list(self._running)
+            )
+            abandoned = [(job.job_id, job.kind, job.payload, job.error) for job in failed]
+            known = {job.job_id for job in self._pending} | set(self._running)
+            adopted = [
+                _QueuedJob(
+                    job_id=job.job_id,
+                    kind=job.kind,
+                    payload=job.payload,
+                    user_id=job.user_id,
+                    lane=job.lane if job.lane in LANES else "batch",
+                    priority=job.priority or 0,
+                )
+                for job in await repo.get_queued_jobs()
+                if job.job_id not in known and job.kind in self._handlers
+            ]
+            await uow.commit()
+
+        for job_id, kind, payload, error in abandoned:
+            registration = self._handlers.get(kind)
+            if registration and registration.on_failure:
+                try:
+                    await registration.on_failure(job_id, payload, error)
+                except Exception as e:
+                    logger.error(f"Failure handler for job {job_id} raised: {e}")
+
+        for job in adopted:
+            self._enqueue(job)
+        if adopted:
+            logger.info(f"Adopted {len(adopted)} queued jobs from the database")
+        return len(adopted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue occupancy for monitoring."""
+        return {
+            "pending": len(self._pending),
+            "running": len(self._running),
+            "max_workers": self.max_workers,
+            "per_user_limit": self.per_user_limit,
+            "max_pending": self.max_pending,
+            "lanes": {
+                lane: {
+                    "pending": sum(1 for j in self._pending if j.lane == lane),
+                    "running": sum(1 for j in self._running.values() if j.lane == lane),
+                    "limit": self.lane_limits[lane],
+                }
+                for lane in LANES
+            },
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+
+    def _enqueue(self, job: _QueuedJob) -> None:
+        job.seq = next(self._seq)
+        self._pending.append(job)
+        self._ensure_started()
+        self._wakeup.set()
+
+    def _ensure_started(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.create_task(self._monitor_loop())
+
+    def _next_runnable(self) -> Optional[_QueuedJob]:
+        """Pick the highest priority pending job that fits within all caps."""
+        if len(self._running) >= self.max_workers:
+            return None
+
+        lane_counts: Dict[str, int] = {}
+        user_counts: Dict[str, int] = {}
+        for job in self._running.values():
+            lane_counts[job.lane] = lane_counts.get(job.lane, 0) + 1
+            if job.user_id:
+                user_counts[job.user_id] = user_counts.get(job.user_id, 0) + 1
+
+        for job in sorted(self._pending, key=_QueuedJob.sort_key):
+            if lane_counts.get(job.lane, 0) >= self.lane_limits[job.lane]:
+                continue
+            if job.user_id and user_counts.get(job.user_id, 0) >= self.per_user_limit:
+                continue
+            return job
+        return None
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while True:
+                job = self._next_runnable()
+                if job is None:
+                    break
+                self._pending.remove(job)
+                self._running[job.job_id] = job
+                self._tasks[job.job_id] = asyncio.create_task(self._run_job(job))
+
+    async def _run_job(self, job: _QueuedJob) -> None:
+        try:
+            async with UnitOfWork(self._session_factory) as uow:
+                claimed = await JobRepository(uow.session).claim_job(
+                    job.job_id, self.worker_id
+                )
+                await uow.commit()
+            if not claimed:
+                logger.info(f"Job {job.job_id} was claimed elsewhere, skipping")
+                return
+
+            logger.info(f"Starting job {job.job_id} ({job.kind})")
+            status, error = "completed", None
+            try:
+                # LLM requests of this job share one fair-queuing lane
+                with llm_tenant(job.job_id):
+                    await self._handlers[job.kind].handler(job.job_id, job.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job {job.job_id} ({job.kind}) failed: {e}", exc_info=True)
+                status, error = "failed", str(e)
+
+            if status == "completed":
+                self._completed += 1
+            else:
+                self._failed += 1
+            async with UnitOfWork(self._session_factory) as uow:
+                await JobRepository(uow.session).mark_finished(job.job_id, status, error)
+                await uow.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error updating job record {job.job_id}: {e}")
+        finally:
+            self._running.pop(job.job_id, None)
+            self._tasks.pop(job.job_id, None)
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    async def _monitor_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                async with UnitOfWork(self._session_factory) as uow:
+                    await JobRepository(uow.session).heartbeat(list(self._running))
+                    await uow.commit()
+                await self.recover()
+            except Exception as e:
+                logger.warning(f"Job queue heartbeat failed: {e}")
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, creating it on first use."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -8,16 +8,38 @@ with proper error handling, retry logic, and response parsing.
 import logging
 import json
 import asyncio
+import inspect
 import re
 import os
 import random
-from typing import Dict, Any, List, Union, Optional, AsyncGenerator, Tuple
+from typing import (
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Union,
+    Optional,
+    AsyncGenerator,
+    Tuple,
+)
 
 import google.genai as genai
 from google.genai.types import GenerateContentConfig, Content
 
 from backend.utils.json.json_repair import repair_json
+from backend.utils.json.streaming_parser import IncrementalJSONParser
 from backend.services.llm.config.genai_config import GenAIConfigFactory, TaskType
+from backend.services.llm.concurrency_governor import (
+    estimate_tokens,
+    get_llm_governor,
+)
+from backend.services.llm.context_cache import (
+    CACHED_CONTEXT_PLACEHOLDER,
+    ContextHandle,
+    GenAIContextCacheBackend,
+    current_context_cache,
+)
 from backend.services.llm.exceptions import (
     LLMAPIError,
     LLMResponseParseError,
@@ -66,6 +88,7 @@ class AsyncGenAIClient:
         max_retries: int = 3,
         initial_delay: float = 1.0,
         backoff_factor: float = 2.0,
+        shared_context: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generate content using the GenAI API with standardized async implementation.
@@ -78,6 +101,9 @@ class AsyncGenAIClient:
             max_retries: Maximum number of retries for API calls
             initial_delay: Initial delay for retry backoff
             backoff_factor: Backoff factor for retry delay
+            shared_context: Optional long text (e.g. a transcript) that precedes
+                the prompt. Inside a ``context_cache_scope`` it is uploaded once
+                and reused as cached content; otherwise it is sent inline.
 
         Returns:
             Parsed response as a dictionary
@@ -86,9 +112,6 @@ class AsyncGenAIClient:
             # Get configuration for the task
             config = GenAIConfigFactory.create_config(task, custom_config)
 
-            # Prepare prompt with system instruction if provided
-            final_prompt = self._prepare_prompt(prompt, system_instruction)
-
             # Adjust retry/backoff for heavy tasks like PRD generation
             task_name = task.value if isinstance(task, TaskType) else str(task)
             local_max_retries = max_retries
@@ -101,9 +124,11 @@ class AsyncGenAIClient:
                 local_backoff = max(local_backoff, 2.5)
 
             # Generate content with retry
-            response = await self._generate_with_retry(
-                model=self.default_model,
-                prompt=final_prompt,
+            response = await self._call_with_shared_context(
+                self._generate_with_retry,
+                prompt,
+                system_instruction,
+                shared_context,
                 config=config,
                 max_retries=local_max_retries,
                 initial_delay=local_initial_delay,
@@ -202,6 +227,174 @@ class AsyncGenAIClient:
             )
             raise LLMServiceError(f"Unexpected error: {str(e)}") from e
 
+    async def generate_json_incrementally(
+        self,
+        task: Union[str, TaskType],
+        prompt: Union[str, List[Union[str, Content]]],
+        on_item: Optional[Callable[[Optional[str], Any], Any]] = None,
+        array_keys: Optional[Iterable[str]] = None,
+        custom_config: Optional[Dict[str, Any]] = None,
+        system_instruction: Optional[str] = None,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        backoff_factor: float = 2.0,
+        shared_context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate a JSON task over a stream, handing out array elements early.
+
+        Chunks are fed to an ``IncrementalJSONParser``; every element of a
+        top-level array (a theme, a pattern, a transcript segment) is passed to
+        ``on_item(key, element)`` as soon as it closes. A response cut short is
+        recovered from its last complete element rather than by regex repair.
+
+        Args:
+            task: Task type (string or TaskType enum)
+            prompt: Prompt text or list of Content objects
+            on_item: Optional callback (sync or async) for completed elements
+            array_keys: Root-object properties whose elements are emitted;
+                None emits elements of every top-level array
+            custom_config: Optional custom configuration parameters
+            system_instruction: Optional system instruction
+            max_retries: Maximum number of retries for opening the stream
+            initial_delay: Initial delay for retry backoff
+            backoff_factor: Backoff factor for retry delay
+            shared_context: Optional long text that precedes the prompt, reused
+                from the context cache as in ``generate_content``
+
+        Returns:
+            The full parsed and post-processed response
+        """
+        try:
+            config = GenAIConfigFactory.create_config(task, custom_config)
+
+            stream = await self._call_with_shared_context(
+                self._generate_stream_with_retry,
+                prompt,
+                system_instruction,
+                shared_context,
+                config=config,
+                max_retries=max_retries,
+                initial_delay=initial_delay,
+                backoff_factor=backoff_factor,
+                task=task,
+            )
+
+            parser = IncrementalJSONParser(array_keys)
+            emitted = 0
+            async for chunk in stream:
+                try:
+                    text = chunk.text
+                except Exception as e:
+                    logger.error(f"Error extracting text from chunk: {str(e)}")
+                    continue
+                if not text:
+                    continue
+                for key, item in parser.feed(text):
+                    emitted += 1
+                    if on_item is not None:
+                        result = on_item(key, item)
+                        if inspect.isawaitable(result):
+                            await result
+
+            try:
+                parsed_response = parser.close()
+                if parser.truncated:
+                    logger.warning(
+                        f"Streamed response for task {task} was truncated; "
+                        f"kept {emitted} complete elements"
+                    )
+            except ValueError as e:
+                logger.warning(
+                    f"Streamed response for task {task} is not valid JSON ({e}), "
+                    f"falling back to repair"
+                )
+                parsed_response = await self._parse_text_response(parser.text, task)
+
+            return await self._post_process_response(parsed_response, task)
+
+        except (LLMAPIError, LLMResponseParseError, LLMProcessingError) as e:
+            # Re-raise known LLM exceptions
+            logger.error(f"Error streaming JSON for task {task}: {str(e)}")
+            raise
+        except Exception as e:
+            # Wrap unknown exceptions
+            logger.error(
+                f"Unexpected error streaming JSON for task {task}: {str(e)}",
+                exc_info=True,
+            )
+            raise LLMServiceError(f"Unexpected error: {str(e)}") from e
+
+    async def _call_with_shared_context(
+        self,
+        call: Callable[..., Any],
+        prompt: Union[str, List[Union[str, Content]]],
+        system_instruction: Optional[str],
+        shared_context: Optional[str],
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a retrying API call with ``shared_context`` as the prompt prefix.
+
+        Inside a ``context_cache_scope`` the shared text is uploaded once and the
+        call gets its cached content handle, with the text replaced by
+        ``CACHED_CONTEXT_PLACEHOLDER`` in the system instruction. If that call
+        fails the handle is dropped and the call is repeated with the text inline.
+
+        Args:
+            call: ``_generate_with_retry`` or ``_generate_stream_with_retry``
+            prompt: Prompt text or list of Content objects
+            system_instruction: Optional system instruction
+            shared_context: Optional long text that precedes the prompt
+            **kwargs: Further arguments for ``call``
+
+        Returns:
+            Whatever ``call`` returns
+        """
+        scope = current_context_cache()
+        context_handle = None
+        if shared_context and scope is not None:
+            context_handle = await scope.handle_for(
+                self.default_model,
+                shared_context,
+                GenAIContextCacheBackend(self.client),
+            )
+
+        if context_handle is not None:
+            # The cached text is the prefix; only the instructions are sent
+            try:
+                return await call(
+                    model=self.default_model,
+                    prompt=self._prepare_prompt(
+                        prompt,
+                        (system_instruction or "").replace(
+                            shared_context, CACHED_CONTEXT_PLACEHOLDER
+                        )
+                        or None,
+                    ),
+                    context_handle=context_handle,
+                    shared_context=shared_context,
+                    **kwargs,
+                )
+            except LLMAPIError as e:
+                logger.warning(
+                    f"Request with cached context {context_handle.name} failed, "
+                    f"retrying with the text inline: {e}"
+                )
+                scope.invalidate(context_handle)
+
+        if shared_context:
+            prompt = [shared_context] + (
+                list(prompt) if isinstance(prompt, list) else [prompt]
+            )
+
+        # Prepare prompt with system instruction if provided
+        return await call(
+            model=self.default_model,
+            prompt=self._prepare_prompt(prompt, system_instruction),
+            **kwargs,
+        )
+
     def _prepare_prompt(
         self,
         prompt: Union[str, List[Union[str, Content]]],
@@ -324,6 +517,8 @@ class AsyncGenAIClient:
         initial_delay: float = 1.0,
         backoff_factor: float = 2.0,
         task: Union[str, TaskType] = None,
+        context_handle: Optional[ContextHandle] = None,
+        shared_context: Optional[str] = None,
     ) -> Any:
         """
         Generate content with retry logic.
@@ -335,6 +530,9 @@ class AsyncGenAIClient:
             max_retries: Maximum number of retries
             initial_delay: Initial delay for retry backoff
             backoff_factor: Backoff factor for retry delay
+            context_handle: Cached content to use as the prompt prefix
+            shared_context: The cached text, sent inline if the fallback
+                model is used (cached content is bound to its model)
 
         Returns:
             Raw response from the API
@@ -343,7 +541,9 @@ class AsyncGenAIClient:
         last_exception = None
 
         # Calculate dynamic timeout based on content size and task complexity
-        timeout_seconds = self._calculate_dynamic_timeout(prompt, task)
+        timeout_seconds = self._calculate_dynamic_timeout(
+            [shared_context] + list(prompt) if context_handle else prompt, task
+        )
 
         # Optional fallback model for overload scenarios
         fallback_model = os.getenv(
@@ -356,13 +556,32 @@ class AsyncGenAIClient:
                 # Choose model (fallback after certain errors)
                 effective_model = fallback_model if use_fallback_next else model
 
-                # Make the API call with dynamic timeout
-                response = await asyncio.wait_for(
-                    self.client.aio.models.generate_content(
-                        model=effective_model, contents=prompt, config=config
-                    ),
-                    timeout=timeout_seconds,
-                )
+                attempt_prompt, attempt_config = prompt, config
+                cached = context_handle is not None and effective_model == model
+                if cached:
+                    attempt_config = config.model_copy(
+                        update={"cached_content": context_handle.name}
+                    )
+                elif context_handle is not None:
+                    attempt_prompt = [shared_context] + list(prompt)
+
+                # Make the API call with dynamic timeout once the governor admits it
+                governor = get_llm_governor("gemini", effective_model)
+                estimated = estimate_tokens(attempt_prompt)
+                if cached:
+                    estimated += context_handle.token_count
+                async with governor.slot(estimated):
+                    response = await asyncio.wait_for(
+                        self.client.aio.models.generate_content(
+                            model=effective_model,
+                            contents=attempt_prompt,
+                            config=attempt_config,
+                        ),
+                        timeout=timeout_seconds,
+                    )
+                scope = current_context_cache()
+                if cached and scope is not None:
+                    scope.record_use(context_handle, response)
                 return response
             except asyncio.TimeoutError as e:
                 last_exception = e
@@ -426,6 +645,8 @@ class AsyncGenAIClient:
         initial_delay: float = 1.0,
         backoff_factor: float = 2.0,
         task: Union[str, TaskType] = None,
+        context_handle: Optional[ContextHandle] = None,
+        shared_context: Optional[str] = None,
     ) -> AsyncGenerator:
         """
         Generate content stream with retry logic.
@@ -437,6 +658,9 @@ class AsyncGenAIClient:
             max_retries: Maximum number of retries
             initial_delay: Initial delay for retry backoff
             backoff_factor: Backoff factor for retry delay
+            context_handle: Cached content to use as the prompt prefix
+            shared_context: The cached text, sent inline if the fallback
+                model is used (cached content is bound to its model)
 
         Returns:
             Async generator for the content stream
@@ -445,7 +669,9 @@ class AsyncGenAIClient:
         last_exception = None
 
         # Calculate dynamic timeout based on content size and task complexity
-        timeout_seconds = self._calculate_dynamic_timeout(prompt, task)
+        timeout_seconds = self._calculate_dynamic_timeout(
+            [shared_context] + list(prompt) if context_handle else prompt, task
+        )
 
         # Optional fallback model for overload scenarios
         fallback_model = os.getenv(
@@ -456,13 +682,35 @@ class AsyncGenAIClient:
         for attempt in range(max_retries):
             try:
                 effective_model = fallback_model if use_fallback_next else model
-                # Make the API call with dynamic timeout
-                stream = await asyncio.wait_for(
-                    self.client.aio.models.generate_content_stream(
-                        model=effective_model, contents=prompt, config=config
-                    ),
-                    timeout=timeout_seconds,
-                )
+
+                attempt_prompt, attempt_config = prompt, config
+                cached = context_handle is not None and effective_model == model
+                if cached:
+                    attempt_config = config.model_copy(
+                        update={"cached_content": context_handle.name}
+                    )
+                elif context_handle is not None:
+                    attempt_prompt = [shared_context] + list(prompt)
+
+                # Make the API call with dynamic timeout once the governor admits it;
+                # the slot covers opening the stream, not consuming it
+                governor = get_llm_governor("gemini", effective_model)
+                estimated = estimate_tokens(attempt_prompt)
+                if cached:
+                    estimated += context_handle.token_count
+                async with governor.slot(estimated):
+                    stream = await asyncio.wait_for(
+                        self.client.aio.models.generate_content_stream(
+                            model=effective_model,
+                            contents=attempt_prompt,
+                            config=attempt_config,
+                        ),
+                        timeout=timeout_seconds,
+                    )
+                scope = current_context_cache()
+                if cached and scope is not None:
+                    # Usage metadata only arrives with the last chunk
+                    scope.record_use(context_handle)
                 return stream
             except asyncio.TimeoutError as e:
                 last_exception = e
@@ -672,6 +920,29 @@ class AsyncGenAIClient:
                 )
                 raise LLMResponseParseError(f"Failed to extract any text from response")
 
+            return await self._parse_text_response(text_response, task)
+        except LLMResponseParseError:
+            # Re-raise known parsing errors
+            raise
+        except Exception as e:
+            # Wrap unknown exceptions
+            logger.error(f"Unexpected error parsing response: {str(e)}", exc_info=True)
+            raise LLMResponseParseError(f"Unexpected error parsing response: {str(e)}")
+
+    async def _parse_text_response(
+        self, text_response: str, task: Union[str, TaskType]
+    ) -> Dict[str, Any]:
+        """
+        Parse the text of a response, repairing JSON for JSON tasks.
+
+        Args:
+            text_response: Text extracted from the response
+            task: Task type
+
+        Returns:
+            Parsed response as a dictionary
+        """
+        try:
             # Check if response is empty or very short
             # Special case for industry detection which can return just the industry name
             if (isinstance(task, str) and task == "industry_detection") or (
@@ -0,0 +1,535 @@
+"""
+Process-wide admission control for LLM requests.
+
+Every LLM client acquires a slot from the governor of its provider and model
+before sending a request, so the total load on a model stays bounded no matter
+how many analyses run at once. A governor combines:
+
+- Token buckets for requests per minute and (estimated) tokens per minute
+- AIMD adaptive concurrency: the in-flight limit halves when the provider
+  answers 429 / RESOURCE_EXHAUSTED and grows by about one per window of
+  successful requests
+- Fair queuing: waiters are grouped by tenant (usually the analysis id, set
+  with ``llm_tenant``) and slots are handed out round-robin across tenants,
+  so one large analysis cannot starve the others
+
+Governors work across event loops and threads. Sync callers running in worker
+threads use ``sync_slot``; it refuses to block a thread running an event loop.
+Live metrics are available from ``governor_metrics()``.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+from pydantic_ai.models.wrapper import WrapperModel
+
+from backend.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+
+_current_tenant: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "llm_tenant", default=DEFAULT_TENANT
+)
+
+# Provider status names (google-genai ``APIError.status``) for throttling
+_RATE_LIMIT_STATUSES = {"RESOURCE_EXHAUSTED", "TOO_MANY_REQUESTS"}
+# SDK exception classes for throttling (openai/anthropic, google-api-core)
+_RATE_LIMIT_ERROR_TYPES = {"RateLimitError", "ResourceExhausted", "TooManyRequests"}
+
+# Longest a waiter sleeps before re-checking the token buckets itself
+_MAX_POLL_SECONDS = 1.0
+
+
+@contextmanager
+def llm_tenant(tenant: Any) -> Iterator[None]:
+    """Attribute LLM requests made in this context to ``tenant`` for fair queuing."""
+    token = _current_tenant.set(str(tenant) if tenant is not None else DEFAULT_TENANT)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
+
+
+def current_tenant() -> str:
+    """Tenant LLM requests in the current context are attributed to."""
+    return _current_tenant.get()
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Whether an exception (or its cause) signals provider throttling.
+
+    Only HTTP status 429, a RESOURCE_EXHAUSTED status or a rate-limit exception
+    type count; error messages are not searched, so unrelated errors that
+    mention "429" or "quota" do not shrink the concurrency limit.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        response = getattr(error, "response", None)
+        codes = (
+            getattr(error, "status_code", None),
+            getattr(error, "code", None),
+            getattr(response, "status_code", None),
+        )
+        if any(isinstance(code, int) and code == 429 for code in codes):
+            return True
+        status = getattr(error, "status", None)
+        if isinstance(status, str) and status.upper() in _RATE_LIMIT_STATUSES:
+            return True
+        if any(cls.__name__ in _RATE_LIMIT_ERROR_TYPES for cls in type(error).__mro__):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def estimate_tokens(*parts: Any) -> int:
+    """Rough token estimate (4 characters per token) for rate budgeting."""
+    chars = 0
+    for part in parts:
+        if part is None:
+            continue
+        if isinstance(part, (list, tuple)):
+            chars += sum(len(str(p)) for p in part)
+        else:
+            chars += len(str(part))
+    return chars // 4
+
+
+class TokenBucket:
+    """Continuously refilled token bucket; a rate of 0 means unlimited."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self._rate = self.capacity / 60.0
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float) -> None:
+        refill = (now - self._updated) * self._rate
+        self.tokens = min(self.capacity, self.tokens + refill)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken; 0 if available now."""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self._rate
+
+    def take(self, amount: float) -> None:
+        if not self.unlimited:
+            self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Correct an earlier estimate; the balance may go negative."""
+        if not self.unlimited:
+            self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class _Waiter:
+    """A queued request, woken from any thread or event loop."""
+
+    __slots__ = (
+        "tokens",
+        "tenant",
+        "enqueued",
+        "granted",
+        "_loop",
+        "_future",
+        "_event",
+    )
+
+    def __init__(self, tokens: int, tenant: str, loop=None):
+        self.tokens = tokens
+        self.tenant = tenant
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self._loop = loop
+        self._future = loop.create_future() if loop is not None else None
+        self._event = None if loop is not None else threading.Event()
+
+    def grant(self) -> None:
+        self.granted = True
+        if self._future is not None:
+            self._loop.call_soon_threadsafe(self._resolve)
+        else:
+            self._event.set()
+
+    def _resolve(self) -> None:
+        if not self._future.done():
+            self._future.set_result(True)
+
+    async def wait(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(asyncio.shield(self._future), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def wait_sync(self, timeout: float) -> None:
+        self._event.wait(timeout)
+
+
+class LLMGovernor:
+    """
+    Admission control for one provider and model.
+
+    Use ``async with governor.slot(estimated_tokens): ...`` around a request.
+    Exceptions leaving the block that look like rate limiting shrink the
+    concurrency limit; successful blocks grow it again.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        backoff_factor: float = 0.5,
+        backoff_cooldown: float = 2.0,
+    ):
+        self.key = key
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.limit = float(
+            min(self.max_concurrency, max(self.min_concurrency, initial_concurrency))
+        )
+        self.backoff_factor = backoff_factor
+        self.backoff_cooldown = backoff_cooldown
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._in_flight = 0
+        self._last_backoff = 0.0
+        self._stats = {
+            "granted": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "rate_limited": 0,
+            "backoffs": 0,
+            "wait_seconds_total": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    # --- admission -------------------------------------------------------
+
+    def _try_start(self, waiter: _Waiter, now: float) -> float:
+        """Start the waiter if limits allow; returns 0 or the seconds to wait."""
+        if self._in_flight >= int(self.limit):
+            return _MAX_POLL_SECONDS
+        wait = max(
+            self._requests.wait_time(1, now),
+            self._tokens.wait_time(waiter.tokens, now),
+        )
+        if wait > 0:
+            return wait
+        self._requests.take(1)
+        self._tokens.take(waiter.tokens)
+        self._in_flight += 1
+        waited = now - waiter.enqueued
+        self._stats["granted"] += 1
+        self._stats["wait_seconds_total"] += waited
+        self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+        waiter.grant()
+        return 0.0
+
+    def _dispatch(self) -> float:
+        """
+        Grant queued waiters round-robin across tenants. Caller holds the lock.
+
+        Returns the seconds until the head waiter could be admitted (0 if the
+        queue is empty).
+        """
+        now = time.monotonic()
+        while self._queues:
+            tenant, queue = next(iter(self._queues.items()))
+            wait = self._try_start(queue[0], now)
+            if wait > 0:
+                return wait
+            queue.popleft()
+            # Move this tenant to the back so the next slot goes to another one
+            del self._queues[tenant]
+            if queue:
+                self._queues[tenant] = queue
+        return 0.0
+
+    def _enqueue(self, waiter: _Waiter) -> float:
+        with self._lock:
+            self._queues.setdefault(waiter.tenant, deque()).append(waiter)
+            return self._dispatch()
+
+    def _poll(self, waiter: _Waiter) -> float:
+        with self._lock:
+            if waiter.granted:
+                return 0.0
+            return self._dispatch() or _MAX_POLL_SECONDS
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Drop a cancelled waiter, or give back its slot if it was granted."""
+        with self._lock:
+            if waiter.granted:
+                self._in_flight -= 1
+            else:
+                queue = self._queues.get(waiter.tenant)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[waiter.tenant]
+            self._dispatch()
+
+    async def acquire(
+        self, estimated_tokens: int = 0, tenant: Optional[str] = None
+    ) -> None:
+        """Wait for a request slot; pair with ``release``."""
+        waiter = _Waiter(
+            max(0, int(estimated_tokens)),
+            tenant or current_tenant(),
+            asyncio.get_running_loop(),
+        )
+        wait = self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                await waiter.wait(min(_MAX_POLL_SECONDS, max(0.01, wait)))
+                wait = self._poll(waiter)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def acquire_sync(
+        self, estimated_tokens: int = 0, tenant: Optional[str] = None
+    ) -> None:
+        """
+        Blocking variant of ``acquire`` for synchronous clients.
+
+        Must run in a worker thread: on a thread running an event loop it would
+        block the coroutines holding the slots it waits for, so it raises
+        ``RuntimeError`` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                f"LLM governor {self.key}: blocking acquire called from a running "
+                f"event loop; use slot() or run the request in a worker thread"
+            )
+        waiter = _Waiter(max(0, int(estimated_tokens)), tenant or current_tenant())
+        wait = self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                waiter.wait_sync(min(_MAX_POLL_SECONDS, max(0.01, wait)))
+                wait = self._poll(waiter)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def release(
+        self,
+        error: Optional[BaseException] = None,
+        estimated_tokens: int = 0,
+        actual_tokens: Optional[int] = None,
+    ) -> None:
+        """
+        Return a slot and adapt the concurrency limit to the outcome.
+
+        Args:
+            error: Exception raised by the request, if any
+            estimated_tokens: Tokens reserved when acquiring
+            actual_tokens: Tokens actually used, to correct the TPM bucket
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if actual_tokens is not None:
+                self._tokens.adjust(actual_tokens - estimated_tokens)
+            if error is None:
+                self._stats["succeeded"] += 1
+                # Additive increase: about +1 per window of successful requests
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+            elif is_rate_limit_error(error):
+                self._stats["rate_limited"] += 1
+                now = time.monotonic()
+                # Requests already in flight fail together; back off once per burst
+                if now - self._last_backoff >= self.backoff_cooldown:
+                    self._last_backoff = now
+                    self._stats["backoffs"] += 1
+                    self.limit = max(
+                        float(self.min_concurrency), self.limit * self.backoff_factor
+                    )
+                    logger.warning(
+                        f"LLM governor {self.key}: rate limited, concurrency limit "
+                        f"lowered to {int(self.limit)}"
+                    )
+            else:
+                self._stats["failed"] += 1
+            self._dispatch()
+
+    @asynccontextmanager
+    async def slot(
+        self, estimated_tokens: int = 0, tenant: Optional[str] = None
+    ) -> AsyncIterator["LLMGovernor"]:
+        """Hold a request slot for the duration of the block."""
+        await self.acquire(estimated_tokens, tenant)
+        try:
+            yield self
+        except BaseException as e:
+            self.release(e, estimated_tokens)
+            raise
+        self.release(None, estimated_tokens)
+
+    @contextmanager
+    def sync_slot(
+        self, estimated_tokens: int = 0, tenant: Optional[str] = None
+    ) -> Iterator["LLMGovernor"]:
+        """Blocking variant of ``slot``, for worker threads only."""
+        self.acquire_sync(estimated_tokens, tenant)
+        try:
+            yield self
+        except BaseException as e:
+            self.release(e, estimated_tokens)
+            raise
+        self.release(None, estimated_tokens)
+
+    # --- introspection ---------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Live state and counters of this governor."""
+        with self._lock:
+            now = time.monotonic()
+            self._requests.wait_time(0, now)
+            self._tokens.wait_time(0, now)
+            granted = self._stats["granted"]
+            return {
+                "key": self.key,
+                "concurrency_limit": int(self.limit),
+                "in_flight": self._in_flight,
+                "queued": sum(len(q) for q in self._queues.values()),
+                "queued_by_tenant": {t: len(q) for t, q in self._queues.items()},
+                "requests_per_minute": self._requests.capacity or None,
+                "requests_available": (
+                    None if self._requests.unlimited else int(self._requests.tokens)
+                ),
+                "tokens_per_minute": self._tokens.capacity or None,
+                "tokens_available": (
+                    None if self._tokens.unlimited else int(self._tokens.tokens)
+                ),
+                "avg_wait_seconds": (
+                    self._stats["wait_seconds_total"] / granted if granted else 0.0
+                ),
+                **{k: v for k, v in self._stats.items() if k != "wait_seconds_total"},
+            }
+
+
+_governors: Dict[str, LLMGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def normalize_model_name(model: Optional[str]) -> str:
+    """Strip API prefixes so ``models/gemini-x`` and ``gemini-x`` share a governor."""
+    name = str(model or "default").strip()
+    if name.startswith("models/"):
+        name = name[len("models/") :]
+    return name
+
+
+def _governor_config(key: str, provider: str) -> Dict[str, Any]:
+    config = {
+        "requests_per_minute": settings.llm_governor_rpm,
+        "tokens_per_minute": settings.llm_governor_tpm,
+        "initial_concurrency": settings.llm_governor_initial_concurrency,
+        "min_concurrency": settings.llm_governor_min_concurrency,
+        "max_concurrency": settings.llm_governor_max_concurrency,
+    }
+    # Per provider or provider:model overrides, most specific last
+    try:
+        overrides = json.loads(settings.llm_governor_overrides or "{}")
+    except ValueError:
+        logger.warning("Ignoring invalid LLM_GOVERNOR_OVERRIDES")
+        overrides = {}
+    for name in (provider, key):
+        if isinstance(overrides.get(name), dict):
+            config.update(overrides[name])
+    return config
+
+
+def get_llm_governor(provider: str, model: Optional[str] = None) -> LLMGovernor:
+    """Get the process-wide governor for ``provider`` and ``model``."""
+    provider = (provider or "default").lower()
+    key = f"{provider}:{normalize_model_name(model)}"
+    governor = _governors.get(key)
+    if governor is None:
+        with _governors_lock:
+            governor = _governors.get(key)
+            if governor is None:
+                governor = LLMGovernor(key, **_governor_config(key, provider))
+                _governors[key] = governor
+    return governor
+
+
+def governor_metrics() -> List[Dict[str, Any]]:
+    """Metrics of all governors created in this process."""
+    with _governors_lock:
+        governors = list(_governors.values())
+    return [g.metrics() for g in governors]
+
+
+def reset_governors() -> None:
+    """Forget all governors (used by tests and after configuration changes)."""
+    with _governors_lock:
+        _governors.clear()
+
+
+class GovernedModel(WrapperModel):
+    """PydanticAI model wrapper acquiring a governor slot for every request."""
+
+    def __init__(self, wrapped: Any, provider: str = "gemini"):
+        super().__init__(wrapped)
+        self._governor_provider = provider
+
+    def _governor(self) -> LLMGovernor:
+        return get_llm_governor(self._governor_provider, self.wrapped.model_name)
+
+    async def request(self, messages, *args, **kwargs):
+        async with self._governor().slot(estimate_tokens(messages)):
+            return await self.wrapped.request(messages, *args, **kwargs)
+
+    @asynccontextmanager
+    async def request_stream(self, messages, *args, **kwargs):
+        async with self._governor().slot(estimate_tokens(messages)):
+            async with self.wrapped.request_stream(
+                messages, *args, **kwargs
+            ) as response_stream:
+                yield response_stream
+
+
+def governed_model(model: Any, provider: str = "gemini") -> GovernedModel:
+    """
+    Wrap a PydanticAI model so every request goes through the governor.
+
+    Args:
+        model: PydanticAI ``Model`` instance
+        provider: Provider part of the governor key
+
+    Returns:
+        The wrapped model, usable anywhere a PydanticAI model is expected
+    """
+    return GovernedModel(model, provider)
@@ -0,0 +1,315 @@
+"""
+Shared Gemini context caching for long texts reused across analysis stages.
+
+One analysis sends the same transcript to Gemini from several stages (themes,
+patterns, personas, insights). Inside a ``context_cache_scope`` the first
+stage uploads the text once as cached content and every later stage sends only
+its instructions, referencing the cached handle as the shared prefix. That
+saves the repeated input tokens and their prefill latency.
+
+Handles are keyed by (model, text digest) within the scope, created at most
+once even when stages race, refreshed shortly before their TTL runs out and
+deleted when the scope exits. Gemini also expires them on its own, so a crashed
+worker leaks nothing beyond the TTL.
+
+Two backends are provided:
+
+- GenAIContextCacheBackend: ``client.aio.caches`` of the google-genai SDK
+- InMemoryContextCacheBackend: in-process fake for tests
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from google.genai import types
+
+from backend.infrastructure.config.settings import settings
+from backend.services.llm.concurrency_governor import (
+    estimate_tokens,
+    normalize_model_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the cached text wherever a prompt would otherwise repeat it
+CACHED_CONTEXT_PLACEHOLDER = "[The transcript is provided in the context above.]"
+# User turn sent after the cached transcript and the task instructions
+CACHED_CONTEXT_PROMPT = (
+    "Analyze the transcript provided above according to the instructions."
+)
+
+# Handles this close to expiry are replaced rather than reused
+_REFRESH_MARGIN_SECONDS = 60.0
+
+
+@dataclass
+class ContextHandle:
+    """A cached-content handle usable as the shared prefix of a request."""
+
+    name: str
+    model: str
+    token_count: int
+    expires_at: float
+
+    def expires_within(self, seconds: float) -> bool:
+        return time.monotonic() + seconds >= self.expires_at
+
+
+class ContextCacheBackend(ABC):
+    """Creates and deletes cached-content handles."""
+
+    @abstractmethod
+    async def create(
+        self, model: str, text: str, ttl_seconds: int, display_name: str
+    ) -> ContextHandle:
+        """Upload ``text`` as cached content for ``model``."""
+
+    @abstractmethod
+    async def delete(self, name: str) -> None:
+        """Delete a handle; missing or expired handles are not an error."""
+
+
+class GenAIContextCacheBackend(ContextCacheBackend):
+    """Backend using the Gemini cached-content API."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def create(
+        self, model: str, text: str, ttl_seconds: int, display_name: str
+    ) -> ContextHandle:
+        cached = await self.client.aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+                ttl=f"{ttl_seconds}s",
+                display_name=display_name,
+            ),
+        )
+        usage = getattr(cached, "usage_metadata", None)
+        token_count = getattr(usage, "total_token_count", None)
+        return ContextHandle(
+            name=cached.name,
+            model=model,
+            token_count=token_count or estimate_tokens(text),
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+
+    async def delete(self, name: str) -> None:
+        await self.client.aio.caches.delete(name=name)
+
+
+class InMemoryContextCacheBackend(ContextCacheBackend):
+    """In-process fake that records uploads and deletions."""
+
+    def __init__(self):
+        self.contents: Dict[str, Tuple[str, str]] = {}
+        self.created: List[str] = []
+        self.deleted: List[str] = []
+
+    async def create(
+        self, model: str, text: str, ttl_seconds: int, display_name: str
+    ) -> ContextHandle:
+        name = f"cachedContents/fake-{len(self.created) + 1}"
+        self.contents[name] = (model, text)
+        self.created.append(name)
+        return ContextHandle(
+            name=name,
+            model=model,
+            token_count=estimate_tokens(text),
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+
+    async def delete(self, name: str) -> None:
+        self.contents.pop(name, None)
+        self.deleted.append(name)
+
+
+@dataclass
+class ContextCacheUsage:
+    """Input-token accounting for one analysis."""
+
+    analysis_id: str
+    handles_created: int = 0
+    uploaded_tokens: int = 0
+    cache_hits: int = 0
+    cached_input_tokens: int = 0
+    fallbacks: int = 0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "handles_created": self.handles_created,
+            "uploaded_tokens": self.uploaded_tokens,
+            "cache_hits": self.cache_hits,
+            # Tokens served from the cache instead of being sent again
+            "cached_input_tokens": self.cached_input_tokens,
+            "saved_input_tokens": max(
+                0, self.cached_input_tokens - self.uploaded_tokens
+            ),
+            "fallbacks": self.fallbacks,
+        }
+
+
+class ContextCacheScope:
+    """Cached-content handles shared by the requests of one analysis."""
+
+    def __init__(
+        self,
+        analysis_id: str,
+        backend: Optional[ContextCacheBackend] = None,
+        ttl_seconds: Optional[int] = None,
+        min_tokens: Optional[int] = None,
+    ):
+        self.usage = ContextCacheUsage(analysis_id=analysis_id)
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds or settings.gemini_context_cache_ttl_seconds
+        self.min_tokens = (
+            settings.gemini_context_cache_min_tokens
+            if min_tokens is None
+            else min_tokens
+        )
+        self._handles: Dict[Tuple[str, str], ContextHandle] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._uncacheable: Set[Tuple[str, str]] = set()
+        self._owners: Dict[str, ContextCacheBackend] = {}
+
+    async def handle_for(
+        self, model: str, text: str, backend: ContextCacheBackend
+    ) -> Optional[ContextHandle]:
+        """
+        Get the handle for ``text``, uploading it on first use.
+
+        Returns None when the text is too short to be worth caching or the
+        upload failed; callers then send the text inline.
+        """
+        if not text or estimate_tokens(text) < self.min_tokens:
+            return None
+        key = (
+            normalize_model_name(model),
+            hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        )
+        if key in self._uncacheable:
+            return None
+        handle = self._handles.get(key)
+        if handle is not None and not handle.expires_within(_REFRESH_MARGIN_SECONDS):
+            return handle
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            handle = await self._create(key, model, text, backend)
+            future.set_result(handle)
+            return handle
+        finally:
+            del self._pending[key]
+            if not future.done():
+                # Cancelled mid-upload: concurrent waiters send the text inline
+                future.set_result(None)
+
+    async def _create(
+        self,
+        key: Tuple[str, str],
+        model: str,
+        text: str,
+        backend: ContextCacheBackend,
+    ) -> Optional[ContextHandle]:
+        backend = self.backend or backend
+        try:
+            handle = await backend.create(
+                model,
+                text,
+                self.ttl_seconds,
+                display_name=f"analysis-{self.usage.analysis_id}",
+            )
+        except Exception as e:
+            logger.warning(
+                f"Context cache upload failed for analysis {self.usage.analysis_id}, "
+                f"sending the text inline: {e}"
+            )
+            self._uncacheable.add(key)
+            return None
+        self._handles[key] = handle
+        self._owners[handle.name] = backend
+        self.usage.handles_created += 1
+        self.usage.uploaded_tokens += handle.token_count
+        logger.info(
+            f"Cached {handle.token_count} tokens as {handle.name} for analysis "
+            f"{self.usage.analysis_id}"
+        )
+        return handle
+
+    def record_use(self, handle: ContextHandle, response: Any = None) -> None:
+        """Count a request served with ``handle`` as its prefix."""
+        usage = getattr(response, "usage_metadata", None)
+        cached_tokens = getattr(usage, "cached_content_token_count", None)
+        self.usage.cache_hits += 1
+        if isinstance(cached_tokens, int):
+            self.usage.cached_input_tokens += cached_tokens
+        else:
+            self.usage.cached_input_tokens += handle.token_count
+
+    def invalidate(self, handle: ContextHandle) -> None:
+        """Stop using a handle whose request failed; the text goes inline."""
+        self.usage.fallbacks += 1
+        for key, known in list(self._handles.items()):
+            if known.name == handle.name:
+                del self._handles[key]
+                self._uncacheable.add(key)
+
+    async def close(self) -> None:
+        """Delete every handle created in this scope."""
+        for name, backend in list(self._owners.items()):
+            try:
+                await backend.delete(name)
+            except Exception as e:
+                logger.debug(f"Could not delete cached content {name}: {e}")
+        self._owners.clear()
+        self._handles.clear()
+
+
+_current_scope: contextvars.ContextVar[Optional[ContextCacheScope]] = (
+    contextvars.ContextVar("context_cache_scope", default=None)
+)
+
+
+def current_context_cache() -> Optional[ContextCacheScope]:
+    """The scope of the running analysis, if context caching is active."""
+    return _current_scope.get()
+
+
+@asynccontextmanager
+async def context_cache_scope(
+    analysis_id: Any, backend: Optional[ContextCacheBackend] = None
+) -> AsyncIterator[ContextCacheUsage]:
+    """
+    Share cached context between the LLM requests made inside the block.
+
+    Yields the usage counters, which are complete once the block exits. When
+    context caching is disabled the block runs without a scope.
+    """
+    if not settings.gemini_context_cache_enabled:
+        yield ContextCacheUsage(analysis_id=str(analysis_id))
+        return
+
+    scope = ContextCacheScope(str(analysis_id), backend=backend)
+    token = _current_scope.set(scope)
+    try:
+        yield scope.usage
+    finally:
+        _current_scope.reset(token)
+        await scope.close()
+        if scope.usage.handles_created:
+            logger.info(
+                f"Context cache for analysis {analysis_id}: {scope.usage.summary()}"
+            )
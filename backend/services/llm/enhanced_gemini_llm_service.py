@@ -15,6 +15,10 @@ from backend.domain.interfaces.llm_unified import ILLMService
 from backend.services.llm.base_llm_service import BaseLLMService
 from backend.services.llm.async_genai_client import AsyncGenAIClient
 from backend.services.llm.config.genai_config import TaskType
+from backend.services.llm.context_cache import (
+    CACHED_CONTEXT_PROMPT,
+    current_context_cache,
+)
 from backend.services.llm.exceptions import (
     LLMAPIError,
     LLMResponseParseError,
@@ -110,6 +114,31 @@ class EnhancedGeminiLLMService(BaseLLMService, ILLMService):
             except Exception:
                 pass
 
+            # Inside an analysis the text is shared by several stages; pass it
+            # as shared context so it is uploaded once and reused from the cache
+            shared = bool(text) and current_context_cache() is not None
+
+            # Callers that want results early get array elements as they close
+            if callable(request.get("on_item")):
+                return await self.client.generate_json_incrementally(
+                    task=task,
+                    prompt=CACHED_CONTEXT_PROMPT if shared else text,
+                    on_item=request["on_item"],
+                    array_keys=request.get("stream_array_keys"),
+                    custom_config=custom_config,
+                    system_instruction=system_message,
+                    shared_context=text if shared else None,
+                )
+
+            if shared:
+                return await self.client.generate_content(
+                    task=task,
+                    prompt=CACHED_CONTEXT_PROMPT,
+                    custom_config=custom_config,
+                    system_instruction=system_message,
+                    shared_context=text,
+                )
+
             # Call the AsyncGenAIClient
             return await self.client.generate_content(
                 task=task,
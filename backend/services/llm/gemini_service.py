@@ -31,6 +31,21 @@ from backend.utils.json.pydantic_parser import (
 )
 from backend.domain.interfaces.llm_unified import ILLMService
 from backend.services.llm.instructor_gemini_client import InstructorGeminiClient
+from backend.services.llm.concurrency_governor import (
+    estimate_tokens,
+    get_llm_governor,
+)
+from backend.services.llm.context_cache import (
+    CACHED_CONTEXT_PLACEHOLDER,
+    CACHED_CONTEXT_PROMPT,
+    ContextHandle,
+    GenAIContextCacheBackend,
+    current_context_cache,
+)
+from backend.services.llm.response_cache import (
+    get_response_cache,
+    should_use_cache,
+)
 
 from backend.schemas import Theme
 from backend.services.llm.prompts.gemini_prompts import GeminiPrompts
@@ -185,6 +200,7 @@ class GeminiService:
         contents: Union[str, List[Union[str, Content]]],
         generation_config: Optional[GenerateContentConfig] = None,
         system_instruction_text: Optional[str] = None,
+        context_handle: Optional[ContextHandle] = None,
     ) -> genai.types.GenerateContentResponse:
         """Makes the actual asynchronous API call to Gemini using client.aio.models.generate_content()."""
         logger.info(f"Attempting to call Gemini API with model: {model_name}")
@@ -299,6 +315,9 @@ class GeminiService:
 
             # DYNAMIC TOKEN ALLOCATION: Adjust based on input size
             input_tokens = len(str(contents).split()) * 1.3  # Rough token estimation
+            if context_handle:
+                # The cached prefix still counts towards the request size
+                input_tokens += context_handle.token_count
             if input_tokens > 50000:  # Large files (>50K tokens)
                 max_output_tokens = 65536  # 64K for large files
                 logger.info(
@@ -346,6 +365,11 @@ class GeminiService:
                 # Create a new config with the response_mime_type included
                 config = types.GenerateContentConfig(**config_kwargs)
 
+            if context_handle:
+                config = config.model_copy(
+                    update={"cached_content": context_handle.name}
+                )
+
             # Make the API call with the correct config parameter and timeout protection
             logger.info(f"Making API call with config={config}")
 
@@ -359,12 +383,17 @@ class GeminiService:
                     f"Large request detected ({input_tokens:.0f} tokens), using {timeout_seconds}s timeout"
                 )
 
-            response = await asyncio.wait_for(
-                self.client.aio.models.generate_content(
-                    model=model_name, contents=final_contents, config=config
-                ),
-                timeout=timeout_seconds,
-            )
+            # Wait for a slot from the process-wide governor before the timeout starts
+            async with get_llm_governor("gemini", model_name).slot(int(input_tokens)):
+                response = await asyncio.wait_for(
+                    self.client.aio.models.generate_content(
+                        model=model_name, contents=final_contents, config=config
+                    ),
+                    timeout=timeout_seconds,
+                )
+            scope = current_context_cache()
+            if context_handle and scope is not None:
+                scope.record_use(context_handle, response)
             return response
         except asyncio.TimeoutError:
             logger.error(
@@ -568,11 +597,16 @@ class GeminiService:
 
                 # Make the API call with the correct config parameter
                 logger.info(f"Making streaming API call with config={config}")
-                async for chunk in await self.client.aio.models.generate_content_stream(
-                    model=model_name,  # Note: parameter is 'model', not 'model_name'
-                    contents=final_contents,
-                    config=config,
-                ):
+                # The governor slot covers opening the stream, not consuming
+                # it, so a slow or disconnected consumer never holds a slot
+                governor = get_llm_governor("gemini", model_name)
+                async with governor.slot(estimate_tokens(final_contents)):
+                    stream = await self.client.aio.models.generate_content_stream(
+                        model=model_name,  # Note: parameter is 'model', not 'model_name'
+                        contents=final_contents,
+                        config=config,
+                    )
+                async for chunk in stream:
                     yield chunk.text
 
                 return  # Successful stream completion for this attempt
@@ -616,6 +650,7 @@ class GeminiService:
         initial_delay: float = 1.0,
         backoff_factor: float = 2.0,
         system_instruction_text: Optional[str] = None,
+        context_handle: Optional[ContextHandle] = None,
     ) -> genai.types.GenerateContentResponse:
         """Generates text using the Gemini API with retry logic."""
         delay = initial_delay
@@ -642,6 +677,7 @@ class GeminiService:
                     contents=current_prompt_parts,
                     generation_config=generation_config,
                     system_instruction_text=system_instruction_text,
+                    context_handle=context_handle,
                 )
                 return response
             except LLMAPIError as e:  # Catch specific API errors for retry
@@ -670,6 +706,50 @@ class GeminiService:
             f"Failed to generate text after {max_retries} retries for model {model_name}."
         )
 
+    async def _generate_text_with_context(
+        self,
+        text: str,
+        generation_config: Optional[GenerateContentConfig] = None,
+        system_instruction_text: Optional[str] = None,
+    ) -> genai.types.GenerateContentResponse:
+        """
+        Generate text for ``text``, reusing the analysis' cached context.
+
+        Inside a ``context_cache_scope`` a long ``text`` is uploaded once and
+        later requests send only the task instructions. If a cached request
+        fails, it is repeated with the text inline.
+        """
+        scope = current_context_cache()
+        handle = None
+        if scope is not None and text:
+            handle = await scope.handle_for(
+                self.default_model_name, text, GenAIContextCacheBackend(self.client)
+            )
+        if handle is not None:
+            try:
+                return await self._generate_text_with_retry(
+                    model_name=self.default_model_name,
+                    prompt_parts=[CACHED_CONTEXT_PROMPT],
+                    generation_config=generation_config,
+                    system_instruction_text=(system_instruction_text or "").replace(
+                        text, CACHED_CONTEXT_PLACEHOLDER
+                    ),
+                    context_handle=handle,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Request with cached context {handle.name} failed, "
+                    f"retrying with the text inline: {e}"
+                )
+                scope.invalidate(handle)
+
+        return await self._generate_text_with_retry(
+            model_name=self.default_model_name,
+            prompt_parts=[text],
+            generation_config=generation_config,
+            system_instruction_text=system_instruction_text,
+        )
+
     @property
     def instructor_client(self) -> InstructorGeminiClient:
         """
@@ -758,6 +838,31 @@ class GeminiService:
 
     async def analyze(
         self, text_or_payload: Union[str, Dict[str, Any]], task: Optional[str] = None, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze text for a task, optionally through the LLM response cache.
+
+        Callers opt into caching by setting ``use_cache`` in the payload (or
+        in ``data``); otherwise the settings default applies.
+        """
+        if isinstance(text_or_payload, dict):
+            cache_payload = dict(text_or_payload)
+            if data:
+                cache_payload = {**data, **cache_payload}
+        else:
+            cache_payload = {**(data or {}), "text": text_or_payload, "task": task or ""}
+
+        if not should_use_cache(cache_payload):
+            return await self._analyze_uncached(text_or_payload, task, data)
+
+        return await get_response_cache().get_or_compute(
+            self.default_model_name,
+            cache_payload,
+            lambda: self._analyze_uncached(text_or_payload, task, data),
+        )
+
+    async def _analyze_uncached(
+        self, text_or_payload: Union[str, Dict[str, Any]], task: Optional[str] = None, data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         # Handle both call patterns:
         # 1. analyze({"task": ..., "text": ...}) - used by processor.py
@@ -1205,8 +1310,6 @@ Double-check your JSON for missing commas before responding.
             # Fallback to original config if creation fails
             logger.warning(f"Using original generation config due to error")
 
-        prompt_parts: List[Union[str, Content]] = [user_message_content]
-
         # Log generation details
         logger.info(
             f"Generating content for task '{task}' with config: {config_params}"
@@ -1231,9 +1334,8 @@ Double-check your JSON for missing commas before responding.
         )
 
         try:
-            response = await self._generate_text_with_retry(
-                model_name=self.default_model_name,  # Added keyword arg for clarity
-                prompt_parts=prompt_parts,
+            response = await self._generate_text_with_context(
+                text=user_message_content,
                 generation_config=current_generation_config,
                 system_instruction_text=system_message_content,
             )
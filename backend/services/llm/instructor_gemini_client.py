@@ -12,7 +12,9 @@ import logging
 import time
 import asyncio
 import os
-from typing import Type, TypeVar, Any, Dict, List, Optional, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Type, TypeVar, Any, Dict, List, Optional, Union
 from dataclasses import dataclass
 
 from google import genai
@@ -27,6 +29,11 @@ from backend.infrastructure.constants.llm_constants import (
     GEMINI_TOP_K,
     ENV_GEMINI_API_KEY,
 )
+from backend.infrastructure.config.settings import settings
+from backend.services.llm.concurrency_governor import (
+    estimate_tokens,
+    get_llm_governor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +41,86 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+class InstrumentedExecutor:
+    """
+    Dedicated, bounded thread pool for blocking Instructor calls.
+
+    Only used when the async Instructor client is unavailable. Keeping these
+    calls off the event loop's default executor means slow LLM requests cannot
+    starve unrelated ``run_in_executor`` work, and the counters show when the
+    pool itself becomes the bottleneck.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "instructor-sync"):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+
+    def _run(self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._active += 1
+        start = time.monotonic()
+        failed = False
+        try:
+            return fn()
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._busy_seconds += time.monotonic() - start
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        """Run a blocking callable on the pool and await its result."""
+        with self._lock:
+            self._submitted += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run, fn)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, queue depth and completion counters."""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "queued": self._submitted - finished - self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_busy_ms": (
+                    int(self._busy_seconds * 1000 / finished) if finished else 0
+                ),
+            }
+
+
+_sync_executor: Optional[InstrumentedExecutor] = None
+_sync_executor_lock = threading.Lock()
+
+
+def get_sync_executor() -> InstrumentedExecutor:
+    """Get the shared executor for the blocking Instructor fallback."""
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                _sync_executor = InstrumentedExecutor(
+                    max(1, settings.instructor_sync_executor_workers)
+                )
+    return _sync_executor
+
+
 @dataclass
 class GenerationMetrics:
     """Metrics for generation performance monitoring."""
@@ -112,6 +199,19 @@ class EnhancedInstructorGeminiClient:
             mode=instructor.Mode.GENAI_TOOLS,  # Use GENAI_TOOLS mode as per official docs
         )
 
+        # Async client on client.aio; structured calls then never occupy a thread
+        try:
+            self.async_instructor_client = instructor.from_genai(
+                client=self.genai_client,
+                mode=instructor.Mode.GENAI_TOOLS,
+                use_async=True,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Async Instructor client unavailable, using the sync fallback: {e}"
+            )
+            self.async_instructor_client = None
+
         self.model_name = model_name
         self.max_retries = max_retries
         self.enable_metrics = enable_metrics
@@ -198,8 +298,23 @@ class EnhancedInstructorGeminiClient:
                 error_type: len([m for m in failed if m.error_type == error_type])
                 for error_type in set(m.error_type for m in failed if m.error_type)
             },
+            "async_client": self.async_instructor_client is not None,
+            "sync_executor": get_sync_executor().stats(),
         }
 
+    def _create_completion(
+        self, messages: List[Dict[str, str]], model_class: Type[T], **kwargs
+    ) -> T:
+        """Run one blocking Instructor request under the model's governor."""
+        governor = get_llm_governor("gemini", self.model_name)
+        with governor.sync_slot(estimate_tokens([m["content"] for m in messages])):
+            return self.instructor_client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                response_model=model_class,
+                **kwargs,
+            )
+
     def generate_with_model(
         self,
         prompt: str,
@@ -260,12 +375,7 @@ class EnhancedInstructorGeminiClient:
 
         # Try initial generation
         try:
-            response = self.instructor_client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                response_model=model_class,
-                **kwargs,
-            )
+            response = self._create_completion(messages, model_class, **kwargs)
             self._finalize_metrics(metrics, success=True)
             logger.info(
                 f"Successfully generated content with model {model_class.__name__}"
@@ -302,12 +412,7 @@ class EnhancedInstructorGeminiClient:
             retry_params.update(strategy)
 
             try:
-                response = self.instructor_client.chat.completions.create(
-                    model=self.model_name,
-                    messages=messages,
-                    response_model=model_class,
-                    **kwargs,
-                )
+                response = self._create_completion(messages, model_class, **kwargs)
                 self._finalize_metrics(metrics, success=True)
                 logger.info(
                     f"Successfully generated content on retry {retry_count + 1}"
@@ -347,6 +452,10 @@ class EnhancedInstructorGeminiClient:
         """
         Generate content asynchronously with a specific Pydantic model.
 
+        Uses the async Instructor client, so no thread is held while waiting
+        for the model. Without it, the blocking client runs on the dedicated
+        ``get_sync_executor()`` pool instead of the loop's default executor.
+
         Args:
             prompt: The prompt to send to the model
             model_class: The Pydantic model class to parse the response into
@@ -372,16 +481,27 @@ class EnhancedInstructorGeminiClient:
 
         # Generate content using correct Instructor API for Gemini
         try:
-            # Use the correct Instructor API for Gemini
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.instructor_client.chat.completions.create(
-                    model=self.model_name,
-                    messages=messages,
-                    response_model=model_class,
-                    **kwargs,
-                ),
-            )
+            # Use the correct Instructor API for Gemini; the governor slot is
+            # taken on the event loop so waiting does not occupy a thread
+            governor = get_llm_governor("gemini", self.model_name)
+            async with governor.slot(estimate_tokens(prompt, system_instruction)):
+                async_client = self.async_instructor_client
+                if async_client is not None:
+                    response = await async_client.chat.completions.create(
+                        model=self.model_name,
+                        messages=messages,
+                        response_model=model_class,
+                        **kwargs,
+                    )
+                else:
+                    response = await get_sync_executor().run(
+                        lambda: self.instructor_client.chat.completions.create(
+                            model=self.model_name,
+                            messages=messages,
+                            response_model=model_class,
+                            **kwargs,
+                        )
+                    )
         except Exception as e:
             logger.error(
                 f"Error generating content asynchronously with Instructor: {str(e)}"
@@ -14,6 +14,14 @@ import time
 from pydantic import ValidationError
 
 from backend.schemas import Theme, Pattern, Insight
+from backend.services.llm.concurrency_governor import (
+    estimate_tokens,
+    get_llm_governor,
+)
+from backend.services.llm.response_cache import (
+    get_response_cache,
+    should_use_cache,
+)
 from backend.utils.json.json_parser import (
     parse_llm_json_response,
     normalize_persona_response,
@@ -64,7 +72,23 @@ class OpenAIService:
 
         logger.info(f"Initialized OpenAI service with model: {self.model}")
 
+    async def _create_chat_completion(self, **kwargs) -> Any:
+        """Create a chat completion once the model's governor admits the request."""
+        governor = get_llm_governor("openai", kwargs.get("model", self.model))
+        estimated = estimate_tokens([m["content"] for m in kwargs.get("messages", [])])
+        async with governor.slot(estimated):
+            return await self.client.chat.completions.create(**kwargs)
+
     async def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze data using OpenAI, optionally through the LLM response cache."""
+        if not should_use_cache(data):
+            return await self._analyze_uncached(data)
+
+        return await get_response_cache().get_or_compute(
+            self.model, data, lambda: self._analyze_uncached(data)
+        )
+
+    async def _analyze_uncached(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze data using OpenAI."""
         task = data.get("task", "")
         text = data.get("text", "")
@@ -115,7 +139,7 @@ class OpenAIService:
             response_format = {"type": "json_object"} if is_json_task else None
 
             # Call OpenAI API
-            response = await self.client.chat.completions.create(
+            response = await self._create_chat_completion(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -1663,7 +1687,7 @@ class OpenAIService:
                 {"role": "user", "content": user_prompt},
             ]
 
-            response = await self.client.chat.completions.create(
+            response = await self._create_chat_completion(
                 model=self.model,
                 messages=messages,
                 response_format={"type": "json_object"},  # Ensure JSON response
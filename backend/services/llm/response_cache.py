@@ -0,0 +1,609 @@
+"""
+Content-addressed cache for LLM responses.
+
+Responses are keyed by (model, prompt template version, normalized payload hash)
+so that re-analysing the same upload reuses earlier results instead of paying
+full LLM latency and cost again. Two backends are provided:
+
+- MemoryCacheBackend: per-process LRU with O(1) eviction and a byte budget
+- SQLiteCacheBackend: on-disk tier that survives restarts and is shared by
+  worker processes on the same host
+
+TieredCacheBackend combines both, serving hot entries from memory and
+promoting disk hits. Call sites opt in per request by setting ``use_cache``
+in the analyze() payload. Requests without the flag follow the enclosing
+``response_cache_scope`` (the analysis pipeline enables caching for its
+stages, so re-running an analysis reuses earlier responses), and otherwise
+the process-wide default from settings.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.constants.llm_constants import (
+    PROMPT_TEMPLATE_VERSION,
+    PROMPT_TEMPLATE_VERSIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Payload keys that never influence the LLM output
+_VOLATILE_PAYLOAD_KEYS = {
+    "use_cache",
+    "timestamp",
+    "request_id",
+    "progress_callback",
+    "analysis_id",
+}
+
+# Caching default of requests without ``use_cache`` in the current context
+_scope_default: contextvars.ContextVar[Optional[bool]] = contextvars.ContextVar(
+    "llm_response_cache_scope", default=None
+)
+
+
+class CacheBackend(ABC):
+    """Storage backend for serialized cache entries."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored bytes for ``key`` or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Store ``value`` under ``key``, evicting old entries if needed."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self, prefix: str = "") -> int:
+        """Remove all entries whose key starts with ``prefix``."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return backend statistics."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache bounded by total bytes and optionally by entry count.
+
+    Entries live in an OrderedDict, so lookups, recency updates and evictions
+    are all O(1).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: Optional[float] = 3600,
+        max_entries: Optional[int] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, stored_at = entry
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            # Never let a single oversized entry flush the whole cache
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.time())
+            self._size += len(value)
+            while self._entries and (
+                self._size > self.max_bytes
+                or (
+                    self.max_entries is not None
+                    and len(self._entries) > self.max_entries
+                )
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self, prefix: str = "") -> int:
+        with self._lock:
+            if not prefix:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._size = 0
+                return removed
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys:
+                self._remove(k)
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    On-disk cache stored in a SQLite database.
+
+    The database runs in WAL mode so several worker processes can share it.
+    Least-recently-used entries are evicted once the total size exceeds the
+    byte budget.
+    """
+
+    # Only refresh accessed_at when it is older than this many seconds, so hot
+    # reads do not turn into a write per lookup.
+    _TOUCH_INTERVAL = 60.0
+    # Re-check the total size after this many writes
+    _PRUNE_EVERY = 32
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: Optional[float] = 7 * 24 * 3600,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._local = threading.local()
+        self._writes_since_prune = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_response_cache_accessed "
+            "ON llm_response_cache (accessed_at)"
+        )
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, created_at, accessed_at FROM llm_response_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        value, created_at, accessed_at = row
+        now = time.time()
+        if self.ttl is not None and now - created_at > self.ttl:
+            self.delete(key)
+            self.misses += 1
+            return None
+        if now - accessed_at > self._TOUCH_INTERVAL:
+            conn.execute(
+                "UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            conn.commit()
+        self.hits += 1
+        return bytes(value)
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_response_cache "
+            "(key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (key, sqlite3.Binary(value), len(value), now, now),
+        )
+        conn.commit()
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= self._PRUNE_EVERY:
+            self._writes_since_prune = 0
+            self.prune()
+
+    def prune(self) -> int:
+        """Drop expired entries and evict LRU entries above the byte budget."""
+        conn = self._connection()
+        removed = 0
+        if self.ttl is not None:
+            cursor = conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?",
+                (time.time() - self.ttl,),
+            )
+            removed += cursor.rowcount
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_response_cache"
+        ).fetchone()[0]
+        if total > self.max_bytes:
+            # Evict down to 90% of the budget to avoid pruning on every write
+            target = int(self.max_bytes * 0.9)
+            rows = conn.execute(
+                "SELECT key, size FROM llm_response_cache ORDER BY accessed_at ASC"
+            )
+            victims = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                victims.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM llm_response_cache WHERE key = ?", victims)
+            removed += len(victims)
+            self.evictions += len(victims)
+        conn.commit()
+        return removed
+
+    def delete(self, key: str) -> None:
+        conn = self._connection()
+        conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+        conn.commit()
+
+    def clear(self, prefix: str = "") -> int:
+        conn = self._connection()
+        if prefix:
+            cursor = conn.execute(
+                "DELETE FROM llm_response_cache WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        else:
+            cursor = conn.execute("DELETE FROM llm_response_cache")
+        conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connection()
+        entries, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_response_cache"
+        ).fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class TieredCacheBackend(CacheBackend):
+    """Memory LRU in front of a persistent backend."""
+
+    def __init__(self, memory: MemoryCacheBackend, disk: CacheBackend):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        value = self.disk.get(key)
+        if value is not None:
+            self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        self.disk.delete(key)
+
+    def clear(self, prefix: str = "") -> int:
+        self.memory.clear(prefix)
+        return self.disk.clear(prefix)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "tiered",
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats(),
+        }
+
+
+def _normalize_value(value: Any) -> Any:
+    """Normalize payload values so cosmetic differences hash identically."""
+    if isinstance(value, str):
+        return "\n".join(line.rstrip() for line in value.replace("\r\n", "\n").split("\n")).strip()
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(v) for v in value]
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    if hasattr(value, "model_dump"):
+        return _normalize_value(value.model_dump())
+    return repr(value)
+
+
+def resolve_model_name(service: Any) -> str:
+    """Best-effort model identifier for an LLM service instance."""
+    getter = getattr(service, "get_model_name", None)
+    if callable(getter) and not inspect.iscoroutinefunction(getter):
+        try:
+            name = getter()
+            if isinstance(name, str):
+                return name
+        except Exception:
+            pass
+    for attr in ("default_model_name", "model_name", "model"):
+        name = getattr(service, attr, None)
+        if isinstance(name, str):
+            return name
+    return type(service).__name__
+
+
+@contextmanager
+def response_cache_scope(enabled: bool = True) -> Iterator[None]:
+    """Cache requests made in this context unless they set ``use_cache``."""
+    token = _scope_default.set(enabled)
+    try:
+        yield
+    finally:
+        _scope_default.reset(token)
+
+
+def should_use_cache(payload: Optional[Dict[str, Any]]) -> bool:
+    """Whether a request payload opted into the response cache."""
+    if isinstance(payload, dict) and "use_cache" in payload:
+        return bool(payload.get("use_cache"))
+    scoped = _scope_default.get()
+    if scoped is not None:
+        return scoped
+    return settings.llm_response_cache_default
+
+
+def is_cacheable_response(result: Any) -> bool:
+    """Responses that signal failure or are empty are never cached."""
+    if result is None:
+        return False
+    if isinstance(result, dict) and (not result or "error" in result):
+        return False
+    return True
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for LLM responses.
+
+    Values are stored as JSON, so every hit returns a fresh copy that callers
+    may mutate freely.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str = "llm"):
+        self.backend = backend
+        self.namespace = namespace
+
+    def make_key(
+        self,
+        model: str,
+        payload: Dict[str, Any],
+        template_version: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model identifier used for the request
+            payload: Request payload (task, text and options)
+            template_version: Prompt template version; defaults to the
+                configured version for the payload's task
+
+        Returns:
+            Namespaced key string
+        """
+        task = payload.get("task", "") if isinstance(payload, dict) else ""
+        if template_version is None:
+            template_version = PROMPT_TEMPLATE_VERSIONS.get(task, PROMPT_TEMPLATE_VERSION)
+        normalized = {
+            k: _normalize_value(v)
+            for k, v in payload.items()
+            if k not in _VOLATILE_PAYLOAD_KEYS and not callable(v)
+        }
+        payload_hash = hashlib.sha256(
+            json.dumps(normalized, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        return f"{self.namespace}:{model}:{template_version}:{payload_hash}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` or None."""
+        try:
+            raw = await asyncio.to_thread(self.backend.get, key)
+        except Exception as e:
+            logger.warning(f"LLM response cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except (ValueError, TypeError):
+            return None
+
+    async def set(self, key: str, value: Any) -> bool:
+        """Store ``value`` under ``key``; returns False if it is not serializable."""
+        try:
+            raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            logger.debug("Skipping LLM response cache write for non-JSON response")
+            return False
+        try:
+            await asyncio.to_thread(self.backend.set, key, raw)
+        except Exception as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+            return False
+        return True
+
+    async def get_or_compute(
+        self,
+        model: str,
+        payload: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        template_version: Optional[str] = None,
+    ) -> Any:
+        """
+        Return a cached response or compute, cache and return a new one.
+
+        Args:
+            model: Model identifier used for the request
+            payload: Request payload used to build the key
+            compute: Coroutine factory that performs the LLM call
+            template_version: Optional explicit prompt template version
+
+        Returns:
+            The cached or freshly computed response
+        """
+        key = self.make_key(model, payload, template_version)
+        cached = await self.get(key)
+        if cached is not None:
+            logger.info(f"LLM response cache hit for task: {payload.get('task')}")
+            return cached
+
+        logger.info(f"LLM response cache miss for task: {payload.get('task')}")
+        result = await compute()
+        if is_cacheable_response(result):
+            await self.set(key, result)
+        return result
+
+    def clear(self) -> int:
+        """Remove every entry in this cache's namespace."""
+        removed = self.backend.clear(f"{self.namespace}:")
+        logger.info(f"Cleared {removed} entries from LLM response cache '{self.namespace}'")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        return {"namespace": self.namespace, **self.backend.stats()}
+
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_cache_backend(
+    kind: Optional[str] = None, path: Optional[str] = None
+) -> CacheBackend:
+    """
+    Create a cache backend from settings.
+
+    Args:
+        kind: "memory", "sqlite" or "tiered"; defaults to settings
+        path: Path of the SQLite database; defaults to settings
+
+    Returns:
+        Configured cache backend
+    """
+    kind = (kind or settings.llm_response_cache_backend).lower()
+    memory = MemoryCacheBackend(
+        max_bytes=settings.llm_response_cache_memory_bytes,
+        ttl=settings.llm_response_cache_ttl,
+    )
+    if kind == "memory":
+        return memory
+
+    try:
+        disk = SQLiteCacheBackend(
+            path or settings.llm_response_cache_path,
+            max_bytes=settings.llm_response_cache_disk_bytes,
+            ttl=settings.llm_response_cache_ttl,
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Falling back to in-memory LLM response cache: {e}")
+        return memory
+
+    if kind == "sqlite":
+        return disk
+    return TieredCacheBackend(memory, disk)
+
+
+def get_cache_backend() -> CacheBackend:
+    """Return the process-wide cache backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_cache_backend()
+    return _backend
+
+
+def set_cache_backend(backend: Optional[CacheBackend]) -> None:
+    """Replace the process-wide backend (used by tests)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def get_response_cache(namespace: str = "llm") -> LLMResponseCache:
+    """Return a response cache bound to the shared backend."""
+    return LLMResponseCache(get_cache_backend(), namespace=namespace)
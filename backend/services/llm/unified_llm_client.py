@@ -24,6 +24,7 @@ from backend.services.external.secure_env import secure_env
 
 # Import proven LLM patterns from V1/V2
 from backend.services.llm.base_llm_service import BaseLLMService
+from backend.services.llm.response_cache import get_response_cache, should_use_cache
 
 # Import pydantic for type hints (required for TypeVar bound)
 from pydantic import BaseModel, ValidationError
@@ -125,12 +126,36 @@ class UnifiedLLMClient:
         
         return self._enhanced_client
     
+    def _cache_payload(self, kind: str, prompt: str, system_instruction: Optional[str],
+                       kwargs: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        """Build the payload used to key the LLM response cache."""
+        return {
+            "task": kind,
+            "text": prompt,
+            "system_instruction": system_instruction,
+            "options": {k: v for k, v in kwargs.items() if k != "use_cache"},
+            **extra,
+        }
+
     async def generate_text(self, prompt: str, system_instruction: Optional[str] = None, **kwargs) -> str:
         """
         Generate text using basic client (V1/V2 compatibility).
         
         This method provides the same interface as V1/V2 LLM services.
+        Pass ``use_cache=True`` to serve repeated prompts from the LLM
+        response cache.
         """
+        if not should_use_cache(kwargs):
+            return await self._generate_text_uncached(prompt, system_instruction, **kwargs)
+
+        return await get_response_cache().get_or_compute(
+            self.model_name,
+            self._cache_payload("unified_text", prompt, system_instruction, kwargs),
+            lambda: self._generate_text_uncached(prompt, system_instruction, **kwargs),
+        )
+
+    async def _generate_text_uncached(self, prompt: str, system_instruction: Optional[str] = None, **kwargs) -> str:
+        """Generate text without consulting the response cache."""
         
         self.current_metrics = RequestMetrics(start_time=time.time())
         
@@ -195,7 +220,35 @@ class UnifiedLLMClient:
         Generate structured output using enhanced client (V3 features).
         
         This method provides V3 enhanced capabilities with proper error handling.
+        Pass ``use_cache=True`` to serve repeated prompts from the LLM
+        response cache; cached values are re-validated against ``model_class``.
         """
+        if not should_use_cache(kwargs):
+            return await self._generate_structured_uncached(
+                prompt, model_class, system_instruction, **kwargs
+            )
+
+        payload = self._cache_payload(
+            "unified_structured",
+            prompt,
+            system_instruction,
+            kwargs,
+            response_model=f"{model_class.__module__}.{model_class.__qualname__}",
+            response_schema=model_class.model_json_schema(),
+        )
+
+        async def compute() -> Dict[str, Any]:
+            result = await self._generate_structured_uncached(
+                prompt, model_class, system_instruction, **kwargs
+            )
+            return result.model_dump(mode="json")
+
+        data = await get_response_cache().get_or_compute(self.model_name, payload, compute)
+        return model_class.model_validate(data)
+
+    async def _generate_structured_uncached(self, prompt: str, model_class: Type[T],
+                                            system_instruction: Optional[str] = None, **kwargs) -> T:
+        """Generate structured output without consulting the response cache."""
         
         if not ENHANCED_FEATURES_AVAILABLE:
             raise RuntimeError("Structured generation not available - missing dependencies")
@@ -9,6 +9,9 @@ import copy
 import importlib.util
 from typing import Dict, Any, List, Tuple, Optional
 from backend.services.llm.base_llm_service import BaseLLMService as ILLMService
+from backend.services.llm.context_cache import context_cache_scope
+from backend.services.llm.response_cache import response_cache_scope
+from backend.services.validation.quote_locator import QuoteLocator
 
 from backend.schemas import DetailedAnalysisResult
 from backend.services.nlp.data_extraction import (
@@ -352,22 +355,11 @@ class NLPProcessor:
             )
 
             start_time = asyncio.get_event_loop().time()
-            logger.info("Starting parallel analysis")
-
-            # Update progress: Starting theme analysis
-            await update_progress(
-                "THEME_EXTRACTION", 0.2, "Starting enhanced theme analysis"
-            )
-
-            # Skip basic theme analysis and go directly to enhanced theme analysis
-            logger.info("Using enhanced theme analysis directly")
-
-            # Initialize variables
-            basic_themes_task = None
-            enhanced_themes_task = None
+            logger.info("Starting stage graph analysis")
 
             # Import GeminiService for type checking
             from backend.services.llm.gemini_service import GeminiService
+            from backend.services.processing.pipeline.stage_graph import StageGraph
 
             # Default to passed service
             target_llm_service_enhanced = llm_service
@@ -385,451 +377,494 @@ class NLPProcessor:
                     "Primary LLM is not Gemini. Using primary LLM for enhanced themes."
                 )
 
-            # Create enhanced theme analysis payload with filename if available
-            logger.info(f"🔍 [THEME_DEBUG] answer_only_text length: {len(answer_only_text)}, preview: {answer_only_text[:300] if answer_only_text else 'EMPTY'}...")
-            enhanced_theme_payload = {
-                "task": "theme_analysis_enhanced",
-                "text": answer_only_text,  # Use answer-only text for themes
-                "use_answer_only": True,  # Flag to indicate answer-only processing
-                "industry": config.get(
-                    "industry"
-                ),  # Pass industry context if available
-            }
-            logger.info(f"🔍 [THEME_DEBUG] Enhanced theme payload created with task: {enhanced_theme_payload['task']}, text length: {len(enhanced_theme_payload['text'])}")
+            # Basic themes are no longer generated; enhanced themes are copied in
+            # once both themes and patterns are available (see insights stage).
+            themes_result = {"themes": []}
+            logger.info(
+                "🎯 [PIPELINE_DEBUG] Initialized themes_result with empty themes"
+            )
 
-            # Add filename to payload if available
-            if filename:
-                enhanced_theme_payload["filename"] = filename
-                logger.info(
-                    f"Adding filename to enhanced theme analysis payload: {filename}"
-                )
+            # ----------------------------------------------------------------
+            # Stage definitions. Each stage declares the outputs it consumes and
+            # the StageGraph starts it as soon as those outputs exist, so theme
+            # analysis and industry detection run concurrently, and patterns and
+            # personas start as soon as the industry is known.
+            # ----------------------------------------------------------------
 
-            # Call analyze using the determined service for enhanced theme analysis
-            enhanced_themes_task = target_llm_service_enhanced.analyze(
-                enhanced_theme_payload
-            )
+            async def run_theme_stage():
+                # Update progress: Starting theme analysis
+                await update_progress(
+                    "THEME_EXTRACTION", 0.2, "Starting enhanced theme analysis"
+                )
 
-            # Get enhanced themes directly
-            logger.info("🎯 [PIPELINE_DEBUG] Awaiting enhanced themes task...")
-            enhanced_themes_result = await enhanced_themes_task
+                # Skip basic theme analysis and go directly to enhanced theme analysis
+                logger.info("Using enhanced theme analysis directly")
 
-            # CRITICAL DEBUG: Print to stdout to ensure we see it
-            print(f"\n{'='*60}")
-            print(f"🔥 [THEME_CRITICAL] Enhanced themes task completed.")
-            print(f"🔥 [THEME_CRITICAL] Result type: {type(enhanced_themes_result)}")
-            print(f"{'='*60}\n")
+                themes_found = 0
 
-            logger.info(
-                f"🎯 [PIPELINE_DEBUG] Enhanced themes task completed. Result type: {type(enhanced_themes_result)}"
-            )
+                async def on_theme(key, theme):
+                    # Streaming-capable services report themes as they close
+                    nonlocal themes_found
+                    themes_found += 1
+                    await update_progress(
+                        "THEME_EXTRACTION",
+                        0.2,
+                        f"Identified {themes_found} themes so far",
+                    )
 
-            # Log full result for debugging
-            if isinstance(enhanced_themes_result, dict):
-                if "error" in enhanced_themes_result:
-                    print(f"🚨 [THEME_ERROR] LLM returned error: {enhanced_themes_result.get('error')}")
-                    logger.error(f"🚨 [THEME_ERROR] LLM returned error: {enhanced_themes_result.get('error')}")
-                print(f"🔥 [THEME_CRITICAL] Result keys: {list(enhanced_themes_result.keys())}")
-                logger.info(f"🎯 [PIPELINE_DEBUG] Enhanced themes result keys: {list(enhanced_themes_result.keys())}")
-                if "enhanced_themes" in enhanced_themes_result:
-                    themes_count = len(enhanced_themes_result.get("enhanced_themes", []))
-                    print(f"✅ [THEME_SUCCESS] Found {themes_count} enhanced themes in result")
-                    logger.info(f"🎯 [PIPELINE_DEBUG] Found {themes_count} enhanced themes in result")
-                    if themes_count > 0:
-                        first_theme_name = enhanced_themes_result["enhanced_themes"][0].get("name", "No name")
-                        print(f"✅ [THEME_SUCCESS] First theme name: {first_theme_name}")
-                        logger.info(f"🎯 [PIPELINE_DEBUG] First theme name: {first_theme_name}")
-                elif "themes" in enhanced_themes_result:
-                    themes_count = len(enhanced_themes_result.get("themes", []))
-                    print(f"⚠️ [THEME_FALLBACK] Found {themes_count} themes (not enhanced) in result")
-                    logger.info(f"🎯 [PIPELINE_DEBUG] Found {themes_count} themes (not enhanced) in result")
-                else:
-                    print(f"❌ [THEME_MISSING] No themes or enhanced_themes key found in result!")
-                    print(f"❌ [THEME_MISSING] Full result (first 500 chars): {str(enhanced_themes_result)[:500]}")
-                    logger.warning(f"🚨 [THEME_WARNING] No themes or enhanced_themes key found in result!")
+                # Create enhanced theme analysis payload with filename if available
+                logger.info(f"🔍 [THEME_DEBUG] answer_only_text length: {len(answer_only_text)}, preview: {answer_only_text[:300] if answer_only_text else 'EMPTY'}...")
+                enhanced_theme_payload = {
+                    "task": "theme_analysis_enhanced",
+                    "text": answer_only_text,  # Use answer-only text for themes
+                    "use_answer_only": True,  # Flag to indicate answer-only processing
+                    "industry": config.get(
+                        "industry"
+                    ),  # Pass industry context if available
+                    "on_item": on_theme,
+                    "stream_array_keys": ("enhanced_themes", "themes"),
+                }
+                logger.info(f"🔍 [THEME_DEBUG] Enhanced theme payload created with task: {enhanced_theme_payload['task']}, text length: {len(enhanced_theme_payload['text'])}")
 
-            # Update progress: Theme analysis completed
-            await update_progress(
-                "THEME_EXTRACTION", 0.4, "Enhanced theme analysis completed"
-            )
+                # Add filename to payload if available
+                if filename:
+                    enhanced_theme_payload["filename"] = filename
+                    logger.info(
+                        f"Adding filename to enhanced theme analysis payload: {filename}"
+                    )
 
-            # Store the enhanced themes as the main themes result
-            themes_result = {"themes": []}  # Initialize with empty themes
-            logger.info(
-                "🎯 [PIPELINE_DEBUG] Initialized themes_result with empty themes"
-            )
+                # Call analyze using the determined service for enhanced theme analysis
+                logger.info("🎯 [PIPELINE_DEBUG] Awaiting enhanced themes task...")
+                enhanced_themes_result = await target_llm_service_enhanced.analyze(
+                    enhanced_theme_payload
+                )
 
-            # Solution 2: Improve the handling of enhanced theme results
-            try:
-                # Log the full structure of the enhanced_themes_result for debugging
                 logger.info(
-                    f"Enhanced theme analysis result structure: {type(enhanced_themes_result)}"
+                    f"🎯 [PIPELINE_DEBUG] Enhanced themes task completed. Result type: {type(enhanced_themes_result)}"
                 )
+
+                # Log full result for debugging
                 if isinstance(enhanced_themes_result, dict):
-                    logger.info(
-                        f"Enhanced theme analysis result keys: {list(enhanced_themes_result.keys())}"
-                    )
-                    # Log the raw result for debugging
-                    logger.debug(
-                        f"Enhanced theme analysis raw result: {json.dumps(enhanced_themes_result)}"
-                    )
+                    if "error" in enhanced_themes_result:
+                        logger.error(f"🚨 [THEME_ERROR] LLM returned error: {enhanced_themes_result.get('error')}")
+                    logger.info(f"🎯 [PIPELINE_DEBUG] Enhanced themes result keys: {list(enhanced_themes_result.keys())}")
+                    if "enhanced_themes" in enhanced_themes_result:
+                        themes_count = len(enhanced_themes_result.get("enhanced_themes", []))
+                        logger.info(f"🎯 [PIPELINE_DEBUG] Found {themes_count} enhanced themes in result")
+                        if themes_count > 0:
+                            first_theme_name = enhanced_themes_result["enhanced_themes"][0].get("name", "No name")
+                            logger.info(f"🎯 [PIPELINE_DEBUG] First theme name: {first_theme_name}")
+                    elif "themes" in enhanced_themes_result:
+                        themes_count = len(enhanced_themes_result.get("themes", []))
+                        logger.info(f"🎯 [PIPELINE_DEBUG] Found {themes_count} themes (not enhanced) in result")
+                    else:
+                        logger.warning(f"🚨 [THEME_WARNING] No themes or enhanced_themes key found in result!")
 
-                # Check for enhanced_themes key first (preferred)
-                if (
-                    isinstance(enhanced_themes_result, dict)
-                    and "enhanced_themes" in enhanced_themes_result
-                    and isinstance(enhanced_themes_result["enhanced_themes"], list)
-                ):
+                # Update progress: Theme analysis completed
+                await update_progress(
+                    "THEME_EXTRACTION", 0.4, "Enhanced theme analysis completed"
+                )
+
+                # Solution 2: Improve the handling of enhanced theme results
+                try:
+                    # Log the full structure of the enhanced_themes_result for debugging
                     logger.info(
-                        f"Enhanced theme analysis completed with {len(enhanced_themes_result.get('enhanced_themes', []))} themes"
+                        f"Enhanced theme analysis result structure: {type(enhanced_themes_result)}"
                     )
-                    # Log the first theme if available
-                    if enhanced_themes_result["enhanced_themes"]:
-                        first_theme = enhanced_themes_result["enhanced_themes"][0]
+                    if isinstance(enhanced_themes_result, dict):
                         logger.info(
-                            f"First enhanced theme: {first_theme.get('name', 'Unnamed')}"
+                            f"Enhanced theme analysis result keys: {list(enhanced_themes_result.keys())}"
                         )
-                # Fall back to themes key if enhanced_themes is not present
-                elif (
-                    isinstance(enhanced_themes_result, dict)
-                    and "themes" in enhanced_themes_result
-                    and isinstance(enhanced_themes_result["themes"], list)
-                ):
-                    logger.info(
-                        f"Enhanced theme analysis returned regular themes with {len(enhanced_themes_result.get('themes', []))} themes"
-                    )
-                    # Copy themes to enhanced_themes for consistent handling
-                    enhanced_themes_result["enhanced_themes"] = enhanced_themes_result[
-                        "themes"
-                    ]
-                    logger.info(
-                        "Copied themes to enhanced_themes for consistent handling"
-                    )
-                    # Log the first theme if available
-                    if enhanced_themes_result["themes"]:
-                        first_theme = enhanced_themes_result["themes"][0]
+                        # Log the raw result for debugging
+                        logger.debug(
+                            f"Enhanced theme analysis raw result: {json.dumps(enhanced_themes_result)}"
+                        )
+
+                    # Check for enhanced_themes key first (preferred)
+                    if (
+                        isinstance(enhanced_themes_result, dict)
+                        and "enhanced_themes" in enhanced_themes_result
+                        and isinstance(enhanced_themes_result["enhanced_themes"], list)
+                    ):
                         logger.info(
-                            f"First theme (copied to enhanced_themes): {first_theme.get('name', 'Unnamed')}"
+                            f"Enhanced theme analysis completed with {len(enhanced_themes_result.get('enhanced_themes', []))} themes"
                         )
-                # Handle direct list of themes (no wrapper object)
-                elif (
-                    isinstance(enhanced_themes_result, list)
-                    and len(enhanced_themes_result) > 0
-                ):
-                    logger.info(
-                        f"Enhanced theme analysis returned a direct list of {len(enhanced_themes_result)} themes"
-                    )
-                    # Wrap the list in a dictionary with enhanced_themes key
-                    enhanced_themes_result = {"enhanced_themes": enhanced_themes_result}
-                    logger.info(
-                        "Wrapped theme list in enhanced_themes key for consistent handling"
-                    )
-                else:
-                    logger.warning(
-                        f"Enhanced theme analysis did not return expected structure. Keys: {list(enhanced_themes_result.keys()) if isinstance(enhanced_themes_result, dict) else 'not a dictionary'}"
-                    )
-                    # Create a default structure if the result is not as expected
+                        # Log the first theme if available
+                        if enhanced_themes_result["enhanced_themes"]:
+                            first_theme = enhanced_themes_result["enhanced_themes"][0]
+                            logger.info(
+                                f"First enhanced theme: {first_theme.get('name', 'Unnamed')}"
+                            )
+                    # Fall back to themes key if enhanced_themes is not present
+                    elif (
+                        isinstance(enhanced_themes_result, dict)
+                        and "themes" in enhanced_themes_result
+                        and isinstance(enhanced_themes_result["themes"], list)
+                    ):
+                        logger.info(
+                            f"Enhanced theme analysis returned regular themes with {len(enhanced_themes_result.get('themes', []))} themes"
+                        )
+                        # Copy themes to enhanced_themes for consistent handling
+                        enhanced_themes_result["enhanced_themes"] = enhanced_themes_result[
+                            "themes"
+                        ]
+                        logger.info(
+                            "Copied themes to enhanced_themes for consistent handling"
+                        )
+                        # Log the first theme if available
+                        if enhanced_themes_result["themes"]:
+                            first_theme = enhanced_themes_result["themes"][0]
+                            logger.info(
+                                f"First theme (copied to enhanced_themes): {first_theme.get('name', 'Unnamed')}"
+                            )
+                    # Handle direct list of themes (no wrapper object)
+                    elif (
+                        isinstance(enhanced_themes_result, list)
+                        and len(enhanced_themes_result) > 0
+                    ):
+                        logger.info(
+                            f"Enhanced theme analysis returned a direct list of {len(enhanced_themes_result)} themes"
+                        )
+                        # Wrap the list in a dictionary with enhanced_themes key
+                        enhanced_themes_result = {"enhanced_themes": enhanced_themes_result}
+                        logger.info(
+                            "Wrapped theme list in enhanced_themes key for consistent handling"
+                        )
+                    else:
+                        logger.warning(
+                            f"Enhanced theme analysis did not return expected structure. Keys: {list(enhanced_themes_result.keys()) if isinstance(enhanced_themes_result, dict) else 'not a dictionary'}"
+                        )
+                        # Create a default structure if the result is not as expected
+                        enhanced_themes_result = {"enhanced_themes": []}
+                        logger.warning(
+                            "Created empty enhanced_themes structure as fallback"
+                        )
+                except Exception as e:
+                    logger.error(f"Error in enhanced theme analysis: {str(e)}")
+                    # Create a fallback enhanced themes result
                     enhanced_themes_result = {"enhanced_themes": []}
+                    logger.warning("Created empty enhanced_themes structure due to error")
+
+                # Solution 3: Improve the fallback mechanism
+                # If enhanced themes are missing or empty, log and proceed with an empty list
+                if not enhanced_themes_result or not enhanced_themes_result.get(
+                    "enhanced_themes"
+                ):
                     logger.warning(
-                        "Created empty enhanced_themes structure as fallback"
+                        "Enhanced themes not available or empty, proceeding with no themes instead of creating synthetic defaults"
                     )
-            except Exception as e:
-                logger.error(f"Error in enhanced theme analysis: {str(e)}")
-                # Create a fallback enhanced themes result
-                enhanced_themes_result = {"enhanced_themes": []}
-                logger.warning("Created empty enhanced_themes structure due to error")
-
-            # Solution 3: Improve the fallback mechanism
-            # If enhanced themes are missing or empty, log and proceed with an empty list
-            if not enhanced_themes_result or not enhanced_themes_result.get(
-                "enhanced_themes"
-            ):
-                logger.warning(
-                    "Enhanced themes not available or empty, proceeding with no themes instead of creating synthetic defaults"
+                    # Ensure we always have a consistent structure for downstream code
+                    if not enhanced_themes_result:
+                        enhanced_themes_result = {"enhanced_themes": []}
+                    elif "enhanced_themes" not in enhanced_themes_result:
+                        enhanced_themes_result["enhanced_themes"] = []
+
+                return enhanced_themes_result
+
+            async def run_industry_stage():
+                # Detect industry from the text
+                detected = await self._detect_industry(combined_text, llm_service)
+                logger.info(f"Detected industry: {detected}")
+                return detected
+
+            async def run_pattern_stage(industry):
+                # Update progress: Starting pattern detection
+                await update_progress(
+                    "PATTERN_DETECTION", 0.45, "Starting pattern detection analysis"
                 )
-                # Ensure we always have a consistent structure for downstream code
-                if not enhanced_themes_result:
-                    enhanced_themes_result = {"enhanced_themes": []}
-                elif "enhanced_themes" not in enhanced_themes_result:
-                    enhanced_themes_result["enhanced_themes"] = []
-
-            # Detect industry from the text
-            industry = await self._detect_industry(combined_text, llm_service)
-            logger.info(f"Detected industry: {industry}")
-
-            # Update progress: Starting pattern detection
-            await update_progress(
-                "PATTERN_DETECTION", 0.45, "Starting pattern detection analysis"
-            )
 
-            # Create pattern recognition payload with filename if available
-            pattern_payload = {
-                "task": "pattern_recognition",
-                "text": combined_text,
-                "industry": industry,
-            }
-
-            # Add filename to payload if available
-            if filename:
-                pattern_payload["filename"] = filename
-                logger.info(
-                    f"Adding filename to pattern recognition payload: {filename}"
-                )
+                # Create pattern recognition payload with filename if available
+                pattern_payload = {
+                    "task": "pattern_recognition",
+                    "text": combined_text,
+                    "industry": industry,
+                }
 
-            # Run pattern recognition using the new PatternService
-            try:
-                # Use the new extract_patterns method if available
-                if hasattr(self, "extract_patterns"):
-                    logger.info("Using new PatternService for pattern extraction")
+                # Add filename to payload if available
+                if filename:
+                    pattern_payload["filename"] = filename
+                    logger.info(
+                        f"Adding filename to pattern recognition payload: {filename}"
+                    )
 
-                    async def get_patterns():
+                # Run pattern recognition using the new PatternService
+                try:
+                    # Use the new extract_patterns method if available
+                    if hasattr(self, "extract_patterns"):
+                        logger.info("Using new PatternService for pattern extraction")
                         # Create a simple transcript structure from the combined text
                         simple_transcript = [{"text": combined_text}]
                         logger.info(
                             f"🔍 [PIPELINE_DEBUG] Starting patterns extraction with {len(themes_result.get('themes', []))} themes"
                         )
-                        return await self.extract_patterns(
+                        patterns_result = await self.extract_patterns(
                             transcript=simple_transcript,
                             themes=themes_result.get("themes", []),
                             industry=industry,
                         )
+                    else:
+                        logger.info(
+                            "Falling back to legacy LLM service for pattern extraction"
+                        )
+                        patterns_result = await llm_service.analyze(pattern_payload)
+                except Exception as e:
+                    logger.error(f"Error in pattern extraction: {str(e)}")
+                    logger.info("Falling back to legacy LLM service for pattern extraction")
+                    patterns_result = await llm_service.analyze(pattern_payload)
 
-                    patterns_task = asyncio.create_task(get_patterns())
-                else:
-                    logger.info(
-                        "Falling back to legacy LLM service for pattern extraction"
-                    )
-                    patterns_task = llm_service.analyze(pattern_payload)
-            except Exception as e:
-                logger.error(f"Error in pattern extraction: {str(e)}")
-                logger.info("Falling back to legacy LLM service for pattern extraction")
-                patterns_task = llm_service.analyze(pattern_payload)
-
-            # PERFORMANCE OPTIMIZATION: Sentiment analysis disabled
-            # Sentiment analysis was never displayed to users (no sentiment tab in UI)
-            # Disabling to improve performance and reduce processing time
-            await update_progress(
-                "SENTIMENT_ANALYSIS",
-                0.5,
-                "Skipping sentiment analysis (disabled for performance)",
-            )
-
-            # Create minimal sentiment result for schema compatibility
-            sentiment_task = asyncio.create_task(
-                self._create_minimal_sentiment_result()
-            )
+                logger.info(
+                    f"🔍 [PIPELINE_DEBUG] Patterns result: {len(patterns_result.get('patterns', []))} patterns"
+                )
 
-            # Wait for remaining tasks to complete
-            logger.info(
-                "⏳ [PIPELINE_DEBUG] Waiting for patterns and sentiment tasks..."
-            )
-            patterns_result, sentiment_result = await asyncio.gather(
-                patterns_task, sentiment_task
-            )
-            logger.info(
-                f"🔍 [PIPELINE_DEBUG] Patterns result: {len(patterns_result.get('patterns', []))} patterns"
-            )
-            logger.info(
-                f"😊 [PIPELINE_DEBUG] Sentiment result keys: {list(sentiment_result.keys()) if isinstance(sentiment_result, dict) else 'not a dict'}"
-            )
+                # Update progress: Pattern detection completed
+                await update_progress(
+                    "PATTERN_DETECTION", 0.6, "Pattern detection completed"
+                )
+                return patterns_result
 
-            # Update progress: Pattern detection completed
-            await update_progress(
-                "PATTERN_DETECTION", 0.6, "Pattern detection completed"
-            )
+            async def run_sentiment_stage():
+                # PERFORMANCE OPTIMIZATION: Sentiment analysis disabled
+                # Sentiment analysis was never displayed to users (no sentiment tab in UI)
+                # Disabling to improve performance and reduce processing time
+                await update_progress(
+                    "SENTIMENT_ANALYSIS",
+                    0.5,
+                    "Skipping sentiment analysis (disabled for performance)",
+                )
 
-            # Update progress: Sentiment analysis completed
-            await update_progress(
-                "SENTIMENT_ANALYSIS", 0.65, "Sentiment analysis completed"
-            )
+                # Create minimal sentiment result for schema compatibility
+                sentiment_result = await self._create_minimal_sentiment_result()
+                logger.info(
+                    f"😊 [PIPELINE_DEBUG] Sentiment result keys: {list(sentiment_result.keys()) if isinstance(sentiment_result, dict) else 'not a dict'}"
+                )
 
-            parallel_duration = asyncio.get_event_loop().time() - start_time
-            logger.info(
-                f"Parallel analysis completed in {parallel_duration:.2f} seconds"
-            )
+                # Update progress: Sentiment analysis completed
+                await update_progress(
+                    "SENTIMENT_ANALYSIS", 0.65, "Sentiment analysis completed"
+                )
 
-            # Process and validate sentiment results before including them in the response
-            # This ensures we only return high-quality sentiment data
-            try:
-                # Check if sentiment analysis was disabled
-                if sentiment_result.get("disabled", False):
-                    logger.info(
-                        "Sentiment analysis was disabled, using minimal sentiment data"
-                    )
+                # Process and validate sentiment results before including them in the response
+                # This ensures we only return high-quality sentiment data
+                try:
+                    # Check if sentiment analysis was disabled
+                    if sentiment_result.get("disabled", False):
+                        logger.info(
+                            "Sentiment analysis was disabled, using minimal sentiment data"
+                        )
+                        processed_sentiment = []
+                        # Store the minimal sentiment overview for schema compatibility
+                        sentiment_overview = sentiment_result.get(
+                            "sentiment_overview",
+                            {"positive": 0.33, "neutral": 0.34, "negative": 0.33},
+                        )
+                    else:
+                        processed_sentiment = self._process_sentiment_results(
+                            sentiment_result
+                        )
+                        logger.info(
+                            f"Processed sentiment results: positive={len(processed_sentiment.get('positive', []))}, neutral={len(processed_sentiment.get('neutral', []))}, negative={len(processed_sentiment.get('negative', []))}"
+                        )
+                        sentiment_overview = None
+                except Exception as e:
+                    logger.error(f"Error processing sentiment results: {str(e)}")
+                    # SCHEMA FIX: Use empty list instead of dictionary for schema compliance
                     processed_sentiment = []
-                    # Store the minimal sentiment overview for schema compatibility
-                    sentiment_overview = sentiment_result.get(
-                        "sentiment_overview",
-                        {"positive": 0.33, "neutral": 0.34, "negative": 0.33},
-                    )
-                else:
-                    processed_sentiment = self._process_sentiment_results(
-                        sentiment_result
-                    )
+                    sentiment_overview = {
+                        "positive": 0.33,
+                        "neutral": 0.34,
+                        "negative": 0.33,
+                    }
+                    logger.warning("Using empty sentiment list due to processing error")
+
+                return processed_sentiment, sentiment_overview
+
+            async def run_persona_stage(industry):
+                # ====================================================================
+                # PERSONA GENERATION - Generated before insights so insights can
+                # reference them. Only needs the industry, so it overlaps with theme
+                # analysis and pattern detection.
+                # ====================================================================
+                logger.info("👥 [PIPELINE] Starting persona generation (before insights)")
+
+                # Use stakeholder-aware text for persona generation if available
+                # This enables proper per-stakeholder persona generation from simulation data
+                persona_text = stakeholder_aware_text if stakeholder_aware_text else combined_text
+                if stakeholder_aware_text:
                     logger.info(
-                        f"Processed sentiment results: positive={len(processed_sentiment.get('positive', []))}, neutral={len(processed_sentiment.get('neutral', []))}, negative={len(processed_sentiment.get('negative', []))}"
+                        f"👥 [PIPELINE] Using stakeholder-aware text for persona generation ({len(stakeholder_aware_text)} chars)"
                     )
-                    sentiment_overview = None
-            except Exception as e:
-                logger.error(f"Error processing sentiment results: {str(e)}")
-                # SCHEMA FIX: Use empty list instead of dictionary for schema compliance
-                processed_sentiment = []
-                sentiment_overview = {
-                    "positive": 0.33,
-                    "neutral": 0.34,
-                    "negative": 0.33,
-                }
-                logger.warning("Using empty sentiment list due to processing error")
 
-            # Be more resilient to partial failures - continue if at least some core results are present
-            # This allows the pipeline to continue even if one analysis step fails
-            try:
-                # Check if we have at least some usable results
-                has_basic_themes = len(themes_result.get("themes", [])) > 0
-                has_enhanced_themes = enhanced_themes_result and (
-                    len(enhanced_themes_result.get("enhanced_themes", [])) > 0
-                    or len(enhanced_themes_result.get("themes", [])) > 0
+                personas_result = await self._generate_personas(
+                    combined_text=persona_text,
+                    industry=industry,
+                    llm_service=llm_service,
+                    progress_callback=progress_callback,
                 )
-                has_patterns = len(patterns_result.get("patterns", [])) > 0
 
-                # Log the status of each analysis component
-                logger.info(
-                    f"Analysis components status - Basic themes: {has_basic_themes}, "
-                    + f"Enhanced themes: {has_enhanced_themes}, Patterns: {has_patterns}"
-                )
+                logger.info(f"👥 [PIPELINE] Persona generation complete: {len(personas_result)} personas")
+                if personas_result:
+                    persona_names = [p.get('name', 'Unnamed') for p in personas_result]
+                    logger.info(f"👥 [PIPELINE] Persona names: {persona_names}")
+                return personas_result
 
-                # Continue if we have at least some usable results
-                # Ideally, we want both themes (basic OR enhanced) AND patterns, but we'll be more resilient
-                if not has_patterns:
-                    logger.warning(
-                        "No patterns found from LLM, attempting to generate fallback patterns from themes"
+            async def run_insight_stage(themes, patterns, sentiment, personas):
+                enhanced_themes_result = themes
+                patterns_result = patterns
+                processed_sentiment, _ = sentiment
+                personas_result = personas
+
+                # Be more resilient to partial failures - continue if at least some core results are present
+                # This allows the pipeline to continue even if one analysis step fails
+                try:
+                    # Check if we have at least some usable results
+                    has_basic_themes = len(themes_result.get("themes", [])) > 0
+                    has_enhanced_themes = enhanced_themes_result and (
+                        len(enhanced_themes_result.get("enhanced_themes", [])) > 0
+                        or len(enhanced_themes_result.get("themes", [])) > 0
                     )
+                    has_patterns = len(patterns_result.get("patterns", [])) > 0
 
-                    # Generate fallback patterns from themes
-                    fallback_patterns = await self._generate_fallback_patterns(
-                        combined_text, themes_result.get("themes", []), llm_service
+                    # Log the status of each analysis component
+                    logger.info(
+                        f"Analysis components status - Basic themes: {has_basic_themes}, "
+                        + f"Enhanced themes: {has_enhanced_themes}, Patterns: {has_patterns}"
                     )
 
-                    if fallback_patterns and len(fallback_patterns) > 0:
-                        logger.info(
-                            f"Successfully generated {len(fallback_patterns)} fallback patterns from themes"
+                    # Continue if we have at least some usable results
+                    # Ideally, we want both themes (basic OR enhanced) AND patterns, but we'll be more resilient
+                    if not has_patterns:
+                        logger.warning(
+                            "No patterns found from LLM, attempting to generate fallback patterns from themes"
                         )
-                        patterns_result["patterns"] = fallback_patterns
-                    else:
+
+                        # Generate fallback patterns from themes
+                        fallback_patterns = await self._generate_fallback_patterns(
+                            combined_text, themes_result.get("themes", []), llm_service
+                        )
+
+                        if fallback_patterns and len(fallback_patterns) > 0:
+                            logger.info(
+                                f"Successfully generated {len(fallback_patterns)} fallback patterns from themes"
+                            )
+                            patterns_result["patterns"] = fallback_patterns
+                        else:
+                            logger.warning(
+                                "Failed to generate fallback patterns, returning empty patterns array"
+                            )
+                            patterns_result["patterns"] = []
+
+                    # If we have patterns but no themes, we'll continue with empty themes
+                    if not (has_basic_themes or has_enhanced_themes):
                         logger.warning(
-                            "Failed to generate fallback patterns, returning empty patterns array"
+                            "No themes found, but patterns are available. Continuing with empty themes."
                         )
-                        patterns_result["patterns"] = []
+                        # Create empty themes array
+                        themes_result["themes"] = []
+
+                    # If enhanced themes succeeded but basic themes failed, use enhanced themes as basic themes
+                    if has_enhanced_themes and not has_basic_themes:
+                        logger.info("Using enhanced themes as fallback for basic themes")
+                        # Copy enhanced themes to basic themes
+                        if "enhanced_themes" in enhanced_themes_result:
+                            themes_result["themes"] = enhanced_themes_result[
+                                "enhanced_themes"
+                            ]
+                        elif "themes" in enhanced_themes_result:
+                            themes_result["themes"] = enhanced_themes_result["themes"]
+                except Exception as e:
+                    logger.error(f"Error checking analysis completeness: {str(e)}")
+                    # Continue processing instead of returning an error
+                    # This allows the pipeline to proceed even if there's an error in the completeness check
+                    logger.info("Continuing despite error in completeness check")
 
-                # If we have patterns but no themes, we'll continue with empty themes
-                if not (has_basic_themes or has_enhanced_themes):
-                    logger.warning(
-                        "No themes found, but patterns are available. Continuing with empty themes."
-                    )
-                    # Create empty themes array
-                    themes_result["themes"] = []
+                # ====================================================================
+                # INSIGHT GENERATION - Now with access to themes, patterns, AND personas
+                # ====================================================================
+                insight_start_time = asyncio.get_event_loop().time()
 
-                # If enhanced themes succeeded but basic themes failed, use enhanced themes as basic themes
-                if has_enhanced_themes and not has_basic_themes:
-                    logger.info("Using enhanced themes as fallback for basic themes")
-                    # Copy enhanced themes to basic themes
-                    if "enhanced_themes" in enhanced_themes_result:
-                        themes_result["themes"] = enhanced_themes_result[
-                            "enhanced_themes"
-                        ]
-                    elif "themes" in enhanced_themes_result:
-                        themes_result["themes"] = enhanced_themes_result["themes"]
-            except Exception as e:
-                logger.error(f"Error checking analysis completeness: {str(e)}")
-                # Continue processing instead of returning an error
-                # This allows the pipeline to proceed even if there's an error in the completeness check
-                logger.info("Continuing despite error in completeness check")
-
-            # ========================================================================
-            # PERSONA GENERATION - Generate personas BEFORE insights so insights can
-            # reference them. This enables cross-referencing between insights and personas.
-            # ========================================================================
-            logger.info("👥 [PIPELINE] Starting persona generation (before insights)")
-
-            # Use stakeholder-aware text for persona generation if available
-            # This enables proper per-stakeholder persona generation from simulation data
-            persona_text = stakeholder_aware_text if stakeholder_aware_text else combined_text
-            if stakeholder_aware_text:
-                logger.info(
-                    f"👥 [PIPELINE] Using stakeholder-aware text for persona generation ({len(stakeholder_aware_text)} chars)"
+                # Update progress: Starting insight generation
+                await update_progress(
+                    "INSIGHT_GENERATION", 0.7, "Starting insight generation"
                 )
 
-            personas_result = await self._generate_personas(
-                combined_text=persona_text,
-                industry=industry,
-                llm_service=llm_service,
-                progress_callback=progress_callback,
-            )
+                # Get themes for insight generation - prefer themes_result but fall back to enhanced_themes
+                themes_for_insights = themes_result.get("themes", [])
+                if not themes_for_insights or len(themes_for_insights) == 0:
+                    # Fall back to enhanced themes if themes_result is empty
+                    if enhanced_themes_result and "enhanced_themes" in enhanced_themes_result:
+                        themes_for_insights = enhanced_themes_result.get("enhanced_themes", [])
+                        logger.info(f"Using enhanced themes for insight generation: {len(themes_for_insights)} themes")
+                    elif enhanced_themes_result and "themes" in enhanced_themes_result:
+                        themes_for_insights = enhanced_themes_result.get("themes", [])
+                        logger.info(f"Using themes from enhanced_themes_result for insight generation: {len(themes_for_insights)} themes")
+
+                # Log what we're using for insight generation
+                logger.info(f"[INSIGHT_PREP] themes_for_insights count: {len(themes_for_insights)}")
+                if themes_for_insights:
+                    theme_names = [t.get('name', 'Unnamed') for t in themes_for_insights[:3]]
+                    logger.info(f"[INSIGHT_PREP] First theme names: {theme_names}")
+                    total_statements = sum(len(t.get('statements', [])) for t in themes_for_insights)
+                    logger.info(f"[INSIGHT_PREP] Total statements across themes: {total_statements}")
+
+                # Create insight generation payload with ALL available context
+                # Now includes personas for cross-referencing
+                insight_payload = {
+                    "task": "insight_generation",
+                    "text": combined_text,
+                    "themes": themes_for_insights,
+                    "patterns": patterns_result.get("patterns", []),
+                    "sentiment": processed_sentiment,
+                    "personas": personas_result,  # Include personas for cross-referencing
+                }
 
-            logger.info(f"👥 [PIPELINE] Persona generation complete: {len(personas_result)} personas")
-            if personas_result:
-                persona_names = [p.get('name', 'Unnamed') for p in personas_result]
-                logger.info(f"👥 [PIPELINE] Persona names: {persona_names}")
+                # Add filename to payload if available
+                if filename:
+                    insight_payload["filename"] = filename
+                    logger.info(
+                        f"Adding filename to insight generation payload: {filename}"
+                    )
 
-            # ========================================================================
-            # INSIGHT GENERATION - Now with access to themes, patterns, AND personas
-            # ========================================================================
-            insight_start_time = asyncio.get_event_loop().time()
+                logger.info(f"[INSIGHT_PREP] Insight payload includes {len(personas_result)} personas for cross-referencing")
 
-            # Update progress: Starting insight generation
-            await update_progress(
-                "INSIGHT_GENERATION", 0.7, "Starting insight generation"
-            )
+                insights_result = await llm_service.analyze(insight_payload)
 
-            # Get themes for insight generation - prefer themes_result but fall back to enhanced_themes
-            themes_for_insights = themes_result.get("themes", [])
-            if not themes_for_insights or len(themes_for_insights) == 0:
-                # Fall back to enhanced themes if themes_result is empty
-                if enhanced_themes_result and "enhanced_themes" in enhanced_themes_result:
-                    themes_for_insights = enhanced_themes_result.get("enhanced_themes", [])
-                    logger.info(f"Using enhanced themes for insight generation: {len(themes_for_insights)} themes")
-                elif enhanced_themes_result and "themes" in enhanced_themes_result:
-                    themes_for_insights = enhanced_themes_result.get("themes", [])
-                    logger.info(f"Using themes from enhanced_themes_result for insight generation: {len(themes_for_insights)} themes")
-
-            # Log what we're using for insight generation
-            logger.info(f"[INSIGHT_PREP] themes_for_insights count: {len(themes_for_insights)}")
-            if themes_for_insights:
-                theme_names = [t.get('name', 'Unnamed') for t in themes_for_insights[:3]]
-                logger.info(f"[INSIGHT_PREP] First theme names: {theme_names}")
-                total_statements = sum(len(t.get('statements', [])) for t in themes_for_insights)
-                logger.info(f"[INSIGHT_PREP] Total statements across themes: {total_statements}")
-
-            # Create insight generation payload with ALL available context
-            # Now includes personas for cross-referencing
-            insight_payload = {
-                "task": "insight_generation",
-                "text": combined_text,
-                "themes": themes_for_insights,
-                "patterns": patterns_result.get("patterns", []),
-                "sentiment": processed_sentiment,
-                "personas": personas_result,  # NEW: Include personas for cross-referencing
-            }
+                # Update progress: Insight generation completed
+                await update_progress(
+                    "INSIGHT_GENERATION", 0.8, "Insight generation completed"
+                )
 
-            # Add filename to payload if available
-            if filename:
-                insight_payload["filename"] = filename
+                insight_duration = asyncio.get_event_loop().time() - insight_start_time
                 logger.info(
-                    f"Adding filename to insight generation payload: {filename}"
+                    f"Insight generation completed in {insight_duration:.2f} seconds"
+                )
+                return insights_result
+
+            stage_graph = (
+                StageGraph(name="interview_analysis")
+                .add_stage("themes", run_theme_stage)
+                .add_stage("industry", run_industry_stage)
+                .add_stage("sentiment", run_sentiment_stage)
+                .add_stage("patterns", run_pattern_stage, inputs=("industry",))
+                .add_stage("personas", run_persona_stage, inputs=("industry",))
+                .add_stage(
+                    "insights",
+                    run_insight_stage,
+                    inputs=("themes", "patterns", "sentiment", "personas"),
                 )
-
-            logger.info(f"[INSIGHT_PREP] Insight payload includes {len(personas_result)} personas for cross-referencing")
-
-            insights_result = await llm_service.analyze(insight_payload)
-
-            # Update progress: Insight generation completed
-            await update_progress(
-                "INSIGHT_GENERATION", 0.8, "Insight generation completed"
-            )
-
-            insight_duration = asyncio.get_event_loop().time() - insight_start_time
-            logger.info(
-                f"Insight generation completed in {insight_duration:.2f} seconds"
             )
+            # Stages share the transcript through one cached-content upload, and
+            # their LLM responses are cached so a re-run of the same upload
+            # (restart, industry tweak) reuses them
+            with response_cache_scope():
+                async with context_cache_scope(analysis_id or id(data)) as cache_usage:
+                    stage_outputs = await stage_graph.run()
+
+            enhanced_themes_result = stage_outputs["themes"]
+            industry = stage_outputs["industry"]
+            patterns_result = stage_outputs["patterns"]
+            processed_sentiment, sentiment_overview = stage_outputs["sentiment"]
+            personas_result = stage_outputs["personas"]
+            insights_result = stage_outputs["insights"]
 
             total_duration = asyncio.get_event_loop().time() - start_time
             logger.info(f"Total analysis completed in {total_duration:.2f} seconds")
@@ -876,14 +911,8 @@ class NLPProcessor:
 
             # Enrich themes with statements_detailed by attributing quotes to source interviews
             try:
-                def _normalize_txt(s: str) -> str:
-                    try:
-                        return " ".join((s or "").lower().strip().split())
-                    except Exception:
-                        return s or ""
-
                 # Build simple per-interview text index with synthetic doc_ids when missing
-                doc_index: list[tuple[str, str]] = []  # (document_id, text_lower)
+                doc_index: list[tuple[str, str]] = []  # (document_id, text)
                 if isinstance(data, dict) and isinstance(data.get("interviews"), list):
                     for i, iv in enumerate(data["interviews"]):
                         try:
@@ -901,22 +930,26 @@ class NLPProcessor:
                             elif isinstance(iv.get("text"), str):
                                 parts.append(iv["text"])
                             if parts:
-                                doc_index.append((str(did), _normalize_txt("\n\n".join(parts))))
+                                doc_index.append((str(did), "\n\n".join(parts)))
                         except Exception:
                             continue
                 else:
                     # Single-document fallback using combined_text
-                    doc_index.append(("original_text", _normalize_txt(combined_text)))
+                    doc_index.append(("original_text", combined_text or ""))
+
+                # Normalize every document once; each distinct quote is one search
+                quote_locator = QuoteLocator.from_documents(doc_index)
 
                 def _infer_doc_id_for_quote(q: str) -> str:
-                    qn = _normalize_txt(q)
-                    if not qn:
+                    # Containment only: a fuzzy token overlap matches almost any
+                    # interview. Long quotes may match on their first 30 chars.
+                    qn = " ".join(q.lower().split())
+                    location = quote_locator.locate(q, fuzzy=False)
+                    if location is None and len(qn) > 30:
+                        location = quote_locator.locate(qn[:30], fuzzy=False)
+                    if location is None or not location.document_id:
                         return "original_text"
-                    for did, txt in doc_index:
-                        # Simple containment match; could be extended with fuzzy matching
-                        if qn in txt or (len(qn) > 30 and qn[:30] in txt):
-                            return did
-                    return "original_text"
+                    return location.document_id
 
                 # Apply attribution to enhanced themes
                 for t in enhanced_themes:
@@ -1006,6 +1039,9 @@ class NLPProcessor:
                 if "personas" not in results:
                     results["personas"] = []
 
+            # Input tokens served from the shared context cache for this analysis
+            results.setdefault("metadata", {})["context_cache"] = cache_usage.summary()
+
             return results
 
         except Exception as e:
@@ -10,10 +10,15 @@ This module provides functionality for:
 
 from typing import Dict, Any, List, Optional, Tuple
 import logging
+import os
 import re
 import json
+from collections import OrderedDict
 from difflib import SequenceMatcher
 
+from backend.infrastructure.config.settings import settings
+from backend.services.processing.tool_catalog_index import ToolCatalogIndex
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,26 @@ except ImportError:
     USE_RAPIDFUZZ = False
     logger.info("rapidfuzz not available, using difflib for string matching")
 
+# Bounds of the per-service LRU caches
+INDUSTRY_CACHE_SIZE = 256
+INDUSTRY_TOOLS_CACHE_SIZE = 64
+
+
+def _lru_get(cache, key):
+    """Look up ``key`` in an OrderedDict LRU cache, marking it recently used."""
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+
+def _lru_put(cache, key, value, max_size):
+    """Store ``key`` in an OrderedDict LRU cache, evicting the oldest entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
 
 class AdaptiveToolRecognitionService:
     """
@@ -33,7 +58,13 @@ class AdaptiveToolRecognitionService:
     robust error correction to identify tools across diverse domains.
     """
 
-    def __init__(self, llm_service, similarity_threshold=0.75, learning_enabled=True):
+    def __init__(
+        self,
+        llm_service,
+        similarity_threshold=0.75,
+        learning_enabled=True,
+        corrections_path=None,
+    ):
         """
         Initialize the adaptive tool recognition service.
 
@@ -41,25 +72,40 @@ class AdaptiveToolRecognitionService:
             llm_service: LLM service for industry detection and tool identification
             similarity_threshold: Threshold for fuzzy matching (0.0-1.0)
             learning_enabled: Whether to enable learning from corrections
+            corrections_path: JSON Lines file of learned corrections; defaults
+                to settings
         """
         self.llm_service = llm_service
         self.similarity_threshold = similarity_threshold
         self.learning_enabled = learning_enabled
+        self.corrections_path = corrections_path or settings.tool_corrections_path
 
-        # Initialize learning database for corrections
-        self.learned_corrections = self._load_learned_corrections()
+        # Learned corrections are loaded on first use
+        self._learned_corrections = None
 
-        # Cache for industry detection
-        self.industry_cache = {}
+        # LRU cache for industry detection, keyed by the start of the text
+        self.industry_cache = OrderedDict()
 
-        # Cache for industry-specific tools
-        self.industry_tools_cache = {}
+        # LRU cache for industry-specific tools and their fuzzy-match indexes
+        self.industry_tools_cache = OrderedDict()
+        self._catalog_indexes = OrderedDict()
 
         # Store rapidfuzz availability
         self.use_rapidfuzz = USE_RAPIDFUZZ
 
         logger.info(f"Initialized AdaptiveToolRecognitionService (similarity_threshold={similarity_threshold}, learning_enabled={learning_enabled})")
 
+    @property
+    def learned_corrections(self):
+        """Corrections by lowercased mention, loaded on first access."""
+        if self._learned_corrections is None:
+            self._learned_corrections = self._load_learned_corrections()
+        return self._learned_corrections
+
+    @learned_corrections.setter
+    def learned_corrections(self, corrections):
+        self._learned_corrections = corrections
+
     def _load_learned_corrections(self):
         """Load learned corrections from previous sessions."""
         # SOLUTION 2: Initialize with predefined corrections for common tool name variations and misspellings
@@ -120,8 +166,30 @@ class AdaptiveToolRecognitionService:
             "gslides": {"tool_name": "Google Slides", "confidence": 0.95}
         }
 
-        # In production, this would load from a database and merge with predefined corrections
         logger.info(f"Loaded {len(predefined_corrections)} predefined tool name corrections")
+
+        # Merge corrections learned in earlier sessions; later lines win
+        learned = 0
+        try:
+            with open(self.corrections_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        predefined_corrections[record["mention"]] = {
+                            "tool_name": record["tool_name"],
+                            "confidence": float(record["confidence"]),
+                        }
+                        learned += 1
+                    except (ValueError, TypeError, KeyError):
+                        # Skip a torn or malformed line
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not load learned tool corrections: {e}")
+
+        if learned:
+            logger.info(f"Loaded {learned} learned tool name corrections")
         return predefined_corrections
 
     async def identify_industry(self, text):
@@ -135,9 +203,10 @@ class AdaptiveToolRecognitionService:
             Identified industry and confidence score
         """
         # Check cache first
-        cache_key = hash(text[:1000])  # Use first 1000 chars as cache key
-        if cache_key in self.industry_cache:
-            return self.industry_cache[cache_key]
+        cache_key = text[:1000]  # Use first 1000 chars as cache key
+        cached = _lru_get(self.industry_cache, cache_key)
+        if cached is not None:
+            return cached
 
         try:
             # Create prompt for industry detection
@@ -203,7 +272,7 @@ FORMAT YOUR RESPONSE AS JSON:
                     industry_data = {"industry": "Technology", "confidence": 0.5}
 
             # Cache the result
-            self.industry_cache[cache_key] = industry_data
+            _lru_put(self.industry_cache, cache_key, industry_data, INDUSTRY_CACHE_SIZE)
 
             logger.info(f"Identified industry: {industry_data.get('industry')} with confidence {industry_data.get('confidence')}")
             return industry_data
@@ -224,8 +293,9 @@ FORMAT YOUR RESPONSE AS JSON:
             Dictionary of tools with variations and functions
         """
         # Check cache first
-        if industry in self.industry_tools_cache:
-            return self.industry_tools_cache[industry]
+        cached = _lru_get(self.industry_tools_cache, industry)
+        if cached is not None:
+            return cached
 
         try:
             # Create prompt for industry-specific tools
@@ -288,8 +358,14 @@ FORMAT YOUR RESPONSE AS JSON:
                     if name not in tools_dict[name]["variations"]:
                         tools_dict[name]["variations"].append(name)
 
-            # Cache the result
-            self.industry_tools_cache[industry] = tools_dict
+            # Cache the result together with its fuzzy-match index
+            _lru_put(
+                self.industry_tools_cache,
+                industry,
+                tools_dict,
+                INDUSTRY_TOOLS_CACHE_SIZE,
+            )
+            self._catalog_index(industry, tools_dict)
 
             logger.info(f"Retrieved {len(tools_dict)} tools for industry: {industry}")
             return tools_dict
@@ -379,7 +455,11 @@ FORMAT YOUR RESPONSE AS JSON:
             enhanced_tools = self._apply_learned_corrections(identified_tools, industry)
 
             # Apply fuzzy matching for low-confidence tools
-            final_tools = self._enhance_with_fuzzy_matching(enhanced_tools, industry_tools)
+            final_tools = self._enhance_with_fuzzy_matching(
+                enhanced_tools,
+                industry_tools,
+                self._catalog_index(industry, industry_tools),
+            )
 
             logger.info(f"Identified {len(final_tools)} tools in text")
             return final_tools
@@ -464,54 +544,80 @@ FORMAT YOUR RESPONSE AS JSON:
 
         return enhanced_tools
 
-    def _enhance_with_fuzzy_matching(self, identified_tools, industry_tools):
+    def _catalog_index(self, industry, industry_tools):
+        """
+        Get the fuzzy-match index for an industry's tools, building it once.
+
+        Args:
+            industry: Industry name
+            industry_tools: Dictionary of industry-specific tools
+
+        Returns:
+            ToolCatalogIndex over the tools' canonical names and variations
+        """
+        cached = _lru_get(self._catalog_indexes, industry)
+        if cached is not None:
+            tools, index = cached
+            if tools is industry_tools and index.threshold == self.similarity_threshold:
+                return index
+
+        index = ToolCatalogIndex(
+            industry_tools,
+            threshold=self.similarity_threshold,
+            use_rapidfuzz=self.use_rapidfuzz,
+        )
+        _lru_put(
+            self._catalog_indexes,
+            industry,
+            (industry_tools, index),
+            INDUSTRY_TOOLS_CACHE_SIZE,
+        )
+        return index
+
+    def _enhance_with_fuzzy_matching(
+        self, identified_tools, industry_tools, catalog_index=None
+    ):
         """
         Enhance low-confidence tools with fuzzy matching against industry tools.
 
         Args:
             identified_tools: List of tools identified by LLM
             industry_tools: Dictionary of industry-specific tools
+            catalog_index: Prebuilt index over ``industry_tools``; built on
+                the fly when omitted
 
         Returns:
             Enhanced list of tools with improved confidence scores
         """
-        enhanced_tools = []
-
-        for tool in identified_tools:
-            # Only apply fuzzy matching to low-confidence tools
-            if tool.get("confidence", 1.0) < 0.7:
-                original_mention = tool.get("original_mention", "").lower()
-                tool_name = tool.get("tool_name", "").lower()
-
-                # Try to find a better match in industry tools
-                best_match = None
-                best_score = 0.0
-
-                for canonical, info in industry_tools.items():
-                    # Check against canonical name
-                    score = self._calculate_similarity(original_mention, canonical)
-                    if score > best_score:
-                        best_score = score
-                        best_match = canonical
-
-                    # Check against variations
-                    for variation in info["variations"]:
-                        score = self._calculate_similarity(original_mention, variation)
-                        if score > best_score:
-                            best_score = score
-                            best_match = canonical
-
-                # If we found a better match with sufficient confidence
-                if best_match and best_score >= self.similarity_threshold:
-                    # Update the tool
-                    tool["tool_name"] = best_match
-                    tool["confidence"] = best_score
-                    tool["is_misspelling"] = True
-                    tool["correction_note"] = f"Enhanced via fuzzy matching: '{original_mention}' → '{best_match}' (score: {best_score:.2f})"
-
-            enhanced_tools.append(tool)
+        # Only apply fuzzy matching to low-confidence tools
+        low_confidence = [
+            tool for tool in identified_tools if tool.get("confidence", 1.0) < 0.7
+        ]
+        if not low_confidence or not industry_tools:
+            return list(identified_tools)
+
+        if catalog_index is None:
+            catalog_index = ToolCatalogIndex(
+                industry_tools,
+                threshold=self.similarity_threshold,
+                use_rapidfuzz=self.use_rapidfuzz,
+            )
+
+        # Score all low-confidence mentions against the catalog in one batch
+        mentions = [tool.get("original_mention", "").lower() for tool in low_confidence]
+        matches = catalog_index.match_many(mentions)
+
+        for tool, original_mention, match in zip(low_confidence, mentions, matches):
+            # If we found a better match with sufficient confidence
+            if match is not None:
+                best_match, best_score = match
+                # Update the tool
+                tool["tool_name"] = best_match
+                tool["confidence"] = best_score
+                tool["is_misspelling"] = True
+                tool["correction_note"] = f"Enhanced via fuzzy matching: '{original_mention}' → '{best_match}' (score: {best_score:.2f})"
 
-        return enhanced_tools
+        return list(identified_tools)
 
     def _calculate_similarity(self, s1, s2):
         """Calculate string similarity using the best available method."""
@@ -540,20 +646,30 @@ FORMAT YOUR RESPONSE AS JSON:
             return
 
         # Add to learned corrections
-        self.learned_corrections[original_mention.lower()] = {
+        mention = original_mention.lower()
+        self.learned_corrections[mention] = {
             "tool_name": correct_tool,
             "confidence": confidence
         }
 
         logger.info(f"Learned correction: '{original_mention}' → '{correct_tool}'")
 
-        # In production, this would save to a database
-        self._save_learned_corrections()
+        self._save_learned_corrections(mention)
 
-    def _save_learned_corrections(self):
-        """Save learned corrections to persistent storage."""
-        # In production, this would save to a database
-        pass
+    def _save_learned_corrections(self, mention):
+        """Append a learned correction to persistent storage."""
+        correction = self.learned_corrections[mention]
+        record = {"mention": mention, **correction}
+        try:
+            directory = os.path.dirname(self.corrections_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # One JSON object per line: appends stay cheap and loading can
+            # stream the file, with later lines overriding earlier ones
+            with open(self.corrections_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not persist learned tool correction: {e}")
 
     def format_tools_for_persona(self, identified_tools, format_type="bullet"):
         """
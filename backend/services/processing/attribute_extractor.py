@@ -79,21 +79,11 @@ class AttributeExtractor:
             llm_service=llm_service, similarity_threshold=0.75, learning_enabled=True
         )
 
-        # Log the number of predefined corrections
-        correction_count = len(self.tool_recognition_service.learned_corrections)
+        # Corrections load lazily on first use, so only log where they live
         logger.info(
-            f"Initialized AdaptiveToolRecognitionService with {correction_count} predefined corrections"
+            f"Initialized AdaptiveToolRecognitionService with corrections from {self.tool_recognition_service.corrections_path}"
         )
 
-        # Log some key corrections for debugging
-        if "mirrorboards" in self.tool_recognition_service.learned_corrections:
-            miro_correction = self.tool_recognition_service.learned_corrections[
-                "mirrorboards"
-            ]
-            logger.info(
-                f"Miro correction loaded: 'mirrorboards' → '{miro_correction['tool_name']}' (confidence: {miro_correction['confidence']})"
-            )
-
         logger.info(
             f"Initialized AttributeExtractor with {llm_service.__class__.__name__}"
         )
@@ -6,6 +6,8 @@ import re
 import logging
 from typing import Dict, List, Any, Optional
 
+from backend.utils.lexicon import get_lexicon
+
 logger = logging.getLogger(__name__)
 
 
@@ -641,10 +643,11 @@ class DemographicExtractor:
         }
 
         # Check for explicit gender statements only
-        for gender, patterns in explicit_gender_indicators.items():
-            for pattern in patterns:
-                if pattern in text:
-                    return gender.title()
+        gender = get_lexicon(
+            explicit_gender_indicators, ignore_case=False, whole_words=False
+        ).first_category(text)
+        if gender:
+            return gender.title()
 
         return ""  # Return empty string - do not infer gender from pronouns alone
 
@@ -845,9 +848,6 @@ class DemographicExtractor:
         Returns:
             Extracted value or empty string
         """
-        for value, patterns in pattern_dict.items():
-            for pattern in patterns:
-                # Use word boundary to match whole words
-                if re.search(r"\b" + re.escape(pattern) + r"\b", text):
-                    return value.capitalize()
-        return ""
+        # Whole-word matches; the first value in dict order with any match wins
+        value = get_lexicon(pattern_dict, ignore_case=False).first_category(text)
+        return value.capitalize() if value else ""
@@ -7,12 +7,22 @@ This module provides functionality for:
 3. Including quote context when necessary
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Set
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Set, Union
 import logging
 import re
 import json
 import os
 
+from backend.services.processing.scoped_text_index import (
+    ScopedTextIndex,
+    SpanSet,
+    looks_like_metadata,
+    looks_like_question,
+    split_sentences_with_spans,
+    tokenize,
+)
+
 try:
     # Try to import from backend structure
     from backend.domain.interfaces.llm_unified import ILLMService
@@ -46,6 +56,14 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of scoped-text indexes kept per service instance
+SCOPED_INDEX_CACHE_SIZE = 16
+
+# Demographics augmentation patterns
+_AGE_RE = re.compile(r"\b(\d{2})\s*(years old|y/o|yo)\b")
+_LOCATION_RE = re.compile(r"\b(based in|from|in)\s+[A-Z][A-Za-z\- ]+\b")
+_SENIORITY_RE = re.compile(r"\b(junior|mid[- ]level|senior|lead|principal)\b")
+
 
 class EvidenceLinkingService:
     """
@@ -63,6 +81,7 @@ class EvidenceLinkingService:
             llm_service: LLM service for finding relevant quotes
         """
         self.llm_service = llm_service
+        self._scoped_index_cache: "OrderedDict[str, ScopedTextIndex]" = OrderedDict()
         # Feature flag to enable scoped, deterministic attribution with offsets/speaker
         # FORCE ENABLED: Always True to ensure consistent evidence quality across all analyses
         self.enable_v2 = True
@@ -575,9 +594,7 @@ class EvidenceLinkingService:
 
     # -------------------- V2: Scoped deterministic attribution with offsets --------------------
     def _tokenize(self, text: str) -> List[str]:
-        if not text:
-            return []
-        return [t for t in re.findall(r"\b[\w-]+\b", text.lower()) if len(t) > 3]
+        return tokenize(text)
 
     def _overlap_ok(self, a: str, b: str) -> Tuple[bool, float]:
         a_set = set(self._tokenize(a))
@@ -590,151 +607,56 @@ class EvidenceLinkingService:
         return ok, jacc
 
     def _iter_sentences_with_spans(self, text: str) -> List[Tuple[int, int, str]]:
-        if not text:
-            return []
-        # Sentence segmentation by punctuation with spans
-        spans: List[Tuple[int, int, str]] = []
-        for m in re.finditer(r"[^.!?\n]+[.!?]", text, flags=re.MULTILINE):
-            s, e = m.span()
-            sent = text[s:e].strip()
-            if len(sent) >= 20:
-                spans.append((s, e, sent))
-        # Newline-aware fallback segmentation for sparse-punctuation texts
-        # Use only when we found no sentence spans via punctuation; avoids duplicating
-        # entire lines when proper sentence segmentation already worked.
-        if len(spans) == 0:
-            try:
-                start = 0
-                for line in text.splitlines(keepends=True):
-                    raw = (line or "").rstrip("\n")
-                    end = start + len(line)
-                    if raw and len(raw.strip()) >= 20:
-                        spans.append((start, end, raw.strip()))
-                    start = end
-            except Exception:
-                pass
-        # Final fallback: whole text
-        if not spans:
-            spans.append((0, len(text), (text or "").strip()))
-        return spans
+        return split_sentences_with_spans(text)
 
     def _span_overlaps(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
         return not (a[1] <= b[0] or b[1] <= a[0])
 
     def _looks_like_metadata(self, sent: str) -> bool:
-        """Heuristic: reject lines that look like metadata/labels or section headers.
-        Examples: 'Primary Stakeholder Category: ...', '💡 Key Insights:', 'KEY THEMES IDENTIFIED'
-        """
-        if not sent:
-            return False
-        s = (sent or "").strip()
-        ls = s.lower()
-        # Common section headers (with or without emoji)
-        heading_patterns = [
-            r"^💡\s*key insights?:",
-            r"^key insights?:",
-            r"^key themes identified",
-            r"^interview metadata",
-            r"^interview dialogue",
-            r"^simulation metadata",
-            r"^stakeholder breakdown",
-        ]
-        for pat in heading_patterns:
-            try:
-                if re.match(pat, ls):
-                    return True
-            except Exception:
-                pass
-        # Label-style metadata with colon
-        if ":" in s:
-            prefix = s.split(":", 1)[0].strip().lower()
-            meta_keys = {
-                "primary stakeholder category",
-                "stakeholder category",
-                "category",
-                "role",
-                "age",
-                "gender",
-                "location",
-                "department",
-                "participant details",
-                "interviewee",
-                "interviewer",
-                "overall sentiment",
-                "interview id",
-                "conducted",
-                "duration",
-            }
-            if any(k in prefix for k in meta_keys):
-                return True
-        return False
+        """Heuristic: reject lines that look like metadata/labels or section headers."""
+        return looks_like_metadata(sent)
 
     def _looks_like_question(self, sent: str) -> bool:
-        """Heuristic: reject researcher-style questions as evidence.
-        Handles timestamps and labels like "[20:04] Researcher: ..." and Q/Question prefixes.
+        """Heuristic: reject researcher-style questions as evidence."""
+        return looks_like_question(sent)
+
+    def _get_scoped_index(self, scoped_text: str) -> ScopedTextIndex:
         """
-        if not sent:
-            return False
-        s = (sent or "").strip()
-        # Strip leading timestamps in square brackets (up to 3 groups)
-        s2 = re.sub(r"^\s*(\[[^\]]+\]\s*){1,3}", "", s)
-        ls2 = s2.lower()
-        # Explicit Q prefixes
-        if re.match(r"^(q|question)\s*[:\-—–]\s*", ls2):
-            return True
-        # Interviewer/researcher/moderator labels after optional timestamp
-        if re.match(r"^(interviewer|researcher|moderator)\s*:\s*", ls2):
-            return True
-        # Uppercase speaker label + colon (e.g., "INTERVIEWER:") after removing timestamp
-        if re.match(r"^[A-Z][A-Z ]{1,20}:\s", s2):
-            return True
-        # Trailing question mark (ASCII or Unicode full-width)
-        if s2.endswith("?") or s2.endswith("？"):
-            return True
-        return False
+        Return the index of a scoped text, building it on first use.
+
+        Recently used indexes are kept so repeated linking over the same speaker
+        scope (e.g. re-hydrating results) does not rebuild them.
+        """
+        index = self._scoped_index_cache.get(scoped_text)
+        if index is not None:
+            self._scoped_index_cache.move_to_end(scoped_text)
+            return index
+        index = ScopedTextIndex(scoped_text)
+        self._scoped_index_cache[scoped_text] = index
+        while len(self._scoped_index_cache) > SCOPED_INDEX_CACHE_SIZE:
+            self._scoped_index_cache.popitem(last=False)
+        return index
 
     def _select_candidate_spans(
         self,
         trait_value: str,
         scoped_text: str,
-        used_spans: List[Tuple[int, int]],
+        used_spans: Union[SpanSet, List[Tuple[int, int]]],
         limit: int = 6,
         metrics: Optional[Dict[str, int]] = None,
+        index: Optional[ScopedTextIndex] = None,
     ) -> List[Tuple[int, int, str, float]]:
         """
         Return up to `limit` candidate sentence spans (start, end, text, score) in scoped_text
         that adequately overlap with the trait_value tokens and do not collide with used_spans.
         """
-        candidates: List[Tuple[int, int, str, float]] = []
-        for s, e, sent in self._iter_sentences_with_spans(scoped_text):
-            if metrics is not None:
-                metrics["checked_sentences"] = metrics.get("checked_sentences", 0) + 1
-            ok, j = self._overlap_ok(trait_value or "", sent)
-            if not ok:
-                if metrics is not None:
-                    metrics["rejected_low_overlap"] = (
-                        metrics.get("rejected_low_overlap", 0) + 1
-                    )
-                continue
-            # Additional hygiene filters: drop metadata-like lines and researcher-style questions
-            if self._looks_like_metadata(sent) or self._looks_like_question(sent):
-                if metrics is not None:
-                    metrics["rejected_metadata_or_question"] = (
-                        metrics.get("rejected_metadata_or_question", 0) + 1
-                    )
-                continue
-            # Dedup against already used spans across traits
-            if any(self._span_overlaps((s, e), u) for u in used_spans):
-                if metrics is not None:
-                    metrics["rejected_collision"] = (
-                        metrics.get("rejected_collision", 0) + 1
-                    )
-                continue
-            # Score could be Jaccard; sort later
-            candidates.append((s, e, sent, j))
-        # Sort best-first by score, then by length desc
-        candidates.sort(key=lambda t: (t[3], len(t[2])), reverse=True)
-        return candidates[:limit]
+        if index is None:
+            index = self._get_scoped_index(scoped_text)
+        if not isinstance(used_spans, SpanSet):
+            used_spans = SpanSet(used_spans)
+        return index.select_candidates(
+            trait_value or "", used_spans, limit=limit, metrics=metrics
+        )
 
     def _evidence_item(
         self, quote: str, s: int, e: int, meta: Dict[str, Any]
@@ -1021,7 +943,7 @@ class EvidenceLinkingService:
         }
 
         enhanced = dict(attributes) if attributes else {}
-        used_spans: List[Tuple[int, int]] = []
+        used_spans = SpanSet()
         evidence_map: Dict[str, List[Dict[str, Any]]] = {}
 
         # Prioritize behavioral/usage fields before demographics to avoid consuming
@@ -1105,35 +1027,29 @@ class EvidenceLinkingService:
             if len(scoped_text) > 5000:
                 base_limit += 2
             limit = base_limit
+            index = self._get_scoped_index(scoped_text)
             candidates = self._select_candidate_spans(
-                trait_value, scoped_text, used_spans, limit=limit, metrics=metrics
+                trait_value,
+                scoped_text,
+                used_spans,
+                limit=limit,
+                metrics=metrics,
+                index=index,
             )
 
             # Demographics pattern-based augmentation (age/location/experience) if still sparse
             if field == "demographics" and len(candidates) < limit:
                 try:
-                    import re as _re
-
                     seen = {(s, e) for (s, e, _t, _sc) in candidates}
-                    for s2, e2, sent2 in self._iter_sentences_with_spans(scoped_text):
-                        if any(self._span_overlaps((s2, e2), u) for u in used_spans):
+                    for s2, e2, sent2 in index.sentences:
+                        if used_spans.overlaps((s2, e2)):
                             continue
                         if (s2, e2) in seen:
                             continue
                         ls2 = (sent2 or "").lower()
-                        has_age = bool(
-                            _re.search(r"\b(\d{2})\s*(years old|y/o|yo)\b", ls2)
-                        )
-                        has_loc = bool(
-                            _re.search(
-                                r"\b(based in|from|in)\s+[A-Z][A-Za-z\- ]+\b", sent2
-                            )
-                        )
-                        has_exp = bool(
-                            _re.search(
-                                r"\b(junior|mid[- ]level|senior|lead|principal)\b", ls2
-                            )
-                        )
+                        has_age = bool(_AGE_RE.search(ls2))
+                        has_loc = bool(_LOCATION_RE.search(sent2))
+                        has_exp = bool(_SENIORITY_RE.search(ls2))
                         if has_age or has_loc or has_exp:
                             candidates.append((s2, e2, sent2, 0.51))
                             seen.add((s2, e2))
@@ -1170,6 +1086,7 @@ class EvidenceLinkingService:
                                 used_spans,
                                 limit=limit,
                                 metrics=metrics,
+                                index=index,
                             )
                 except Exception:
                     pass
@@ -1208,7 +1125,7 @@ class EvidenceLinkingService:
                 items.append(self._evidence_item(sent.strip(), s, e, scope_meta))
                 metrics[f"accepted_{field}"] = metrics.get(f"accepted_{field}", 0) + 1
                 field_spans.append(span)
-                used_spans.append(span)
+                used_spans.add(span)
 
                 # Write back evidence quotes as strings (back-compat) and collect structured items separately
                 # Metrics: count accepted items per sentence
@@ -1242,7 +1159,12 @@ class EvidenceLinkingService:
                 if field == "demographics" and len(filtered_items) < desired_min:
                     # Re-run candidate selection ignoring cross-trait collisions to avoid starving this field
                     more_cands = self._select_candidate_spans(
-                        trait_value, scoped_text, [], limit=limit, metrics=None
+                        trait_value,
+                        scoped_text,
+                        SpanSet(),
+                        limit=limit,
+                        metrics=None,
+                        index=index,
                     )
                     for s, e, sent, _ in more_cands:
                         span = (s, e)
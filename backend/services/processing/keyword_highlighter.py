@@ -12,6 +12,9 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\b\w+\b")
+_LEADING_NUMBER_RE = re.compile(r"^\$?\d+")
+
 
 @dataclass
 class HighlightingContext:
@@ -229,6 +232,61 @@ class ContextAwareKeywordHighlighter:
         "audience",
     }
 
+    # Common quantitative terms
+    QUANTITATIVE_INDICATORS = frozenset(
+        {
+            "percent",
+            "percentage",
+            "rate",
+            "cost",
+            "price",
+            "fee",
+            "dollar",
+            "cents",
+            "minutes",
+            "hours",
+            "days",
+            "weeks",
+            "months",
+            "years",
+            "times",
+            "rating",
+        }
+    )
+
+    # Descriptive/emotional words worth highlighting
+    DESCRIPTIVE_WORDS = frozenset(
+        {
+            "difficult",
+            "easy",
+            "hard",
+            "simple",
+            "complex",
+            "complicated",
+            "fast",
+            "slow",
+            "quick",
+            "efficient",
+            "effective",
+            "useful",
+            "important",
+            "critical",
+            "essential",
+            "necessary",
+            "required",
+            "frustrated",
+            "satisfied",
+            "happy",
+            "unhappy",
+            "concerned",
+            "worried",
+            "confident",
+            "uncertain",
+            "sure",
+            "unsure",
+        }
+    )
+
     def __init__(self):
         """Initialize the keyword highlighter."""
         self.all_trait_keywords = set()
@@ -410,7 +468,7 @@ Return terms in lowercase for consistency.""",
         trait_keywords = self.TRAIT_KEYWORDS.get(trait_name, set())
 
         # Extract keywords from trait description
-        description_words = set(re.findall(r"\b\w+\b", trait_description.lower()))
+        description_words = set(_WORD_RE.findall(trait_description.lower()))
         description_keywords = description_words - self.GENERIC_WORDS
 
         # Combine all relevant keywords
@@ -447,7 +505,7 @@ Return terms in lowercase for consistency.""",
         self, quote: str, context: HighlightingContext
     ) -> List[str]:
         """Identify which words in the quote should be highlighted."""
-        words = re.findall(r"\b\w+\b", quote.lower())
+        words = _WORD_RE.findall(quote.lower())
         words_to_highlight = []
 
         # Score words based on relevance
@@ -506,7 +564,7 @@ Return terms in lowercase for consistency.""",
         """Check if a word represents quantitative data (numbers, currency, percentages)."""
         # Check for currency symbols and numbers
         if (
-            re.match(r"^\$?\d+", word)
+            _LEADING_NUMBER_RE.match(word)
             or "%" in word
             or word.endswith("k")
             or word.endswith("m")
@@ -514,79 +572,25 @@ Return terms in lowercase for consistency.""",
             return True
 
         # Check for common quantitative terms
-        quantitative_indicators = {
-            "percent",
-            "percentage",
-            "rate",
-            "cost",
-            "price",
-            "fee",
-            "dollar",
-            "cents",
-            "minutes",
-            "hours",
-            "days",
-            "weeks",
-            "months",
-            "years",
-            "times",
-            "rating",
-        }
-
-        return word.lower() in quantitative_indicators
+        return word.lower() in self.QUANTITATIVE_INDICATORS
 
     def _is_descriptive_word(self, word: str) -> bool:
         """Check if a word is descriptive/emotional and worth highlighting."""
-        descriptive_indicators = {
-            "difficult",
-            "easy",
-            "hard",
-            "simple",
-            "complex",
-            "complicated",
-            "fast",
-            "slow",
-            "quick",
-            "efficient",
-            "effective",
-            "useful",
-            "important",
-            "critical",
-            "essential",
-            "necessary",
-            "required",
-            "frustrated",
-            "satisfied",
-            "happy",
-            "unhappy",
-            "concerned",
-            "worried",
-            "confident",
-            "uncertain",
-            "sure",
-            "unsure",
-        }
-        return word in descriptive_indicators
+        return word in self.DESCRIPTIVE_WORDS
 
     def _apply_highlighting(self, quote: str, words_to_highlight: List[str]) -> str:
         """Apply bold highlighting to specified words in the quote."""
         if not words_to_highlight:
             return quote
 
-        highlighted_quote = quote
-
-        # Sort by length (longest first) to avoid partial replacements
-        words_sorted = sorted(words_to_highlight, key=len, reverse=True)
+        targets = {word.lower() for word in words_to_highlight}
 
-        for word in words_sorted:
-            # Use word boundaries to avoid partial matches
-            pattern = r"\b" + re.escape(word) + r"\b"
-            replacement = f"**{word}**"
-            highlighted_quote = re.sub(
-                pattern, replacement, highlighted_quote, flags=re.IGNORECASE
-            )
+        def highlight(match: re.Match) -> str:
+            word = match.group().lower()
+            return f"**{word}**" if word in targets else match.group()
 
-        return highlighted_quote
+        # One pass over the quote's whole words (case-insensitive)
+        return _WORD_RE.sub(highlight, quote)
 
     def validate_highlighting_quality(
         self, evidence_quotes: List[str]
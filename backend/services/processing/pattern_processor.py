@@ -20,6 +20,7 @@ from backend.infrastructure.api.processor import IProcessor
 from pydantic_ai import Agent
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
+from backend.services.llm.concurrency_governor import governed_model
 
 # Import constants for API key
 from backend.infrastructure.constants.llm_constants import ENV_GEMINI_API_KEY
@@ -58,7 +59,9 @@ class PatternProcessor(IProcessor):
             if api_key:
                 os.environ["GEMINI_API_KEY"] = api_key
             provider = GoogleProvider(api_key=api_key)
-            self.model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+            self.model = governed_model(
+                GoogleModel("models/gemini-3-flash-preview", provider=provider)
+            )
             self.pattern_agent = Agent(
                 model=self.model,
                 output_type=PatternResponse,
@@ -5,6 +5,7 @@ from typing import Any
 from pydantic_ai import Agent, PromptedOutput
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
+from backend.services.llm.concurrency_governor import governed_model
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,9 @@ def initialize_pydantic_ai_agent() -> tuple[Any, bool]:
             raise ValueError("Neither GEMINI_API_KEY nor GOOGLE_API_KEY environment variable is set")
 
         provider = GoogleProvider(api_key=api_key)
-        gemini_model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        gemini_model = governed_model(
+            GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        )
         logger.info("[QUALITY] Initialized Gemini 3 Flash Preview model for high-quality persona generation")
 
         # Import here to avoid import cycles
@@ -65,7 +68,9 @@ def initialize_production_persona_agent() -> tuple[Any, bool]:
             raise ValueError("Neither GEMINI_API_KEY nor GOOGLE_API_KEY environment variable is set")
 
         provider = GoogleProvider(api_key=api_key)
-        gemini_model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        gemini_model = governed_model(
+            GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        )
         logger.info("[PRODUCTION_PERSONA] Initialized Gemini 3 Flash Preview model")
 
         from backend.domain.models.production_persona import ProductionPersona
@@ -114,7 +119,9 @@ def initialize_direct_persona_agent() -> tuple[Any, bool]:
             raise ValueError("Neither GEMINI_API_KEY nor GOOGLE_API_KEY environment variable is set")
 
         provider = GoogleProvider(api_key=api_key)
-        gemini_model = GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        gemini_model = governed_model(
+            GoogleModel("models/gemini-3-flash-preview", provider=provider)
+        )
         logger.info("[DIRECT_PERSONA] Initialized Gemini 3 Flash Preview model")
 
         from backend.models.enhanced_persona_models import DirectPersona
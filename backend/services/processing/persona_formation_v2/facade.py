@@ -6,7 +6,9 @@ This implementation intentionally reuses existing AttributeExtractor and
 PersonaBuilder to preserve output shape while enabling EVIDENCE_LINKING_V2.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
 import os
 import time
 
@@ -28,6 +30,7 @@ from backend.services.processing.persona_formation_v2.validation import (
 from backend.services.processing.evidence_linking_service import EvidenceLinkingService
 from backend.services.processing.trait_formatting_service import TraitFormattingService
 from backend.domain.interfaces.llm_unified import ILLMService
+from backend.infrastructure.config.settings import settings
 from backend.infrastructure.events.event_manager import event_manager, EventType
 from backend.services.processing.persona_formation_v2.fallbacks import (
     EnhancedFallbackBuilder,
@@ -76,6 +79,8 @@ class PersonaFormationFacade:
             "yes",
             "on",
         )
+        # Maximum number of speakers whose personas are formed at the same time
+        self.speaker_concurrency = max(1, settings.persona_formation_concurrency)
         # Extractors (operate on attributes dict)
         self.demographics_ex = DemographicsExtractor()
         self.goals_ex = GoalsExtractor()
@@ -122,6 +127,373 @@ class PersonaFormationFacade:
             return []
         return await self.form_personas_from_transcript(segments, context=context)
 
+    async def _form_speaker_persona(
+        self,
+        speaker: str,
+        utterances: List[str],
+        speaker_turns: List[Tuple[str, str]],
+        doc_ids_for_speaker: List[str],
+        speaker_role: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Form the persona of one speaker scope; returns None if it fails."""
+        # Build grouped scoped_text per document and corresponding doc_spans for this speaker
+        try:
+            # Group this speaker's (doc_id, text) turns per document preserving order
+            order = []
+            buckets: Dict[str, List[str]] = {}
+            for did, txt in speaker_turns:
+                if did not in buckets:
+                    buckets[did] = []
+                    order.append(did)
+                if txt:
+                    buckets[did].append(str(txt))
+            pieces: List[str] = []
+            doc_spans: List[Dict[str, Any]] = []  # type: ignore[name-defined]
+            cursor = 0
+            sep = "\n\n"
+            for did in order:
+                block = "\n".join(buckets.get(did) or [])
+                start = cursor
+                end = start + len(block)
+                doc_spans.append({"document_id": did, "start": start, "end": end})
+                pieces.append(block)
+                cursor = end + len(sep)
+            scoped_text = sep.join(pieces)
+        except Exception:
+            scoped_text = "\n".join(u for u in utterances if u)
+            doc_spans = []
+
+        # Determine per-speaker document_id from transcript segments (mode)
+        doc_id = None
+        if doc_ids_for_speaker:
+            # Choose the most frequent non-empty document_id
+            counts = Counter([d for d in doc_ids_for_speaker if d])
+            if counts:
+                doc_id = counts.most_common(1)[0][0]
+        if not doc_id:
+            doc_id = (context or {}).get("document_id")
+
+        # LLM-clean: keep only participant-verbatim lines (fail-open)
+        try:
+            _pre_clean = scoped_text
+            scoped_text = await self.evidence_linker.llm_clean_scoped_text(
+                scoped_text,
+                scope_meta={
+                    "speaker": speaker,
+                    "speaker_role": speaker_role,
+                    "document_id": doc_id,
+                },
+            )
+            # If cleaning changed the text, previously computed doc_spans no longer align; drop them
+            if doc_spans and scoped_text != _pre_clean:
+                doc_spans = []
+        except Exception:
+            pass
+        # Extract attributes for this speaker scope
+        scope_meta = {
+            "speaker": speaker,
+            "speaker_role": speaker_role,
+            "document_id": doc_id,
+        }
+        if doc_spans:
+            scope_meta["doc_spans"] = doc_spans
+        try:
+            attributes = await self.extractor.extract_attributes_from_text(
+                scoped_text, role=speaker_role, scope_meta=scope_meta
+            )
+            enhanced_attrs = attributes
+            evidence_map = None
+            v2_metrics: Dict[str, Any] = {}
+            if self.enable_evidence_v2:
+                try:
+                    enhanced_attrs, evidence_map = (
+                        self.evidence_linker.link_evidence_to_attributes_v2(
+                            attributes,
+                            scoped_text,
+                            scope_meta=scope_meta,
+                            protect_key_quotes=True,
+                        )
+                    )
+                    # Read the metrics before awaiting: other speakers run concurrently
+                    v2_metrics = getattr(self.evidence_linker, "last_metrics_v2", {})
+                except Exception:
+                    # Fail open: continue without V2 evidence if anything goes wrong
+                    enhanced_attrs = attributes
+                    evidence_map = None
+
+            # Persona-level hard gate: drop any question/metadata-like evidence strings
+            def _is_bad_evidence_line(q: str) -> bool:
+                try:
+                    import re
+
+                    s = (q or "").strip()
+                    if not s:
+                        return False
+                    # Strip leading timestamps like "[20:04]"
+                    s2 = re.sub(r"^\s*(\[[^\]]+\]\s*){1,3}", "", s)
+                    ls2 = s2.lower()
+                    # Q/Question prefixes
+                    if re.match(r"^(q|question)\s*[:\-\u2014\u2013]\s*", ls2):
+                        return True
+                    # Interviewer/researcher/moderator labels
+                    if re.match(r"^(interviewer|researcher|moderator)\s*:\s*", ls2):
+                        return True
+                    # All-caps labels (e.g., "INTERVIEWER:")
+                    if re.match(r"^[A-Z][A-Z ]{1,20}:\s", s2):
+                        return True
+                    # Section headers and insights
+                    if (
+                        re.match(r"^(\ud83d\udca1\s*)?key insights?:", ls2)
+                        or "key themes identified" in ls2
+                    ):
+                        return True
+                    # Trailing question mark
+                    return s2.endswith("?") or s2.endswith("\uff1f")
+                except Exception:
+                    return False
+
+            # Filter evidence arrays in enhanced attributes
+            if isinstance(enhanced_attrs, dict):
+                for fk, fv in list(enhanced_attrs.items()):
+                    if isinstance(fv, dict) and isinstance(
+                        fv.get("evidence"), list
+                    ):
+                        filtered = [
+                            q
+                            for q in fv["evidence"]
+                            if not _is_bad_evidence_line(q)
+                        ]
+                        # Optional LLM gate (fail-open)
+                        try:
+                            approved_idx = (
+                                await self.evidence_linker.llm_filter_quotes(
+                                    filtered, scope_meta
+                                )
+                            )
+                            if approved_idx and len(approved_idx) != len(filtered):
+                                filtered = [
+                                    q
+                                    for i, q in enumerate(filtered)
+                                    if i in approved_idx
+                                ]
+                        except Exception:
+                            pass
+                        if len(filtered) != len(fv["evidence"]):
+                            nf = dict(fv)
+                            nf["evidence"] = filtered
+                            enhanced_attrs[fk] = nf
+            # Also filter structured evidence_map for instrumentation cleanliness
+            if isinstance(evidence_map, dict):
+                for field, items in list(evidence_map.items()):
+                    # First apply local hygiene
+                    pre = [
+                        it
+                        for it in items
+                        if not _is_bad_evidence_line(it.get("quote", ""))
+                    ]
+                    # Optional LLM gate over quotes (fail-open)
+                    try:
+                        quotes = [it.get("quote", "") for it in pre]
+                        approved_idx = await self.evidence_linker.llm_filter_quotes(
+                            quotes, scope_meta
+                        )
+                        if approved_idx and len(approved_idx) != len(pre):
+                            pre = [
+                                it for i, it in enumerate(pre) if i in approved_idx
+                            ]
+                    except Exception:
+                        pass
+                    evidence_map[field] = pre
+            # Write structured evidence back into attributes when V2 is enabled
+            if (
+                self.enable_evidence_v2
+                and isinstance(evidence_map, dict)
+                and isinstance(enhanced_attrs, dict)
+            ):
+                for field, items in evidence_map.items():
+                    fv = enhanced_attrs.get(field)
+                    if isinstance(fv, dict) and isinstance(items, list) and items:
+                        nf = dict(fv)
+                        nf["evidence"] = (
+                            items  # preserve dict items with offsets/speaker
+                        )
+                        enhanced_attrs[field] = nf
+            persona = self._make_persona_from_attributes(enhanced_attrs)
+
+            # Derive a specific role/title for stakeholder detection downstream
+            try:
+                if "role" not in persona or not str(persona.get("role")).strip():
+                    # Prefer structured_demographics.roles.value if available
+                    sd = persona.get("structured_demographics") or {}
+                    roles_val = (
+                        (sd.get("roles") or {}).get("value")
+                        if isinstance(sd, dict)
+                        else None
+                    )
+                    if (
+                        isinstance(roles_val, str)
+                        and roles_val.strip()
+                        and roles_val.lower()
+                        not in {"not specified", "professional role"}
+                    ):
+                        persona["role"] = roles_val.strip()
+                    else:
+                        # Fallback: try role_context.value
+                        rc = persona.get("role_context")
+                        if isinstance(rc, dict) and rc.get("value"):
+                            persona["role"] = str(rc["value"]).strip()[:120]
+                        else:
+                            # Last resort: use leading part of name before comma as a title-ish hint
+                            nm = str(persona.get("name") or "").strip()
+                            if "," in nm:
+                                persona["role"] = nm.split(",", 1)[0].strip()
+            except Exception:
+                pass
+
+            # Final hard gate (post-assembly): remove any evidence items with invalid offsets/speaker
+            try:
+
+                def _valid_struct_item(it: Any) -> bool:
+                    if not isinstance(it, dict):
+                        return True  # leave plain strings
+                    spk = str((it.get("speaker") or "").strip())
+                    if not spk or spk.lower() == "researcher":
+                        return False
+                    if it.get("start_char") is None or it.get("end_char") is None:
+                        return False
+                    return True
+
+                # Clean top-level trait evidence lists
+                for fk, fv in list(persona.items()):
+                    if isinstance(fv, dict) and isinstance(
+                        fv.get("evidence"), list
+                    ):
+                        persona[fk]["evidence"] = [
+                            it for it in fv["evidence"] if _valid_struct_item(it)
+                        ]
+                # Clean StructuredDemographics nested evidence
+                sd = persona.get("structured_demographics")
+                if isinstance(sd, dict):
+                    for dk, dv in list(sd.items()):
+                        if isinstance(dv, dict) and isinstance(
+                            dv.get("evidence"), list
+                        ):
+                            sd[dk]["evidence"] = [
+                                it
+                                for it in dv["evidence"]
+                                if _valid_struct_item(it)
+                            ]
+                # Clean evidence_map instrumentation too
+                if self.enable_evidence_v2 and isinstance(evidence_map, dict):
+                    for field, items in list(evidence_map.items()):
+                        evidence_map[field] = [
+                            it for it in (items or []) if _valid_struct_item(it)
+                        ]
+            except Exception:
+                pass
+
+            # Stakeholder type correction: prefer specific titles over generic placeholders
+            try:
+                import re
+
+                def _is_generic_type(val: str) -> bool:
+                    v = (val or "").strip().lower()
+                    if not v:
+                        return True
+                    generic = {
+                        "primary_customer",
+                        "customer",
+                        "user",
+                        "participant",
+                        "interviewee",
+                        "respondent",
+                        "unknown",
+                        "n/a",
+                        "not specified",
+                        "professional role",
+                        "professional role context",
+                        "professional demographics",
+                    }
+                    if v in generic:
+                        return True
+                    if re.match(r"^(primary|generic)\s+(customer|user)s?$", v):
+                        return True
+                    return False
+
+                specific_type = None
+                meta = persona.get("persona_metadata") or {}
+                cat = (
+                    meta.get("stakeholder_category")
+                    if isinstance(meta, dict)
+                    else None
+                )
+                if (
+                    isinstance(cat, str)
+                    and cat.strip()
+                    and not _is_generic_type(cat)
+                ):
+                    specific_type = cat.strip()
+                else:
+                    role_val = str(persona.get("role", "")).strip()
+                    if role_val and not _is_generic_type(role_val):
+                        specific_type = role_val
+                    else:
+                        sd = persona.get("structured_demographics") or {}
+                        roles_val = (
+                            (sd.get("roles") or {}).get("value")
+                            if isinstance(sd, dict)
+                            else None
+                        )
+                        if (
+                            isinstance(roles_val, str)
+                            and roles_val.strip()
+                            and not _is_generic_type(roles_val)
+                        ):
+                            specific_type = roles_val.strip()
+                if specific_type:
+                    si = persona.setdefault("stakeholder_intelligence", {})
+                    cur = str(si.get("stakeholder_type", "") or "").strip().lower()
+                    if (not cur) or _is_generic_type(cur):
+                        si["stakeholder_type"] = specific_type
+            except Exception:
+                pass
+
+            # Attach instrumentation for tests/AB only (non-breaking)
+            if self.enable_evidence_v2 and evidence_map is not None:
+                persona["_evidence_linking_v2"] = {
+                    "evidence_map": evidence_map,
+                    "metrics": v2_metrics,
+                    "scope_meta": scope_meta,
+                }
+            # Keep name fallback if missing
+            if not persona.get("name"):
+                persona["name"] = (
+                    speaker if isinstance(speaker, str) else "Participant"
+                )
+            return persona
+        except Exception as e:
+            if self.enable_events:
+                try:
+                    await event_manager.emit(
+                        EventType.ERROR_OCCURRED,
+                        {
+                            "stage": "persona_formation_v2.speaker",
+                            "speaker": str(speaker),
+                            "message": str(e),
+                        },
+                    )
+                    await event_manager.emit_error(
+                        e,
+                        {
+                            "stage": "persona_formation_v2.speaker",
+                            "speaker": str(speaker),
+                        },
+                    )
+                except Exception:
+                    pass
+            return None
+
     async def form_personas_from_transcript(
         self,
         transcript: List[Dict[str, Any]],
@@ -147,12 +519,26 @@ class PersonaFormationFacade:
                 pass
 
         # Group dialogues by speaker for non-interviewer roles to create per-participant personas
+        # in a single pass; per-document turns and document ids are keyed by the raw
+        # speaker value, so segments without a speaker only contribute utterances
         by_speaker: Dict[str, List[str]] = {}
         role_counts: Dict[str, Dict[str, int]] = {}
+        turns_by_speaker: Dict[Any, List[Tuple[str, str]]] = {}
+        doc_ids_by_speaker: Dict[Any, List[str]] = {}
         for seg in transcript:
             try:
+                raw_speaker = seg.get("speaker_id") or seg.get("speaker")
+                turns_by_speaker.setdefault(raw_speaker, []).append(
+                    (
+                        (seg.get("document_id") or "original_text"),
+                        (seg.get("dialogue") or seg.get("text") or ""),
+                    )
+                )
+                doc_ids_by_speaker.setdefault(raw_speaker, []).append(
+                    str(seg.get("document_id") or "").strip()
+                )
                 role = (seg.get("role") or "").strip().lower()
-                speaker = seg.get("speaker_id") or seg.get("speaker") or "Participant"
+                speaker = raw_speaker or "Participant"
                 # Track role counts per speaker to compute a modal role later
                 role_counts.setdefault(speaker, {})[role or "participant"] = (
                     role_counts.setdefault(speaker, {}).get(role or "participant", 0)
@@ -177,379 +563,27 @@ class PersonaFormationFacade:
             else:
                 modal_role_by_speaker[spk] = "Participant"
 
-        personas: List[Dict[str, Any]] = []
-        for speaker, utterances in by_speaker.items():
-            # Build grouped scoped_text per document and corresponding doc_spans for this speaker
-            try:
-                # Collect (doc_id, text) pairs for this speaker preserving order
-                speaker_turns = [
-                    (
-                        (seg.get("document_id") or "original_text"),
-                        (seg.get("dialogue") or seg.get("text") or ""),
-                    )
-                    for seg in transcript
-                    if (seg.get("speaker_id") or seg.get("speaker")) == speaker
-                ]
-                order = []
-                buckets: Dict[str, List[str]] = {}
-                for did, txt in speaker_turns:
-                    if did not in buckets:
-                        buckets[did] = []
-                        order.append(did)
-                    if txt:
-                        buckets[did].append(str(txt))
-                pieces: List[str] = []
-                doc_spans: List[Dict[str, Any]] = []  # type: ignore[name-defined]
-                cursor = 0
-                sep = "\n\n"
-                for did in order:
-                    block = "\n".join(buckets.get(did) or [])
-                    start = cursor
-                    end = start + len(block)
-                    doc_spans.append({"document_id": did, "start": start, "end": end})
-                    pieces.append(block)
-                    cursor = end + len(sep)
-                scoped_text = sep.join(pieces)
-            except Exception:
-                scoped_text = "\n".join(u for u in utterances if u)
-                doc_spans = []
-
-            # Determine per-speaker document_id from transcript segments (mode)
-            doc_ids_for_speaker = [
-                (seg.get("document_id") or "").strip()
-                for seg in transcript
-                if (seg.get("speaker_id") or seg.get("speaker")) == speaker
-            ]
-            doc_id = None
-            if doc_ids_for_speaker:
-                # Choose the most frequent non-empty document_id
-                from collections import Counter
-
-                counts = Counter([d for d in doc_ids_for_speaker if d])
-                if counts:
-                    doc_id = counts.most_common(1)[0][0]
-            if not doc_id:
-                doc_id = (context or {}).get("document_id")
-
-            # LLM-clean: keep only participant-verbatim lines (fail-open)
-            try:
-                _pre_clean = scoped_text
-                scoped_text = await self.evidence_linker.llm_clean_scoped_text(
-                    scoped_text,
-                    scope_meta={
-                        "speaker": speaker,
-                        "speaker_role": modal_role_by_speaker.get(
-                            speaker, "Participant"
-                        ),
-                        "document_id": doc_id,
-                    },
-                )
-                # If cleaning changed the text, previously computed doc_spans no longer align; drop them
-                if doc_spans and scoped_text != _pre_clean:
-                    doc_spans = []
-            except Exception:
-                pass
-            # Extract attributes for this speaker scope
-            speaker_role = modal_role_by_speaker.get(speaker, "Participant")
-            scope_meta = {
-                "speaker": speaker,
-                "speaker_role": speaker_role,
-                "document_id": doc_id,
-            }
-            if doc_spans:
-                scope_meta["doc_spans"] = doc_spans
-            try:
-                attributes = await self.extractor.extract_attributes_from_text(
-                    scoped_text, role=speaker_role, scope_meta=scope_meta
+        # Form personas concurrently, bounded so a large focus group does not
+        # flood the LLM provider; results keep the speaker order of the transcript
+        semaphore = asyncio.Semaphore(self.speaker_concurrency)
+
+        async def _form(
+            speaker: str, utterances: List[str]
+        ) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._form_speaker_persona(
+                    speaker,
+                    utterances,
+                    turns_by_speaker.get(speaker, []),
+                    doc_ids_by_speaker.get(speaker, []),
+                    modal_role_by_speaker.get(speaker, "Participant"),
+                    context,
                 )
-                enhanced_attrs = attributes
-                evidence_map = None
-                if self.enable_evidence_v2:
-                    try:
-                        enhanced_attrs, evidence_map = (
-                            self.evidence_linker.link_evidence_to_attributes_v2(
-                                attributes,
-                                scoped_text,
-                                scope_meta=scope_meta,
-                                protect_key_quotes=True,
-                            )
-                        )
-                    except Exception:
-                        # Fail open: continue without V2 evidence if anything goes wrong
-                        enhanced_attrs = attributes
-                        evidence_map = None
 
-                # Persona-level hard gate: drop any question/metadata-like evidence strings
-                def _is_bad_evidence_line(q: str) -> bool:
-                    try:
-                        import re
-
-                        s = (q or "").strip()
-                        if not s:
-                            return False
-                        # Strip leading timestamps like "[20:04]"
-                        s2 = re.sub(r"^\s*(\[[^\]]+\]\s*){1,3}", "", s)
-                        ls2 = s2.lower()
-                        # Q/Question prefixes
-                        if re.match(r"^(q|question)\s*[:\-\u2014\u2013]\s*", ls2):
-                            return True
-                        # Interviewer/researcher/moderator labels
-                        if re.match(r"^(interviewer|researcher|moderator)\s*:\s*", ls2):
-                            return True
-                        # All-caps labels (e.g., "INTERVIEWER:")
-                        if re.match(r"^[A-Z][A-Z ]{1,20}:\s", s2):
-                            return True
-                        # Section headers and insights
-                        if (
-                            re.match(r"^(\ud83d\udca1\s*)?key insights?:", ls2)
-                            or "key themes identified" in ls2
-                        ):
-                            return True
-                        # Trailing question mark
-                        return s2.endswith("?") or s2.endswith("\uff1f")
-                    except Exception:
-                        return False
-
-                # Filter evidence arrays in enhanced attributes
-                if isinstance(enhanced_attrs, dict):
-                    for fk, fv in list(enhanced_attrs.items()):
-                        if isinstance(fv, dict) and isinstance(
-                            fv.get("evidence"), list
-                        ):
-                            filtered = [
-                                q
-                                for q in fv["evidence"]
-                                if not _is_bad_evidence_line(q)
-                            ]
-                            # Optional LLM gate (fail-open)
-                            try:
-                                approved_idx = (
-                                    await self.evidence_linker.llm_filter_quotes(
-                                        filtered, scope_meta
-                                    )
-                                )
-                                if approved_idx and len(approved_idx) != len(filtered):
-                                    filtered = [
-                                        q
-                                        for i, q in enumerate(filtered)
-                                        if i in approved_idx
-                                    ]
-                            except Exception:
-                                pass
-                            if len(filtered) != len(fv["evidence"]):
-                                nf = dict(fv)
-                                nf["evidence"] = filtered
-                                enhanced_attrs[fk] = nf
-                # Also filter structured evidence_map for instrumentation cleanliness
-                if isinstance(evidence_map, dict):
-                    for field, items in list(evidence_map.items()):
-                        # First apply local hygiene
-                        pre = [
-                            it
-                            for it in items
-                            if not _is_bad_evidence_line(it.get("quote", ""))
-                        ]
-                        # Optional LLM gate over quotes (fail-open)
-                        try:
-                            quotes = [it.get("quote", "") for it in pre]
-                            approved_idx = await self.evidence_linker.llm_filter_quotes(
-                                quotes, scope_meta
-                            )
-                            if approved_idx and len(approved_idx) != len(pre):
-                                pre = [
-                                    it for i, it in enumerate(pre) if i in approved_idx
-                                ]
-                        except Exception:
-                            pass
-                        evidence_map[field] = pre
-                # Write structured evidence back into attributes when V2 is enabled
-                if (
-                    self.enable_evidence_v2
-                    and isinstance(evidence_map, dict)
-                    and isinstance(enhanced_attrs, dict)
-                ):
-                    for field, items in evidence_map.items():
-                        fv = enhanced_attrs.get(field)
-                        if isinstance(fv, dict) and isinstance(items, list) and items:
-                            nf = dict(fv)
-                            nf["evidence"] = (
-                                items  # preserve dict items with offsets/speaker
-                            )
-                            enhanced_attrs[field] = nf
-                persona = self._make_persona_from_attributes(enhanced_attrs)
-
-                # Derive a specific role/title for stakeholder detection downstream
-                try:
-                    if "role" not in persona or not str(persona.get("role")).strip():
-                        # Prefer structured_demographics.roles.value if available
-                        sd = persona.get("structured_demographics") or {}
-                        roles_val = (
-                            (sd.get("roles") or {}).get("value")
-                            if isinstance(sd, dict)
-                            else None
-                        )
-                        if (
-                            isinstance(roles_val, str)
-                            and roles_val.strip()
-                            and roles_val.lower()
-                            not in {"not specified", "professional role"}
-                        ):
-                            persona["role"] = roles_val.strip()
-                        else:
-                            # Fallback: try role_context.value
-                            rc = persona.get("role_context")
-                            if isinstance(rc, dict) and rc.get("value"):
-                                persona["role"] = str(rc["value"]).strip()[:120]
-                            else:
-                                # Last resort: use leading part of name before comma as a title-ish hint
-                                nm = str(persona.get("name") or "").strip()
-                                if "," in nm:
-                                    persona["role"] = nm.split(",", 1)[0].strip()
-                except Exception:
-                    pass
-
-                # Final hard gate (post-assembly): remove any evidence items with invalid offsets/speaker
-                try:
-
-                    def _valid_struct_item(it: Any) -> bool:
-                        if not isinstance(it, dict):
-                            return True  # leave plain strings
-                        spk = str((it.get("speaker") or "").strip())
-                        if not spk or spk.lower() == "researcher":
-                            return False
-                        if it.get("start_char") is None or it.get("end_char") is None:
-                            return False
-                        return True
-
-                    # Clean top-level trait evidence lists
-                    for fk, fv in list(persona.items()):
-                        if isinstance(fv, dict) and isinstance(
-                            fv.get("evidence"), list
-                        ):
-                            persona[fk]["evidence"] = [
-                                it for it in fv["evidence"] if _valid_struct_item(it)
-                            ]
-                    # Clean StructuredDemographics nested evidence
-                    sd = persona.get("structured_demographics")
-                    if isinstance(sd, dict):
-                        for dk, dv in list(sd.items()):
-                            if isinstance(dv, dict) and isinstance(
-                                dv.get("evidence"), list
-                            ):
-                                sd[dk]["evidence"] = [
-                                    it
-                                    for it in dv["evidence"]
-                                    if _valid_struct_item(it)
-                                ]
-                    # Clean evidence_map instrumentation too
-                    if self.enable_evidence_v2 and isinstance(evidence_map, dict):
-                        for field, items in list(evidence_map.items()):
-                            evidence_map[field] = [
-                                it for it in (items or []) if _valid_struct_item(it)
-                            ]
-                except Exception:
-                    pass
-
-                # Stakeholder type correction: prefer specific titles over generic placeholders
-                try:
-                    import re
-
-                    def _is_generic_type(val: str) -> bool:
-                        v = (val or "").strip().lower()
-                        if not v:
-                            return True
-                        generic = {
-                            "primary_customer",
-                            "customer",
-                            "user",
-                            "participant",
-                            "interviewee",
-                            "respondent",
-                            "unknown",
-                            "n/a",
-                            "not specified",
-                            "professional role",
-                            "professional role context",
-                            "professional demographics",
-                        }
-                        if v in generic:
-                            return True
-                        if re.match(r"^(primary|generic)\s+(customer|user)s?$", v):
-                            return True
-                        return False
-
-                    specific_type = None
-                    meta = persona.get("persona_metadata") or {}
-                    cat = (
-                        meta.get("stakeholder_category")
-                        if isinstance(meta, dict)
-                        else None
-                    )
-                    if (
-                        isinstance(cat, str)
-                        and cat.strip()
-                        and not _is_generic_type(cat)
-                    ):
-                        specific_type = cat.strip()
-                    else:
-                        role_val = str(persona.get("role", "")).strip()
-                        if role_val and not _is_generic_type(role_val):
-                            specific_type = role_val
-                        else:
-                            sd = persona.get("structured_demographics") or {}
-                            roles_val = (
-                                (sd.get("roles") or {}).get("value")
-                                if isinstance(sd, dict)
-                                else None
-                            )
-                            if (
-                                isinstance(roles_val, str)
-                                and roles_val.strip()
-                                and not _is_generic_type(roles_val)
-                            ):
-                                specific_type = roles_val.strip()
-                    if specific_type:
-                        si = persona.setdefault("stakeholder_intelligence", {})
-                        cur = str(si.get("stakeholder_type", "") or "").strip().lower()
-                        if (not cur) or _is_generic_type(cur):
-                            si["stakeholder_type"] = specific_type
-                except Exception:
-                    pass
-
-                # Attach instrumentation for tests/AB only (non-breaking)
-                if self.enable_evidence_v2 and evidence_map is not None:
-                    persona["_evidence_linking_v2"] = {
-                        "evidence_map": evidence_map,
-                        "metrics": getattr(self.evidence_linker, "last_metrics_v2", {}),
-                        "scope_meta": scope_meta,
-                    }
-                # Keep name fallback if missing
-                if not persona.get("name"):
-                    persona["name"] = (
-                        speaker if isinstance(speaker, str) else "Participant"
-                    )
-                personas.append(persona)
-            except Exception as e:
-                if self.enable_events:
-                    try:
-                        await event_manager.emit(
-                            EventType.ERROR_OCCURRED,
-                            {
-                                "stage": "persona_formation_v2.speaker",
-                                "speaker": str(speaker),
-                                "message": str(e),
-                            },
-                        )
-                        await event_manager.emit_error(
-                            e,
-                            {
-                                "stage": "persona_formation_v2.speaker",
-                                "speaker": str(speaker),
-                            },
-                        )
-                    except Exception:
-                        pass
-                continue
+        results = await asyncio.gather(
+            *(_form(speaker, utterances) for speaker, utterances in by_speaker.items())
+        )
+        personas: List[Dict[str, Any]] = [p for p in results if p is not None]
 
         # If nothing detected (e.g., only interviewer found), create a single persona
         if not personas:
@@ -16,6 +16,7 @@ from backend.services.processing.pipeline.nlp_processor_facade import NLPProcess
 from backend.services.processing.pipeline.stakeholder_aware_transcript_processor import (
     StakeholderAwareTranscriptProcessor,
 )
+from backend.services.processing.pipeline.stage_graph import StageGraph
 
 __all__ = [
     "BaseProcessor",
@@ -24,4 +25,5 @@ __all__ = [
     "PipelineFactory",
     "NLPProcessorFacade",
     "StakeholderAwareTranscriptProcessor",
+    "StageGraph",
 ]
@@ -0,0 +1,171 @@
+"""
+Declarative stage graph for concurrent analysis pipelines.
+
+This module provides a small DAG scheduler for async pipeline stages. Each stage
+declares the names of the outputs it consumes; the scheduler starts a stage as
+soon as all of its inputs are available, so independent stages (for example
+theme analysis and industry detection) run concurrently instead of one after
+the other.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+StageFunc = Callable[..., Awaitable[Any]]
+
+
+@dataclass
+class Stage:
+    """A single node in a stage graph."""
+
+    name: str
+    func: StageFunc
+    inputs: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class StageGraph:
+    """
+    Dependency-driven scheduler for async pipeline stages.
+
+    Stages are registered with the names of the outputs they need. Inputs may
+    refer to other stages or to seed values passed to ``run``. A stage function
+    is called with its inputs as keyword arguments and its return value becomes
+    the output stored under the stage name.
+    """
+
+    def __init__(self, name: str = "pipeline"):
+        """
+        Initialize an empty stage graph.
+
+        Args:
+            name: Name used in log messages
+        """
+        self.name = name
+        self._stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+    def add_stage(
+        self, name: str, func: StageFunc, inputs: Iterable[str] = ()
+    ) -> "StageGraph":
+        """
+        Register a stage.
+
+        Args:
+            name: Unique stage name, also the key of its output
+            func: Async callable invoked with the stage inputs as keyword arguments
+            inputs: Names of the stage outputs or seed values this stage consumes
+
+        Returns:
+            The graph, to allow chaining
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already registered")
+        self._stages[name] = Stage(name=name, func=func, inputs=tuple(inputs))
+        return self
+
+    @property
+    def stages(self) -> List[str]:
+        """Names of the registered stages in registration order."""
+        return list(self._stages)
+
+    def validate(self, seeds: Iterable[str] = ()) -> None:
+        """
+        Check that every input is resolvable and the graph is acyclic.
+
+        Args:
+            seeds: Names of values that will be supplied to ``run``
+
+        Raises:
+            ValueError: If an input is unknown or the stages form a cycle
+        """
+        available = set(seeds)
+        for stage in self._stages.values():
+            for dep in stage.inputs:
+                if dep not in self._stages and dep not in available:
+                    raise ValueError(
+                        f"Stage '{stage.name}' depends on unknown input '{dep}'"
+                    )
+
+        resolved = set(available)
+        remaining = dict(self._stages)
+        while remaining:
+            ready = [
+                name
+                for name, stage in remaining.items()
+                if all(dep in resolved for dep in stage.inputs)
+            ]
+            if not ready:
+                raise ValueError(
+                    f"Stage graph '{self.name}' has a dependency cycle between: "
+                    f"{sorted(remaining)}"
+                )
+            for name in ready:
+                resolved.add(name)
+                del remaining[name]
+
+    async def run(self, seeds: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute all stages, starting each one as soon as its inputs exist.
+
+        If any stage raises, the remaining stages are cancelled and the
+        exception is propagated to the caller.
+
+        Args:
+            seeds: Initial values that stages may declare as inputs
+
+        Returns:
+            Dictionary of seed values and stage outputs keyed by name
+        """
+        outputs: Dict[str, Any] = dict(seeds or {})
+        self.validate(outputs.keys())
+        self.timings = {}
+
+        pending = dict(self._stages)
+        running: Dict[asyncio.Task, str] = {}
+        graph_start = time.monotonic()
+
+        def _start_ready() -> None:
+            for name in list(pending):
+                stage = pending[name]
+                if all(dep in outputs for dep in stage.inputs):
+                    del pending[name]
+                    kwargs = {dep: outputs[dep] for dep in stage.inputs}
+                    self.timings[name] = {"start": time.monotonic() - graph_start}
+                    logger.info(f"[{self.name}] Starting stage '{name}'")
+                    task = asyncio.create_task(stage.func(**kwargs))
+                    running[task] = name
+
+        _start_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = running.pop(task)
+                    outputs[name] = task.result()
+                    timing = self.timings[name]
+                    timing["end"] = time.monotonic() - graph_start
+                    timing["duration"] = timing["end"] - timing["start"]
+                    logger.info(
+                        f"[{self.name}] Stage '{name}' completed in "
+                        f"{timing['duration']:.2f}s"
+                    )
+                _start_ready()
+        except BaseException:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+            raise
+
+        logger.info(
+            f"[{self.name}] All {len(self._stages)} stages completed in "
+            f"{time.monotonic() - graph_start:.2f}s"
+        )
+        return outputs
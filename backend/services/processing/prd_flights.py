@@ -0,0 +1,196 @@
+"""
+Single-flight PRD generation.
+
+A PRD generation is one long LLM call per section. Two tabs, or a client
+retrying after a timeout, used to start identical generations side by side.
+``PRDFlightRegistry`` runs at most one generation per
+``(result_id, prd_type, input hash)``: later requests for the same key join
+the running flight instead of starting another.
+
+Flights run as their own tasks, independent of the request that started them,
+so they double as background jobs: a client can start one, return at once and
+poll or stream its progress by ``(result_id, prd_type)``. Finished flights are
+remembered in a small LRU so their status stays available after completion.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Finished flights kept for status polling
+FINISHED_FLIGHTS_SIZE = 256
+
+FlightKey = Tuple[int, str, str]
+FlightRunner = Callable[["PRDFlight"], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class PRDFlight:
+    """One PRD generation shared by every request for the same key."""
+
+    result_id: int
+    prd_type: str
+    input_hash: str
+    user_id: Optional[str] = None
+    task: Optional[asyncio.Task] = None
+    sections: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    _changed: asyncio.Event = field(
+        default_factory=asyncio.Event, init=False, repr=False
+    )
+
+    @property
+    def key(self) -> FlightKey:
+        return (self.result_id, self.prd_type, self.input_hash)
+
+    @property
+    def done(self) -> bool:
+        return self.task is not None and self.task.done()
+
+    @property
+    def status(self) -> str:
+        """``running``, ``completed`` or ``failed``."""
+        if not self.done:
+            return "running"
+        if self.task.cancelled() or self.task.exception() is not None:
+            return "failed"
+        return "failed" if "error" in self.task.result() else "completed"
+
+    def add_section(self, section: str, prd_data: Dict[str, Any]) -> None:
+        """Record a finished section and wake up listeners."""
+        self.sections[section] = prd_data
+        self._notify()
+
+    async def wait_for_change(self) -> None:
+        """Wait until a section finishes or the flight ends."""
+        if not self.done:
+            await self._changed.wait()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Status of the flight, including the PRD once it is complete."""
+        snapshot: Dict[str, Any] = {
+            "result_id": self.result_id,
+            "prd_type": self.prd_type,
+            "status": self.status,
+            "sections_ready": sorted(self.sections),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.status == "completed":
+            snapshot["prd_data"] = self.task.result()
+        elif self.status == "failed":
+            snapshot["error"] = self.error
+        return snapshot
+
+    @property
+    def error(self) -> Optional[str]:
+        if not self.done:
+            return None
+        if self.task.cancelled():
+            return "PRD generation was cancelled"
+        if self.task.exception() is not None:
+            return str(self.task.exception())
+        return self.task.result().get("error")
+
+    def _notify(self) -> None:
+        # Swap in a fresh event so every current listener wakes exactly once
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class PRDFlightRegistry:
+    """
+    In-process registry of PRD generations.
+
+    Args:
+        finished_size: Number of finished flights kept for status lookups
+    """
+
+    def __init__(self, finished_size: int = FINISHED_FLIGHTS_SIZE):
+        self.finished_size = finished_size
+        self._inflight: Dict[FlightKey, PRDFlight] = {}
+        self._latest: "OrderedDict[Tuple[int, str], PRDFlight]" = OrderedDict()
+        self._started = 0
+        self._joined = 0
+
+    def start(
+        self,
+        result_id: int,
+        prd_type: str,
+        input_hash: str,
+        runner: FlightRunner,
+        user_id: Optional[str] = None,
+    ) -> Tuple[PRDFlight, bool]:
+        """
+        Join the running flight for a key, or start one with ``runner``.
+
+        Returns:
+            The flight and whether this call started it
+        """
+        key = (result_id, prd_type, input_hash)
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._joined += 1
+            logger.info(
+                f"Joining running PRD generation for result_id: {result_id}, "
+                f"prd_type: {prd_type}"
+            )
+            return flight, False
+
+        flight = PRDFlight(result_id, prd_type, input_hash, user_id=user_id)
+        flight.task = asyncio.create_task(runner(flight))
+        flight.task.add_done_callback(lambda _: self._finish(flight))
+        self._inflight[key] = flight
+        self._latest[(result_id, prd_type)] = flight
+        self._latest.move_to_end((result_id, prd_type))
+        self._started += 1
+        self._evict()
+        return flight, True
+
+    def latest(self, result_id: int, prd_type: str) -> Optional[PRDFlight]:
+        """Most recently started flight of a result and PRD type."""
+        return self._latest.get((result_id, prd_type))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return flight counters for monitoring."""
+        return {
+            "running": len(self._inflight),
+            "tracked": len(self._latest),
+            "started": self._started,
+            "joined": self._joined,
+        }
+
+    def _finish(self, flight: PRDFlight) -> None:
+        flight.finished_at = time.time()
+        if self._inflight.get(flight.key) is flight:
+            del self._inflight[flight.key]
+        if flight.status == "failed":
+            logger.error(
+                f"PRD generation failed for result_id: {flight.result_id}, "
+                f"prd_type: {flight.prd_type}: {flight.error}"
+            )
+        flight._notify()
+        self._evict()
+
+    def _evict(self) -> None:
+        # Only finished flights are evicted; running ones are still joinable
+        excess = len(self._latest) - self.finished_size
+        for key in [k for k, f in self._latest.items() if f.done][: max(excess, 0)]:
+            del self._latest[key]
+
+
+_prd_flights: Optional[PRDFlightRegistry] = None
+
+
+def get_prd_flights() -> PRDFlightRegistry:
+    """Return the process-wide PRD flight registry, creating it on first use."""
+    global _prd_flights
+    if _prd_flights is None:
+        _prd_flights = PRDFlightRegistry()
+    return _prd_flights
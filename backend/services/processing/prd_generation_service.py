@@ -2,8 +2,10 @@
 PRD generation service.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 import json
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -11,10 +13,33 @@ from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 
 from backend.services.llm import LLMServiceFactory
-from backend.models import CachedPRD, User
+from backend.models import AnalysisResult, CachedPRD, InterviewData, User
 
 logger = logging.getLogger(__name__)
 
+# Sections of a "both" PRD, generated and cached independently
+PRD_SECTIONS = ("operational", "technical")
+
+SectionCallback = Callable[[str, Dict[str, Any]], None]
+
+
+def prd_input_hash(
+    analysis_results: Dict[str, Any], prd_type: str, industry: Optional[str] = None
+) -> str:
+    """
+    Hash of everything a PRD is generated from.
+
+    Two requests with the same hash would send the same prompt, so they can
+    share one generation.
+    """
+    payload = {
+        key: analysis_results.get(key)
+        for key in ("themes", "patterns", "insights", "personas", "original_text")
+    }
+    payload.update(prd_type=prd_type, industry=industry)
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
 
 class PRDGenerationService:
     """
@@ -30,6 +55,9 @@ class PRDGenerationService:
         """
         Initialize the PRD generation service.
 
+        The LLM service is created on first use, so cache lookups do not pay
+        for an LLM client.
+
         Args:
             db: Database session for caching PRDs
             llm_service: LLM service to use for PRD generation
@@ -37,10 +65,17 @@ class PRDGenerationService:
         """
         self.db = db
         self.user = user
-        self.llm_service = llm_service or LLMServiceFactory.create("enhanced_gemini")
-        logger.info(
-            f"Initialized PRDGenerationService with {self.llm_service.__class__.__name__}"
-        )
+        self._llm_service = llm_service
+
+    @property
+    def llm_service(self):
+        if self._llm_service is None:
+            self._llm_service = LLMServiceFactory.create("enhanced_gemini")
+            logger.info(
+                f"Initialized PRDGenerationService with "
+                f"{self._llm_service.__class__.__name__}"
+            )
+        return self._llm_service
 
     async def generate_prd(
         self,
@@ -49,16 +84,23 @@ class PRDGenerationService:
         industry: Optional[str] = None,
         result_id: Optional[int] = None,
         force_regenerate: bool = False,
+        on_section: Optional[SectionCallback] = None,
     ) -> Dict[str, Any]:
         """
         Generate a PRD from analysis results.
 
+        A ``both`` PRD is generated as an operational and a technical section
+        running concurrently; each section is cached on its own, so a later
+        request for either half (or a retry after one half failed) reuses it.
+
         Args:
             analysis_results: Analysis results containing themes, patterns, insights, and personas
             prd_type: Type of PRD to generate ("operational", "technical", or "both")
             industry: Optional industry context
             result_id: ID of the analysis result (for caching)
             force_regenerate: Whether to force regeneration even if cached version exists
+            on_section: Optional callback invoked as ``(section, prd_data)`` when
+                a section of a ``both`` PRD is ready
 
         Returns:
             Generated PRD
@@ -79,24 +121,102 @@ class PRDGenerationService:
 
             # Check cache first if database session is available and not forcing regeneration
             if self.db and result_id and not force_regenerate:
-                cached_prd = self._get_cached_prd(result_id, prd_type)
-                if cached_prd:
+                cached = self.get_cached_prd_data(result_id, prd_type)
+                if cached:
                     logger.info(
                         f"Using cached PRD for result_id: {result_id}, prd_type: {prd_type}"
                     )
-                    # Ensure normalized shape even for older cached PRDs
-                    try:
-                        normalized = self._normalize_operational_prd(
-                            dict(cached_prd.prd_data)
-                        )
-                    except Exception:
-                        normalized = cached_prd.prd_data
-                    return normalized
+                    return cached
 
             logger.info(
                 f"Generating {prd_type} PRD for result_id: {result_id or 'unknown'}"
             )
 
+            if prd_type != "both":
+                return await self._generate_section(
+                    analysis_results, prd_type, industry, result_id, force_regenerate
+                )
+
+            # Wait for both sections even when one fails, so the other is
+            # cached before returning and never outlives this request's session
+            sections = await asyncio.gather(
+                *(
+                    self._generate_section(
+                        analysis_results,
+                        section,
+                        industry,
+                        result_id,
+                        force_regenerate,
+                        on_section,
+                    )
+                    for section in PRD_SECTIONS
+                ),
+                return_exceptions=True,
+            )
+            for section in sections:
+                if isinstance(section, BaseException):
+                    raise section
+            prd_data = {
+                "prd_type": "both",
+                **{
+                    f"{section}_prd": data.get(f"{section}_prd")
+                    for section, data in zip(PRD_SECTIONS, sections)
+                },
+                "metadata": {**sections[0].get("metadata", {}), "prd_type": "both"},
+            }
+
+            if self.db and result_id:
+                self._cache_prd(result_id, "both", prd_data)
+
+            logger.info(f"Successfully generated PRD with type: {prd_type}")
+            return prd_data
+
+        except Exception as e:
+            logger.error(f"Error generating PRD: {str(e)}")
+            # Return a minimal error response
+            return {
+                "error": f"Failed to generate PRD: {str(e)}",
+                "prd_type": prd_type,
+                "operational_prd": (
+                    {
+                        "objectives": [
+                            {"title": "Error", "description": "Failed to generate PRD"}
+                        ]
+                    }
+                    if prd_type in ["operational", "both"]
+                    else None
+                ),
+                "technical_prd": (
+                    {
+                        "objectives": [
+                            {"title": "Error", "description": "Failed to generate PRD"}
+                        ]
+                    }
+                    if prd_type in ["technical", "both"]
+                    else None
+                ),
+            }
+
+    async def _generate_section(
+        self,
+        analysis_results: Dict[str, Any],
+        prd_type: str,
+        industry: Optional[str],
+        result_id: Optional[int],
+        force_regenerate: bool,
+        on_section: Optional[SectionCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate (or reuse the cached) operational or technical PRD.
+
+        Raises:
+            ValueError: If the LLM did not return the requested section
+        """
+        prd_data = None
+        if self.db and result_id and not force_regenerate:
+            prd_data = self.get_cached_prd_data(result_id, prd_type)
+
+        if not prd_data:
             # Extract relevant data from analysis results
             themes = analysis_results.get("themes", [])
             patterns = analysis_results.get("patterns", [])
@@ -120,11 +240,19 @@ class PRDGenerationService:
             }
 
             # Call LLM to generate PRD
-            logger.info("Calling LLM to generate PRD")
+            logger.info(f"Calling LLM to generate {prd_type} PRD")
             llm_response = await self.llm_service.analyze(request_data)
 
             # Parse and validate the response
             prd_data = self._parse_llm_response(llm_response)
+            if not isinstance(prd_data.get(f"{prd_type}_prd"), dict):
+                raise ValueError(f"LLM response has no {prd_type}_prd section")
+
+            # Keep only the requested section (the fallback PRD carries both)
+            for section in PRD_SECTIONS:
+                if section != prd_type:
+                    prd_data.pop(f"{section}_prd", None)
+            prd_data["prd_type"] = prd_type
 
             # Add metadata
             prd_data["metadata"] = {
@@ -145,34 +273,34 @@ class PRDGenerationService:
             if self.db and result_id:
                 self._cache_prd(result_id, prd_type, prd_data)
 
-            logger.info(f"Successfully generated PRD with type: {prd_type}")
-            return prd_data
+        if on_section:
+            on_section(prd_type, prd_data)
+        return prd_data
 
-        except Exception as e:
-            logger.error(f"Error generating PRD: {str(e)}")
-            # Return a minimal error response
-            return {
-                "error": f"Failed to generate PRD: {str(e)}",
-                "prd_type": prd_type,
-                "operational_prd": (
-                    {
-                        "objectives": [
-                            {"title": "Error", "description": "Failed to generate PRD"}
-                        ]
-                    }
-                    if prd_type in ["operational", "both"]
-                    else None
-                ),
-                "technical_prd": (
-                    {
-                        "objectives": [
-                            {"title": "Error", "description": "Failed to generate PRD"}
-                        ]
-                    }
-                    if prd_type in ["technical", "both"]
-                    else None
-                ),
-            }
+    def get_cached_prd_data(
+        self, result_id: int, prd_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached PRD of a result in its normalized shape.
+
+        When the service has a user, only PRDs of that user's results are
+        returned, so the lookup can run before the analysis result is loaded.
+
+        Args:
+            result_id: ID of the analysis result
+            prd_type: Type of PRD to retrieve
+
+        Returns:
+            PRD data if cached, None otherwise
+        """
+        cached_prd = self._get_cached_prd(result_id, prd_type)
+        if not cached_prd or not cached_prd.prd_data:
+            return None
+        # Ensure normalized shape even for older cached PRDs
+        try:
+            return self._normalize_operational_prd(dict(cached_prd.prd_data))
+        except Exception:
+            return cached_prd.prd_data
 
     def _extract_json_candidate(self, text: str) -> Optional[str]:
         """Best-effort extraction of a JSON object from free text.
@@ -382,15 +510,20 @@ class PRDGenerationService:
             if not self.db:
                 return None
 
-            cached_prd = (
-                self.db.query(CachedPRD)
-                .filter(
-                    CachedPRD.result_id == result_id, CachedPRD.prd_type == prd_type
-                )
-                .first()
+            query = self.db.query(CachedPRD).filter(
+                CachedPRD.result_id == result_id, CachedPRD.prd_type == prd_type
             )
+            if self.user:
+                # Only serve PRDs of results the user owns
+                query = (
+                    query.join(
+                        AnalysisResult, CachedPRD.result_id == AnalysisResult.result_id
+                    )
+                    .join(InterviewData, AnalysisResult.data_id == InterviewData.id)
+                    .filter(InterviewData.user_id == self.user.user_id)
+                )
 
-            return cached_prd
+            return query.first()
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving cached PRD: {str(e)}")
             return None
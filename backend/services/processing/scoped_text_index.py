@@ -0,0 +1,298 @@
+"""
+Precomputed sentence index over a persona-scoped text.
+
+``EvidenceLinkingService.link_evidence_to_attributes_v2`` selects candidate
+sentences for every trait field of a persona. Building a ``ScopedTextIndex``
+once per speaker scope segments the text, tokenizes each sentence and evaluates
+the hygiene heuristics up front, so selecting candidates for a trait only looks
+at the sentences sharing a token with the trait value.
+"""
+
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from backend.utils.lexicon import get_lexicon
+
+_SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]", flags=re.MULTILINE)
+_TOKEN_RE = re.compile(r"\b[\w-]+\b")
+
+# Section headings, matched at the start of a lowercased line in one pass
+_HEADING_RE = re.compile(
+    "|".join(
+        (
+            r"💡\s*key insights?:",
+            r"key insights?:",
+            r"key themes identified",
+            r"interview metadata",
+            r"interview dialogue",
+            r"simulation metadata",
+            r"stakeholder breakdown",
+        )
+    )
+)
+_META_KEYS = (
+    "primary stakeholder category",
+    "stakeholder category",
+    "category",
+    "role",
+    "age",
+    "gender",
+    "location",
+    "department",
+    "participant details",
+    "interviewee",
+    "interviewer",
+    "overall sentiment",
+    "interview id",
+    "conducted",
+    "duration",
+)
+# Label keys found anywhere in the prefix before a colon
+_META_KEYS_LEXICON = get_lexicon(_META_KEYS, whole_words=False)
+_LEADING_TIMESTAMPS_RE = re.compile(r"^\s*(\[[^\]]+\]\s*){1,3}")
+_QUESTION_PREFIX_RE = re.compile(r"^(q|question)\s*[:\-—–]\s*")
+_RESEARCHER_LABEL_RE = re.compile(r"^(interviewer|researcher|moderator)\s*:\s*")
+_UPPERCASE_LABEL_RE = re.compile(r"^[A-Z][A-Z ]{1,20}:\s")
+
+MIN_SENTENCE_LENGTH = 20
+
+Span = Tuple[int, int]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens longer than three characters."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 3]
+
+
+def split_sentences_with_spans(text: str) -> List[Tuple[int, int, str]]:
+    """
+    Segment text into sentences with their character spans.
+
+    Sentences are split on terminal punctuation. Texts without any punctuated
+    sentence fall back to one span per line, and finally to the whole text.
+    Sentences shorter than 20 characters are skipped.
+
+    Args:
+        text: Text to segment
+
+    Returns:
+        List of (start, end, stripped sentence) tuples
+    """
+    if not text:
+        return []
+    spans: List[Tuple[int, int, str]] = []
+    for m in _SENTENCE_RE.finditer(text):
+        s, e = m.span()
+        sent = text[s:e].strip()
+        if len(sent) >= MIN_SENTENCE_LENGTH:
+            spans.append((s, e, sent))
+    # Newline-aware fallback segmentation for sparse-punctuation texts
+    # Use only when we found no sentence spans via punctuation; avoids duplicating
+    # entire lines when proper sentence segmentation already worked.
+    if not spans:
+        start = 0
+        for line in text.splitlines(keepends=True):
+            raw = (line or "").rstrip("\n")
+            end = start + len(line)
+            if raw and len(raw.strip()) >= MIN_SENTENCE_LENGTH:
+                spans.append((start, end, raw.strip()))
+            start = end
+    # Final fallback: whole text
+    if not spans:
+        spans.append((0, len(text), (text or "").strip()))
+    return spans
+
+
+def looks_like_metadata(sent: str) -> bool:
+    """Heuristic: reject lines that look like metadata/labels or section headers.
+    Examples: 'Primary Stakeholder Category: ...', '💡 Key Insights:', 'KEY THEMES IDENTIFIED'
+    """
+    if not sent:
+        return False
+    s = sent.strip()
+    ls = s.lower()
+    if _HEADING_RE.match(ls):
+        return True
+    # Label-style metadata with colon
+    if ":" in s:
+        prefix = s.split(":", 1)[0].strip().lower()
+        if _META_KEYS_LEXICON.search(prefix):
+            return True
+    return False
+
+
+def looks_like_question(sent: str) -> bool:
+    """Heuristic: reject researcher-style questions as evidence.
+    Handles timestamps and labels like "[20:04] Researcher: ..." and Q/Question prefixes.
+    """
+    if not sent:
+        return False
+    # Strip leading timestamps in square brackets (up to 3 groups)
+    s2 = _LEADING_TIMESTAMPS_RE.sub("", sent.strip())
+    ls2 = s2.lower()
+    if _QUESTION_PREFIX_RE.match(ls2):
+        return True
+    # Interviewer/researcher/moderator labels after optional timestamp
+    if _RESEARCHER_LABEL_RE.match(ls2):
+        return True
+    # Uppercase speaker label + colon (e.g., "INTERVIEWER:") after removing timestamp
+    if _UPPERCASE_LABEL_RE.match(s2):
+        return True
+    # Trailing question mark (ASCII or Unicode full-width)
+    return s2.endswith("?") or s2.endswith("？")
+
+
+class SpanSet:
+    """
+    Set of half-open character spans with logarithmic overlap checks.
+
+    Added spans are merged into sorted, disjoint intervals. A span overlaps the
+    set exactly when it shares a character with one of the added spans.
+    """
+
+    def __init__(self, spans: Optional[Iterable[Span]] = None):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._count = 0
+        for span in spans or ():
+            self.add(span)
+
+    def add(self, span: Span) -> None:
+        """Add a span, merging it with the intervals it touches."""
+        start, end = span
+        self._count += 1
+        lo = bisect_left(self._ends, start)
+        hi = lo
+        while hi < len(self._starts) and self._starts[hi] <= end:
+            start = min(start, self._starts[hi])
+            end = max(end, self._ends[hi])
+            hi += 1
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def overlaps(self, span: Span) -> bool:
+        """Return True if the span shares a character with any added span."""
+        start, end = span
+        i = bisect_left(self._starts, end) - 1
+        return i >= 0 and self._ends[i] > start
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Span]:
+        return iter(zip(self._starts, self._ends))
+
+
+class ScopedTextIndex:
+    """
+    Sentences of a scoped text with token sets, an inverted index and hygiene flags.
+
+    Attributes:
+        text: The indexed text
+        sentences: List of (start, end, sentence) tuples in text order
+        token_sets: Token set of each sentence
+        hygiene_rejected: Whether each sentence looks like metadata or a question
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.sentences = split_sentences_with_spans(self.text)
+        self.token_sets: List[FrozenSet[str]] = []
+        self.hygiene_rejected: List[bool] = []
+        self._postings: Dict[str, List[int]] = {}
+        for i, (_s, _e, sent) in enumerate(self.sentences):
+            tokens = frozenset(tokenize(sent))
+            self.token_sets.append(tokens)
+            self.hygiene_rejected.append(
+                looks_like_metadata(sent) or looks_like_question(sent)
+            )
+            for token in tokens:
+                self._postings.setdefault(token, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def overlapping_sentences(self, query: str) -> List[Tuple[int, float]]:
+        """
+        Find sentences with enough token overlap with the query.
+
+        A sentence qualifies when it shares at least two tokens with the query
+        or their Jaccard similarity is at least 0.25.
+
+        Args:
+            query: Text to match, typically a trait value
+
+        Returns:
+            List of (sentence index, Jaccard score) in text order
+        """
+        query_tokens = set(tokenize(query))
+        if not query_tokens:
+            return []
+        shared: Counter = Counter()
+        for token in query_tokens:
+            for i in self._postings.get(token, ()):
+                shared[i] += 1
+        matches: List[Tuple[int, float]] = []
+        for i in sorted(shared):
+            inter = shared[i]
+            union = len(query_tokens) + len(self.token_sets[i]) - inter
+            jacc = inter / max(1, union)
+            if inter >= 2 or jacc >= 0.25:
+                matches.append((i, jacc))
+        return matches
+
+    def select_candidates(
+        self,
+        query: str,
+        used_spans: Optional[SpanSet] = None,
+        limit: int = 6,
+        metrics: Optional[Dict[str, int]] = None,
+    ) -> List[Tuple[int, int, str, float]]:
+        """
+        Return up to ``limit`` candidate sentences for a query, best first.
+
+        Candidates overlap the query tokens, pass the hygiene filters and do not
+        collide with ``used_spans``. They are ordered by score, then length.
+
+        Args:
+            query: Text to match, typically a trait value
+            used_spans: Spans already taken by other traits
+            limit: Maximum number of candidates
+            metrics: Optional counters updated with rejection reasons
+
+        Returns:
+            List of (start, end, sentence, score) tuples
+        """
+        matches = self.overlapping_sentences(query)
+        if metrics is not None:
+            metrics["checked_sentences"] = metrics.get("checked_sentences", 0) + len(
+                self.sentences
+            )
+            metrics["rejected_low_overlap"] = (
+                metrics.get("rejected_low_overlap", 0)
+                + len(self.sentences)
+                - len(matches)
+            )
+        candidates: List[Tuple[int, int, str, float]] = []
+        for i, jacc in matches:
+            s, e, sent = self.sentences[i]
+            if self.hygiene_rejected[i]:
+                if metrics is not None:
+                    metrics["rejected_metadata_or_question"] = (
+                        metrics.get("rejected_metadata_or_question", 0) + 1
+                    )
+                continue
+            if used_spans is not None and used_spans.overlaps((s, e)):
+                if metrics is not None:
+                    metrics["rejected_collision"] = (
+                        metrics.get("rejected_collision", 0) + 1
+                    )
+                continue
+            candidates.append((s, e, sent, jacc))
+        # Sort best-first by score, then by length desc
+        candidates.sort(key=lambda t: (t[3], len(t[2])), reverse=True)
+        return candidates[:limit]
@@ -0,0 +1,154 @@
+"""
+Fuzzy lookup index over an industry's tool catalog.
+
+``AdaptiveToolRecognitionService`` corrects low-confidence tool mentions by
+finding the most similar canonical name or variation in the industry catalog.
+Comparing a mention against every entry costs one similarity call per entry;
+``ToolCatalogIndex`` flattens the catalog once, sorted by length, and scores a
+batch of mentions in a single ``rapidfuzz.process.cdist`` call restricted to
+the entries whose length can still reach the threshold.
+
+The length window is exact rather than heuristic: both ``fuzz.ratio`` and
+``SequenceMatcher.ratio`` are at most ``2 * min(l1, l2) / (l1 + l2)``, so
+entries outside the window can never score at or above the threshold, and
+results are identical to the pairwise scan (ties go to the entry that comes
+first in the catalog).
+"""
+
+import bisect
+import logging
+import math
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+
+    USE_RAPIDFUZZ = True
+except ImportError:
+    USE_RAPIDFUZZ = False
+
+# Matched mentions remembered per index
+MATCH_CACHE_SIZE = 4096
+
+ToolMatch = Tuple[str, float]
+
+
+class ToolCatalogIndex:
+    """
+    Length-blocked fuzzy matcher for a catalog of tools.
+
+    Args:
+        industry_tools: Catalog as returned by ``get_industry_tools``,
+            ``{canonical: {"variations": [...], ...}}``
+        threshold: Minimum similarity (0.0-1.0) for a match
+        cache_size: Number of mention lookups kept in the LRU cache
+    """
+
+    def __init__(
+        self,
+        industry_tools: Mapping[str, Mapping[str, Any]],
+        threshold: float = 0.75,
+        cache_size: int = MATCH_CACHE_SIZE,
+        use_rapidfuzz: bool = USE_RAPIDFUZZ,
+    ):
+        self.threshold = threshold
+        self.cache_size = cache_size
+        self.use_rapidfuzz = use_rapidfuzz and USE_RAPIDFUZZ
+
+        # Choice -> (catalog position, canonical); the first occurrence wins
+        entries: Dict[str, Tuple[int, str]] = {}
+        position = 0
+        for canonical, info in industry_tools.items():
+            for choice in [canonical, *(info or {}).get("variations", [])]:
+                choice = (choice or "").lower()
+                if choice and choice not in entries:
+                    entries[choice] = (position, canonical)
+                position += 1
+
+        ordered = sorted(entries.items(), key=lambda e: (len(e[0]), e[1][0]))
+        self._choices: List[str] = [choice for choice, _ in ordered]
+        self._lengths: List[int] = [len(choice) for choice in self._choices]
+        self._positions: List[int] = [pos for _, (pos, _) in ordered]
+        self._canonicals: List[str] = [canonical for _, (_, canonical) in ordered]
+        self._cache: "OrderedDict[str, Optional[ToolMatch]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._choices)
+
+    def _window(self, length: int) -> Tuple[int, int]:
+        """Slice of choices whose length allows a score >= threshold."""
+        t = self.threshold
+        if t <= 0:
+            return 0, len(self._choices)
+        # Small slack keeps boundary lengths despite float rounding
+        low = math.floor(length * t / (2 - t) - 1e-9)
+        high = math.ceil(length * (2 - t) / t + 1e-9)
+        return (
+            bisect.bisect_left(self._lengths, low),
+            bisect.bisect_right(self._lengths, high),
+        )
+
+    def match(self, mention: str) -> Optional[ToolMatch]:
+        """Best ``(canonical, score)`` for a mention, or None below threshold."""
+        return self.match_many([mention])[0]
+
+    def match_many(self, mentions: Iterable[str]) -> List[Optional[ToolMatch]]:
+        """Best ``(canonical, score)`` for each mention, scored in one batch."""
+        queries = [(mention or "").lower() for mention in mentions]
+        found: Dict[str, Optional[ToolMatch]] = {}
+        pending: List[str] = []
+        for query in dict.fromkeys(queries):
+            if not query:
+                found[query] = None
+            elif query in self._cache:
+                self._cache.move_to_end(query)
+                found[query] = self._cache[query]
+            else:
+                pending.append(query)
+
+        if pending:
+            for query, match in zip(pending, self._score(pending)):
+                found[query] = self._cache[query] = match
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return [found[query] for query in queries]
+
+    def _score(self, queries: List[str]) -> List[Optional[ToolMatch]]:
+        windows = [self._window(len(q)) for q in queries]
+        lo = min(start for start, _ in windows)
+        hi = max(end for _, end in windows)
+        if lo >= hi:
+            return [None] * len(queries)
+
+        # Per query: best score and the window offsets reaching it
+        candidates: List[Tuple[float, Sequence[int]]] = []
+        if self.use_rapidfuzz:
+            scores = process.cdist(
+                queries, self._choices[lo:hi], scorer=fuzz.ratio, dtype=np.float64
+            )
+            for row in scores / 100.0:
+                best = row.max()
+                candidates.append((float(best), np.flatnonzero(row == best).tolist()))
+        else:
+            for query, (start, end) in zip(queries, windows):
+                row = [
+                    SequenceMatcher(None, query, choice).ratio()
+                    for choice in self._choices[start:end]
+                ]
+                best = max(row, default=0.0)
+                ties = [start - lo + i for i, score in enumerate(row) if score == best]
+                candidates.append((best, ties))
+
+        results: List[Optional[ToolMatch]] = []
+        for best, ties in candidates:
+            if best <= 0.0 or best < self.threshold:
+                results.append(None)
+                continue
+            i = lo + min(ties, key=lambda i: self._positions[lo + i])
+            results.append((self._canonicals[i], best))
+        return results
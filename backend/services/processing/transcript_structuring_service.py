@@ -5,10 +5,12 @@ This service uses an LLM to convert raw interview transcripts into a structured
 JSON format with speaker identification and role inference.
 """
 
+import asyncio
 import json
 import logging
 import re
-from typing import Dict, Any, List, Optional, Union
+import zlib
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from pydantic import ValidationError
 
@@ -20,6 +22,7 @@ from backend.utils.json.json_repair import (
 from backend.models.transcript import TranscriptSegment, StructuredTranscript
 
 from backend.domain.interfaces.llm_unified import ILLMService
+from backend.infrastructure.config.settings import settings
 from backend.services.llm.prompts.tasks.transcript_structuring import (
     TranscriptStructuringPrompts,
 )
@@ -27,6 +30,23 @@ from backend.services.llm.prompts.tasks.transcript_structuring import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Line starting a new interview in a multi-interview file, e.g. "=== INTERVIEW 3 ==="
+# or "=== Interview with Jane ===" (the formats ``_detect_content_type`` counts)
+_INTERVIEW_MARKER_RE = re.compile(
+    r"^(?:[ \t=#*-]*interview\s+#?\d+\b|[ \t]*===[^\n]*interview[^\n]*===)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Line starting a speaker turn, e.g. "Interviewer:" or "[00:12] Jane Doe:"
+_SPEAKER_LABEL_RE = re.compile(r"^\s*(?:\[[^\]]*\]\s*)?[A-Z][\w .'’-]{0,40}:\s")
+# Generic speaker ids that are only unique within a single interview
+_GENERIC_SPEAKER_RE = re.compile(
+    r"^(interviewer|interviewee|participant|researcher|respondent|moderator|speaker)"
+    r"(?:[ _]?(\d+))?$",
+    re.IGNORECASE,
+)
+# A chunk may end after a turn whose hash has these low bits cleared
+_CHUNK_BOUNDARY_MASK = 0x7
+
 
 class TranscriptStructuringService:
     """
@@ -152,6 +172,10 @@ class TranscriptStructuringService:
         """
         Structure a raw interview transcript using LLM.
 
+        Transcripts longer than ``settings.transcript_chunk_chars`` are split at
+        interview and speaker-turn boundaries and the chunks are structured
+        concurrently (see ``_structure_chunks``).
+
         Args:
             raw_text: Raw interview transcript text
             filename: Optional filename (not used for content type detection)
@@ -164,124 +188,15 @@ class TranscriptStructuringService:
             return []
 
         try:
-            # Get the prompt for transcript structuring
-            prompt = TranscriptStructuringPrompts.get_prompt()
-
             # Log the length of the raw text
             logger.info(f"Structuring transcript with {len(raw_text)} characters")
 
-            # Detect content type based on the actual content
-            content_info = self._detect_content_type(raw_text)
-
-            # Add special instructions based on content type
-            if content_info["is_problem_focused"]:
-                logger.info(
-                    "Detected problem-focused interview content. Using special handling."
-                )
-                prompt = (
-                    prompt
-                    + "\n\nIMPORTANT: This appears to be a problem-focused interview. Focus on accurately structuring the dialogue without interpreting the content. Ensure the output is a valid JSON array with proper speaker_id, role, and dialogue fields."
-                )
-
-            if content_info["has_timestamps"]:
-                logger.info(
-                    "Detected timestamps in content. Adding special handling instructions."
-                )
-                prompt = (
-                    prompt
-                    + "\n\nNOTE: This transcript contains timestamps. Remember to exclude timestamps from the speaker_id and dialogue fields."
-                )
-
-            if content_info["content_complexity"] == "high":
-                logger.info(
-                    "Detected high complexity content. Adding special handling instructions."
-                )
-                prompt = (
-                    prompt
-                    + "\n\nNOTE: This is a complex transcript. Pay special attention to maintaining the correct sequence of dialogue and ensuring all speakers are consistently identified."
-                )
-
-            if content_info["is_multi_interview"]:
-                logger.info(
-                    f"Detected multi-interview file with {content_info['interview_count']} interviews. Adding special handling instructions."
-                )
-                prompt = (
-                    prompt
-                    + f"\n\nCRITICAL: This file contains {content_info['interview_count']} SEPARATE INTERVIEWS. Each interview has its own unique participants. "
-                    + "You MUST create unique speaker_id values for each interview to avoid merging different people. "
-                    + "For example, use 'Interviewee_1', 'Interviewee_2', 'Researcher_1', 'Researcher_2', etc. "
-                    + "DO NOT use generic names like 'Interviewee' or 'Researcher' that would merge different people together. "
-                    + "Each interview represents a different person with unique characteristics and responses."
-                )
-
-            # Create a response schema using the TranscriptSegment model
-            # This helps Gemini understand the expected output structure
-            response_schema = {
-                "type": "array",
-                "items": TranscriptSegment.model_json_schema(),
-            }
-
-            logger.info(
-                f"Using response schema for transcript structuring: {response_schema}"
-            )
-
-            # Call LLM to structure the transcript with enhanced JSON configuration
-            llm_response = await self.llm_service.analyze(
-                {
-                    "task": "transcript_structuring",
-                    "text": raw_text,
-                    "prompt": prompt,
-                    "enforce_json": True,  # Crucial for Gemini to output JSON
-                    "temperature": 0.0,  # For deterministic structuring
-                    "response_mime_type": "application/json",  # Explicitly enforce JSON output
-                    "response_schema": response_schema,  # Provide the schema for structured output
-                    "content_info": content_info,  # Pass content info instead of relying on filename
-                }
-            )
-
-            # Parse the LLM response
-            structured_transcript = self._parse_llm_response(llm_response)
-
-            # Check if the response indicates a timeout or API error
-            if self._is_timeout_or_api_error(llm_response):
-                logger.warning(
-                    "LLM API timeout or error detected. Using manual extraction fallback."
-                )
-                structured_transcript = self._extract_transcript_manually(raw_text)
-
-            # If problem-focused content and still no valid structure, try fallback method
-            elif content_info["is_problem_focused"] and not structured_transcript:
-                logger.warning(
-                    "Problem-focused content failed to structure. Trying fallback method."
-                )
-                structured_transcript = self._extract_transcript_manually(raw_text)
-
-            # Validate the structured transcript using Pydantic
-            validated_segments = []
-            for segment in structured_transcript:
-                try:
-                    # Validate each segment against the TranscriptSegment model
-                    validated_segment = TranscriptSegment(**segment)
-                    validated_segments.append(validated_segment.model_dump())
-                except ValidationError as e:
-                    logger.warning(f"Validation error for segment: {e}")
-                    # Try to fix common issues
-                    if "role" in segment and segment["role"] not in [
-                        "Interviewer",
-                        "Interviewee",
-                        "Participant",
-                    ]:
-                        segment["role"] = "Participant"
-                        try:
-                            validated_segment = TranscriptSegment(**segment)
-                            validated_segments.append(validated_segment.model_dump())
-                            logger.info(f"Fixed invalid role in segment")
-                        except ValidationError:
-                            logger.warning(
-                                f"Could not fix segment even after role correction"
-                            )
+            chunks = self._split_into_chunks(raw_text)
+            if len(chunks) > 1:
+                structured_transcript = await self._structure_chunks(chunks)
+            else:
+                structured_transcript = await self._structure_text(raw_text)
 
-            structured_transcript = validated_segments
             # Normalize roles consistently across the transcript (infer interviewer vs interviewee)
             try:
                 structured_transcript = self._normalize_roles(structured_transcript)
@@ -306,6 +221,349 @@ class TranscriptStructuringService:
             logger.error(f"Error structuring transcript: {str(e)}", exc_info=True)
             return []
 
+    async def _structure_text(
+        self,
+        raw_text: str,
+        use_cache: Optional[bool] = None,
+        multi_interview: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Structure one piece of transcript text with a single LLM call.
+
+        Falls back to manual extraction when the LLM call times out or fails.
+
+        Args:
+            raw_text: Transcript text to structure
+            use_cache: Optional ``use_cache`` flag for the LLM request
+            multi_interview: Whether to add multi-interview speaker instructions
+
+        Returns:
+            List of validated transcript segments
+        """
+        # Get the prompt for transcript structuring
+        prompt = TranscriptStructuringPrompts.get_prompt()
+
+        # Detect content type based on the actual content
+        content_info = self._detect_content_type(raw_text)
+        if not multi_interview:
+            # The caller keeps speakers of different interviews apart
+            content_info["is_multi_interview"] = False
+            content_info["interview_count"] = 1
+
+        # Add special instructions based on content type
+        if content_info["is_problem_focused"]:
+            logger.info(
+                "Detected problem-focused interview content. Using special handling."
+            )
+            prompt = (
+                prompt
+                + "\n\nIMPORTANT: This appears to be a problem-focused interview. Focus on accurately structuring the dialogue without interpreting the content. Ensure the output is a valid JSON array with proper speaker_id, role, and dialogue fields."
+            )
+
+        if content_info["has_timestamps"]:
+            logger.info(
+                "Detected timestamps in content. Adding special handling instructions."
+            )
+            prompt = (
+                prompt
+                + "\n\nNOTE: This transcript contains timestamps. Remember to exclude timestamps from the speaker_id and dialogue fields."
+            )
+
+        if content_info["content_complexity"] == "high":
+            logger.info(
+                "Detected high complexity content. Adding special handling instructions."
+            )
+            prompt = (
+                prompt
+                + "\n\nNOTE: This is a complex transcript. Pay special attention to maintaining the correct sequence of dialogue and ensuring all speakers are consistently identified."
+            )
+
+        if content_info["is_multi_interview"]:
+            logger.info(
+                f"Detected multi-interview file with {content_info['interview_count']} interviews. Adding special handling instructions."
+            )
+            prompt = (
+                prompt
+                + f"\n\nCRITICAL: This file contains {content_info['interview_count']} SEPARATE INTERVIEWS. Each interview has its own unique participants. "
+                + "You MUST create unique speaker_id values for each interview to avoid merging different people. "
+                + "For example, use 'Interviewee_1', 'Interviewee_2', 'Researcher_1', 'Researcher_2', etc. "
+                + "DO NOT use generic names like 'Interviewee' or 'Researcher' that would merge different people together. "
+                + "Each interview represents a different person with unique characteristics and responses."
+            )
+
+        # Create a response schema using the TranscriptSegment model
+        # This helps Gemini understand the expected output structure
+        response_schema = {
+            "type": "array",
+            "items": TranscriptSegment.model_json_schema(),
+        }
+
+        logger.info(
+            f"Using response schema for transcript structuring: {response_schema}"
+        )
+
+        # Call LLM to structure the transcript with enhanced JSON configuration
+        request = {
+            "task": "transcript_structuring",
+            "text": raw_text,
+            "prompt": prompt,
+            "enforce_json": True,  # Crucial for Gemini to output JSON
+            "temperature": 0.0,  # For deterministic structuring
+            "response_mime_type": "application/json",  # Explicitly enforce JSON output
+            "response_schema": response_schema,  # Provide the schema for structured output
+            "content_info": content_info,  # Pass content info instead of relying on filename
+        }
+        if use_cache is not None:
+            request["use_cache"] = use_cache
+        llm_response = await self.llm_service.analyze(request)
+
+        # Parse the LLM response
+        structured_transcript = self._parse_llm_response(llm_response)
+
+        # Check if the response indicates a timeout or API error
+        if self._is_timeout_or_api_error(llm_response):
+            logger.warning(
+                "LLM API timeout or error detected. Using manual extraction fallback."
+            )
+            structured_transcript = self._extract_transcript_manually(raw_text)
+
+        # If problem-focused content and still no valid structure, try fallback method
+        elif content_info["is_problem_focused"] and not structured_transcript:
+            logger.warning(
+                "Problem-focused content failed to structure. Trying fallback method."
+            )
+            structured_transcript = self._extract_transcript_manually(raw_text)
+
+        # Validate the structured transcript using Pydantic
+        validated_segments = []
+        for segment in structured_transcript:
+            try:
+                # Validate each segment against the TranscriptSegment model
+                validated_segment = TranscriptSegment(**segment)
+                validated_segments.append(validated_segment.model_dump())
+            except ValidationError as e:
+                logger.warning(f"Validation error for segment: {e}")
+                # Try to fix common issues
+                if "role" in segment and segment["role"] not in [
+                    "Interviewer",
+                    "Interviewee",
+                    "Participant",
+                ]:
+                    segment["role"] = "Participant"
+                    try:
+                        validated_segment = TranscriptSegment(**segment)
+                        validated_segments.append(validated_segment.model_dump())
+                        logger.info(f"Fixed invalid role in segment")
+                    except ValidationError:
+                        logger.warning(
+                            f"Could not fix segment even after role correction"
+                        )
+
+        return validated_segments
+
+    def _split_into_chunks(self, raw_text: str) -> List[Tuple[int, str]]:
+        """
+        Split a long transcript into chunks at interview and speaker-turn boundaries.
+
+        Interviews are never mixed within a chunk. Inside an interview, turns are
+        packed into chunks of at most ``settings.transcript_chunk_chars``
+        characters, cutting after turns selected by a hash of their content, so an
+        edit in one part of the transcript leaves the other chunks (and their
+        cached LLM responses) unchanged.
+
+        Args:
+            raw_text: Raw interview transcript text
+
+        Returns:
+            List of (interview number, chunk text) tuples in transcript order; the
+            interview number is 0 when the transcript has no interview markers
+        """
+        max_chars = max(1000, settings.transcript_chunk_chars)
+        if len(raw_text) <= max_chars:
+            return [(0, raw_text)]
+
+        starts = [m.start() for m in _INTERVIEW_MARKER_RE.finditer(raw_text)]
+        if len(starts) > 1:
+            # Any preamble before the first marker belongs to the first interview
+            bounds = [0] + starts[1:] + [len(raw_text)]
+            interviews = [
+                (number, raw_text[bounds[number - 1] : bounds[number]])
+                for number in range(1, len(bounds))
+            ]
+        else:
+            interviews = [(0, raw_text)]
+
+        chunks: List[Tuple[int, str]] = []
+        for number, interview_text in interviews:
+            current: List[str] = []
+            size = 0
+            for turn in self._split_into_turns(interview_text, max_chars):
+                if current and size + len(turn) > max_chars:
+                    chunks.append((number, "".join(current)))
+                    current, size = [], 0
+                current.append(turn)
+                size += len(turn)
+                if (
+                    size >= max_chars // 4
+                    and zlib.crc32(turn.strip().encode("utf-8")) & _CHUNK_BOUNDARY_MASK
+                    == 0
+                ):
+                    chunks.append((number, "".join(current)))
+                    current, size = [], 0
+            if current:
+                chunks.append((number, "".join(current)))
+
+        logger.info(
+            f"Split transcript of {len(raw_text)} characters into {len(chunks)} chunks "
+            f"across {len(interviews)} interview(s)"
+        )
+        return chunks
+
+    def _split_into_turns(self, text: str, max_chars: int) -> List[str]:
+        """
+        Split transcript text into speaker turns, keeping every character.
+
+        A turn starts at a speaker label line or after a blank line. Turns longer
+        than ``max_chars`` are split further at line breaks, and single lines
+        longer than that at ``max_chars`` characters.
+        """
+        turns: List[str] = []
+        current: List[str] = []
+        previous_blank = False
+        for line in text.splitlines(keepends=True):
+            starts_turn = bool(_SPEAKER_LABEL_RE.match(line)) or (
+                previous_blank and line.strip()
+            )
+            if starts_turn and current:
+                turns.append("".join(current))
+                current = []
+            current.append(line)
+            previous_blank = not line.strip()
+        if current:
+            turns.append("".join(current))
+
+        pieces: List[str] = []
+        for turn in turns:
+            if len(turn) <= max_chars:
+                pieces.append(turn)
+                continue
+            piece = ""
+            for line in turn.splitlines(keepends=True):
+                if piece and len(piece) + len(line) > max_chars:
+                    pieces.append(piece)
+                    piece = ""
+                while len(line) > max_chars:
+                    pieces.append(line[:max_chars])
+                    line = line[max_chars:]
+                piece += line
+            if piece:
+                pieces.append(piece)
+        return pieces
+
+    async def _structure_chunks(
+        self, chunks: List[Tuple[int, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Structure transcript chunks concurrently and stitch them in order.
+
+        Each chunk is an individually cached LLM call. Chunks split at interview
+        markers hold a single interview; other chunks get the multi-interview
+        speaker instructions whenever ``_detect_content_type`` finds interviews
+        in them. Each chunk's speakers are then mapped onto the ids used for the
+        same name or label in earlier chunks of the interview (see
+        ``_reconcile_speakers``). Speakers with generic ids (``Interviewer``,
+        ``Participant_1``, ...) are suffixed with the interview number so people
+        from different interviews are not merged, and segments are tagged with
+        ``document_id`` ``interview_<n>``.
+
+        Args:
+            chunks: (interview number, chunk text) tuples from ``_split_into_chunks``
+
+        Returns:
+            Stitched list of transcript segments in transcript order
+        """
+        semaphore = asyncio.Semaphore(max(1, settings.transcript_chunk_concurrency))
+
+        async def structure_chunk(number: int, chunk_text: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                segments = await self._structure_text(
+                    chunk_text, use_cache=True, multi_interview=not number
+                )
+            if not segments:
+                logger.warning(
+                    "Chunk failed to structure. Using manual extraction fallback."
+                )
+                segments = self._extract_transcript_manually(chunk_text)
+            return segments
+
+        results = await asyncio.gather(
+            *(structure_chunk(number, chunk_text) for number, chunk_text in chunks)
+        )
+
+        known_speakers: Dict[Tuple[int, str], str] = {}
+        stitched: List[Dict[str, Any]] = []
+        for (number, _), segments in zip(chunks, results):
+            for segment in self._reconcile_speakers(segments, number, known_speakers):
+                if number:
+                    segment["speaker_id"] = self._scope_speaker_id(
+                        segment.get("speaker_id", ""), number
+                    )
+                    if not segment.get("document_id"):
+                        segment["document_id"] = f"interview_{number}"
+                stitched.append(segment)
+        logger.info(
+            f"Stitched {len(stitched)} segments from {len(chunks)} transcript chunks"
+        )
+        return stitched
+
+    @classmethod
+    def _reconcile_speakers(
+        cls,
+        segments: List[Dict[str, Any]],
+        interview_number: int,
+        known_speakers: Dict[Tuple[int, str], str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Map a chunk's speaker ids onto the ids earlier chunks used for them.
+
+        Chunks are structured independently, so the same person can come back as
+        ``Jane Doe`` and ``jane doe``, or ``Interviewee`` and ``Interviewee_1``.
+        Speakers are matched by name or label (see ``_speaker_key``) within the
+        same interview; unmatched speakers are added to ``known_speakers``.
+
+        Returns:
+            Copies of the segments with reconciled speaker ids
+        """
+        reconciled = []
+        for segment in segments:
+            segment = dict(segment)
+            speaker_id = segment.get("speaker_id") or ""
+            key = (interview_number, cls._speaker_key(speaker_id))
+            if key[1]:
+                segment["speaker_id"] = known_speakers.setdefault(key, speaker_id)
+            reconciled.append(segment)
+        return reconciled
+
+    @staticmethod
+    def _speaker_key(speaker_id: str) -> str:
+        """Case- and separator-insensitive key; a bare generic label is number 1."""
+        normalized = " ".join(re.split(r"[\s_]+", (speaker_id or "").strip()))
+        match = _GENERIC_SPEAKER_RE.match(normalized)
+        if match:
+            return f"{match.group(1).lower()} {match.group(2) or '1'}"
+        return normalized.lower()
+
+    @staticmethod
+    def _scope_speaker_id(speaker_id: str, interview_number: int) -> str:
+        """Make a generic speaker id unique to its interview; names are kept."""
+        match = _GENERIC_SPEAKER_RE.match((speaker_id or "").strip())
+        if not match:
+            return speaker_id
+        base, index = match.group(1), match.group(2)
+        if index is None or index == "1":
+            return f"{base}_{interview_number}"
+        return f"{base}_{interview_number}_{index}"
+
     def _is_timeout_or_api_error(
         self, llm_response: Union[str, Dict[str, Any], List[Dict[str, Any]]]
     ) -> bool:
@@ -19,3 +19,22 @@ class AnalysisResultRow:
     llm_model: Optional[str]
     results: Optional[Any]
     stakeholder_intelligence: Optional[Any]
+
+
+@dataclass(frozen=True)
+class AnalysisListItemRow:
+    """Projection of an analysis result for the history list.
+
+    Carries only scalar columns, the stored summary and the joined filename;
+    the ``results`` JSON is never part of this row.
+    """
+
+    result_id: int
+    data_id: Optional[int]
+    analysis_date: Optional[Any]
+    completed_at: Optional[Any]
+    status: Optional[str]
+    llm_provider: Optional[str]
+    llm_model: Optional[str]
+    summary: Optional[Any]
+    filename: Optional[str]
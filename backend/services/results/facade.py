@@ -57,6 +57,23 @@ class ResultsServiceFacade:
             sort_by=sort_by, sort_direction=sort_direction, status=status
         )
 
+    def list_analyses_page(
+        self,
+        *,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return LegacyResultsService(self.db, self.user).list_analyses_page(
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+
     def get_design_thinking_personas(self, result_id: int):
         return LegacyResultsService(self.db, self.user).get_design_thinking_personas(
             result_id
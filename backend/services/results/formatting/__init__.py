@@ -14,6 +14,7 @@ from .influence import (
     should_compute_influence_metrics,
 )
 from .themes import adjust_theme_frequencies_for_prevalence, hydrate_theme_statement_documents
+from .summary import build_analysis_summary
 
 __all__ = [
     "extract_sentiment_statements_from_data",
@@ -27,4 +28,5 @@ __all__ = [
     "should_compute_influence_metrics",
     "adjust_theme_frequencies_for_prevalence",
     "hydrate_theme_statement_documents",
+    "build_analysis_summary",
 ]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def _count(results: Dict[str, Any], key: str) -> int:
+    value = results.get(key)
+    return len(value) if isinstance(value, list) else 0
+
+
+def build_analysis_summary(results: Any, status: str) -> Dict[str, Any]:
+    """Build the small per-analysis summary stored for the history list.
+
+    The summary is computed once when an analysis finishes so that listing
+    analyses never has to load or parse the full results JSON.
+    """
+    if not isinstance(results, dict):
+        results = {}
+    summary: Dict[str, Any] = {
+        "status": status,
+        "theme_count": _count(results, "themes"),
+        "enhanced_theme_count": _count(results, "enhanced_themes"),
+        "pattern_count": _count(results, "patterns"),
+        "persona_count": _count(results, "personas"),
+        "insight_count": _count(results, "insights"),
+    }
+    sentiment_overview = results.get("sentimentOverview")
+    if isinstance(sentiment_overview, dict):
+        summary["sentimentOverview"] = sentiment_overview
+    if status == "failed":
+        error = results.get("error_details") or results.get("error")
+        if error:
+            summary["error"] = str(error)[:500]
+    return summary
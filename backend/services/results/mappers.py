@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from backend.services.results.dto import AnalysisResultRow
+from backend.services.results.dto import AnalysisListItemRow, AnalysisResultRow
 
 
 def to_analysis_result_row(row: Any) -> AnalysisResultRow:
@@ -21,3 +21,18 @@ def to_analysis_result_row(row: Any) -> AnalysisResultRow:
         results=getattr(row, "results", None),
         stakeholder_intelligence=getattr(row, "stakeholder_intelligence", None),
     )
+
+
+def to_analysis_list_item_row(row: Any) -> AnalysisListItemRow:
+    """Map a projected list row (named tuple or ORM-like object) to a DTO."""
+    return AnalysisListItemRow(
+        result_id=getattr(row, "result_id", None),
+        data_id=getattr(row, "data_id", None),
+        analysis_date=getattr(row, "analysis_date", None),
+        completed_at=getattr(row, "completed_at", None),
+        status=getattr(row, "status", None),
+        llm_provider=getattr(row, "llm_provider", None),
+        llm_model=getattr(row, "llm_model", None),
+        summary=getattr(row, "summary", None),
+        filename=getattr(row, "filename", None),
+    )
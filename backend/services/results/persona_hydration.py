@@ -1,5 +1,5 @@
 """
-Helper functions for results endpoints.
+Persona evidence hydration for the results read view.
 
 Extracted from app.py to improve maintainability.
 """
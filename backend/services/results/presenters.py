@@ -7,6 +7,12 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from backend.services.results.dto import AnalysisListItemRow
+from backend.utils.timezone_utils import format_iso_utc
+
+# Database status -> list schema status
+_LIST_STATUS = {"processing": "pending", "error": "failed"}
+
 
 class ResultsPresenter:
     @staticmethod
@@ -18,3 +24,22 @@ class ResultsPresenter:
     def to_api_list(payload: Dict[str, Any]) -> Dict[str, Any]:
         return payload
 
+    @staticmethod
+    def to_api_list_item(item: AnalysisListItemRow) -> Dict[str, Any]:
+        """Shape a projected history row; counts come from the stored summary."""
+        summary = item.summary if isinstance(item.summary, dict) else {}
+        payload: Dict[str, Any] = {
+            "id": str(item.result_id),
+            "result_id": item.result_id,
+            "status": _LIST_STATUS.get(item.status, item.status),
+            "createdAt": format_iso_utc(item.analysis_date),
+            "completedAt": format_iso_utc(item.completed_at),
+            "fileName": item.filename or "Unknown",
+            "fileSize": None,
+            "llmProvider": item.llm_provider,
+            "llmModel": item.llm_model,
+            "summary": summary,
+        }
+        if summary.get("error"):
+            payload["error"] = summary["error"]
+        return payload
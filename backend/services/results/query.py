@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import replace
+from typing import List, Optional, Sequence, Tuple
 
 from sqlalchemy.orm import Session
 
-from backend.services.results.dto import AnalysisResultRow
-from backend.services.results.mappers import to_analysis_result_row
+from backend.services.results.dto import AnalysisListItemRow, AnalysisResultRow
+from backend.services.results.mappers import (
+    to_analysis_list_item_row,
+    to_analysis_result_row,
+)
 from backend.services.results.repositories import AnalysisResultRepository
 
 
@@ -25,3 +29,37 @@ class AnalysisResultQuery:
             return None
         return to_analysis_result_row(row)
 
+    def list_owned_results_page(
+        self,
+        *,
+        user_id: str,
+        sort_by: str = "createdAt",
+        sort_direction: str = "desc",
+        statuses: Optional[Sequence[str]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AnalysisListItemRow], Optional[str]]:
+        rows, next_cursor = self.repo.list_for_user(
+            user_id,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            statuses=statuses,
+            limit=limit,
+            cursor=cursor,
+        )
+        items = [to_analysis_list_item_row(row) for row in rows]
+
+        # Finished rows from before summaries were stored get one backfill
+        missing = [
+            item.result_id
+            for item in items
+            if item.summary is None
+            and item.status in ("completed", "failed", "error")
+        ]
+        if missing:
+            summaries = self.repo.backfill_summaries(missing)
+            items = [
+                replace(item, summary=summaries.get(item.result_id, item.summary))
+                for item in items
+            ]
+        return items, next_cursor
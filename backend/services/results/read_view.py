@@ -0,0 +1,76 @@
+"""Materialized read view of an analysis result.
+
+``GET /api/results/{id}`` formats the stored results, re-links persona
+evidence against the transcript and revalidates every persona. The outcome
+only depends on the stored results and on the hydration/validation code, so
+it is computed once when the analysis completes, stored on
+``AnalysisResult.read_view`` and served as-is until either changes.
+
+The view is stamped with the fingerprint stored in
+``AnalysisResult.results_fingerprint`` (refreshed on every write of
+``results``) and with ``READ_VIEW_VERSION``; on a mismatch the next read
+rebuilds and stores it. Bump the version whenever hydration, revalidation or
+result formatting changes its output. The ETag is derived from the same
+stamp, so a client revalidating with ``If-None-Match`` gets a 304 without the
+results or the view being loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+# Algorithm version of the hydrated/revalidated view
+READ_VIEW_VERSION = "2025-11-24.1"
+
+
+def results_fingerprint(results: Any) -> str:
+    """Digest of a stored ``results`` value (JSON text or decoded JSON)."""
+    if isinstance(results, (bytes, bytearray)):
+        payload = bytes(results)
+    elif isinstance(results, str):
+        payload = results.encode("utf-8")
+    else:
+        payload = json.dumps(
+            results, sort_keys=True, separators=(",", ":"), default=str
+        ).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def read_view_stamp(fingerprint: str, options: Dict[str, Any]) -> str:
+    """Stamp identifying one view: results, algorithm version and options."""
+    parts = [fingerprint, READ_VIEW_VERSION] + [
+        f"{key}={options[key]}" for key in sorted(options)
+    ]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def etag_for(stamp: str) -> str:
+    """Strong ETag header value for a view stamp."""
+    return f'"{stamp}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header already names ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    return "*" in candidates or any(
+        c.removeprefix("W/") == etag for c in candidates
+    )
+
+
+def load_read_view(row: Any, stamp: str) -> Optional[Dict[str, Any]]:
+    """Return the stored view of ``row`` when it was built for ``stamp``."""
+    view = getattr(row, "read_view", None)
+    if not isinstance(view, dict) or view.get("stamp") != stamp:
+        return None
+    response = view.get("response")
+    return response if isinstance(response, dict) else None
+
+
+def build_read_view(stamp: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Stored form of a computed view."""
+    return {"stamp": stamp, "version": READ_VIEW_VERSION, "response": response}
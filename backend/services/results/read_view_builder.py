@@ -0,0 +1,332 @@
+"""Building and storing the materialized results read view.
+
+The completed-analysis worker stores the view as soon as the results are
+written. ``GET /api/results`` rebuilds and stores it whenever the stored view
+is missing or stale (results rewritten by another route, ``READ_VIEW_VERSION``
+bump, hydration/revalidation flag change), so each results version is
+formatted once rather than on every read. Rows written before the
+fingerprint column existed get their fingerprint on their first read.
+
+Building the view formats, hydrates and validates the whole result, so the
+async callers run it in a worker thread on a session of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from backend.models import AnalysisResult, User
+from backend.schemas import ResultResponse
+from backend.services.results.persona_hydration import (
+    build_concat_and_spans,
+    should_hydrate_personas,
+    should_revalidate_personas,
+    hydrate_persona_evidence,
+)
+from backend.services.results.read_view import (
+    build_read_view,
+    read_view_stamp,
+    results_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def read_view_options() -> Dict[str, Any]:
+    """Read-time options that change the view and are part of its stamp."""
+    return {
+        "hydrate": should_hydrate_personas(),
+        "revalidate": should_revalidate_personas(),
+    }
+
+
+def format_result(db: Session, user: User, result_id: int) -> Any:
+    """Format a stored result, then hydrate and revalidate its personas."""
+    from backend.api.dependencies import get_container
+
+    container = get_container()
+    factory = container.get_results_service()
+    results_service = factory(db, user)
+
+    # Get formatted results
+    result = results_service.get_analysis_result(result_id)
+
+    # Optional on-read hydration for personas
+    if should_hydrate_personas() and isinstance(result, dict):
+        _hydrate_result_personas(result)
+
+    # Optional on-read revalidation
+    if should_revalidate_personas() and isinstance(result, dict):
+        _revalidate_result_personas(result)
+
+    return result
+
+
+def materialize_read_view(
+    db: Session, row: AnalysisResult, user: User
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the read view of a completed result and store it.
+
+    The view is stamped with the fingerprint the row had before formatting
+    and only stored while the row still carries that fingerprint, so a
+    concurrent write of ``results`` is never overwritten with a view of the
+    previous results. Failures are logged.
+
+    Returns:
+        The view, or None if the result has no view or it could not be built
+    """
+    result_id = row.result_id
+    try:
+        fingerprint = row.results_fingerprint
+        if row.status != "completed" or not fingerprint:
+            return None
+        stamp = read_view_stamp(fingerprint, read_view_options())
+        result = format_result(db, user, result_id)
+        if not isinstance(result, dict) or result.get("status") != "completed":
+            return None
+        view = jsonable_encoder(ResultResponse.model_validate(result))
+    except Exception as err:
+        logger.warning(f"[READ_VIEW] Could not build view for {result_id}: {err}")
+        return None
+
+    store_read_view(db, result_id, fingerprint, build_read_view(stamp, view))
+    return view
+
+
+async def materialize_read_view_in_thread(
+    db: Session, result_id: int, user: User
+) -> Optional[Dict[str, Any]]:
+    """
+    Run ``materialize_read_view`` for ``result_id`` off the event loop.
+
+    The row is re-read on a session of the worker thread, bound to the same
+    engine as ``db``.
+
+    Returns:
+        The view, or None if the result has no view or it could not be built
+    """
+
+    def build(session: Session) -> Optional[Dict[str, Any]]:
+        row = session.get(AnalysisResult, result_id)
+        if row is None:
+            return None
+        return materialize_read_view(session, row, user)
+
+    return await _run_in_own_session(db, build)
+
+
+async def backfill_results_fingerprint_in_thread(
+    db: Session, result_id: int
+) -> Optional[str]:
+    """Run ``backfill_results_fingerprint`` off the event loop."""
+    return await _run_in_own_session(
+        db, lambda session: backfill_results_fingerprint(session, result_id)
+    )
+
+
+def backfill_results_fingerprint(db: Session, result_id: int) -> Optional[str]:
+    """
+    Compute and store the fingerprint of a row that has none.
+
+    Rows written before ``results_fingerprint`` existed never went through the
+    ORM write hook. The UPDATE only applies while the fingerprint is still
+    NULL, so a concurrent write of ``results`` (which stamps its own
+    fingerprint) wins.
+
+    Returns:
+        The stored fingerprint, or None if the row has no results
+    """
+    try:
+        results = (
+            db.query(AnalysisResult.results)
+            .filter(AnalysisResult.result_id == result_id)
+            .scalar()
+        )
+        if not results:
+            return None
+        fingerprint = results_fingerprint(results)
+        stored = (
+            db.query(AnalysisResult)
+            .filter(
+                AnalysisResult.result_id == result_id,
+                AnalysisResult.results_fingerprint.is_(None),
+            )
+            .update(
+                {AnalysisResult.results_fingerprint: fingerprint},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if stored:
+            return fingerprint
+        # Results were rewritten meanwhile; use the fingerprint that write stored
+        return (
+            db.query(AnalysisResult.results_fingerprint)
+            .filter(AnalysisResult.result_id == result_id)
+            .scalar()
+        )
+    except Exception as err:
+        db.rollback()
+        logger.warning(
+            f"[READ_VIEW] Could not backfill fingerprint for {result_id}: {err}"
+        )
+        return None
+
+
+async def _run_in_own_session(db: Session, work: Callable[[Session], T]) -> T:
+    """Run ``work`` in a worker thread on a new session bound like ``db``."""
+    bind = db.get_bind()
+
+    def run() -> T:
+        with Session(bind=bind) as session:
+            return work(session)
+
+    return await asyncio.to_thread(run)
+
+
+def store_read_view(
+    db: Session, result_id: int, fingerprint: str, read_view: Dict[str, Any]
+) -> bool:
+    """
+    Store ``read_view`` if the row's results still have ``fingerprint``.
+
+    A bulk UPDATE, so the ORM write hook does not treat it as a results write.
+
+    Returns:
+        True if the view was stored
+    """
+    try:
+        stored = (
+            db.query(AnalysisResult)
+            .filter(
+                AnalysisResult.result_id == result_id,
+                AnalysisResult.results_fingerprint == fingerprint,
+            )
+            .update({AnalysisResult.read_view: read_view}, synchronize_session=False)
+        )
+        db.commit()
+    except Exception as err:
+        db.rollback()
+        logger.warning(f"[READ_VIEW] Could not store view for {result_id}: {err}")
+        return False
+    if not stored:
+        logger.info(f"[READ_VIEW] Results of {result_id} changed, view not stored")
+    return bool(stored)
+
+
+def _hydrate_result_personas(result: Dict[str, Any]) -> None:
+    """Hydrate personas with evidence document IDs and offsets."""
+    try:
+        results_obj = result.get("results") or {}
+        personas = results_obj.get("personas")
+        if not isinstance(personas, list) or not personas:
+            return
+
+        source_payload = results_obj.get("source") or {}
+        transcript = (
+            source_payload.get("transcript")
+            if isinstance(source_payload, dict)
+            else None
+        )
+
+        scoped_text, doc_spans = None, None
+        if isinstance(transcript, list) and transcript:
+            txt, spans = build_concat_and_spans(transcript)
+            if txt and spans:
+                scoped_text, doc_spans = txt, spans
+        if not scoped_text:
+            scoped_text = source_payload.get("original_text") or ""
+
+        if scoped_text:
+            hydrate_persona_evidence(personas, scoped_text, doc_spans)
+
+    except Exception as err:
+        logger.warning(f"[FULL_RESULTS_HYDRATION] Skipped due to error: {err}")
+
+
+def _revalidate_result_personas(result: Dict[str, Any]) -> None:
+    """Revalidate persona evidence on read."""
+    try:
+        from backend.services.validation.persona_evidence_validator import (
+            PersonaEvidenceValidator,
+        )
+
+        results_obj = result.get("results") or {}
+        personas = results_obj.get("personas")
+        if not isinstance(personas, list) or not personas:
+            return
+
+        source_payload = results_obj.get("source") or {}
+        transcript = (
+            source_payload.get("transcript")
+            if isinstance(source_payload, dict)
+            else None
+        )
+        source_text = (
+            source_payload.get("original_text")
+            if isinstance(source_payload, dict)
+            else None
+        )
+
+        validator = PersonaEvidenceValidator()
+        all_matches = []
+        any_cross_trait = False
+        speaker_mismatch_count = 0
+
+        if not (isinstance(transcript, list) and transcript):
+            transcript = None
+
+        for p in personas:
+            if not isinstance(p, dict):
+                continue
+            try:
+                matches = validator.match_evidence(
+                    persona_ssot=p,
+                    source_text=source_text,
+                    transcript=transcript,
+                )
+                all_matches.extend(matches)
+
+                dup = PersonaEvidenceValidator.detect_duplication(p)
+                ctr = dup.get("cross_trait_reuse")
+                if isinstance(ctr, list):
+                    any_cross_trait = any_cross_trait or bool(ctr)
+                elif ctr:
+                    any_cross_trait = True
+
+                sc = PersonaEvidenceValidator.check_speaker_consistency(p, transcript)
+                sm = sc.get("speaker_mismatches")
+                if isinstance(sm, list):
+                    speaker_mismatch_count += len(sm)
+                elif isinstance(sm, int):
+                    speaker_mismatch_count += sm
+            except (TypeError, KeyError, AttributeError):
+                continue
+
+        contamination = PersonaEvidenceValidator.detect_contamination(personas)
+        summary = PersonaEvidenceValidator.summarize(
+            all_matches,
+            {"cross_trait_reuse": any_cross_trait},
+            {"speaker_mismatches": speaker_mismatch_count},
+            contamination,
+        )
+        confidence = PersonaEvidenceValidator.compute_confidence_components(summary)
+
+        # Shape similar to previous payloads
+        results_obj["validation_summary"] = {
+            "counts": summary.get("counts", {}),
+            "method": "persona_evidence_validator_v1",
+            "speaker_mismatches": speaker_mismatch_count,
+            "contamination": contamination,
+            "confidence_components": confidence,
+        }
+    except Exception as err:
+        logger.warning(f"[ON_READ_REVALIDATION] Skipped due to error: {err}")
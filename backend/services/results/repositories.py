@@ -8,7 +8,11 @@ modular structure and will be wired in Phase 2.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from backend.models import AnalysisResult, InterviewData
@@ -40,10 +44,125 @@ class AnalysisResultRepository:
         *,
         sort_by: str = "createdAt",
         sort_direction: str = "desc",
-        status: Optional[str] = None,
-    ) -> List[Any]:  # noqa: ANN401
-        """List analysis results for a user with optional sorting/filtering."""
-        raise NotImplementedError
+        statuses: Optional[Sequence[str]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Any], Optional[str]]:  # noqa: ANN401
+        """List a page of analysis results for a user.
+
+        Selects only the list columns plus the filename from the ownership
+        join; the ``results`` JSON is never loaded. Pages are keyset based:
+        ``cursor`` is the opaque value returned for the previous page.
+        ``statuses`` limits the rows to those database status values.
+
+        Returns:
+            Tuple of (projected rows, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if sort_by == "fileName":
+            sort_col = func.coalesce(InterviewData.filename, "")
+        else:
+            sort_by = "createdAt"
+            sort_col = AnalysisResult.analysis_date
+        descending = sort_direction != "asc"
+
+        query = (
+            self.db.query(
+                AnalysisResult.result_id,
+                AnalysisResult.data_id,
+                AnalysisResult.analysis_date,
+                AnalysisResult.completed_at,
+                AnalysisResult.status,
+                AnalysisResult.llm_provider,
+                AnalysisResult.llm_model,
+                AnalysisResult.summary,
+                InterviewData.filename,
+            )
+            .join(InterviewData, AnalysisResult.data_id == InterviewData.id)
+            .filter(InterviewData.user_id == user_id)
+        )
+        if statuses:
+            query = query.filter(AnalysisResult.status.in_(list(statuses)))
+
+        if cursor:
+            last_value, last_id = _decode_cursor(cursor, sort_by)
+            if descending:
+                query = query.filter(
+                    or_(
+                        sort_col < last_value,
+                        and_(sort_col == last_value, AnalysisResult.result_id < last_id),
+                    )
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        sort_col > last_value,
+                        and_(sort_col == last_value, AnalysisResult.result_id > last_id),
+                    )
+                )
+
+        if descending:
+            query = query.order_by(sort_col.desc(), AnalysisResult.result_id.desc())
+        else:
+            query = query.order_by(sort_col.asc(), AnalysisResult.result_id.asc())
+
+        rows = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            last_value = (last.filename or "") if sort_by == "fileName" else last.analysis_date
+            next_cursor = _encode_cursor(sort_by, last_value, last.result_id)
+        return rows, next_cursor
+
+    def backfill_summaries(self, result_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Compute and store summaries for finished rows created before summaries existed."""
+        from backend.services.results.formatting.summary import build_analysis_summary
+
+        summaries: Dict[int, Dict[str, Any]] = {}
+        if not result_ids:
+            return summaries
+        rows = (
+            self.db.query(AnalysisResult)
+            .filter(AnalysisResult.result_id.in_(result_ids))
+            .all()
+        )
+        for row in rows:
+            results = row.results
+            if isinstance(results, str):
+                try:
+                    results = json.loads(results)
+                except (json.JSONDecodeError, TypeError):
+                    results = {}
+            row.summary = build_analysis_summary(results, row.status)
+            summaries[row.result_id] = row.summary
+        self.db.commit()
+        return summaries
+
+
+def _encode_cursor(sort_by: str, value: Any, result_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort_by, value, result_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, int]:
+    try:
+        cursor_sort, value, result_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        if cursor_sort != sort_by:
+            raise ValueError("cursor was issued for a different sort order")
+        if sort_by == "createdAt":
+            value = datetime.fromisoformat(value)
+        return value, int(result_id)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
 
 
 class PersonaRepository:
@@ -667,18 +667,20 @@ class ResultsService:
                 else:
                     query = query.order_by(InterviewData.filename.desc())
 
-            # Execute query
-            analysis_results = query.all()
+            # Execute query; the filename comes from the ownership join
+            analysis_results = query.add_columns(InterviewData.filename).all()
 
             # Format the results
             formatted_results = []
-            for result in analysis_results:
+            for result, filename in analysis_results:
                 # Skip results with no data
                 if not result:
                     continue
 
                 # Format data to match frontend schema
-                formatted_result = self._format_analysis_list_item(result)
+                formatted_result = self._format_analysis_list_item(
+                    result, filename=filename or "Unknown"
+                )
                 formatted_results.append(formatted_result)
 
             logger.info(
@@ -695,6 +697,65 @@ class ResultsService:
                 status_code=500, detail=f"Internal server error: {str(e)}"
             )
 
+    def list_analyses_page(
+        self,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[Literal["asc", "desc"]] = "desc",
+        status: Optional[Literal["pending", "completed", "failed"]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieve one page of the current user's analyses for the history list.
+
+        Only list columns, the stored summary and the joined filename are read;
+        the results JSON is not loaded.
+
+        Args:
+            sort_by: Field to sort by (createdAt, fileName)
+            sort_direction: Sort direction (asc, desc)
+            status: Filter by status
+            limit: Page size
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Dict with ``items``, ``next_cursor`` and ``has_more``
+
+        Raises:
+            HTTPException: 400 for a malformed cursor
+        """
+        from backend.services.results.presenters import ResultsPresenter
+        from backend.services.results.query import AnalysisResultQuery
+
+        # Failed analyses are stored as "failed" or, by older code paths, "error"
+        db_statuses = {
+            "pending": ("processing",),
+            "failed": ("failed", "error"),
+        }.get(status, (status,) if status else None)
+        try:
+            items, next_cursor = AnalysisResultQuery(self.db).list_owned_results_page(
+                user_id=self.user.user_id,
+                sort_by=sort_by or "createdAt",
+                sort_direction=sort_direction or "desc",
+                statuses=db_statuses,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {str(e)}")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error retrieving analyses page: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Internal server error: {str(e)}"
+            )
+
+        return {
+            "items": [ResultsPresenter.to_api_list_item(item) for item in items],
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+
     def _ensure_personas_present(
         self, results_dict: Dict[str, Any], result_id: int
     ) -> None:
@@ -742,12 +803,15 @@ class ResultsService:
                 return interview_data.filename or "Unknown"
         return "Unknown"
 
-    def _format_analysis_list_item(self, result: "AnalysisResult") -> Dict[str, Any]:
+    def _format_analysis_list_item(
+        self, result: "AnalysisResult", filename: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Format a single analysis result for the list view.
 
         Args:
             result: AnalysisResult database record
+            filename: Filename from the query join; looked up when omitted
 
         Returns:
             Formatted result for API response
@@ -755,11 +819,14 @@ class ResultsService:
         # Format data to match frontend schema
         from backend.services.results.formatters import get_filename_for_data_id
 
+        if filename is None:
+            filename = get_filename_for_data_id(self.db, result.data_id)
+
         formatted_result = {
             "id": str(result.result_id),
             "status": result.status,
             "createdAt": format_iso_utc(result.analysis_date),
-            "fileName": get_filename_for_data_id(self.db, result.data_id),
+            "fileName": filename,
             "fileSize": None,  # We don't store this currently
             "themes": [],
             "enhanced_themes": [],  # Initialize empty enhanced themes list
@@ -5,6 +5,7 @@ from typing import List, Dict, Any
 from pydantic_ai import Agent
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
+from backend.services.llm.concurrency_governor import governed_model
 
 # Schema types used by Agents
 from backend.schemas import (
@@ -33,7 +34,7 @@ class StakeholderAgentFactory:
         # Prefer models/gemini-3-flash-preview for speed and quality balance
         model_name = os.getenv("STAKEHOLDER_GEMINI_MODEL", "models/gemini-3-flash-preview")
         provider = GoogleProvider(api_key=api_key)
-        self.gemini_model = GoogleModel(model_name, provider=provider)
+        self.gemini_model = governed_model(GoogleModel(model_name, provider=provider))
         self._agent_cache: Dict[str, Agent] = {}
         logger.info(
             f"[AGENT_FACTORY] Initialized StakeholderAgentFactory with model {model_name}"
@@ -41,6 +41,7 @@ class InfluenceMetricsCalculator:
             from pydantic_ai import Agent, ModelSettings
             from pydantic_ai.models.google import GoogleModel
             from pydantic_ai.providers.google import GoogleProvider
+            from backend.services.llm.concurrency_governor import governed_model
 
             api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
             if not api_key:
@@ -50,7 +51,9 @@ class InfluenceMetricsCalculator:
             provider = GoogleProvider(api_key=api_key)
             # Create cross-stakeholder patterns agent
             self.patterns_agent = Agent(
-                model=GoogleModel("models/gemini-3-flash-preview", provider=provider),
+                model=governed_model(
+                    GoogleModel("models/gemini-3-flash-preview", provider=provider)
+                ),
                 system_prompt=self._get_patterns_analysis_prompt(),
                 model_settings=ModelSettings(timeout=300),
                 temperature=0,
@@ -51,6 +51,7 @@ class StakeholderReportAssembler:
             from pydantic_ai import Agent
             from pydantic_ai.models.google import GoogleModel
             from pydantic_ai.providers.google import GoogleProvider
+            from backend.services.llm.concurrency_governor import governed_model
 
             api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
             if not api_key:
@@ -69,7 +70,9 @@ class StakeholderReportAssembler:
             provider = GoogleProvider(api_key=api_key)
             # Create multi-stakeholder summary agent
             self.summary_agent = Agent(
-                model=GoogleModel("models/gemini-3-flash-preview", provider=provider),
+                model=governed_model(
+                    GoogleModel("models/gemini-3-flash-preview", provider=provider)
+                ),
                 output_type=SummaryLLMOutput,
                 system_prompt=self._get_summary_generation_prompt(),
                 **extra_kwargs,
@@ -59,6 +59,7 @@ class StakeholderThemeAnalyzer:
             from pydantic_ai import Agent, ModelSettings
             from pydantic_ai.models.google import GoogleModel
             from pydantic_ai.providers.google import GoogleProvider
+            from backend.services.llm.concurrency_governor import governed_model
 
             api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
             if not api_key:
@@ -68,7 +69,9 @@ class StakeholderThemeAnalyzer:
             provider = GoogleProvider(api_key=api_key)
             # Create theme attribution agent
             self.theme_agent = Agent(
-                model=GoogleModel("models/gemini-3-flash-preview", provider=provider),
+                model=governed_model(
+                    GoogleModel("models/gemini-3-flash-preview", provider=provider)
+                ),
                 output_type=ThemeAttributionModel,
                 system_prompt=self._get_theme_attribution_prompt(),
                 model_settings=ModelSettings(timeout=300),
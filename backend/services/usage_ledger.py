@@ -0,0 +1,309 @@
+"""
+Atomic usage counters with cached reads and debounced metadata sync.
+
+Usage used to live in the ``User.usage_data`` JSON blob: every tracked
+analysis loaded the blob, bumped a counter, wrote the whole blob back and then
+awaited a Clerk metadata update inline. Two analyses of one user racing each
+other lost an increment, and every limit check re-parsed the blob.
+
+``UsageLedger`` replaces that with:
+
+- one ``usage_counters`` row per user, month and metric, incremented by a
+  single upsert (``count = count + 1``) so concurrent increments never collide
+- a short-TTL in-process cache in front of counter reads, updated in place by
+  increments from this process, so limit checks rarely touch the database
+- a debounced background flush of usage to external metadata: bursts of
+  increments for one user collapse into one update with the latest counts
+
+Counters are seeded from the legacy JSON counts on their first increment, so
+usage recorded before the ledger existed still counts toward the limits.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from backend.infrastructure.config.settings import settings
+from backend.utils.timezone_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("analyses_count", "prd_generations_count")
+
+# Users whose monthly usage is kept in the read cache
+USAGE_CACHE_SIZE = 4096
+
+MonthUsage = Dict[str, int]
+UsageSync = Callable[[str, MonthUsage], Awaitable[Any]]
+
+
+def current_period() -> str:
+    """Usage period of the current UTC month, e.g. ``2025-11``."""
+    return datetime.now(timezone.utc).strftime("%Y-%m")
+
+
+class UsageLedger:
+    """
+    Monthly per-user usage counters.
+
+    Args:
+        cache_ttl: Seconds a cached usage read stays valid
+        sync_debounce: Seconds to wait for more increments before syncing
+    """
+
+    def __init__(
+        self,
+        cache_ttl: Optional[float] = None,
+        sync_debounce: Optional[float] = None,
+    ):
+        self.cache_ttl = (
+            cache_ttl if cache_ttl is not None else settings.usage_cache_ttl_seconds
+        )
+        self.sync_debounce = (
+            sync_debounce
+            if sync_debounce is not None
+            else settings.usage_sync_debounce_seconds
+        )
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, MonthUsage]]" = (
+            OrderedDict()
+        )
+        self._pending_sync: Dict[str, Tuple[MonthUsage, UsageSync]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self.reads = 0
+        self.syncs = 0
+
+    def get_month_usage(
+        self,
+        db: Session,
+        user_id: str,
+        legacy: Optional[Callable[[], MonthUsage]] = None,
+        period: Optional[str] = None,
+    ) -> MonthUsage:
+        """
+        Usage of a user in a month, served from the cache when fresh.
+
+        Args:
+            db: Session used on a cache miss
+            user_id: User to read
+            legacy: Returns the legacy JSON counts, used for metrics that have
+                no counter row yet; only called on a cache miss
+            period: Month to read, defaults to the current one
+
+        Returns:
+            Count per metric
+        """
+        period = period or current_period()
+        key = (user_id, period)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return dict(cached[1])
+
+        self.reads += 1
+        rows = db.execute(
+            select(self._model.metric, self._model.count).where(
+                self._model.user_id == user_id, self._model.period == period
+            )
+        ).all()
+        usage = {metric: 0 for metric in METRICS}
+        missing = set(METRICS) - {metric for metric, _ in rows}
+        if missing and legacy is not None:
+            legacy_usage = legacy()
+            for metric in missing:
+                usage[metric] = int(legacy_usage.get(metric, 0) or 0)
+        for metric, count in rows:
+            usage[metric] = count
+        self._remember(key, usage)
+        return dict(usage)
+
+    def increment(
+        self,
+        db: Session,
+        user_id: str,
+        metric: str,
+        seed: int = 0,
+        period: Optional[str] = None,
+    ) -> int:
+        """
+        Atomically add one to a counter and commit.
+
+        Args:
+            db: Session the increment is executed and committed in
+            user_id: User whose usage grows
+            metric: One of ``METRICS``
+            seed: Count the counter starts from when it does not exist yet
+            period: Month to count in, defaults to the current one
+
+        Returns:
+            The new count
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown usage metric '{metric}'")
+        period = period or current_period()
+        now = utc_now()
+        table = self._model.__table__
+        dialect = db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            statement = (
+                insert(table)
+                .values(
+                    user_id=user_id,
+                    period=period,
+                    metric=metric,
+                    count=seed + 1,
+                    updated_at=now,
+                )
+                .on_conflict_do_update(
+                    index_elements=["user_id", "period", "metric"],
+                    set_={"count": table.c.count + 1, "updated_at": now},
+                )
+                .returning(table.c.count)
+            )
+            count = db.execute(statement).scalar_one()
+        else:
+            count = self._increment_generic(db, user_id, period, metric, seed, now)
+        db.commit()
+
+        key = (user_id, period)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Keep this process's view exact without another read
+            cached[1][metric] = count
+        return count
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop cached usage of a user, e.g. after an external reset."""
+        for key in [k for k in self._cache if k[0] == user_id]:
+            del self._cache[key]
+
+    def schedule_sync(self, user_id: str, usage: MonthUsage, sync: UsageSync) -> None:
+        """
+        Push usage to external metadata after the debounce interval.
+
+        Later calls for the same user before the flush replace the pending
+        usage, so a burst of increments results in one update.
+        """
+        self._pending_sync[user_id] = (dict(usage), sync)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync caller): sent by the next flush or at shutdown
+            return
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_after_debounce())
+
+    async def flush_sync(self) -> int:
+        """
+        Send all pending metadata updates now.
+
+        Returns:
+            Number of users synced
+        """
+        pending, self._pending_sync = self._pending_sync, {}
+        for user_id, (usage, sync) in pending.items():
+            try:
+                await sync(user_id, usage)
+                self.syncs += 1
+            except Exception as e:
+                logger.warning(f"Error syncing usage of user {user_id}: {str(e)}")
+        return len(pending)
+
+    async def stop(self) -> None:
+        """Cancel the pending debounce and flush what is left."""
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+        self._flusher = None
+        await self.flush_sync()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache and sync counters for monitoring."""
+        return {
+            "cached_users": len(self._cache),
+            "reads": self.reads,
+            "pending_syncs": len(self._pending_sync),
+            "syncs": self.syncs,
+        }
+
+    @property
+    def _model(self):
+        from backend.models import UsageCounter
+
+        return UsageCounter
+
+    def _remember(self, key: Tuple[str, str], usage: MonthUsage) -> None:
+        self._cache[key] = (time.monotonic() + self.cache_ttl, usage)
+        self._cache.move_to_end(key)
+        while len(self._cache) > USAGE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _increment_generic(
+        self,
+        db: Session,
+        user_id: str,
+        period: str,
+        metric: str,
+        seed: int,
+        now: datetime,
+    ) -> int:
+        """Increment on databases without ``ON CONFLICT``: update, else insert."""
+        from sqlalchemy.exc import IntegrityError
+
+        model = self._model
+        match = (
+            model.user_id == user_id,
+            model.period == period,
+            model.metric == metric,
+        )
+        for _ in range(2):
+            result = db.execute(
+                update(model)
+                .where(*match)
+                .values(count=model.count + 1, updated_at=now)
+            )
+            if result.rowcount:
+                return db.execute(select(model.count).where(*match)).scalar_one()
+            try:
+                with db.begin_nested():
+                    db.add(
+                        model(
+                            user_id=user_id,
+                            period=period,
+                            metric=metric,
+                            count=seed + 1,
+                            updated_at=now,
+                        )
+                    )
+                return seed + 1
+            except IntegrityError:
+                # Another writer created the row first; update it instead
+                continue
+        raise RuntimeError(f"Could not increment usage counter {metric}")
+
+    async def _flush_after_debounce(self) -> None:
+        while self._pending_sync:
+            await asyncio.sleep(self.sync_debounce)
+            await self.flush_sync()
+
+
+_usage_ledger: Optional[UsageLedger] = None
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Return the process-wide usage ledger, creating it on first use."""
+    global _usage_ledger
+    if _usage_ledger is None:
+        _usage_ledger = UsageLedger()
+    return _usage_ledger
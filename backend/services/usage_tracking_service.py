@@ -2,11 +2,12 @@
 Usage Tracking Service for monitoring and enforcing subscription limits.
 """
 
-from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import logging
 
+from backend.services.usage_ledger import current_period, get_usage_ledger
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -139,10 +140,23 @@ class UsageTrackingService:
         """
         Get the current month's usage statistics.
 
+        Counts come from the usage ledger through its short-TTL cache; months
+        tracked before the ledger existed fall back to ``usage_data``.
+
         Returns:
             Dict with analyses_count and prd_generations_count
         """
-        current_month = datetime.now(timezone.utc).strftime("%Y-%m")
+        try:
+            return get_usage_ledger().get_month_usage(
+                self.db, self.user.user_id, legacy=self._legacy_month_usage
+            )
+        except Exception as e:
+            logger.error(f"Error reading usage ledger: {str(e)}")
+            return self._legacy_month_usage()
+
+    def _legacy_month_usage(self) -> Dict[str, int]:
+        """Current month's counts as recorded in the ``usage_data`` JSON."""
+        current_month = current_period()
 
         # Check if usage_data exists
         if not self.user.usage_data:
@@ -309,91 +323,9 @@ class UsageTrackingService:
         Returns:
             Current analysis count for the month
         """
-        try:
-            # Initialize usage_data if not exists
-            if not self.user.usage_data:
-                self.user.usage_data = {}
-
-            # Ensure usage_data is a dictionary
-            if not isinstance(self.user.usage_data, dict):
-                logger.warning(
-                    f"User {self.user.user_id} has invalid usage_data type: {type(self.user.usage_data)}. Resetting to empty dict."
-                )
-                self.user.usage_data = {}
-
-            # Get current month and year for tracking
-            current_month = datetime.now(timezone.utc).strftime("%Y-%m")
-
-            # Initialize usage tracking if not exists
-            if "usage" not in self.user.usage_data:
-                self.user.usage_data["usage"] = {}
-
-            if current_month not in self.user.usage_data["usage"]:
-                self.user.usage_data["usage"][current_month] = {
-                    "analyses_count": 0,
-                    "prd_generations_count": 0,
-                    "analyses": [],
-                    "prd_generations": [],
-                }
-
-            # Increment analysis count and add to list
-            self.user.usage_data["usage"][current_month]["analyses_count"] += 1
-            self.user.usage_data["usage"][current_month]["analyses"].append(
-                {
-                    "analysis_id": analysis_id,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-
-            # CRITICAL: Mark the JSON field as modified so SQLAlchemy detects the change
-            from sqlalchemy.orm.attributes import flag_modified
-
-            flag_modified(self.user, "usage_data")
-
-            # Update user in database
-            self.db.commit()
-
-            # Update Clerk metadata with current usage
-            try:
-                # Check if CLERK_SECRET_KEY is configured
-                if not self.clerk_service.clerk_secret:
-                    logger.warning(
-                        "Skipping Clerk metadata update: CLERK_SECRET_KEY not configured"
-                    )
-                else:
-                    # Create a simplified usage object for Clerk
-                    usage_data = {
-                        "analyses_count": self.user.usage_data["usage"][current_month][
-                            "analyses_count"
-                        ],
-                        "prd_generations_count": self.user.usage_data["usage"][
-                            current_month
-                        ]["prd_generations_count"],
-                    }
-
-                    # Update Clerk metadata
-                    await self.clerk_service.update_user_metadata(
-                        self.user.user_id, {"publicMetadata": {"usage": usage_data}}
-                    )
-            except Exception as clerk_error:
-                logger.warning(f"Error updating Clerk metadata: {str(clerk_error)}")
-                # Continue even if Clerk update fails
-
-            logger.info(f"Tracked analysis {analysis_id} for user {self.user.user_id}")
-            return self.user.usage_data["usage"][current_month]["analyses_count"]
-
-        except Exception as e:
-            logger.error(f"Error tracking analysis: {str(e)}")
-            try:
-                self.db.rollback()
-            except Exception as rollback_error:
-                logger.error(f"Error during rollback: {str(rollback_error)}")
-
-            # Return current count or 0 if we can't determine it
-            try:
-                return self.user.usage_data["usage"][current_month]["analyses_count"]
-            except (KeyError, TypeError):
-                return 0
+        count = self._track("analyses_count")
+        logger.info(f"Tracked analysis {analysis_id} for user {self.user.user_id}")
+        return count
 
     async def track_prd_generation(self, result_id: int) -> int:
         """
@@ -405,92 +337,48 @@ class UsageTrackingService:
         Returns:
             Current PRD generation count for the month
         """
-        try:
-            # Initialize usage_data if not exists
-            if not self.user.usage_data:
-                self.user.usage_data = {}
-
-            # Ensure usage_data is a dictionary
-            if not isinstance(self.user.usage_data, dict):
-                logger.warning(
-                    f"User {self.user.user_id} has invalid usage_data type: {type(self.user.usage_data)}. Resetting to empty dict."
-                )
-                self.user.usage_data = {}
-
-            # Get current month and year for tracking
-            current_month = datetime.now(timezone.utc).strftime("%Y-%m")
-
-            # Initialize usage tracking if not exists
-            if "usage" not in self.user.usage_data:
-                self.user.usage_data["usage"] = {}
-
-            if current_month not in self.user.usage_data["usage"]:
-                self.user.usage_data["usage"][current_month] = {
-                    "analyses_count": 0,
-                    "prd_generations_count": 0,
-                    "analyses": [],
-                    "prd_generations": [],
-                }
+        count = self._track("prd_generations_count")
+        logger.info(f"Tracked PRD generation {result_id} for user {self.user.user_id}")
+        return count
 
-            # Increment PRD generation count and add to list
-            self.user.usage_data["usage"][current_month]["prd_generations_count"] += 1
-            self.user.usage_data["usage"][current_month]["prd_generations"].append(
-                {
-                    "result_id": result_id,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-
-            # CRITICAL: Mark the JSON field as modified so SQLAlchemy detects the change
-            from sqlalchemy.orm.attributes import flag_modified
-
-            flag_modified(self.user, "usage_data")
-
-            # Update user in database
-            self.db.commit()
-
-            # Update Clerk metadata with current usage
-            try:
-                # Check if CLERK_SECRET_KEY is configured
-                if not self.clerk_service.clerk_secret:
-                    logger.warning(
-                        "Skipping Clerk metadata update: CLERK_SECRET_KEY not configured"
-                    )
-                else:
-                    # Create a simplified usage object for Clerk
-                    usage_data = {
-                        "analyses_count": self.user.usage_data["usage"][current_month][
-                            "analyses_count"
-                        ],
-                        "prd_generations_count": self.user.usage_data["usage"][
-                            current_month
-                        ]["prd_generations_count"],
-                    }
-
-                    # Update Clerk metadata
-                    await self.clerk_service.update_user_metadata(
-                        self.user.user_id, {"publicMetadata": {"usage": usage_data}}
-                    )
-            except Exception as clerk_error:
-                logger.warning(f"Error updating Clerk metadata: {str(clerk_error)}")
-                # Continue even if Clerk update fails
+    def _track(self, metric: str) -> int:
+        """
+        Increment a usage counter and schedule the Clerk metadata update.
 
-            logger.info(
-                f"Tracked PRD generation {result_id} for user {self.user.user_id}"
+        Returns:
+            The new count, or the last known count if the increment failed
+        """
+        ledger = get_usage_ledger()
+        try:
+            legacy = self._legacy_month_usage()
+            count = ledger.increment(
+                self.db, self.user.user_id, metric, seed=legacy.get(metric, 0)
             )
-            return self.user.usage_data["usage"][current_month]["prd_generations_count"]
-
         except Exception as e:
-            logger.error(f"Error tracking PRD generation: {str(e)}")
+            logger.error(f"Error tracking {metric}: {str(e)}")
             try:
                 self.db.rollback()
             except Exception as rollback_error:
                 logger.error(f"Error during rollback: {str(rollback_error)}")
+            return self._legacy_month_usage().get(metric, 0)
 
-            # Return current count or 0 if we can't determine it
-            try:
-                return self.user.usage_data["usage"][current_month][
-                    "prd_generations_count"
-                ]
-            except (KeyError, TypeError):
-                return 0
+        try:
+            usage = ledger.get_month_usage(
+                self.db, self.user.user_id, legacy=self._legacy_month_usage
+            )
+            ledger.schedule_sync(self.user.user_id, usage, self._sync_clerk_usage)
+        except Exception as e:
+            logger.warning(f"Error scheduling usage metadata sync: {str(e)}")
+        return count
+
+    async def _sync_clerk_usage(self, user_id: str, usage: Dict[str, int]) -> None:
+        """Update Clerk metadata with the user's current usage."""
+        # Check if CLERK_SECRET_KEY is configured
+        if not getattr(self.clerk_service, "clerk_secret", None):
+            logger.warning(
+                "Skipping Clerk metadata update: CLERK_SECRET_KEY not configured"
+            )
+            return
+        await self.clerk_service.update_user_metadata(
+            user_id, {"publicMetadata": {"usage": usage}}
+        )
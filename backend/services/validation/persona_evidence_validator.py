@@ -14,11 +14,42 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
-import re
+
+from backend.services.validation.quote_locator import (
+    QuoteLocation,
+    QuoteLocator,
+    normalize_text,
+)
+from backend.utils.lexicon import get_lexicon
 
 # Types
 StructuredTranscript = List[Dict[str, str]]  # [{speaker, dialogue}]
 
+# Label keys marking metadata lines, found anywhere before the colon
+_META_KEYS_LEXICON = get_lexicon(
+    (
+        "primary stakeholder category",
+        "stakeholder category",
+        "category",
+        "role",
+        "age",
+        "gender",
+        "location",
+        "department",
+        "participant details",
+        "interviewee",
+        "interviewer",
+    ),
+    whole_words=False,
+)
+
+# Fuzzy token-overlap matches are reported as normalized
+_MATCH_TYPES = {
+    "verbatim": "verbatim",
+    "normalized": "normalized",
+    "fuzzy": "normalized",
+}
+
 
 @dataclass
 class EvidenceMatch:
@@ -27,13 +58,17 @@ class EvidenceMatch:
     start_char: Optional[int]
     end_char: Optional[int]
     speaker: Optional[str]
+    document_id: Optional[str] = None
 
 
 class PersonaEvidenceValidator:
     """Validator for persona evidence items against source text/transcript."""
 
+    _MAX_CACHED_LOCATORS = 8
+
     def __init__(self, normalization: bool = True):
         self.normalization = normalization
+        self._locators: Dict[int, Tuple[Any, QuoteLocator]] = {}
 
     @staticmethod
     def _looks_like_metadata_line(q: str) -> bool:
@@ -42,20 +77,7 @@ class PersonaEvidenceValidator:
         s = str(q).strip()
         if ":" in s:
             prefix = s.split(":", 1)[0].strip().lower()
-            meta_keys = {
-                "primary stakeholder category",
-                "stakeholder category",
-                "category",
-                "role",
-                "age",
-                "gender",
-                "location",
-                "department",
-                "participant details",
-                "interviewee",
-                "interviewer",
-            }
-            return any(k in prefix for k in meta_keys)
+            return _META_KEYS_LEXICON.search(prefix)
         return False
 
     @staticmethod
@@ -100,73 +122,30 @@ class PersonaEvidenceValidator:
 
     @staticmethod
     def _normalize(text: str) -> str:
-        t = text or ""
-        # Lowercase early for consistent comparisons
-        t = t.lower().strip()
-
-        # Remove leading bracketed timestamps like "[12:40]" (simple, non-regex)
-        # Do it repeatedly in case of stacked prefixes
-        def strip_leading_timestamp(s: str) -> str:
-            s = s.lstrip()
-            while s.startswith("["):
-                close = s.find("]")
-                if 0 < close <= 8:
-                    inside = s[1:close]
-                    parts = inside.split(":")
-                    if (
-                        len(parts) == 2
-                        and all(p.isdigit() for p in parts)
-                        and len(parts[1]) in (2,)
-                    ):
-                        s = s[close + 1 :].lstrip()
-                        continue
-                break
-            return s
-
-        t = strip_leading_timestamp(t)
-
-        # Strip common speaker labels at the start (no heavy regex)
-        labels = [
-            "researcher",
-            "interviewer",
-            "moderator",
-            "interviewee",
-            "participant",
-            "speaker",
-            "user",
-            "customer",
-            "stakeholder",
-        ]
-
-        def strip_leading_label(s: str) -> str:
-            s0 = s.lstrip()
-            for lbl in labels:
-                if s0.startswith(lbl + ":"):
-                    return s0[len(lbl) + 1 :].lstrip()
-                if s0.startswith(lbl + " -"):
-                    return s0[len(lbl) + 2 :].lstrip()
-            return s0
-
-        t = strip_leading_label(t)
-
-        # Normalize smart quotes/apostrophes
-        t = t.replace("\u201c", '"').replace("\u201d", '"').replace("\u2019", "'")
-        # Normalize dashes and ellipsis
-        t = t.replace("\u2013", "-").replace("\u2014", "-").replace("\u2026", "...")
-        # Remove zero-width and non-breaking spaces
-        t = t.replace("\u200b", "").replace("\u00a0", " ")
-        # Collapse whitespace
-        t = re.sub(r"[\s\n\r\t]+", " ", t).strip()
-        # Light punctuation normalization: remove surrounding quotes/brackets
-        t = t.strip("\"'“”‘’[]()")
-        return t
-
-    def _fuzzy_contains(self, src: str, q: str) -> bool:
-        a = self._normalize(src)
-        b = self._normalize(q)
-        at = set(a.split())
-        bt = set(b.split())
-        return len(bt) >= 2 and len(at & bt) / max(1, len(bt)) >= 0.25
+        return normalize_text(text)
+
+    def _locator_for(self, source: Any) -> QuoteLocator:
+        """Quote index for a source text or transcript, built once per object."""
+        cached = self._locators.get(id(source))
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        if isinstance(source, str):
+            locator = QuoteLocator([(None, None, source)])
+        else:
+            locator = QuoteLocator.from_transcript(source)
+        if len(self._locators) >= self._MAX_CACHED_LOCATORS:
+            self._locators.clear()
+        # Keep the source alive so its id cannot be reused while cached
+        self._locators[id(source)] = (source, locator)
+        return locator
+
+    def _locate(self, source: Any, quote: str) -> Optional[QuoteLocation]:
+        location = self._locator_for(source).locate(quote)
+        if location is None:
+            return None
+        if location.match_type != "verbatim" and not self.normalization:
+            return None
+        return location
 
     def _find_in_text(
         self, source: str, quote: str
@@ -174,39 +153,33 @@ class PersonaEvidenceValidator:
         """Try exact and normalized matching against a single source string."""
         if not source or not quote:
             return ("no_match", None, None)
-        # Exact match
-        idx = source.find(quote)
-        if idx != -1:
-            return ("verbatim", idx, idx + len(quote))
-        # Normalized match
-        if self.normalization:
-            norm_src = self._normalize(source)
-            norm_quote = self._normalize(quote)
-            idx = norm_src.find(norm_quote)
-            if idx != -1:
-                # Best-effort: cannot easily map back to original offsets; leave None
-                return ("normalized", None, None)
-            # Fuzzy token overlap as last resort
-            if self._fuzzy_contains(source, quote):
-                return ("normalized", None, None)
-        return ("no_match", None, None)
+        location = self._locate(source, quote)
+        if location is None:
+            return ("no_match", None, None)
+        return (
+            _MATCH_TYPES[location.match_type],
+            location.start_char,
+            location.end_char,
+        )
 
     def _find_in_transcript(
         self, transcript: StructuredTranscript, quote: str
     ) -> Tuple[str, Optional[int], Optional[int], Optional[str]]:
-        """Search each segment's dialogue; return match type and speaker when found."""
-        global_offset = 0
-        for seg in transcript:
-            dialogue = seg.get("dialogue", "")
-            speaker = seg.get("speaker")
-            mtype, s, e = self._find_in_text(dialogue, quote)
-            if mtype != "no_match":
-                # Map offsets to transcript-level by accumulating if needed
-                if s is not None and e is not None:
-                    return (mtype, global_offset + s, global_offset + e, speaker)
-                return (mtype, None, None, speaker)
-            global_offset += len(dialogue) + 1  # +1 for separator
-        return ("no_match", None, None, None)
+        """Search the transcript; return match type, offsets and speaker when found.
+
+        Verbatim matches anywhere win over normalized ones, which win over
+        fuzzy token overlap. Offsets are transcript-level (segments joined by
+        a single separator).
+        """
+        location = self._locate(transcript, quote) if quote else None
+        if location is None:
+            return ("no_match", None, None, None)
+        return (
+            _MATCH_TYPES[location.match_type],
+            location.start_char,
+            location.end_char,
+            location.speaker,
+        )
 
     def match_evidence(
         self,
@@ -255,13 +228,27 @@ class PersonaEvidenceValidator:
                 )
                 continue
             if transcript:
+                source: Any = transcript
                 mtype, s, e, sp = self._find_in_transcript(transcript, quote)
             else:
-                mtype, s, e = self._find_in_text(source_text or "", quote)
+                source = source_text or ""
+                mtype, s, e = self._find_in_text(source, quote)
                 sp = item.get("speaker")
+            doc_id = None
+            if mtype != "no_match":
+                # Cached by the locator; segments may carry their own document
+                location = self._locate(source, quote)
+                doc_id = (location and location.document_id) or item.get(
+                    "document_id"
+                )
             matches.append(
                 EvidenceMatch(
-                    index=index, match_type=mtype, start_char=s, end_char=e, speaker=sp
+                    index=index,
+                    match_type=mtype,
+                    start_char=s,
+                    end_char=e,
+                    speaker=sp,
+                    document_id=doc_id,
                 )
             )
         return matches
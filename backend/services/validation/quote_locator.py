@@ -0,0 +1,361 @@
+"""
+Precomputed quote index over a transcript or a set of documents.
+
+Evidence validation and theme attribution look up many short quotes in the
+same long source. ``QuoteLocator`` normalizes every segment once and joins the
+segments into a single corpus, so each distinct quote costs one substring
+search over the whole source instead of a normalize-and-search per segment.
+Matches report the segment's document_id and speaker, and offsets in the
+original text, including for matches found only after normalization.
+
+Quotes are resolved in order of strength:
+
+- verbatim: the quote occurs as-is in a segment
+- normalized: it occurs after ``normalize_text`` (case, timestamps, speaker
+  labels, typographic quotes and whitespace)
+- fuzzy: enough of its tokens occur in one segment; no offsets
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+_SPEAKER_LABELS = (
+    "researcher",
+    "interviewer",
+    "moderator",
+    "interviewee",
+    "participant",
+    "speaker",
+    "user",
+    "customer",
+    "stakeholder",
+)
+# Typographic characters folded to ASCII (a missing value drops the character)
+_CHAR_REPLACEMENTS = {
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2019": "'",
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2026": "...",
+    "\u200b": "",
+    "\u00a0": " ",
+}
+_WHITESPACE_RE = re.compile(r"[\s\n\r\t]+")
+# Whitespace runs other than a single space
+_IRREGULAR_WHITESPACE_RE = re.compile(r"\s*[^\S ]\s*|\s{2,}")
+_SURROUNDING_CHARS = "\"'“”‘’[]()"
+
+# Fuzzy matches need this many quote tokens and this share of them in a segment
+FUZZY_MIN_TOKENS = 2
+FUZZY_MIN_OVERLAP = 0.25
+
+# Source segment: (document_id, speaker, text)
+Segment = Tuple[Optional[str], Optional[str], str]
+
+
+def _strip_leading_timestamp(s: str) -> str:
+    """Remove stacked leading "[mm:ss]" timestamps."""
+    s = s.lstrip()
+    while s.startswith("["):
+        close = s.find("]")
+        if 0 < close <= 8:
+            parts = s[1:close].split(":")
+            if (
+                len(parts) == 2
+                and all(p.isdigit() for p in parts)
+                and len(parts[1]) == 2
+            ):
+                s = s[close + 1 :].lstrip()
+                continue
+        break
+    return s
+
+
+def _strip_leading_label(s: str) -> str:
+    """Remove a leading speaker label such as "interviewee:"."""
+    s = s.lstrip()
+    for label in _SPEAKER_LABELS:
+        if s.startswith(label + ":"):
+            return s[len(label) + 1 :].lstrip()
+        if s.startswith(label + " -"):
+            return s[len(label) + 2 :].lstrip()
+    return s
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a quote or source text for tolerant matching."""
+    t = (text or "").lower().strip()
+    t = _strip_leading_timestamp(t)
+    t = _strip_leading_label(t)
+    for char, replacement in _CHAR_REPLACEMENTS.items():
+        t = t.replace(char, replacement)
+    t = _WHITESPACE_RE.sub(" ", t).strip()
+    return t.strip(_SURROUNDING_CHARS)
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    Normalize like ``normalize_text`` and map every output character back.
+
+    Returns the normalized text and, for each of its characters, the index of
+    the character of ``text`` it came from.
+    """
+    text = text or ""
+    t = text.lower()
+    offsets = list(range(len(text)))
+    if len(t) != len(text):
+        # Some characters lowercase to several; map them one by one
+        chars: List[str] = []
+        offsets = []
+        for i, char in enumerate(text):
+            lowered = char.lower()
+            chars.append(lowered)
+            offsets.extend([i] * len(lowered))
+        t = "".join(chars)
+
+    def keep(start: int, end: int) -> None:
+        nonlocal t, offsets
+        t = t[start:end]
+        offsets = offsets[start:end]
+
+    keep(len(t) - len(t.lstrip()), len(t.rstrip()))
+    # Prefix stripping returns a suffix, so drop the same number of characters
+    keep(len(t) - len(_strip_leading_timestamp(t)), len(t))
+    keep(len(t) - len(_strip_leading_label(t)), len(t))
+
+    if any(char in t for char in _CHAR_REPLACEMENTS):
+        chars, mapped = [], []
+        for char, offset in zip(t, offsets):
+            replacement = _CHAR_REPLACEMENTS.get(char, char)
+            chars.append(replacement)
+            mapped.extend([offset] * len(replacement))
+        t, offsets = "".join(chars), mapped
+
+    chars, mapped = [], []
+    pos = 0
+    # Single spaces are already collapsed; only rewrite the other runs
+    for match in _IRREGULAR_WHITESPACE_RE.finditer(t):
+        chars.append(t[pos : match.start()])
+        mapped.extend(offsets[pos : match.start()])
+        chars.append(" ")
+        mapped.append(offsets[match.start()])
+        pos = match.end()
+    chars.append(t[pos:])
+    mapped.extend(offsets[pos:])
+    t, offsets = "".join(chars), mapped
+
+    keep(len(t) - len(t.lstrip()), len(t.rstrip()))
+    keep(
+        len(t) - len(t.lstrip(_SURROUNDING_CHARS)),
+        len(t.rstrip(_SURROUNDING_CHARS)),
+    )
+    return t, offsets
+
+
+def _shingles(tokens: Sequence[str]) -> Set[Tuple[str, str]]:
+    return set(zip(tokens, tokens[1:]))
+
+
+@dataclass
+class QuoteLocation:
+    """Where a quote was found."""
+
+    match_type: str  # "verbatim" | "normalized" | "fuzzy"
+    segment_index: int
+    document_id: Optional[str]
+    speaker: Optional[str]
+    # Offsets in the source, segments joined with "\n"; None for fuzzy matches
+    start_char: Optional[int]
+    end_char: Optional[int]
+
+
+class QuoteLocator:
+    """
+    Locate quotes in a fixed list of source segments.
+
+    Offsets refer to the segment texts joined with a single "\\n", matching
+    how transcripts are flattened elsewhere. Results are cached per quote.
+    """
+
+    def __init__(self, segments: Iterable[Segment]):
+        self._segments: List[Segment] = [
+            (document_id, speaker, text or "")
+            for document_id, speaker, text in segments
+        ]
+        texts = [text for _, _, text in self._segments]
+        self._corpus = "\n".join(texts)
+        self._starts: List[int] = []
+        offset = 0
+        for text in texts:
+            self._starts.append(offset)
+            offset += len(text) + 1
+
+        # normalize_text never emits "\n", so hits cannot span segments
+        normalized = [normalize_text(text) for text in texts]
+        self._normalized_corpus = "\n".join(normalized)
+        self._normalized_starts: List[int] = []
+        offset = 0
+        for text in normalized:
+            self._normalized_starts.append(offset)
+            offset += len(text) + 1
+
+        self._normalized = normalized
+        # Token and word-pair postings, built when a quote first needs them
+        self._token_index: Optional[Dict[str, List[int]]] = None
+        self._shingle_index: Dict[Tuple[str, str], List[int]] = {}
+        self._offset_maps: Dict[int, Optional[List[int]]] = {}
+        self._cache: Dict[str, Optional[QuoteLocation]] = {}
+        self._fuzzy_cache: Dict[str, Optional[QuoteLocation]] = {}
+
+    @classmethod
+    def from_transcript(
+        cls,
+        transcript: Sequence[Dict[str, Any]],
+        document_id: Optional[str] = None,
+    ) -> "QuoteLocator":
+        """Index structured transcript segments ({speaker, dialogue})."""
+        return cls(
+            (
+                seg.get("document_id") or document_id,
+                seg.get("speaker"),
+                seg.get("dialogue") or "",
+            )
+            for seg in transcript
+            if isinstance(seg, dict)
+        )
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Tuple[str, str]]) -> "QuoteLocator":
+        """Index (document_id, text) pairs."""
+        return cls((document_id, None, text) for document_id, text in documents)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def locate(self, quote: str, fuzzy: bool = True) -> Optional[QuoteLocation]:
+        """
+        Find ``quote``; None when no segment matches.
+
+        With ``fuzzy=False`` only verbatim and normalized matches count.
+        """
+        if not quote:
+            return None
+        if quote not in self._cache:
+            self._cache[quote] = self._locate(quote)
+        location = self._cache[quote]
+        if location is None and fuzzy:
+            if quote not in self._fuzzy_cache:
+                normalized_quote = normalize_text(quote)
+                self._fuzzy_cache[quote] = (
+                    self._locate_fuzzy(normalized_quote) if normalized_quote else None
+                )
+            location = self._fuzzy_cache[quote]
+        return location
+
+    def locate_all(self, quotes: Iterable[str]) -> Dict[str, Optional[QuoteLocation]]:
+        """Find every distinct quote."""
+        return {quote: self.locate(quote) for quote in set(quotes)}
+
+    def _locate(self, quote: str) -> Optional[QuoteLocation]:
+        location = self._locate_verbatim(quote)
+        if location is not None:
+            return location
+        normalized_quote = normalize_text(quote)
+        if not normalized_quote:
+            return None
+        return self._locate_normalized(normalized_quote)
+
+    def _location(
+        self, match_type: str, index: int, start: Optional[int], end: Optional[int]
+    ) -> QuoteLocation:
+        document_id, speaker, _ = self._segments[index]
+        return QuoteLocation(match_type, index, document_id, speaker, start, end)
+
+    def _locate_verbatim(self, quote: str) -> Optional[QuoteLocation]:
+        start = self._corpus.find(quote)
+        while start != -1:
+            index = bisect_right(self._starts, start) - 1
+            segment_end = self._starts[index] + len(self._segments[index][2])
+            if start + len(quote) <= segment_end:
+                return self._location("verbatim", index, start, start + len(quote))
+            start = self._corpus.find(quote, start + 1)
+        return None
+
+    def _locate_normalized(self, normalized_quote: str) -> Optional[QuoteLocation]:
+        start = self._normalized_corpus.find(normalized_quote)
+        if start == -1:
+            return None
+        index = bisect_right(self._normalized_starts, start) - 1
+        offsets = self._offset_map(index)
+        if offsets is None:
+            return self._location("normalized", index, None, None)
+        local = start - self._normalized_starts[index]
+        base = self._starts[index]
+        return self._location(
+            "normalized",
+            index,
+            base + offsets[local],
+            base + offsets[local + len(normalized_quote) - 1] + 1,
+        )
+
+    def _offset_map(self, index: int) -> Optional[List[int]]:
+        """Normalized-to-original offsets of a segment, computed on first use."""
+        if index not in self._offset_maps:
+            text = self._segments[index][2]
+            normalized, offsets = normalize_with_offsets(text)
+            # Only trust the map when it reproduces the searched text
+            self._offset_maps[index] = (
+                offsets if normalized == normalize_text(text) else None
+            )
+        return self._offset_maps[index]
+
+    def _build_token_index(self) -> None:
+        self._token_index = {}
+        for i, text in enumerate(self._normalized):
+            tokens = text.split()
+            for token in set(tokens):
+                self._token_index.setdefault(token, []).append(i)
+            for shingle in _shingles(tokens):
+                self._shingle_index.setdefault(shingle, []).append(i)
+
+    def _locate_fuzzy(self, normalized_quote: str) -> Optional[QuoteLocation]:
+        tokens = normalized_quote.split()
+        distinct = set(tokens)
+        if len(distinct) < FUZZY_MIN_TOKENS:
+            return None
+        if self._token_index is None:
+            self._build_token_index()
+        token_hits: Counter = Counter()
+        for token in distinct:
+            token_hits.update(self._token_index.get(token, ()))
+        shingle_hits: Counter = Counter()
+        for shingle in _shingles(tokens):
+            shingle_hits.update(self._shingle_index.get(shingle, ()))
+
+        candidates = [
+            i
+            for i, hits in token_hits.items()
+            if hits / len(distinct) >= FUZZY_MIN_OVERLAP
+        ]
+        if not candidates:
+            return None
+        # Prefer segments sharing word pairs, then words, then the earliest
+        index = min(
+            candidates,
+            key=lambda i: (-shingle_hits[i], -token_hits[i], i),
+        )
+        return self._location("fuzzy", index, None, None)
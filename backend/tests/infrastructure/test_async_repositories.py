@@ -0,0 +1,106 @@
+"""
+Tests for the repositories and UnitOfWork running on an async session.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.database import Base, get_async_database_url
+from backend.infrastructure.persistence.job_repository import JobRepository
+from backend.infrastructure.persistence.pipeline_run_repository import (
+    PipelineRunRepository,
+)
+from backend.infrastructure.persistence.simulation_repository import (
+    SimulationRepository,
+)
+from backend.infrastructure.persistence.unit_of_work import UnitOfWork
+from backend.models import JobRecord, PipelineRun, SimulationData, User
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [
+        Base.metadata.tables[model.__tablename__]
+        for model in (User, SimulationData, PipelineRun, JobRecord)
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables)
+        )
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    # aiosqlite connections run on their own threads; an undisposed engine
+    # keeps the process alive after the tests finish
+    await engine.dispose()
+
+
+def test_async_database_url_uses_async_drivers():
+    assert (
+        get_async_database_url("sqlite:///./axwise.db")
+        == "sqlite+aiosqlite:///./axwise.db"
+    )
+    assert (
+        get_async_database_url("postgresql://u:p@db:5432/app")
+        == "postgresql+asyncpg://u:p@db:5432/app"
+    )
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_async_session(session_factory):
+    async with UnitOfWork(session_factory) as uow:
+        assert uow.is_async
+        repo = SimulationRepository(uow.session)
+        await repo.create_simulation("sim-1", "user-1", {"a": 1}, {}, {})
+        await repo.create_simulation("sim-2", "user-1", {"a": 2}, {}, {})
+
+    async with UnitOfWork(session_factory) as uow:
+        repo = SimulationRepository(uow.session)
+        await repo.update_simulation_results("sim-1", [{"name": "P"}], [])
+        assert await repo.count() == 2
+
+    async with UnitOfWork(session_factory) as uow:
+        repo = SimulationRepository(uow.session)
+        completed = await repo.get_completed_simulations(user_id="user-1")
+        assert [s.simulation_id for s in completed] == ["sim-1"]
+        assert await repo.delete_simulation("sim-2") is True
+
+    async with UnitOfWork(session_factory) as uow:
+        repo = SimulationRepository(uow.session)
+        assert await repo.get_by_simulation_id("sim-2") is None
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_async_session_on_error(session_factory):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(session_factory) as uow:
+            await PipelineRunRepository(uow.session).create_pipeline_run(
+                job_id="job-1", business_context={}, user_id="user-1"
+            )
+            raise RuntimeError("boom")
+
+    async with UnitOfWork(session_factory) as uow:
+        repo = PipelineRunRepository(uow.session)
+        assert await repo.get_by_job_id("job-1") is None
+        assert await repo.count_pipeline_runs() == 0
+
+
+@pytest.mark.asyncio
+async def test_job_claim_is_conditional_on_async_session(session_factory):
+    async with UnitOfWork(session_factory) as uow:
+        await JobRepository(uow.session).create_job(
+            job_id="j1", kind="analysis", payload={}, user_id="user-1"
+        )
+
+    async with UnitOfWork(session_factory) as uow:
+        repo = JobRepository(uow.session)
+        assert await repo.claim_job("j1", "w1") is True
+        assert await repo.claim_job("j1", "w2") is False
+        assert await repo.heartbeat(["j1"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_context_manager_rejects_async_session(session_factory):
+    with pytest.raises(TypeError):
+        with UnitOfWork(session_factory):
+            pass
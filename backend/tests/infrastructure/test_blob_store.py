@@ -0,0 +1,115 @@
+"""
+Tests for the content-addressed blob store and the blob route.
+"""
+
+import base64
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.api.routes import blobs
+from backend.infrastructure.storage import (
+    LocalBlobStore,
+    extract_embedded_blobs,
+    store_data_uri,
+)
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+DATA_URI = "data:image/png;base64," + base64.b64encode(PNG).decode("ascii")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalBlobStore(str(tmp_path))
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(blobs, "get_blob_store", lambda: store)
+    app = FastAPI()
+    app.include_router(blobs.router)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+def test_put_object_deduplicates_by_content(store, tmp_path):
+    first = store.put_object(PNG, "image/png")
+    second = store.put_object(PNG, "image/png")
+
+    assert first == second
+    assert [p.name for p in tmp_path.glob("*/*") if p.suffix != ".json"] == [
+        first.key
+    ]
+    assert store.head_object(first.key).content_type == "image/png"
+    assert store.get_object(first.key, (0, 3)) == PNG[:4]
+    assert store.delete_object(first.key) is True
+    assert store.head_object(first.key) is None
+
+
+def test_extract_embedded_blobs_replaces_data_uris(store):
+    results = {
+        "personas": [
+            {"name": "Ada", "avatar_url": DATA_URI, "food_images": {"lunch": DATA_URI}}
+        ],
+        "themes": ["data:image/png;base64,not base64!"],
+    }
+
+    assert extract_embedded_blobs(results, store) == 2
+
+    url = results["personas"][0]["avatar_url"]
+    assert url == store_data_uri(DATA_URI, store)
+    assert url.startswith("/api/blobs/")
+    assert results["personas"][0]["food_images"]["lunch"] == url
+    assert results["themes"] == ["data:image/png;base64,not base64!"]
+
+
+@pytest.mark.asyncio
+async def test_get_blob_supports_etag_and_ranges(store, client):
+    key = store.put_object(PNG, "image/png").key
+
+    response = await client.get(f"/api/blobs/{key}")
+    assert response.status_code == 200
+    assert response.content == PNG
+    assert response.headers["content-type"] == "image/png"
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert "content-disposition" not in response.headers
+    etag = response.headers["etag"]
+
+    not_modified = await client.get(
+        f"/api/blobs/{key}", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+
+    partial = await client.get(f"/api/blobs/{key}", headers={"Range": "bytes=8-15"})
+    assert partial.status_code == 206
+    assert partial.content == PNG[8:16]
+    assert partial.headers["content-range"] == f"bytes 8-15/{len(PNG)}"
+
+    suffix = await client.get(f"/api/blobs/{key}", headers={"Range": "bytes=-4"})
+    assert suffix.content == PNG[-4:]
+
+    unsatisfiable = await client.get(
+        f"/api/blobs/{key}", headers={"Range": f"bytes={len(PNG)}-"}
+    )
+    assert unsatisfiable.status_code == 416
+
+    missing = await client.get("/api/blobs/" + "0" * 64)
+    assert missing.status_code == 404
+    invalid = await client.get("/api/blobs/not-a-key")
+    assert invalid.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_active_content_is_served_as_attachment(store, client):
+    svg = b'<svg xmlns="http://www.w3.org/2000/svg"><script>alert(1)</script></svg>'
+    key = store.put_object(svg, "image/svg+xml").key
+
+    response = await client.get(f"/api/blobs/{key}")
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == "attachment"
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert "default-src 'none'" in response.headers["content-security-policy"]
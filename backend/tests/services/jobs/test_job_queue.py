@@ -0,0 +1,169 @@
+"""
+Tests for the bounded background job queue.
+
+These tests check the global, per-user and lane caps, backpressure, and the
+recovery of jobs whose worker stopped sending heartbeats.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.models import JobRecord
+from backend.services.jobs.job_queue import JobQueue, QueueFullError
+from backend.utils.timezone_utils import utc_now
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    JobRecord.__table__.create(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _make_queue(session_factory, **kwargs):
+    options = dict(max_workers=2, per_user_limit=1, max_pending=10, heartbeat_seconds=60)
+    options.update(kwargs)
+    return JobQueue(session_factory=session_factory, **options)
+
+
+async def _wait_until(predicate, timeout=1.0):
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_caps_limit_concurrency_and_interactive_lane_runs_first(session_factory):
+    queue = _make_queue(session_factory)
+    release = asyncio.Event()
+    started = []
+
+    async def handler(job_id, payload):
+        started.append(job_id)
+        await release.wait()
+
+    queue.register_handler("work", handler)
+    try:
+        await queue.submit("work", {}, user_id="alice", job_id="a1")
+        await queue.submit("work", {}, user_id="alice", job_id="a2")
+        await queue.submit("work", {}, user_id="bob", lane="batch", job_id="b1")
+        await queue.submit("work", {}, user_id="carol", job_id="c1")
+
+        await _wait_until(lambda: len(started) == 2)
+        await asyncio.sleep(0.05)
+
+        # Global cap of two; alice is capped at one and carol's interactive
+        # job is preferred over bob's batch job
+        assert started == ["a1", "c1"]
+        assert queue.stats()["pending"] == 2
+
+        release.set()
+        await _wait_until(lambda: queue.stats()["completed"] == 4)
+        assert sorted(started) == ["a1", "a2", "b1", "c1"]
+
+        with session_factory() as session:
+            statuses = {job.job_id: job.status for job in session.query(JobRecord)}
+        assert set(statuses.values()) == {"completed"}
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_queue_is_full(session_factory):
+    queue = _make_queue(session_factory, max_workers=1, max_pending=1)
+    release = asyncio.Event()
+
+    async def handler(job_id, payload):
+        await release.wait()
+
+    queue.register_handler("work", handler)
+    try:
+        await queue.submit("work", {}, job_id="running")
+        await _wait_until(lambda: queue.stats()["running"] == 1)
+        await queue.submit("work", {}, job_id="waiting")
+
+        with pytest.raises(QueueFullError):
+            await queue.submit("work", {}, job_id="rejected")
+        with pytest.raises(ValueError):
+            await queue.submit("unknown", {})
+    finally:
+        release.set()
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_mark_job_failed(session_factory):
+    queue = _make_queue(session_factory)
+
+    async def handler(job_id, payload):
+        raise RuntimeError("boom")
+
+    queue.register_handler("work", handler)
+    try:
+        await queue.submit("work", {}, job_id="bad")
+        await _wait_until(lambda: queue.stats()["failed"] == 1)
+
+        with session_factory() as session:
+            job = session.query(JobRecord).filter_by(job_id="bad").one()
+        assert job.status == "failed"
+        assert job.error == "boom"
+        assert job.attempts == 1
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_recover_requeues_stalled_jobs_and_fails_exhausted_ones(session_factory):
+    stale = utc_now() - timedelta(hours=1)
+    with session_factory() as session:
+        session.add_all(
+            [
+                JobRecord(
+                    job_id="retry", kind="work", payload={"n": 1}, status="running",
+                    attempts=1, max_attempts=2, heartbeat_at=stale, created_at=stale,
+                ),
+                JobRecord(
+                    job_id="exhausted", kind="work", payload={"n": 2}, status="running",
+                    attempts=2, max_attempts=2, heartbeat_at=stale, created_at=stale,
+                ),
+                JobRecord(
+                    job_id="waiting", kind="work", payload={"n": 3}, status="queued",
+                    created_at=stale,
+                ),
+            ]
+        )
+        session.commit()
+
+    queue = _make_queue(session_factory, stale_seconds=60)
+    ran = []
+    abandoned = []
+
+    async def handler(job_id, payload):
+        ran.append(payload["n"])
+
+    async def on_failure(job_id, payload, error):
+        abandoned.append(job_id)
+
+    queue.register_handler("work", handler, on_failure=on_failure)
+    try:
+        await queue.start()
+        await _wait_until(lambda: queue.stats()["completed"] == 2)
+
+        assert sorted(ran) == [1, 3]
+        assert abandoned == ["exhausted"]
+        with session_factory() as session:
+            statuses = {job.job_id: job.status for job in session.query(JobRecord)}
+        assert statuses == {"retry": "completed", "exhausted": "failed", "waiting": "completed"}
+    finally:
+        await queue.stop()
@@ -0,0 +1,123 @@
+"""
+Tests for the stage graph scheduler.
+
+These tests check that stages run as soon as their inputs are available,
+that independent stages overlap, and that invalid graphs are rejected.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.processing.pipeline.stage_graph import StageGraph
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently():
+    started = []
+
+    async def slow(name):
+        started.append(name)
+        await asyncio.sleep(0.05)
+        return name
+
+    graph = (
+        StageGraph()
+        .add_stage("a", lambda: slow("a"))
+        .add_stage("b", lambda: slow("b"))
+        .add_stage("c", lambda: slow("c"))
+    )
+
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    outputs = await graph.run()
+    elapsed = loop.time() - start
+
+    assert outputs == {"a": "a", "b": "b", "c": "c"}
+    assert sorted(started) == ["a", "b", "c"]
+    assert elapsed < 0.12
+
+
+@pytest.mark.asyncio
+async def test_stage_starts_when_its_inputs_are_ready():
+    order = []
+    slow_done = asyncio.Event()
+
+    async def fast():
+        order.append("fast")
+        return 1
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        order.append("slow")
+        slow_done.set()
+        return 2
+
+    async def after_fast(fast):
+        # Must not wait for the unrelated slow stage
+        assert not slow_done.is_set()
+        order.append("after_fast")
+        return fast + 10
+
+    async def join(after_fast, slow, seed):
+        order.append("join")
+        return after_fast + slow + seed
+
+    graph = (
+        StageGraph()
+        .add_stage("fast", fast)
+        .add_stage("slow", slow)
+        .add_stage("after_fast", after_fast, inputs=("fast",))
+        .add_stage("join", join, inputs=("after_fast", "slow", "seed"))
+    )
+
+    outputs = await graph.run({"seed": 100})
+
+    assert outputs["join"] == 113
+    assert order == ["fast", "after_fast", "slow", "join"]
+    assert set(graph.timings) == {"fast", "slow", "after_fast", "join"}
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_remaining_stages():
+    cancelled = asyncio.Event()
+
+    async def boom():
+        raise RuntimeError("stage failed")
+
+    async def long_running():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    graph = (
+        StageGraph()
+        .add_stage("boom", boom)
+        .add_stage("long", long_running)
+        .add_stage("never", long_running, inputs=("boom",))
+    )
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        await graph.run()
+    assert cancelled.is_set()
+
+
+def test_validate_rejects_unknown_inputs_and_cycles():
+    async def noop(**_):
+        return None
+
+    with pytest.raises(ValueError, match="unknown input"):
+        StageGraph().add_stage("a", noop, inputs=("missing",)).validate()
+
+    cyclic = (
+        StageGraph()
+        .add_stage("a", noop, inputs=("b",))
+        .add_stage("b", noop, inputs=("a",))
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        cyclic.validate()
+
+    with pytest.raises(ValueError, match="already registered"):
+        StageGraph().add_stage("a", noop).add_stage("a", noop)
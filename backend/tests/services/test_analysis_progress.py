@@ -0,0 +1,151 @@
+"""
+Tests for the out-of-band analysis progress store.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import JSON, MetaData, create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.models import AnalysisProgress, AnalysisResult, InterviewData, User
+from backend.services.analysis_progress import AnalysisProgressStore
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    metadata = MetaData()
+    for model in (User, InterviewData, AnalysisResult, AnalysisProgress):
+        model.__table__.to_metadata(metadata)
+    metadata.tables["analysis_results"].c.stakeholder_intelligence.type = JSON()
+    metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest_asyncio.fixture
+async def make_store(session_factory):
+    stores = []
+
+    def make(flush_interval):
+        store = AnalysisProgressStore(session_factory, flush_interval=flush_interval)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_updates_are_coalesced_into_periodic_writes(session_factory, make_store):
+    store = make_store(0.05)
+
+    for i in range(20):
+        store.update(1, "THEME_EXTRACTION", i / 20, f"tick {i}", overall=0.4 + i / 100)
+    # Overall progress never moves backwards
+    store.update(1, "PATTERN_DETECTION", 0.1, "late tick", overall=0.2)
+
+    await asyncio.sleep(0.15)
+    assert store.writes == 1
+
+    with session_factory() as session:
+        row = session.get(AnalysisProgress, 1)
+        assert row.current_stage == "PATTERN_DETECTION"
+        assert row.progress == pytest.approx(0.59)
+        assert set(row.stage_states) == {"THEME_EXTRACTION", "PATTERN_DETECTION"}
+
+    await store.finish(1, "completed", "done")
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_updates_until_finished(make_store):
+    store = make_store(10)
+    store.update(7, "ANALYSIS", 0.1, "starting", overall=0.1)
+    received = []
+
+    async def consume():
+        async for snapshot in store.subscribe(7):
+            received.append((snapshot["status"], snapshot["current_stage"]))
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    store.update(7, "THEME_EXTRACTION", 0.5, "themes", overall=0.45)
+    await store.finish(7, "failed", "boom", error="boom", error_code="X")
+    await asyncio.wait_for(consumer, timeout=1)
+
+    assert received == [
+        ("processing", "ANALYSIS"),
+        ("processing", "THEME_EXTRACTION"),
+        ("failed", "THEME_EXTRACTION"),
+    ]
+    # Finished analyses are served from the table, not memory
+    assert store.snapshot(7) is None
+    persisted = await store.get(7)
+    assert persisted["status"] == "failed"
+    assert persisted["error"] == "boom"
+    assert persisted["stage_states"]["THEME_EXTRACTION"]["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_finished_analysis_yields_final_snapshot(make_store):
+    store = make_store(10)
+    await store.finish(3, "completed", "done")
+
+    snapshots = [s async for s in store.subscribe(3, keepalive=0.01)]
+
+    assert len(snapshots) == 1
+    assert snapshots[0]["progress"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_subscribe_without_progress_ends_with_result_status(
+    session_factory, make_store
+):
+    with session_factory() as session:
+        session.add(
+            AnalysisResult(
+                result_id=5, status="error", error_message="legacy failure"
+            )
+        )
+        session.add(AnalysisResult(result_id=6, status="completed"))
+        session.commit()
+    store = make_store(10)
+
+    failed = [s async for s in store.subscribe(5, keepalive=0.01)]
+    completed = [s async for s in store.subscribe(6, keepalive=0.01)]
+
+    assert [(s["status"], s["error"]) for s in failed] == [
+        ("failed", "legacy failure")
+    ]
+    assert [(s["status"], s["progress"]) for s in completed] == [("completed", 1.0)]
+
+
+@pytest.mark.asyncio
+async def test_terminal_snapshot_is_kept_until_written(make_store, monkeypatch):
+    store = make_store(0.01)
+    write = store._write
+    failures = []
+
+    def flaky_write(states):
+        if not failures:
+            failures.append(states)
+            raise RuntimeError("database down")
+        write(states)
+
+    monkeypatch.setattr(store, "_write", flaky_write)
+    await store.finish(9, "completed", "done")
+
+    assert store.snapshot(9)["status"] == "completed"
+    for _ in range(100):
+        if store.snapshot(9) is None:
+            break
+        await asyncio.sleep(0.01)
+    assert store.snapshot(9) is None
+    assert (await store.get(9))["status"] == "completed"
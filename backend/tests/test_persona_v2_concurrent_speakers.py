@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+
+from backend.infrastructure.config.settings import settings
+from backend.services.processing.persona_formation_v2.facade import PersonaFormationFacade
+
+
+class DummyLLMService:
+    async def analyze(self, *args, **kwargs):
+        return {}
+
+
+def _focus_group(n: int):
+    transcript = []
+    for i in range(n):
+        transcript.append(
+            {
+                "role": "interviewer",
+                "speaker": "Moderator",
+                "dialogue": f"Question {i} about your reporting workflow?",
+            }
+        )
+        transcript.append(
+            {
+                "role": "participant",
+                "speaker": f"P{i}",
+                "document_id": f"doc-{i}",
+                "dialogue": f"I am participant {i} and I build weekly reports by hand.",
+            }
+        )
+    return transcript
+
+
+@pytest.mark.asyncio
+async def test_speakers_formed_concurrently_in_transcript_order(monkeypatch):
+    monkeypatch.setattr(settings, "persona_formation_concurrency", 3)
+    facade = PersonaFormationFacade(DummyLLMService())
+
+    active = 0
+    peak = 0
+    seen_scopes = {}
+
+    async def fake_clean(scoped_text, scope_meta=None):
+        return scoped_text
+
+    async def fake_extract(scoped_text, role=None, scope_meta=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        speaker = scope_meta["speaker"]
+        seen_scopes[speaker] = (scoped_text, scope_meta["document_id"])
+        # Later speakers finish first to check that ordering is preserved
+        await asyncio.sleep(0.01 * (10 - int(speaker[1:])))
+        active -= 1
+        return {"name": speaker}
+
+    monkeypatch.setattr(facade.evidence_linker, "llm_clean_scoped_text", fake_clean)
+    monkeypatch.setattr(facade.extractor, "extract_attributes_from_text", fake_extract)
+
+    personas = await facade.form_personas_from_transcript(_focus_group(8))
+
+    speakers = [p["_evidence_linking_v2"]["scope_meta"]["speaker"] for p in personas]
+    assert speakers == [f"P{i}" for i in range(8)]
+    assert peak == 3
+    assert "Moderator" not in seen_scopes
+    assert seen_scopes["P5"] == (
+        "I am participant 5 and I build weekly reports by hand.",
+        "doc-5",
+    )
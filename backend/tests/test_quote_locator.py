@@ -0,0 +1,85 @@
+import pytest
+
+from backend.services.validation.persona_evidence_validator import (
+    PersonaEvidenceValidator,
+)
+from backend.services.validation.quote_locator import (
+    QuoteLocator,
+    normalize_text,
+    normalize_with_offsets,
+)
+
+TRANSCRIPT = [
+    {"speaker": "Interviewer", "dialogue": "How do you build the weekly report?"},
+    {
+        "speaker": "Interviewee",
+        "dialogue": (
+            "[03:10] Interviewee:  We export   everything to “Excel”… then fix it."
+        ),
+    },
+    {
+        "speaker": "Interviewee",
+        "dialogue": "Honestly the export step is the worst part.",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "  [12:40] [12:41] Interviewee: Hello   World… ",
+        "“Quoted” – text​ with\n\ttabs",
+        "(bracketed) ",
+        "Speaker - 'single'",
+        "",
+    ],
+)
+def test_offset_normalization_matches_normalize_text(text):
+    normalized, offsets = normalize_with_offsets(text)
+    assert normalized == normalize_text(text)
+    assert len(offsets) == len(normalized)
+    assert offsets == sorted(offsets)
+
+
+def test_normalized_match_maps_to_original_offsets():
+    locator = QuoteLocator.from_transcript(TRANSCRIPT, document_id="doc-1")
+    location = locator.locate('we export everything to "excel"...')
+
+    assert location.match_type == "normalized"
+    assert (location.speaker, location.document_id) == ("Interviewee", "doc-1")
+    flat = "\n".join(seg["dialogue"] for seg in TRANSCRIPT)
+    assert flat[location.start_char : location.end_char] == (
+        "We export   everything to “Excel”…"
+    )
+
+
+def test_verbatim_match_wins_over_earlier_fuzzy_segment():
+    locator = QuoteLocator.from_documents(
+        [("a", "the export step report"), ("b", "the export step is slow")]
+    )
+
+    location = locator.locate("export step is slow")
+
+    assert (location.match_type, location.document_id) == ("verbatim", "b")
+    assert (location.start_char, location.end_char) == (27, 46)
+    assert locator.locate("nothing in common here") is None
+
+
+def test_fuzzy_matches_can_be_excluded():
+    locator = QuoteLocator.from_documents([("a", "the export step is slow")])
+
+    assert locator.locate("export takes forever", fuzzy=False) is None
+    assert locator.locate("export takes forever").match_type == "fuzzy"
+    assert locator.locate("Export step", fuzzy=False).match_type == "normalized"
+
+
+def test_validator_reuses_index_and_reports_offsets():
+    validator = PersonaEvidenceValidator()
+    quote = "Honestly the export step is the worst part."
+
+    mtype, s, e, sp = validator._find_in_transcript(TRANSCRIPT, quote)
+    validator._find_in_transcript(TRANSCRIPT, "weekly report fix")
+
+    assert (mtype, sp) == ("verbatim", "Interviewee")
+    assert "\n".join(seg["dialogue"] for seg in TRANSCRIPT)[s:e] == quote
+    assert len(validator._locators) == 1
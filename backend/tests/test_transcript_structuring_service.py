@@ -2,6 +2,7 @@
 Tests for the TranscriptStructuringService.
 """
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -210,3 +211,165 @@ class TestTranscriptStructuringService:
         assert len(result) == 2
         assert result[0]["speaker_id"] == "Interviewer"
         assert result[1]["speaker_id"] == "John"
+
+
+def _long_transcript(interviews: int, turns: int) -> str:
+    parts = []
+    for n in range(1, interviews + 1):
+        parts.append(f"=== INTERVIEW {n} ===\n")
+        for t in range(turns):
+            parts.append(f"Interviewer: Question {t} about reporting in interview {n}?\n")
+            parts.append(
+                f"Interviewee: Answer {t} from interview {n}. "
+                + "We export spreadsheets every week and clean them by hand. " * 3
+                + "\n"
+            )
+    return "".join(parts)
+
+
+class TestTranscriptChunking:
+    """Tests for chunked structuring of long transcripts."""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        from backend.infrastructure.config.settings import settings
+
+        monkeypatch.setattr(settings, "transcript_chunk_chars", 2000)
+        monkeypatch.setattr(settings, "transcript_chunk_concurrency", 2)
+
+    def test_chunks_cover_text_and_respect_interviews(self):
+        service = TranscriptStructuringService(AsyncMock())
+        text = _long_transcript(interviews=3, turns=12)
+
+        chunks = service._split_into_chunks(text)
+
+        assert "".join(chunk for _, chunk in chunks) == text
+        assert [n for n, _ in chunks] == sorted(n for n, _ in chunks)
+        assert {n for n, _ in chunks} == {1, 2, 3}
+        assert all(len(chunk) <= 2000 for _, chunk in chunks)
+        assert all(
+            chunk.startswith(("Interviewer:", "Interviewee:", "=== INTERVIEW"))
+            for _, chunk in chunks
+        )
+
+    def test_edit_only_changes_nearby_chunks(self):
+        service = TranscriptStructuringService(AsyncMock())
+        text = _long_transcript(interviews=1, turns=40)
+        edited = text.replace("Question 30 about", "Question thirty about")
+
+        before = [chunk for _, chunk in service._split_into_chunks(text)]
+        after = [chunk for _, chunk in service._split_into_chunks(edited)]
+
+        assert len(set(before) - set(after)) <= 2
+        assert before[0] == after[0]
+
+    def test_short_transcript_is_a_single_chunk(self):
+        service = TranscriptStructuringService(AsyncMock())
+        assert service._split_into_chunks("Interviewer: Hi?\n") == [
+            (0, "Interviewer: Hi?\n")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_structured_concurrently_and_stitched_in_order(self):
+        active = 0
+        peak = 0
+        requests = []
+
+        async def analyze(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            requests.append(request)
+            text = request["text"]
+            await asyncio.sleep(0.001 * (len(requests) % 3))
+            active -= 1
+            segments = []
+            for line in text.splitlines():
+                speaker, _, dialogue = line.partition(": ")
+                if speaker in ("Interviewer", "Interviewee"):
+                    segments.append(
+                        {"speaker_id": speaker, "role": speaker, "dialogue": dialogue}
+                    )
+            return segments
+
+        llm_service = MagicMock()
+        llm_service.analyze = analyze
+        service = TranscriptStructuringService(llm_service)
+        text = _long_transcript(interviews=2, turns=12)
+
+        result = await service.structure_transcript(text)
+
+        assert len(requests) > 2
+        assert peak == 2
+        assert all(r["use_cache"] is True for r in requests)
+        assert len(result) == 48
+        assert [s["dialogue"].split()[1] for s in result[:4]] == ["0", "0", "1", "1"]
+        assert {s["speaker_id"] for s in result} == {
+            "Interviewer_1",
+            "Interviewee_1",
+            "Interviewer_2",
+            "Interviewee_2",
+        }
+        assert result[0]["document_id"] == "interview_1"
+        assert result[-1]["document_id"] == "interview_2"
+
+    def test_scope_speaker_id_keeps_names(self):
+        scope = TranscriptStructuringService._scope_speaker_id
+        assert scope("Interviewee_1", 4) == "Interviewee_4"
+        assert scope("Participant 2", 4) == "Participant_4_2"
+        assert scope("Jane Doe", 4) == "Jane Doe"
+
+    def test_alternate_interview_markers_split_interviews(self):
+        service = TranscriptStructuringService(AsyncMock())
+        text = _long_transcript(interviews=2, turns=12).replace(
+            "=== INTERVIEW 2 ===", "=== Interview with the second customer ==="
+        )
+
+        assert {n for n, _ in service._split_into_chunks(text)} == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_unmarked_chunks_reconcile_speaker_ids(self):
+        requests = []
+
+        async def analyze(request):
+            requests.append(request)
+            text = request["text"]
+            # Only the chunk with the first question uses the canonical ids
+            canonical = "Question 0 " in text
+            segments = []
+            for line in text.splitlines():
+                speaker, _, dialogue = line.partition(": ")
+                if speaker == "Moderator":
+                    speaker_id = "Moderator" if canonical else "moderator_1"
+                elif speaker == "Dana Smith":
+                    speaker_id = speaker if canonical else "dana  smith"
+                else:
+                    continue
+                segments.append(
+                    {"speaker_id": speaker_id, "role": "", "dialogue": dialogue}
+                )
+            return segments
+
+        llm_service = MagicMock()
+        llm_service.analyze = analyze
+        service = TranscriptStructuringService(llm_service)
+        text = "".join(
+            f"Moderator: Question {t} about reporting?\n"
+            f"Dana Smith: Answer {t}. "
+            + "We export spreadsheets every week and clean them by hand. " * 3
+            + "\n"
+            for t in range(30)
+        ).replace("Answer 20.", "Answer 20. Like I said in interview 2 of 5.")
+
+        result = await service.structure_transcript(text)
+
+        assert len(requests) > 2
+        assert all(n == 0 for n, _ in service._split_into_chunks(text))
+        assert len(result) == 60
+        assert {s["speaker_id"] for s in result} == {"Moderator", "Dana Smith"}
+        assert {s["role"] for s in result} == {"Interviewer", "Interviewee"}
+        assert [
+            r["content_info"]["is_multi_interview"]
+            for r in requests
+            if "interview 2 of 5" in r["text"]
+        ] == [True]
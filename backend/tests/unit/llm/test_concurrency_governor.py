@@ -0,0 +1,185 @@
+"""
+Tests for the process-wide LLM concurrency governor.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.llm import concurrency_governor
+from backend.services.llm.concurrency_governor import (
+    LLMGovernor,
+    get_llm_governor,
+    governed_model,
+    is_rate_limit_error,
+    llm_tenant,
+)
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+@pytest.mark.asyncio
+async def test_slot_bounds_in_flight_requests():
+    governor = LLMGovernor("test:model", initial_concurrency=3, max_concurrency=3)
+    active = 0
+    peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with governor.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(12)))
+
+    assert peak == 3
+    metrics = governor.metrics()
+    assert metrics["succeeded"] == 12
+    assert metrics["in_flight"] == 0
+    assert metrics["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_halves_limit_and_success_ramps_up():
+    governor = LLMGovernor(
+        "test:model", initial_concurrency=8, max_concurrency=8, backoff_cooldown=60
+    )
+
+    for _ in range(3):
+        with pytest.raises(RateLimited):
+            async with governor.slot():
+                raise RateLimited("429 RESOURCE_EXHAUSTED")
+
+    # Failures of one burst back off only once
+    assert governor.metrics()["concurrency_limit"] == 4
+    assert governor.metrics()["rate_limited"] == 3
+
+    for _ in range(20):
+        async with governor.slot():
+            pass
+    assert governor.metrics()["concurrency_limit"] > 4
+
+    with pytest.raises(ValueError):
+        async with governor.slot():
+            raise ValueError("bad json")
+    assert governor.metrics()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slots_are_shared_round_robin_across_tenants():
+    governor = LLMGovernor("test:model", initial_concurrency=1, max_concurrency=1)
+    order = []
+
+    async def call(tenant):
+        with llm_tenant(tenant):
+            async with governor.slot():
+                order.append(tenant)
+                await asyncio.sleep(0.001)
+
+    blocker = asyncio.Event()
+
+    async def hold():
+        async with governor.slot(tenant="other"):
+            await blocker.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    # Tenant "a" queues many requests before "b" queues a few
+    tasks = [asyncio.create_task(call("a")) for _ in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(call("b")) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert governor.metrics()["queued_by_tenant"] == {"a": 4, "b": 2}
+
+    blocker.set()
+    await asyncio.gather(holder, *tasks)
+
+    assert order == ["a", "b", "a", "b", "a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_request_bucket_throttles_and_cancelled_waiters_leave_queue():
+    governor = LLMGovernor("test:model", requests_per_minute=2, initial_concurrency=4)
+
+    async with governor.slot():
+        pass
+    async with governor.slot():
+        pass
+
+    # The bucket is empty: the next request has to wait about 30 seconds
+    waiter = asyncio.create_task(governor.acquire())
+    await asyncio.sleep(0.02)
+    assert not waiter.done()
+    assert governor.metrics()["queued"] == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert governor.metrics()["queued"] == 0
+    assert governor.metrics()["in_flight"] == 0
+
+
+def test_sync_slot_and_registry():
+    concurrency_governor.reset_governors()
+    governor = get_llm_governor("gemini", "models/gemini-2.5-flash")
+    assert governor is get_llm_governor("Gemini", "gemini-2.5-flash")
+
+    with governor.sync_slot(estimated_tokens=100):
+        assert governor.metrics()["in_flight"] == 1
+    assert governor.metrics()["succeeded"] == 1
+
+    assert [m["key"] for m in concurrency_governor.governor_metrics()] == [
+        "gemini:gemini-2.5-flash"
+    ]
+    concurrency_governor.reset_governors()
+
+
+@pytest.mark.asyncio
+async def test_sync_slot_refuses_to_block_an_event_loop():
+    governor = LLMGovernor("test:model")
+
+    with pytest.raises(RuntimeError):
+        with governor.sync_slot():
+            pass
+    assert governor.metrics()["in_flight"] == 0
+    assert governor.metrics()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_governed_model_runs_requests_through_its_governor():
+    from pydantic_ai import Agent
+    from pydantic_ai.models.test import TestModel
+
+    concurrency_governor.reset_governors()
+    model = governed_model(TestModel(), provider="test")
+    result = await Agent(model).run("hello")
+
+    assert result.output
+    governor = get_llm_governor("test", model.wrapped.model_name)
+    assert governor.metrics()["succeeded"] == 1
+    concurrency_governor.reset_governors()
+
+
+def test_is_rate_limit_error_follows_causes():
+    class APIError(Exception):
+        status = "RESOURCE_EXHAUSTED"
+
+    class RateLimitError(Exception):
+        pass
+
+    try:
+        try:
+            raise APIError("quota exceeded")
+        except APIError as e:
+            raise ValueError("API call failed") from e
+    except ValueError as wrapped:
+        assert is_rate_limit_error(wrapped)
+    assert is_rate_limit_error(RateLimitError("slow down"))
+    assert not is_rate_limit_error(ValueError("invalid JSON"))
+    assert not is_rate_limit_error(
+        ValueError("expected 429 items, quota field missing")
+    )
@@ -0,0 +1,141 @@
+"""
+Tests for shared Gemini context caching across analysis stages.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.llm.async_genai_client import AsyncGenAIClient
+from backend.services.llm.context_cache import (
+    CACHED_CONTEXT_PLACEHOLDER,
+    ContextCacheScope,
+    InMemoryContextCacheBackend,
+    context_cache_scope,
+    current_context_cache,
+)
+from backend.services.llm.enhanced_gemini_llm_service import (
+    EnhancedGeminiLLMService,
+)
+from backend.services.llm.gemini_service import GeminiService
+
+TRANSCRIPT = "Interviewer: What slows you down?\nUser: Manual reporting. " * 800
+
+
+class SlowBackend(InMemoryContextCacheBackend):
+    async def create(self, model, text, ttl_seconds, display_name):
+        await asyncio.sleep(0.01)
+        return await super().create(model, text, ttl_seconds, display_name)
+
+
+@pytest.mark.asyncio
+async def test_scope_uploads_once_and_cleans_up():
+    backend = SlowBackend()
+    scope = ContextCacheScope("a1", backend=backend, min_tokens=1000)
+
+    handles = await asyncio.gather(
+        *(scope.handle_for("gemini-2.5-flash", TRANSCRIPT, None) for _ in range(5))
+    )
+
+    assert len(backend.created) == 1
+    assert {h.name for h in handles} == {backend.created[0]}
+    assert await scope.handle_for("gemini-2.5-flash", "short", None) is None
+
+    scope.record_use(handles[0])
+    assert scope.usage.cached_input_tokens == handles[0].token_count
+
+    scope.invalidate(handles[0])
+    assert await scope.handle_for("gemini-2.5-flash", TRANSCRIPT, None) is None
+    assert scope.usage.fallbacks == 1
+
+    await scope.close()
+    assert backend.deleted == backend.created
+
+
+@pytest.mark.asyncio
+async def test_gemini_service_stages_share_cached_transcript():
+    requests = []
+
+    async def generate_content(model, contents, config):
+        requests.append((contents, config))
+        return SimpleNamespace(
+            text="{}",
+            usage_metadata=SimpleNamespace(cached_content_token_count=9000),
+        )
+
+    service = object.__new__(GeminiService)
+    service.default_model_name = "gemini-2.5-flash"
+    service.client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    )
+    backend = InMemoryContextCacheBackend()
+
+    async with context_cache_scope("analysis-7", backend=backend) as usage:
+        assert current_context_cache() is not None
+        for task in ("themes", "patterns", "insights"):
+            await service._generate_text_with_context(
+                TRANSCRIPT,
+                system_instruction_text=f"Find {task} in:\n{TRANSCRIPT}",
+            )
+        # Short texts are sent inline
+        await service._generate_text_with_context("hello", system_instruction_text="x")
+
+    assert current_context_cache() is None
+    assert len(backend.created) == 1
+    assert backend.deleted == backend.created
+
+    for contents, config in requests[:3]:
+        assert config.cached_content == backend.created[0]
+        sent = "".join(str(part) for part in contents)
+        assert TRANSCRIPT not in sent
+        assert CACHED_CONTEXT_PLACEHOLDER in sent
+    assert requests[3][1].cached_content is None
+
+    summary = usage.summary()
+    assert summary["cache_hits"] == 3
+    assert summary["cached_input_tokens"] == 27000
+    assert summary["saved_input_tokens"] == 27000 - summary["uploaded_tokens"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_stage_uses_cached_transcript():
+    requests = []
+    text = json.dumps({"patterns": [{"name": "Workaround"}]})
+
+    async def stream():
+        yield SimpleNamespace(text=text)
+
+    async def generate_content_stream(model, contents, config):
+        requests.append((contents, config))
+        return stream()
+
+    client = object.__new__(AsyncGenAIClient)
+    client.default_model = "gemini-2.5-flash"
+    client.client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content_stream=generate_content_stream)
+        )
+    )
+    service = object.__new__(EnhancedGeminiLLMService)
+    service.client = client
+    backend = InMemoryContextCacheBackend()
+    seen = []
+
+    async with context_cache_scope("analysis-8", backend=backend) as usage:
+        result = await service._call_llm_api(
+            f"Find patterns in:\n{TRANSCRIPT}",
+            TRANSCRIPT,
+            "pattern_recognition",
+            {"on_item": lambda key, item: seen.append(item["name"])},
+        )
+
+    assert seen == ["Workaround"]
+    assert result["patterns"][0]["name"] == "Workaround"
+    contents, config = requests[0]
+    assert config.cached_content == backend.created[0]
+    sent = "".join(str(part) for part in contents)
+    assert TRANSCRIPT not in sent
+    assert CACHED_CONTEXT_PLACEHOLDER in sent
+    assert usage.summary()["cache_hits"] == 1
@@ -0,0 +1,122 @@
+"""
+Tests for the async structured-generation path of the Instructor client.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from backend.services.llm import instructor_gemini_client
+from backend.services.llm.instructor_gemini_client import (
+    InstructorGeminiClient,
+    InstrumentedExecutor,
+)
+
+
+class Answer(BaseModel):
+    text: str
+
+
+def _client(sync_create, async_create=None):
+    client = object.__new__(InstructorGeminiClient)
+    client.model_name = "gemini-2.5-flash"
+    client.enable_metrics = False
+    client.instructor_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=sync_create))
+    )
+    client.async_instructor_client = (
+        SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=async_create))
+        )
+        if async_create
+        else None
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_awaited_without_threads():
+    calls = []
+
+    def sync_create(**kwargs):
+        raise AssertionError("sync client must not be used")
+
+    async def async_create(**kwargs):
+        calls.append((kwargs, threading.current_thread()))
+        return Answer(text="ok")
+
+    result = await _client(sync_create, async_create).generate_with_model_async(
+        "Say ok", Answer, system_instruction="Be brief"
+    )
+
+    assert result == Answer(text="ok")
+    kwargs, thread = calls[0]
+    assert kwargs["response_model"] is Answer
+    assert kwargs["messages"][0] == {"role": "system", "content": "Be brief"}
+    assert thread is threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_sync_fallback_runs_on_dedicated_executor(monkeypatch):
+    executor = InstrumentedExecutor(max_workers=2, thread_name_prefix="test-sync")
+    monkeypatch.setattr(instructor_gemini_client, "_sync_executor", executor)
+    threads = []
+
+    def sync_create(**kwargs):
+        threads.append(threading.current_thread().name)
+        return Answer(text="fallback")
+
+    result = await _client(sync_create).generate_with_model_async("Hi", Answer)
+
+    assert result.text == "fallback"
+    assert threads[0].startswith("test-sync")
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_counts_failures():
+    executor = InstrumentedExecutor(max_workers=1)
+
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        await executor.run(boom)
+    assert await executor.run(lambda: 3) == 3
+    assert executor.stats()["failed"] == 1
+    assert executor.stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_json_repair_from_async_code_uses_the_async_client():
+    from backend.utils.json.instructor_parser import InstructorParser
+
+    sync_calls = []
+
+    def sync_create(**kwargs):
+        sync_calls.append(threading.current_thread())
+        return Answer(text="repaired")
+
+    async def async_create(**kwargs):
+        return Answer(text="repaired")
+
+    parser = InstructorParser(_client(sync_create, async_create))
+    malformed = '{"txt": "not the schema"'
+
+    assert await parser.parse_with_model_async(malformed, Answer) == Answer(
+        text="repaired"
+    )
+    # The blocking repair is not attempted on the loop thread ...
+    assert parser.parse_with_model(malformed, Answer) is None
+    assert sync_calls == []
+    # ... but still works from a worker thread
+    assert await asyncio.to_thread(
+        parser.parse_with_model, malformed, Answer
+    ) == Answer(text="repaired")
+    assert sync_calls and sync_calls[0] is not threading.current_thread()
@@ -0,0 +1,136 @@
+"""
+Tests for the content-addressed LLM response cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from backend.services.llm import response_cache
+from backend.services.llm.response_cache import (
+    LLMResponseCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCacheBackend,
+)
+
+
+def test_memory_backend_evicts_least_recently_used_by_bytes():
+    backend = MemoryCacheBackend(max_bytes=10, ttl=None)
+    backend.set("a", b"aaaa")
+    backend.set("b", b"bbbb")
+    assert backend.get("a") == b"aaaa"  # "a" is now most recently used
+
+    backend.set("c", b"cccc")  # 12 bytes > 10, evicts "b"
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"aaaa"
+    assert backend.get("c") == b"cccc"
+    assert backend.stats()["bytes"] == 8
+    assert backend.stats()["evictions"] == 1
+
+
+def test_request_cache_max_size_counts_entries():
+    from backend.services.processing.llm_request_cache import LLMRequestCache
+
+    backend = MemoryCacheBackend(ttl=None)
+    response_cache.set_cache_backend(backend)
+    try:
+        LLMRequestCache.set_cache_config(max_size=2)
+        for key in ("a", "b", "c"):
+            backend.set(key, b"x")
+
+        assert backend.get("a") is None
+        assert backend.stats()["entries"] == 2
+        assert backend.max_bytes == 32 * 1024 * 1024
+    finally:
+        response_cache.set_cache_backend(None)
+
+
+def test_cache_scope_sets_default_for_requests_without_flag(monkeypatch):
+    monkeypatch.setattr(
+        response_cache.settings, "llm_response_cache_default", False
+    )
+    assert not response_cache.should_use_cache({"task": "theme_analysis"})
+
+    with response_cache.response_cache_scope():
+        assert response_cache.should_use_cache({"task": "theme_analysis"})
+        assert not response_cache.should_use_cache({"use_cache": False})
+
+    assert not response_cache.should_use_cache({"task": "theme_analysis"})
+
+
+def test_sqlite_backend_survives_reopen_and_prunes(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    backend = SQLiteCacheBackend(path, max_bytes=100, ttl=None)
+    backend.set("llm:a", b"x" * 40)
+    backend.set("llm:b", b"y" * 40)
+
+    reopened = SQLiteCacheBackend(path, max_bytes=100, ttl=None)
+    assert reopened.get("llm:a") == b"x" * 40
+
+    reopened.set("llm:c", b"z" * 40)
+    reopened.prune()
+    assert reopened.stats()["bytes"] <= 90
+
+    assert reopened.clear("llm:") >= 1
+    assert reopened.stats()["entries"] == 0
+
+
+def test_cache_key_ignores_volatile_fields_and_whitespace():
+    cache = LLMResponseCache(MemoryCacheBackend())
+    base = cache.make_key("gemini", {"task": "theme_analysis", "text": "Hello\r\nworld  "})
+    same = cache.make_key(
+        "gemini",
+        {"task": "theme_analysis", "text": "Hello\nworld", "use_cache": True, "request_id": "x"},
+    )
+    other_model = cache.make_key("gpt", {"task": "theme_analysis", "text": "Hello\nworld"})
+    other_version = cache.make_key(
+        "gemini", {"task": "theme_analysis", "text": "Hello\nworld"}, template_version="2"
+    )
+
+    assert base == same
+    assert base != other_model
+    assert base != other_version
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_returns_copies_and_skips_errors(tmp_path):
+    backend = TieredCacheBackend(
+        MemoryCacheBackend(), SQLiteCacheBackend(str(tmp_path / "c.sqlite3"))
+    )
+    cache = LLMResponseCache(backend)
+    compute = AsyncMock(return_value={"themes": [{"name": "A"}]})
+    payload = {"task": "theme_analysis", "text": "text"}
+
+    first = await cache.get_or_compute("m", payload, compute)
+    first["themes"].append({"name": "mutated"})
+    second = await cache.get_or_compute("m", payload, compute)
+
+    assert compute.await_count == 1
+    assert second == {"themes": [{"name": "A"}]}
+
+    failing = AsyncMock(return_value={"error": "quota"})
+    await cache.get_or_compute("m", {"task": "x", "text": "t"}, failing)
+    await cache.get_or_compute("m", {"task": "x", "text": "t"}, failing)
+    assert failing.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_cache_facade_uses_shared_backend(tmp_path):
+    from backend.services.processing.llm_request_cache import LLMRequestCache
+
+    response_cache.set_cache_backend(MemoryCacheBackend())
+    try:
+        service = AsyncMock()
+        service.analyze = AsyncMock(return_value={"segments": []})
+        request = {"task": "transcript_structuring", "text": "A: hi"}
+
+        await LLMRequestCache.get_or_compute(request, service)
+        await LLMRequestCache.get_or_compute(request, service)
+        service.analyze.assert_awaited_once_with(request)
+
+        LLMRequestCache.clear_cache()
+        await LLMRequestCache.get_or_compute(request, service)
+        assert service.analyze.await_count == 2
+    finally:
+        response_cache.set_cache_backend(None)
@@ -0,0 +1,99 @@
+"""
+Tests for incremental JSON parsing of streamed LLM responses.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.llm.async_genai_client import AsyncGenAIClient
+from backend.utils.json.streaming_parser import IncrementalJSONParser
+
+THEMES = {
+    "enhanced_themes": [
+        {"name": "Reporting", "statements": ["It takes \"hours\" [really]", "a\\b"]},
+        {"name": "Onboarding", "statements": ["{not json}", "ok, fine"]},
+        {"name": "Pricing", "statements": []},
+    ],
+    "metadata": {"count": 3},
+}
+
+
+def _feed(parser, text, size):
+    items = []
+    for i in range(0, len(text), size):
+        items.extend(parser.feed(text[i : i + size]))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 7, 10000])
+def test_elements_are_emitted_as_they_close(size):
+    text = "```json\n" + json.dumps(THEMES, indent=2) + "\n```"
+    parser = IncrementalJSONParser(array_keys=["enhanced_themes"])
+
+    items = _feed(parser, text, size)
+
+    assert items == [("enhanced_themes", t) for t in THEMES["enhanced_themes"]]
+    assert parser.close() == THEMES
+    assert not parser.truncated
+
+
+def test_first_element_is_available_before_the_response_ends():
+    text = json.dumps(THEMES)
+    cut = text.index('{"name": "Onboarding"')
+    parser = IncrementalJSONParser()
+
+    assert parser.feed(text[:cut]) == [
+        ("enhanced_themes", THEMES["enhanced_themes"][0])
+    ]
+
+
+def test_truncated_stream_keeps_complete_elements():
+    text = json.dumps(THEMES)
+    cut = text.index('"ok, fine"') + 4
+    parser = IncrementalJSONParser()
+    items = parser.feed(text[:cut])
+
+    recovered = parser.close()
+
+    assert parser.truncated
+    assert recovered == {"enhanced_themes": THEMES["enhanced_themes"][:1]}
+    assert [item for _, item in items] == recovered["enhanced_themes"]
+
+
+def test_root_array_of_scalars_and_segments():
+    parser = IncrementalJSONParser()
+    items = _feed(parser, '[{"speaker_id": "A", "dialogue": "Hi"}, "x", 3, nul', 5)
+
+    segment = {"speaker_id": "A", "dialogue": "Hi"}
+    assert items == [(None, segment), (None, "x"), (None, 3)]
+    assert parser.close() == [segment, "x", 3]
+
+
+@pytest.mark.asyncio
+async def test_client_streams_items_and_post_processes():
+    text = json.dumps({"patterns": [{"name": "Workaround"}, {"name": "Escalation"}]})
+
+    async def stream():
+        for i in range(0, len(text), 9):
+            yield SimpleNamespace(text=text[i : i + 9])
+
+    async def open_stream(**kwargs):
+        return stream()
+
+    client = object.__new__(AsyncGenAIClient)
+    client.default_model = "gemini-2.5-flash"
+    client._generate_stream_with_retry = open_stream
+    seen = []
+
+    async def on_item(key, item):
+        seen.append((key, item["name"]))
+
+    result = await client.generate_json_incrementally(
+        "pattern_recognition", "Find patterns", on_item=on_item
+    )
+
+    assert seen == [("patterns", "Workaround"), ("patterns", "Escalation")]
+    # Post-processing fills pattern defaults on the full result
+    assert result["patterns"][0]["category"] == "Workflow"
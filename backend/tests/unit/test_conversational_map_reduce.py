@@ -0,0 +1,138 @@
+"""
+Tests for map-reduce theme extraction and overlapped stages of the
+conversational analysis agent.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.research.simulation_bridge.services import (
+    conversational_analysis_agent as analysis,
+)
+from backend.api.research.simulation_bridge.services.theme_reduction import (
+    reduce_themes,
+    text_windows,
+)
+
+
+def test_reduce_clusters_near_duplicate_themes():
+    themes = reduce_themes(
+        [
+            [
+                {
+                    "name": "Data Security Concerns",
+                    "statements": ["a"],
+                    "frequency": 0.4,
+                },
+                {"name": "Pricing", "statements": ["p"]},
+            ],
+            [
+                {
+                    "name": "Concerns about the data security",
+                    "statements": ["a", "b"],
+                    "keywords": ["gdpr"],
+                    "frequency": 0.9,
+                },
+                {"name": "Pricing transparency", "statements": ["q"]},
+            ],
+        ]
+    )
+
+    assert [t["name"] for t in themes] == [
+        "Data Security Concerns",
+        "Pricing",
+        "Pricing transparency",
+    ]
+    assert themes[0]["statements"] == ["a", "b"]
+    assert themes[0]["keywords"] == ["gdpr"]
+    assert themes[0]["frequency"] == 0.9
+    assert list(text_windows("x" * 90, 50, 10)) == [(0, 50), (40, 90)]
+
+
+@pytest.mark.asyncio
+async def test_windows_are_extracted_concurrently_and_reduced():
+    agent = analysis.ConversationalAnalysisAgent(None, max_concurrent_windows=3)
+    running, peak = [], []
+
+    async def run(prompt):
+        running.append(prompt)
+        peak.append(len(running))
+        await asyncio.sleep(0.02)
+        running.remove(prompt)
+        window = prompt.split("CURRENT DATA WINDOW (")[1].split(")")[0]
+        return SimpleNamespace(
+            output=analysis.ThemesResult(
+                themes=[
+                    analysis.LLMTheme(
+                        name="Onboarding friction", statements=[window]
+                    ),
+                    analysis.LLMTheme(
+                        name="onboarding frictions", statements=["shared"]
+                    ),
+                ]
+            )
+        )
+
+    agent.themes_agent = SimpleNamespace(run=run)
+    text = "x" * 250000
+    context = analysis.AnalysisContext(simulation_id="s", data_size=len(text))
+
+    result = await agent._extract_themes_conversational(text, context)
+
+    windows = list(text_windows(text, 50000, 10000))
+    assert len(windows) == 6 and max(peak) == 3
+    assert [t.name for t in result["themes"]] == ["Onboarding friction"]
+    statements = [f"{start}-{end}" for start, end in windows]
+    assert result["themes"][0].statements == (
+        statements[:1] + ["shared"] + statements[1:]
+    )
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap_after_themes():
+    agent = analysis.ConversationalAnalysisAgent(None)
+    events = []
+
+    def stage(name, result):
+        async def analyze(simulation_text, context, *args):
+            events.append(f"start {name}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {name}")
+            return result
+
+        return analyze
+
+    agent._extract_themes_conversational = stage("themes", {"themes": []})
+    agent._detect_patterns_conversational = stage("patterns", {"patterns": []})
+    agent._analyze_stakeholders_conversational = stage(
+        "stakeholders", {"stakeholder_intelligence": {}}
+    )
+    agent._analyze_sentiment_conversational = stage(
+        "sentiment", {"sentiment_details": []}
+    )
+    agent._generate_personas_conversational = stage("personas", {"personas": []})
+    agent._synthesize_insights_conversational = stage("insights", {"insights": []})
+    context = analysis.AnalysisContext(simulation_id="s", data_size=10)
+
+    results = await agent._run_conversational_workflow("text", context)
+
+    assert events[:2] == ["start themes", "end themes"]
+    assert set(events[2:6]) == {
+        "start patterns",
+        "start stakeholders",
+        "start sentiment",
+        "start personas",
+    }
+    assert events[-2:] == ["start insights", "end insights"]
+    assert set(results) == {
+        "themes",
+        "patterns",
+        "stakeholder_intelligence",
+        "sentiment_details",
+        "personas",
+        "insights",
+    }
+    context.advance_stage("done")
+    assert context.is_analysis_complete()
@@ -0,0 +1,65 @@
+"""
+Tests for the compiled lexicon matcher and the helpers ported to it.
+"""
+
+import re
+
+import pytest
+
+from backend.services.processing.keyword_highlighter import (
+    ContextAwareKeywordHighlighter,
+)
+from backend.utils.lexicon import Lexicon, LexiconHit, get_lexicon
+
+LEVELS = {
+    "entry-level": ["entry level", "entry", "junior"],
+    "mid-level": ["mid level", "mid-career", "mid"],
+    "senior": ["senior", "lead"],
+}
+
+
+def test_scan_reports_overlapping_and_prefix_terms():
+    lexicon = Lexicon(LEVELS)
+
+    hits = lexicon.scan("Entry level, then mid-career lead; entryway")
+
+    assert hits == [
+        LexiconHit("entry level", "entry-level", 0, 11),
+        LexiconHit("entry", "entry-level", 0, 5),
+        LexiconHit("mid-career", "mid-level", 18, 28),
+        LexiconHit("mid", "mid-level", 18, 21),
+        LexiconHit("lead", "senior", 29, 33),
+    ]
+    assert "Junior" in lexicon and "jun" not in lexicon
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["a lead who was junior", "mid-career", "midway leader", "", "senior mid level"],
+)
+def test_first_category_matches_per_term_search(text):
+    expected = None
+    for category, terms in LEVELS.items():
+        if any(re.search(r"\b" + re.escape(t) + r"\b", text) for t in terms):
+            expected = category
+            break
+
+    assert get_lexicon(LEVELS, ignore_case=False).first_category(text) == expected
+
+
+def test_substring_mode_and_cache():
+    lexicon = get_lexicon(("role", "age"), whole_words=False)
+
+    assert lexicon.search("stage manager")
+    assert not lexicon.search("location")
+    assert get_lexicon(("role", "age"), whole_words=False) is lexicon
+
+
+def test_highlighting_is_case_insensitive_and_whole_word():
+    highlighter = ContextAwareKeywordHighlighter()
+
+    highlighted = highlighter._apply_highlighting(
+        "Costs rose; the COST of costing is a cost.", ["cost", "costs"]
+    )
+
+    assert highlighted == "**costs** rose; the **cost** of costing is a **cost**."
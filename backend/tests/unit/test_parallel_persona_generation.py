@@ -0,0 +1,139 @@
+"""
+Tests for concurrent persona generation, name reservation and the persona to
+interview pipeline of the simulation bridge.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.research.simulation_bridge.models import (
+    BusinessContext,
+    QuestionsData,
+    SimulatedInterview,
+    SimulatedPerson,
+    SimulationConfig,
+    SimulationRequest,
+    Stakeholder,
+)
+from backend.api.research.simulation_bridge.services.name_registry import (
+    NameRegistry,
+)
+from backend.api.research.simulation_bridge.services.orchestrator import (
+    SimulationOrchestrator,
+)
+
+
+def _stakeholders(*names):
+    return {
+        "primary": [
+            Stakeholder(id=name, name=name, description=f"{name} users", questions=[])
+            for name in names
+        ]
+    }
+
+
+def _person(name):
+    return SimulatedPerson.model_construct(
+        id="", name=name, stakeholder_type="", motivations=[], pain_points=[]
+    )
+
+
+CONTEXT = BusinessContext(
+    business_idea="Bikes", target_customer="Riders", problem="Rust"
+)
+CONFIG = SimulationConfig(people_per_stakeholder=2)
+
+
+def test_registry_resolves_collisions_and_keeps_titles():
+    names = NameRegistry()
+
+    assert names.reserve("a", "Sarah Chen, CFO") == "Sarah Chen, CFO"
+    assert names.reserve("b", "Sarah Chen, Buyer") == "Sarah A. Chen, Buyer"
+    assert names.reserve("b", "Sarah Chen") == "Sarah B. Chen"
+    assert names.reserve("c", "Cher") == "Cher"
+    assert names.reserve("c", "Cher, Singer") == "Cher 2, Singer"
+    assert names.by_category["b"] == {"Sarah A. Chen", "Sarah B. Chen"}
+
+
+@pytest.mark.asyncio
+async def test_stakeholders_are_generated_concurrently_with_unique_names():
+    generator = SimulationOrchestrator(max_concurrent=3).persona_generator
+    running, peak = [], []
+
+    async def run(prompt, model_settings=None):
+        running.append(prompt)
+        peak.append(len(running))
+        await asyncio.sleep(0.02)
+        running.remove(prompt)
+        if "Stakeholder D" in prompt:
+            raise RuntimeError("boom")
+        # Every stakeholder proposes the same names
+        return SimpleNamespace(output=[_person("Ana Ruiz, Lead"), _person("Ben Ode")])
+
+    generator.agent = SimpleNamespace(run=run)
+    stakeholders = _stakeholders("A", "B", "C", "D")
+    stakeholders["primary"] = [
+        s.model_copy(update={"name": f"Stakeholder {s.name}"})
+        for s in stakeholders["primary"]
+    ]
+
+    people = await generator.generate_all_people(stakeholders, CONTEXT, CONFIG)
+
+    assert max(peak) == 3
+    assert [p.stakeholder_type for p in people] == [
+        "Stakeholder A",
+        "Stakeholder A",
+        "Stakeholder B",
+        "Stakeholder B",
+        "Stakeholder C",
+        "Stakeholder C",
+    ]
+    bases = [NameRegistry.base_name(p.name) for p in people]
+    assert len(set(bases)) == 6
+    assert sum(p.name.endswith(", Lead") for p in people) == 3
+
+
+@pytest.mark.asyncio
+async def test_interviews_start_before_all_personas_exist():
+    orchestrator = SimulationOrchestrator(max_concurrent=4)
+    events = []
+    delays = {"Slow": 0.1, "Fast": 0.0}
+
+    async def run(prompt, model_settings=None):
+        name = "Slow" if "Name: Slow" in prompt else "Fast"
+        await asyncio.sleep(delays[name])
+        events.append(f"personas {name}")
+        return SimpleNamespace(output=[_person(f"{name} Person")])
+
+    async def interview(persona, stakeholder, business_context, config, callback):
+        events.append(f"interview {persona.stakeholder_type}")
+        callback("done", 100)
+        return SimulatedInterview(
+            person_id=persona.id,
+            stakeholder_type=persona.stakeholder_type,
+            responses=[],
+            interview_duration_minutes=1,
+            overall_sentiment="neutral",
+            key_themes=[],
+        )
+
+    orchestrator.persona_generator.agent = SimpleNamespace(run=run)
+    simulator = orchestrator.parallel_interview_simulator
+    simulator.simulate_interview_with_semaphore = interview
+    request = SimulationRequest(
+        questions_data=QuestionsData(stakeholders=_stakeholders("Slow", "Fast")),
+        business_context=CONTEXT,
+        config=SimulationConfig(people_per_stakeholder=1),
+    )
+    updates = []
+
+    personas, interviews = await orchestrator._generate_and_interview(
+        "sim", request, lambda *args: updates.append(args)
+    )
+
+    assert events.index("interview Fast") < events.index("personas Slow")
+    assert [p.stakeholder_type for p in personas] == ["Slow", "Fast"]
+    assert [i.person_id for i in interviews] == [p.id for p in personas]
+    assert updates[-1][1:] == (2, 2, 0)
@@ -0,0 +1,154 @@
+"""
+Tests for single-flight PRD generation and concurrently generated sections.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.routes import prd as prd_routes
+from backend.services.processing.prd_flights import PRDFlightRegistry
+from backend.services.processing.prd_generation_service import (
+    PRDGenerationService,
+    prd_input_hash,
+)
+
+
+class _SectionLLM:
+    """Returns one PRD section per call and records concurrency."""
+
+    def __init__(self, fail=None, delays=None):
+        self.fail = fail
+        self.delays = delays or {}
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def analyze(self, request_data):
+        prd_type = request_data["prd_type"]
+        self.calls.append(prd_type)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.delays.get(prd_type, 0.02))
+        self.running -= 1
+        if prd_type == self.fail:
+            raise RuntimeError("timeout")
+        return {
+            "prd_type": prd_type,
+            f"{prd_type}_prd": {"objectives": [{"title": prd_type}]},
+        }
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_generation():
+    registry = PRDFlightRegistry()
+    release = asyncio.Event()
+    runs = []
+
+    async def runner(flight):
+        runs.append(flight.key)
+        await release.wait()
+        return {"prd_type": flight.prd_type}
+
+    first, started = registry.start(1, "both", "h1", runner, user_id="u")
+    second, joined_started = registry.start(1, "both", "h1", runner, user_id="u")
+    other, _ = registry.start(1, "both", "h2", runner, user_id="u")
+    release.set()
+    results = await asyncio.gather(first.task, second.task, other.task)
+
+    assert (started, joined_started) == (True, False)
+    assert first is second and other is not first
+    assert runs == [(1, "both", "h1"), (1, "both", "h2")]
+    assert results[0] == {"prd_type": "both"}
+    assert registry.latest(1, "both") is other
+    assert registry.stats()["running"] == 0
+    assert first.snapshot()["status"] == "completed"
+
+
+def test_input_hash_tracks_the_prompt_inputs():
+    results = {"themes": [{"name": "a"}], "personas": [], "status": "x"}
+
+    assert prd_input_hash(results, "both") == prd_input_hash(
+        {**results, "status": "y"}, "both"
+    )
+    assert prd_input_hash(results, "both") != prd_input_hash(results, "technical")
+    assert prd_input_hash(results, "both") != prd_input_hash(
+        {**results, "themes": []}, "both"
+    )
+
+
+@pytest.mark.asyncio
+async def test_both_generates_sections_concurrently():
+    llm = _SectionLLM()
+    service = PRDGenerationService(llm_service=llm)
+    ready = []
+
+    prd_data = await service.generate_prd(
+        {"themes": []}, "both", on_section=lambda name, _: ready.append(name)
+    )
+
+    assert sorted(llm.calls) == ["operational", "technical"]
+    assert llm.peak == 2
+    assert sorted(ready) == ["operational", "technical"]
+    assert prd_data["prd_type"] == "both"
+    assert prd_data["operational_prd"]["objectives"][0]["title"] == "operational"
+    assert "brd" in prd_data["operational_prd"]
+    assert prd_data["technical_prd"]["objectives"][0]["title"] == "technical"
+
+
+@pytest.mark.asyncio
+async def test_failed_section_keeps_the_other_section_cached(monkeypatch):
+    cache = {}
+    llm = _SectionLLM(fail="technical", delays={"operational": 0.05})
+    service = PRDGenerationService(db=object(), llm_service=llm)
+    monkeypatch.setattr(
+        service, "get_cached_prd_data", lambda result_id, t: cache.get(t)
+    )
+    monkeypatch.setattr(
+        service, "_cache_prd", lambda result_id, t, data: cache.__setitem__(t, data)
+    )
+
+    failed = await service.generate_prd({}, "both", result_id=7)
+    # The slower section finished and was cached before the error returned
+    assert llm.running == 0 and "operational" in cache
+    llm.fail = None
+    retried = await service.generate_prd({}, "both", result_id=7)
+
+    assert "error" in failed
+    assert llm.calls == ["operational", "technical", "technical"]
+    assert "error" not in retried and cache["both"] is retried
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_sections_then_complete(monkeypatch):
+    registry = PRDFlightRegistry()
+    monkeypatch.setattr(prd_routes, "get_prd_flights", lambda: registry)
+    release = asyncio.Event()
+
+    async def runner(flight):
+        flight.add_section("operational", {"operational_prd": {}})
+        await release.wait()
+        flight.add_section("technical", {"technical_prd": {}})
+        return {"prd_type": "both"}
+
+    registry.start(3, "both", "h", runner, user_id="u")
+    user = SimpleNamespace(user_id="u")
+    response = await prd_routes.stream_prd(3, "both", db=None, user=user)
+    events = []
+    async for chunk in response.body_iterator:
+        events.append((chunk.split("\n")[0], json.loads(chunk.split("data: ", 1)[1])))
+        release.set()
+
+    assert [name for name, _ in events] == [
+        "event: section",
+        "event: section",
+        "event: complete",
+    ]
+    assert [data.get("section") for _, data in events[:2]] == [
+        "operational",
+        "technical",
+    ]
+    assert events[-1][1]["prd_data"] == {"prd_type": "both"}
+    assert prd_routes._find_flight(3, "both", SimpleNamespace(user_id="v")) is None
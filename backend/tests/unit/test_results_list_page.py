@@ -0,0 +1,135 @@
+"""
+Tests for the paginated, projection-based analysis history list.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import JSON, MetaData, create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.models import AnalysisResult, InterviewData, User
+from backend.services.results.formatting.summary import build_analysis_summary
+from backend.services.results_service import ResultsService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # Copy the tables so the Postgres-only JSONB column can be created on SQLite
+    metadata = MetaData()
+    for model in (User, InterviewData, AnalysisResult):
+        model.__table__.to_metadata(metadata)
+    metadata.tables["analysis_results"].c.stakeholder_intelligence.type = JSON()
+    metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add_all(
+        [
+            User(user_id="u1", email="u1@example.com"),
+            User(user_id="u2", email="u2@example.com"),
+        ]
+    )
+    base = datetime(2025, 1, 1)
+    for i in range(5):
+        data = InterviewData(user_id="u1", filename=f"file-{i}.txt", input_type="text")
+        session.add(data)
+        session.flush()
+        session.add(
+            AnalysisResult(
+                data_id=data.id,
+                analysis_date=base + timedelta(days=i),
+                status="completed",
+                results={"themes": [{"name": "t"}] * i, "personas": []},
+                summary=build_analysis_summary({"themes": [{}] * i}, "completed"),
+            )
+        )
+    other = InterviewData(user_id="u2", filename="other.txt", input_type="text")
+    session.add(other)
+    session.flush()
+    session.add(AnalysisResult(data_id=other.id, analysis_date=base, status="completed"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_pages_walk_all_owned_results_without_loading_results(db):
+    service = ResultsService(db, db.get(User, "u1"))
+    statements = []
+    event.listen(
+        db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    first = service.list_analyses_page(limit=2)
+    second = service.list_analyses_page(limit=2, cursor=first["next_cursor"])
+    third = service.list_analyses_page(limit=2, cursor=second["next_cursor"])
+
+    names = [item["fileName"] for page in (first, second, third) for item in page["items"]]
+    assert names == [f"file-{i}.txt" for i in (4, 3, 2, 1, 0)]
+    assert first["items"][0]["summary"]["theme_count"] == 4
+    assert third["has_more"] is False and third["next_cursor"] is None
+
+    # One query per page, and none of them selects the results column
+    assert len(statements) == 3
+    assert not any("analysis_results.results" in s for s in statements)
+
+
+def test_sort_by_filename_ascending_and_status_filter(db):
+    service = ResultsService(db, db.get(User, "u1"))
+
+    page = service.list_analyses_page(sort_by="fileName", sort_direction="asc", limit=3)
+    rest = service.list_analyses_page(
+        sort_by="fileName", sort_direction="asc", limit=3, cursor=page["next_cursor"]
+    )
+    assert [i["fileName"] for i in page["items"] + rest["items"]] == [
+        f"file-{i}.txt" for i in range(5)
+    ]
+
+    assert service.list_analyses_page(status="pending", limit=10)["items"] == []
+
+
+def test_failed_filter_includes_error_status(db):
+    rows = db.query(AnalysisResult).join(InterviewData).filter(
+        InterviewData.filename.in_(["file-1.txt", "file-2.txt"])
+    ).order_by(InterviewData.filename).all()
+    rows[0].status = "failed"
+    rows[1].status = "error"
+    db.commit()
+    service = ResultsService(db, db.get(User, "u1"))
+
+    items = service.list_analyses_page(status="failed", limit=10)["items"]
+
+    assert sorted(i["fileName"] for i in items) == ["file-1.txt", "file-2.txt"]
+    assert {i["status"] for i in items} == {"failed"}
+
+
+def test_missing_summaries_are_backfilled_once(db):
+    row = db.query(AnalysisResult).join(InterviewData).filter(
+        InterviewData.filename == "file-3.txt"
+    ).one()
+    row.summary = None
+    db.commit()
+    service = ResultsService(db, db.get(User, "u1"))
+
+    items = service.list_analyses_page(limit=10)["items"]
+
+    backfilled = next(i for i in items if i["fileName"] == "file-3.txt")
+    assert backfilled["summary"]["theme_count"] == 3
+    db.refresh(row)
+    assert row.summary["theme_count"] == 3
+
+
+def test_invalid_cursor_is_rejected(db):
+    from fastapi import HTTPException
+
+    service = ResultsService(db, db.get(User, "u1"))
+    with pytest.raises(HTTPException) as exc:
+        service.list_analyses_page(limit=2, cursor="not-a-cursor")
+    assert exc.value.status_code == 400
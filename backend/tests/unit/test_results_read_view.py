@@ -0,0 +1,173 @@
+"""
+Tests for the materialized, ETag-versioned results read view.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import JSON, MetaData, create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+
+from backend.api.routes import analysis as analysis_routes
+from backend.models import AnalysisResult, InterviewData, User
+from backend.services.results import read_view, read_view_builder
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    metadata = MetaData()
+    for model in (User, InterviewData, AnalysisResult):
+        model.__table__.to_metadata(metadata)
+    metadata.tables["analysis_results"].c.stakeholder_intelligence.type = JSON()
+    metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(user_id="u1", email="u1@example.com"))
+    data = InterviewData(user_id="u1", filename="a.txt", input_type="text")
+    session.add(data)
+    session.flush()
+    session.add(
+        AnalysisResult(
+            result_id=7,
+            data_id=data.id,
+            status="completed",
+            results=json.dumps({"themes": [], "personas": []}),
+        )
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def formatted(monkeypatch):
+    calls = []
+
+    class Service:
+        def get_analysis_result(self, result_id):
+            calls.append(result_id)
+            return {
+                "status": "completed",
+                "result_id": result_id,
+                "results": {"themes": [], "personas": [], "run": len(calls)},
+            }
+
+    class Container:
+        def get_results_service(self):
+            return lambda db, user: Service()
+
+    monkeypatch.setattr(
+        "backend.api.dependencies.get_container", lambda: Container()
+    )
+    return calls
+
+
+def _request(etag=None):
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+async def _get(db, etag=None):
+    return await analysis_routes.get_results(
+        7, _request(etag), db=db, current_user=User(user_id="u1")
+    )
+
+
+@pytest.mark.asyncio
+async def test_view_is_materialized_on_write_and_revalidated_with_etag(
+    db, formatted
+):
+    row = db.get(AnalysisResult, 7)
+    assert row.results_fingerprint == read_view.results_fingerprint(row.results)
+    assert read_view_builder.materialize_read_view(db, row, User(user_id="u1"))
+    db.expire_all()
+
+    first = await _get(db)
+    second = await _get(db)
+
+    assert formatted == [7]
+    assert first.body == second.body
+    assert json.loads(second.body)["results"]["run"] == 1
+    etag = first.headers["etag"]
+    assert second.headers["etag"] == etag
+
+    not_modified = await _get(db, etag=f'W/{etag}, "other"')
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert formatted == [7]
+    db.expunge_all()
+    row = db.query(AnalysisResult).first()
+    assert "read_view" in inspect(row).unloaded
+
+
+@pytest.mark.asyncio
+async def test_stale_view_is_rebuilt_and_stored_on_read(db, formatted, monkeypatch):
+    row = db.get(AnalysisResult, 7)
+    read_view_builder.materialize_read_view(db, row, User(user_id="u1"))
+    etag = (await _get(db)).headers["etag"]
+
+    row.results = json.dumps({"themes": [{"name": "new"}], "personas": []})
+    db.commit()
+    assert row.read_view is None
+    changed = await _get(db, etag=etag)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert formatted == [7, 7]
+    # The view is stored from a worker-thread session; start a fresh read
+    db.expire_all()
+    await _get(db)
+    assert formatted == [7, 7]
+    assert db.get(AnalysisResult, 7).read_view is not None
+
+    monkeypatch.setattr(read_view, "READ_VIEW_VERSION", "next")
+    await _get(db)
+    db.expire_all()
+    await _get(db)
+    assert formatted == [7, 7, 7]
+    db.expire_all()
+    assert db.get(AnalysisResult, 7).read_view["version"] == "next"
+
+
+@pytest.mark.asyncio
+async def test_view_of_overwritten_results_is_not_stored(db, monkeypatch):
+    def format_and_race(session, user, result_id):
+        # Another route rewrites the results while this view is being built
+        other = session.get(AnalysisResult, result_id)
+        other.results = json.dumps({"themes": [{"name": "late"}], "personas": []})
+        session.commit()
+        return {"status": "completed", "result_id": result_id, "results": {}}
+
+    monkeypatch.setattr(read_view_builder, "format_result", format_and_race)
+    response = await _get(db)
+
+    assert response.status_code == 200
+    db.expire_all()
+    assert db.get(AnalysisResult, 7).read_view is None
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_of_legacy_row_is_backfilled_on_read(db, formatted):
+    # Written before the fingerprint column existed
+    db.query(AnalysisResult).filter(AnalysisResult.result_id == 7).update(
+        {AnalysisResult.results_fingerprint: None}, synchronize_session=False
+    )
+    db.commit()
+    db.expire_all()
+    assert db.get(AnalysisResult, 7).results_fingerprint is None
+
+    first = await _get(db)
+    etag = first.headers["etag"]
+    db.expire_all()
+    row = db.get(AnalysisResult, 7)
+    assert row.results_fingerprint == read_view.results_fingerprint(row.results)
+
+    not_modified = await _get(db, etag=etag)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert formatted == [7]
@@ -0,0 +1,84 @@
+"""
+Tests for the precomputed scoped-text index used by evidence linking V2.
+"""
+
+from backend.services.processing.evidence_linking_service import (
+    EvidenceLinkingService,
+)
+from backend.services.processing.scoped_text_index import ScopedTextIndex, SpanSet
+
+
+TEXT = (
+    "Interviewer: Which tools do you use for weekly reporting? "
+    "I rely on spreadsheets for weekly reporting and manual data cleanup. "
+    "Role: Senior analyst. "
+    "We automate the reporting pipeline with scripts when spreadsheets break. "
+    "Our budget meetings happen quarterly with the finance team."
+)
+
+
+def test_span_set_merges_and_detects_overlaps():
+    spans = SpanSet([(10, 20), (30, 40)])
+    assert spans.overlaps((15, 16))
+    assert spans.overlaps((0, 11))
+    assert not spans.overlaps((20, 30))
+    assert not spans.overlaps((40, 50))
+
+    spans.add((20, 30))
+    assert list(spans) == [(10, 40)]
+    assert spans.overlaps((25, 26))
+    assert len(spans) == 3
+
+
+def test_index_precomputes_hygiene_and_matches_tokens():
+    index = ScopedTextIndex(TEXT)
+
+    assert len(index) == 5
+    assert index.hygiene_rejected == [True, False, True, False, False]
+
+    matched = [
+        i for i, _ in index.overlapping_sentences("weekly reporting spreadsheets")
+    ]
+    assert matched == [0, 1, 3]
+    assert index.overlapping_sentences("") == []
+
+
+def test_select_candidates_skips_used_spans_and_counts_rejections():
+    index = ScopedTextIndex(TEXT)
+    metrics = {}
+    first = index.select_candidates(
+        "weekly reporting spreadsheets", SpanSet(), metrics=metrics
+    )
+
+    assert [c[2] for c in first] == [
+        "I rely on spreadsheets for weekly reporting and manual data cleanup.",
+        "We automate the reporting pipeline with scripts when spreadsheets break.",
+    ]
+    assert metrics == {
+        "checked_sentences": 5,
+        "rejected_low_overlap": 2,
+        "rejected_metadata_or_question": 1,
+    }
+
+    used = SpanSet([first[0][:2]])
+    second = index.select_candidates("weekly reporting spreadsheets", used)
+    assert [c[2] for c in second] == [first[1][2]]
+
+
+def test_service_reuses_index_for_same_scope():
+    service = EvidenceLinkingService(llm_service=None)
+    attributes = {
+        "technology_usage": {
+            "value": "spreadsheets for weekly reporting",
+            "confidence": 0.7,
+        }
+    }
+
+    service.link_evidence_to_attributes_v2(attributes, TEXT, {"speaker": "P1"})
+    index = service._get_scoped_index(TEXT)
+    _, evidence = service.link_evidence_to_attributes_v2(
+        attributes, TEXT, {"speaker": "P1"}
+    )
+
+    assert service._get_scoped_index(TEXT) is index
+    assert evidence["technology_usage"][0]["start_char"] == TEXT.index(" I rely")
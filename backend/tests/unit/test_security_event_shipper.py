@@ -0,0 +1,136 @@
+"""
+Tests for the background security event shipper.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from backend.services.external.security_event_shipper import SecurityEventShipper
+
+
+def _shipper(tmp_path, handler, **kwargs):
+    options = {"batch_size": 10, "flush_seconds": 0.01, "max_queue": 100}
+    options.update(kwargs)
+    return SecurityEventShipper(
+        "https://sink.test/logSecurityEvent",
+        spill_path=str(tmp_path / "spill.jsonl"),
+        transport=httpx.MockTransport(handler),
+        **options,
+    )
+
+
+async def _until(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_immediately_and_events_are_delivered(tmp_path):
+    received = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        received.append(json.loads(request.content))
+        return httpx.Response(200)
+
+    shipper = _shipper(tmp_path, handler)
+    assert all(shipper.enqueue({"n": i}) for i in range(25))
+    assert received == []
+
+    release.set()
+    await _until(lambda: shipper.stats()["sent"] == 25)
+    await shipper.stop()
+
+    assert sorted(event["n"] for event in received) == list(range(25))
+    assert shipper.stats()["high_water"] >= 15
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_counts(tmp_path):
+    async def handler(request):
+        return httpx.Response(200)
+
+    shipper = _shipper(tmp_path, handler, max_queue=3)
+
+    results = [shipper.enqueue({"n": i}) for i in range(5)]
+
+    assert results == [True, True, True, False, False]
+    assert shipper.stats()["dropped"] == 2
+    await shipper.stop()
+
+
+@pytest.mark.asyncio
+async def test_undelivered_events_spill_and_replay_when_sink_recovers(tmp_path):
+    sink_up = False
+    received = []
+
+    async def handler(request):
+        event = json.loads(request.content)
+        if event.get("bad"):
+            return httpx.Response(400, text="invalid")
+        if not sink_up:
+            raise httpx.ConnectError("sink down")
+        received.append(event["n"])
+        return httpx.Response(200)
+
+    shipper = _shipper(tmp_path, handler)
+    for i in range(3):
+        shipper.enqueue({"n": i})
+    shipper.enqueue({"bad": True})
+    await _until(lambda: shipper.stats()["spilled"] == 3)
+    assert shipper.stats()["rejected"] == 1
+    assert received == []
+
+    sink_up = True
+    shipper.enqueue({"n": 3})
+    await _until(lambda: shipper.stats()["replayed"] == 3)
+    await shipper.stop()
+
+    assert sorted(received) == [0, 1, 2, 3]
+    assert not (tmp_path / "spill.jsonl").exists()
+
+
+@pytest.mark.asyncio
+async def test_stop_spills_queued_events(tmp_path):
+    async def handler(request):
+        return httpx.Response(200)
+
+    shipper = _shipper(tmp_path, handler)
+    await shipper.stop()
+    shipper._queue.extend([{"n": 1}, {"n": 2}])
+
+    await shipper.stop()
+
+    lines = (tmp_path / "spill.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [{"n": 1}, {"n": 2}]
+
+
+def test_client_of_a_finished_loop_is_closed(tmp_path):
+    async def handler(request):
+        return httpx.Response(200)
+
+    shipper = _shipper(tmp_path, handler)
+
+    async def deliver(sent):
+        shipper.enqueue({"n": sent})
+        await _until(lambda: shipper.stats()["sent"] == sent)
+        return shipper._client
+
+    # The first loop ends without stop(), leaving its client behind
+    first = asyncio.run(deliver(1))
+    assert not first.is_closed
+
+    async def deliver_on_new_loop():
+        second = await deliver(2)
+        await shipper.stop()
+        return second
+
+    second = asyncio.run(deliver_on_new_loop())
+    assert second is not first
+    assert first.is_closed
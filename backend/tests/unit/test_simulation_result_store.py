@@ -0,0 +1,91 @@
+"""
+Tests for the bounded, spill-to-disk store of completed simulation results.
+"""
+
+import pytest
+
+from backend.api.research.simulation_bridge.models import SimulationResponse
+from backend.api.research.simulation_bridge.services import (
+    orchestrator as orchestrator_module,
+)
+from backend.api.research.simulation_bridge.services.orchestrator import (
+    SimulationOrchestrator,
+)
+from backend.api.research.simulation_bridge.services.simulation_store import (
+    SimulationResultStore,
+)
+from backend.services.llm.response_cache import SQLiteCacheBackend
+
+
+def _response(simulation_id, padding=2000):
+    return SimulationResponse(
+        success=True,
+        message="done",
+        simulation_id=simulation_id,
+        data={"analysis_ready_text": "x" * padding},
+        metadata={"total_personas": 3, "total_interviews": 3},
+    )
+
+
+def test_store_spills_to_disk_and_rehydrates(tmp_path):
+    disk = SQLiteCacheBackend(str(tmp_path / "sims.sqlite3"))
+    store = SimulationResultStore(max_bytes=5000, disk=disk)
+
+    for simulation_id in ("a", "b", "c"):
+        store.put(simulation_id, _response(simulation_id))
+
+    assert store.keys() == ["b", "c"]
+    assert store.stats()["resident_bytes"] <= 5000
+    assert store.stats()["spills"] == 1
+    assert set(store.summaries()) == {"a", "b", "c"}
+
+    rehydrated = store.get("a")
+    assert rehydrated == _response("a")
+    assert store.keys() == ["c", "a"]
+    assert store.get("c") is not None
+    assert store.get("missing") is None
+    stats = store.stats()
+    assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    # A fresh store (e.g. after a restart) still finds spilled results
+    assert SimulationResultStore(max_bytes=5000, disk=disk).get("b") is not None
+    assert store.clear() == 3
+    assert store.get("b") is None and len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_store_spills_and_rehydrates_off_the_loop(tmp_path):
+    disk = SQLiteCacheBackend(str(tmp_path / "sims.sqlite3"))
+    store = SimulationResultStore(max_bytes=5000, disk=disk)
+
+    await store.put_async("big", _response("big", padding=8000))
+    for simulation_id in ("a", "b", "c"):
+        await store.put_async(simulation_id, _response(simulation_id))
+
+    assert store.keys() == ["b", "c"]
+    assert store.stats()["spills"] == 2
+    assert await store.get_async("big") == _response("big", padding=8000)
+    assert await store.get_async("a") == _response("a")
+    assert await store.get_async("missing") is None
+    assert store.keys() == ["c", "a"]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_bounds_finished_progress(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "FINISHED_PROGRESS_SIZE", 2)
+    orchestrator = SimulationOrchestrator()
+    orchestrator.active_simulations = {
+        simulation_id: orchestrator_module.SimulationProgress(
+            simulation_id=simulation_id,
+            stage="initializing",
+            progress_percentage=0,
+            current_task="",
+        )
+        for simulation_id in ("running", "a", "b", "c")
+    }
+
+    for simulation_id in ("a", "b", "c"):
+        await orchestrator._update_progress(simulation_id, "completed", 100, "")
+
+    assert set(orchestrator.active_simulations) == {"running", "b", "c"}
@@ -0,0 +1,133 @@
+"""
+Tests for the indexed tool-catalog matcher and the recognition service caches.
+"""
+
+import random
+import string
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.services.processing import adaptive_tool_recognition_service as atr
+from backend.services.processing.adaptive_tool_recognition_service import (
+    AdaptiveToolRecognitionService,
+)
+from backend.services.processing.tool_catalog_index import ToolCatalogIndex
+
+
+def _catalog(size, seed=7):
+    rng = random.Random(seed)
+
+    def word():
+        return "".join(rng.choice("abcdefgh ") for _ in range(rng.randint(2, 14)))
+
+    return {
+        word().strip() or "x": {"variations": [word() for _ in range(3)]}
+        for _ in range(size)
+    }
+
+
+def _pairwise(service, mention, industry_tools):
+    """Reference: the original one-pair-at-a-time scan."""
+    best_match, best_score = None, 0.0
+    for canonical, info in industry_tools.items():
+        for choice in [canonical] + info["variations"]:
+            score = service._calculate_similarity(mention, choice)
+            if score > best_score:
+                best_match, best_score = canonical, score
+    if best_match and best_score >= service.similarity_threshold:
+        return best_match, best_score
+    return None
+
+
+@pytest.mark.parametrize(
+    "use_rapidfuzz",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not atr.USE_RAPIDFUZZ, reason="rapidfuzz is not installed"
+            ),
+        ),
+        False,
+    ],
+)
+def test_index_matches_pairwise_scan(use_rapidfuzz):
+    service = AdaptiveToolRecognitionService(AsyncMock())
+    service.use_rapidfuzz = use_rapidfuzz
+    catalog = _catalog(300)
+    index = ToolCatalogIndex(catalog, threshold=0.75, use_rapidfuzz=use_rapidfuzz)
+    rng = random.Random(3)
+    choices = [c for name, info in catalog.items() for c in [name, *info["variations"]]]
+    mentions = [
+        "".join(
+            ch if rng.random() > 0.15 else rng.choice(string.ascii_lowercase)
+            for ch in rng.choice(choices)
+        )
+        for _ in range(150)
+    ] + ["", "zzzzzzzzzzzzzzzzzzzzzzzzz"]
+
+    assert index.match_many(mentions) == [
+        _pairwise(service, m, catalog) for m in mentions
+    ]
+
+
+def test_ties_go_to_first_catalog_entry_and_lookups_are_bounded():
+    catalog = {
+        "mirx": {"variations": []},
+        "miry": {"variations": ["mira"]},
+    }
+    index = ToolCatalogIndex(catalog, threshold=0.7, cache_size=2)
+
+    assert index.match("mira") == ("miry", 1.0)
+    assert index.match("mirz") == ("mirx", 0.75)
+    assert index.match_many(["a", "b", "mira"]) == [None, None, ("miry", 1.0)]
+    assert list(index._cache) == ["a", "b"]
+
+
+def test_enhance_uses_prebuilt_index_for_low_confidence_tools():
+    service = AdaptiveToolRecognitionService(AsyncMock())
+    catalog = {"miro": {"variations": ["miro", "miroboard"]}}
+    index = service._catalog_index("Technology", catalog)
+    tools = [
+        {"tool_name": "?", "original_mention": "Mirro", "confidence": 0.5},
+        {"tool_name": "Mirro", "original_mention": "Mirro", "confidence": 0.9},
+    ]
+
+    result = service._enhance_with_fuzzy_matching(tools, catalog, index)
+
+    assert result[0]["tool_name"] == "miro" and result[0]["is_misspelling"]
+    assert result[1]["tool_name"] == "Mirro"
+    assert service._catalog_index("Technology", catalog) is index
+
+
+@pytest.mark.asyncio
+async def test_industry_caches_are_bounded_lru(monkeypatch):
+    monkeypatch.setattr(atr, "INDUSTRY_CACHE_SIZE", 2)
+    llm = AsyncMock()
+    llm.analyze.return_value = {"industry": "Finance", "confidence": 0.9}
+    service = AdaptiveToolRecognitionService(llm)
+
+    for text in ["a", "b", "a", "c"]:
+        await service.identify_industry(text)
+
+    assert list(service.industry_cache) == ["a", "c"]
+    assert llm.analyze.call_count == 3
+
+
+def test_learned_corrections_persist_and_load_lazily(tmp_path):
+    path = tmp_path / "corrections.jsonl"
+    first = AdaptiveToolRecognitionService(AsyncMock(), corrections_path=str(path))
+    first.learn_from_correction("Jirra", "Jira", 0.8)
+    first.learn_from_correction("jirra", "Jira Software", 0.85)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"mention": "torn"')
+
+    second = AdaptiveToolRecognitionService(AsyncMock(), corrections_path=str(path))
+    assert second._learned_corrections is None
+    assert second.learned_corrections["jirra"] == {
+        "tool_name": "Jira Software",
+        "confidence": 0.85,
+    }
+    assert second.learned_corrections["mirrorboards"]["tool_name"] == "Miro"
+    assert "torn" not in second.learned_corrections
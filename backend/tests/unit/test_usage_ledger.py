@@ -0,0 +1,109 @@
+"""
+Tests for the atomic usage ledger behind UsageTrackingService.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base
+from backend.models import UsageCounter, User
+from backend.services import usage_ledger as usage_ledger_module
+from backend.services.usage_ledger import UsageLedger, current_period
+from backend.services.usage_tracking_service import UsageTrackingService
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'usage.db'}", connect_args={"timeout": 30}
+    )
+    Base.metadata.create_all(engine, tables=[User.__table__, UsageCounter.__table__])
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(User(user_id="u1", email="u1@example.com"))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def test_concurrent_increments_are_not_lost(session_factory):
+    ledger = UsageLedger(cache_ttl=0)
+
+    def work():
+        with session_factory() as db:
+            for _ in range(25):
+                ledger.increment(db, "u1", "analyses_count")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with session_factory() as db:
+        usage = ledger.get_month_usage(db, "u1")
+    assert usage == {"analyses_count": 200, "prd_generations_count": 0}
+
+
+def test_reads_are_cached_and_kept_exact_by_local_increments(session_factory):
+    ledger = UsageLedger(cache_ttl=60)
+    legacy_calls = []
+
+    def legacy():
+        legacy_calls.append(1)
+        return {"analyses_count": 4, "prd_generations_count": 1}
+
+    with session_factory() as db:
+        assert ledger.get_month_usage(db, "u1", legacy=legacy)["analyses_count"] == 4
+        assert ledger.increment(db, "u1", "analyses_count", seed=4) == 5
+        usage = ledger.get_month_usage(db, "u1", legacy=legacy)
+
+    assert usage == {"analyses_count": 5, "prd_generations_count": 1}
+    assert ledger.reads == 1 and len(legacy_calls) == 1
+    with pytest.raises(ValueError):
+        ledger.increment(None, "u1", "unknown_count")
+
+
+@pytest.mark.asyncio
+async def test_metadata_sync_is_debounced_to_latest_usage():
+    ledger = UsageLedger(sync_debounce=0.02)
+    sent = []
+
+    async def sync(user_id, usage):
+        sent.append((user_id, usage["analyses_count"]))
+
+    for count in range(1, 4):
+        ledger.schedule_sync("u1", {"analyses_count": count}, sync)
+    ledger.schedule_sync("u2", {"analyses_count": 9}, sync)
+    await asyncio.sleep(0.1)
+
+    assert sorted(sent) == [("u1", 3), ("u2", 9)]
+    ledger.schedule_sync("u1", {"analyses_count": 4}, sync)
+    await ledger.stop()
+    assert sent[-1] == ("u1", 4)
+
+
+@pytest.mark.asyncio
+async def test_tracking_service_seeds_counter_from_usage_data(
+    session_factory, monkeypatch
+):
+    monkeypatch.setattr(usage_ledger_module, "_usage_ledger", UsageLedger())
+    with session_factory() as db:
+        user = db.get(User, "u1")
+        user.usage_data = {
+            "subscription": {"tier": "free", "status": "active"},
+            "usage": {current_period(): {"analyses_count": 2}},
+        }
+        db.commit()
+        service = UsageTrackingService(db, user)
+
+        assert await service.track_analysis(10) == 3
+        assert await service.track_analysis(11) == 4
+        usage = await service.get_current_month_usage()
+
+    assert usage == {"analyses_count": 4, "prd_generations_count": 0}
+    await usage_ledger_module.get_usage_ledger().stop()
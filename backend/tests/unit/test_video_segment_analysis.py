@@ -0,0 +1,187 @@
+"""
+Tests for concurrent, cached segment analysis of long videos.
+"""
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+def _import_video_analysis():
+    # Importing the routes package builds services that refuse to start
+    # without a Gemini API key; the tests only use fakes, so any key will do
+    with pytest.MonkeyPatch.context() as mp:
+        if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
+            mp.setenv("GEMINI_API_KEY", "test-key")
+        from backend.api.axpersona.routes import video_analysis
+
+    return video_analysis
+
+
+video_analysis = _import_video_analysis()
+
+GeminiVideoAnalyzer = video_analysis.GeminiVideoAnalyzer
+VideoMetadataRequest = video_analysis.VideoMetadataRequest
+get_video_metadata = video_analysis.get_video_metadata
+
+
+def _annotation(start, end, description):
+    return {
+        "timestamp_start": start,
+        "timestamp_end": end,
+        "description": description,
+    }
+
+
+def _analyzer():
+    analyzer = GeminiVideoAnalyzer()
+    analyzer._available = True
+    return analyzer
+
+
+def test_stitch_merges_events_reported_on_both_sides_of_a_boundary():
+    analyzer = _analyzer()
+    windows = [(0, 600), (600, 1200)]
+    segments = [
+        [
+            _annotation("09:00", "09:30", "Queue at Shake Shack"),
+            _annotation("09:45", "10:00", "Crowd forming near the waterfall"),
+        ],
+        [
+            _annotation("10:00", "10:20", "Crowd forming near the waterfall."),
+            _annotation("10:05", "10:30", "Trolley blocks the corridor"),
+        ],
+    ]
+
+    stitched = analyzer.stitch_segments(segments, windows)
+
+    assert [a["description"] for a in stitched] == [
+        "Queue at Shake Shack",
+        "Crowd forming near the waterfall",
+        "Trolley blocks the corridor",
+    ]
+    assert stitched[1]["timestamp_end"] == "10:20"
+
+
+@pytest.mark.asyncio
+async def test_segments_run_concurrently_and_are_stitched_in_order(monkeypatch):
+    analyzer = _analyzer()
+    running = []
+    peak = []
+
+    async def generate(video_url, start_offset, end_offset, segment_prompt):
+        running.append(start_offset)
+        peak.append(len(running))
+        # Later segments finish first
+        await asyncio.sleep(0.05 - start_offset / 60000)
+        running.remove(start_offset)
+        ts = analyzer._seconds_to_timestamp(start_offset + 60)
+        return [_annotation(ts, ts, f"event at {start_offset}")]
+
+    monkeypatch.setattr(analyzer, "_generate_segment", generate)
+
+    completion = [
+        index
+        async for index, _ in analyzer.iter_segments(
+            "technical", "https://v.test/a", 1800
+        )
+    ]
+    annotations = await analyzer.analyze_video("https://v.test/a", None, 1800)
+
+    assert completion == [2, 1, 0]
+    assert max(peak) == 3
+    assert [a["description"] for a in annotations] == [
+        "event at 0",
+        "event at 600",
+        "event at 1200",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_segment_results_are_cached_by_video_window_and_prompt():
+    analyzer = _analyzer()
+    text = json.dumps([_annotation("00:10", "00:20", "x")])
+    generate = AsyncMock(return_value=SimpleNamespace(text=text))
+    analyzer._client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate))
+    )
+    url = "https://www.youtube.com/watch?v=abc123"
+
+    first = await analyzer._generate_segment(url, 0, 600, "prompt")
+    second = await analyzer._generate_segment(url + "&t=5", 0, 600, "prompt")
+    await analyzer._generate_segment(url, 0, 600, "other prompt")
+
+    assert first == second
+    assert generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_metadata_runs_yt_dlp_without_blocking_and_is_cached(monkeypatch):
+    calls = []
+
+    class Process:
+        returncode = 0
+
+        async def communicate(self):
+            return json.dumps({"title": "Walk", "duration": 3725}).encode(), b""
+
+    async def create_subprocess_exec(*args, **kwargs):
+        calls.append(args)
+        return Process()
+
+    monkeypatch.setattr(
+        video_analysis, "_metadata_cache", video_analysis.OrderedDict()
+    )
+    monkeypatch.setattr(
+        video_analysis.asyncio, "create_subprocess_exec", create_subprocess_exec
+    )
+    request = VideoMetadataRequest(video_url="https://youtu.be/xyz")
+
+    first = await get_video_metadata(request)
+    second = await get_video_metadata(request)
+
+    assert (first.title, first.duration_formatted, first.video_id) == (
+        "Walk",
+        "1:02:05",
+        "xyz",
+    )
+    assert second == first
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_segments_then_stitched_response(monkeypatch):
+    analyzer = _analyzer()
+
+    async def generate(video_url, start_offset, end_offset, segment_prompt):
+        ts = analyzer._seconds_to_timestamp(start_offset + 30)
+        return [{**_annotation(ts, ts, f"event at {start_offset}"), "summary": "s"}]
+
+    monkeypatch.setattr(analyzer, "_generate_segment", generate)
+    monkeypatch.setattr(video_analysis, "_video_analyzer", analyzer)
+    request = video_analysis.VideoAnalysisRequest(
+        video_url="https://v.test/a", video_duration_seconds=1500
+    )
+
+    response = await video_analysis.stream_video_analysis(request)
+    events = [
+        (chunk.split("\n")[0], json.loads(chunk.split("data: ", 1)[1]))
+        async for chunk in response.body_iterator
+    ]
+
+    segments = [data for name, data in events if name == "event: segment"]
+    assert sorted((s["kind"], s["segment"]) for s in segments) == [
+        (kind, i) for kind in ("annotations", "technical") for i in range(3)
+    ]
+    name, complete = events[-1]
+    assert name == "event: complete"
+    assert [a["description"] for a in complete["annotations"]] == [
+        "event at 0",
+        "event at 600",
+        "event at 1200",
+    ]
+    assert len(complete["technical_annotations"]) == 3
@@ -29,7 +29,8 @@ from .instructor_parser import (
     instructor_parser,
     parse_json_with_instructor,
     parse_llm_json_response_with_instructor,
-    parse_with_model_instructor
+    parse_with_model_instructor,
+    parse_with_model_instructor_async
 )
 
 __all__ = [
@@ -51,5 +52,6 @@ __all__ = [
     'instructor_parser',
     'parse_json_with_instructor',
     'parse_llm_json_response_with_instructor',
-    'parse_with_model_instructor'
+    'parse_with_model_instructor',
+    'parse_with_model_instructor_async'
 ]
@@ -6,9 +6,10 @@ the new Instructor-based approach. It maintains API compatibility with the
 existing code while leveraging Instructor's structured output capabilities.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel, ValidationError
 
@@ -22,6 +23,15 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+def _in_event_loop() -> bool:
+    """Whether the current thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class InstructorParser:
     """
     Instructor-based JSON parser.
@@ -176,6 +186,9 @@ class InstructorParser:
         """
         Parse JSON string using a Pydantic model.
 
+        The Instructor repair makes a blocking LLM call, so it is skipped on a
+        thread running an event loop; coroutines use ``parse_with_model_async``.
+
         Args:
             json_str: The JSON string to parse
             model_class: The Pydantic model class to use for parsing
@@ -184,6 +197,82 @@ class InstructorParser:
         Returns:
             Parsed model instance or None if parsing fails
         """
+        parsed = self._parse_with_model_locally(json_str, model_class, context)
+        if parsed is not None:
+            return parsed
+
+        # If we have an Instructor client, try to repair the JSON
+        if self.instructor_client:
+            if _in_event_loop():
+                logger.warning(
+                    f"Instructor-based repair skipped in {context}: called from a "
+                    f"running event loop, use parse_with_model_async"
+                )
+                return None
+            try:
+                self._ensure_initialized()
+                prompt, system_instruction = self._repair_prompt(json_str, model_class)
+
+                # Use Instructor to repair the JSON
+                repaired = self.instructor_client.generate_with_model(
+                    prompt=prompt,
+                    model_class=model_class,
+                    temperature=0.0,
+                    system_instruction=system_instruction,
+                    response_mime_type="application/json",
+                )
+
+                logger.info(f"Successfully repaired JSON with Instructor in {context}")
+                return repaired
+            except Exception as e:
+                logger.error(f"Instructor-based repair failed in {context}: {e}")
+
+        return None
+
+    async def parse_with_model_async(
+        self, json_str: str, model_class: Type[T], context: str = ""
+    ) -> Optional[T]:
+        """
+        Async variant of ``parse_with_model`` for callers on the event loop.
+
+        The Instructor repair goes through ``generate_with_model_async``, which
+        waits for its governor slot on the loop instead of blocking it.
+
+        Args:
+            json_str: The JSON string to parse
+            model_class: The Pydantic model class to use for parsing
+            context: Context for error logging
+
+        Returns:
+            Parsed model instance or None if parsing fails
+        """
+        parsed = self._parse_with_model_locally(json_str, model_class, context)
+        if parsed is not None:
+            return parsed
+
+        if self.instructor_client:
+            try:
+                self._ensure_initialized()
+                prompt, system_instruction = self._repair_prompt(json_str, model_class)
+                repaired = await self.instructor_client.generate_with_model_async(
+                    prompt=prompt,
+                    model_class=model_class,
+                    temperature=0.0,
+                    system_instruction=system_instruction,
+                    response_mime_type="application/json",
+                )
+
+                logger.info(f"Successfully repaired JSON with Instructor in {context}")
+                return repaired
+            except Exception as e:
+                logger.error(f"Instructor-based repair failed in {context}: {e}")
+
+        return None
+
+    def _parse_with_model_locally(
+        self, json_str: str, model_class: Type[T], context: str = ""
+    ) -> Optional[T]:
+        """Validate ``json_str`` against the model, repairing it without the LLM."""
         # First try direct parsing with the model
         try:
             return model_class.model_validate_json(json_str)
@@ -201,20 +290,19 @@ class InstructorParser:
                 logger.warning(
                     f"Pydantic validation error after dict parsing in {context}: {e}"
                 )
+        return None
 
-        # If we have an Instructor client, try to repair the JSON
-        if self.instructor_client:
-            try:
-                self._ensure_initialized()
-                # Use Instructor to parse the JSON
-                system_instruction = (
-                    "You are a helpful assistant that repairs malformed JSON. "
-                    "Your task is to fix the JSON and return a valid JSON object "
-                    "that matches the expected schema."
-                )
-
-                # Create a simple prompt with the JSON string
-                prompt = f"""
+    @staticmethod
+    def _repair_prompt(json_str: str, model_class: Type[BaseModel]) -> Tuple[str, str]:
+        """Prompt and system instruction asking the LLM to repair ``json_str``."""
+        system_instruction = (
+            "You are a helpful assistant that repairs malformed JSON. "
+            "Your task is to fix the JSON and return a valid JSON object "
+            "that matches the expected schema."
+        )
+
+        # Create a simple prompt with the JSON string
+        prompt = f"""
                 The following JSON is malformed:
 
                 ```
@@ -229,22 +317,7 @@ class InstructorParser:
 
                 Return only the fixed JSON, nothing else.
                 """
-
-                # Use Instructor to repair the JSON
-                repaired = self.instructor_client.generate_with_model(
-                    prompt=prompt,
-                    model_class=model_class,
-                    temperature=0.0,
-                    system_instruction=system_instruction,
-                    response_mime_type="application/json",
-                )
-
-                logger.info(f"Successfully repaired JSON with Instructor in {context}")
-                return repaired
-            except Exception as e:
-                logger.error(f"Instructor-based repair failed in {context}: {e}")
-
-        return None
+        return prompt, system_instruction
 
     def parse_llm_json_response(
         self,
@@ -437,3 +510,22 @@ def parse_with_model_instructor(
         Parsed model instance or None if parsing fails
     """
     return instructor_parser.parse_with_model(json_str, model_class, context)
+
+
+async def parse_with_model_instructor_async(
+    json_str: str, model_class: Type[T], context: str = ""
+) -> Optional[T]:
+    """
+    Async variant of ``parse_with_model_instructor`` for coroutines.
+
+    Args:
+        json_str: The JSON string to parse
+        model_class: The Pydantic model class to use for parsing
+        context: Context for error logging
+
+    Returns:
+        Parsed model instance or None if parsing fails
+    """
+    return await instructor_parser.parse_with_model_async(
+        json_str, model_class, context
+    )
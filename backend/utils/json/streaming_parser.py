@@ -0,0 +1,240 @@
+"""
+Incremental JSON parsing for streamed LLM output.
+
+Long JSON responses (themes, patterns, transcript segments) arrive as a stream
+of text chunks. ``IncrementalJSONParser`` scans each chunk once, tracking only
+the container structure, and emits every element of the top-level arrays as
+soon as it closes, so callers can act on the first theme while the rest of the
+response is still being generated.
+
+When the stream stops early (output token limit, dropped connection) the
+document is recovered structurally: it is cut after the last complete value
+and the open containers are closed, instead of rewriting the text with
+regex-based repair.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Characters that change the parser state outside strings
+_STRUCTURAL_RE = re.compile(r'[{}\[\],:"]')
+# Characters that can end or escape inside a string
+_STRING_RE = re.compile(r'["\\]')
+_ROOT_START_RE = re.compile(r"[{\[]")
+
+
+class _Frame:
+    """An open object or array."""
+
+    __slots__ = (
+        "kind",
+        "key",
+        "target",
+        "boundary",
+        "emitted",
+        "expect_key",
+        "last_key",
+    )
+
+    def __init__(self, kind: str, key: Optional[str] = None, target: bool = False):
+        self.kind = kind
+        self.key = key
+        # Elements of target arrays are emitted as they close
+        self.target = target
+        # Start of the current element (just after "[" or ",")
+        self.boundary = 0
+        self.emitted = False
+        self.expect_key = kind == "{"
+        self.last_key: Optional[str] = None
+
+
+class IncrementalJSONParser:
+    """
+    Parse a JSON document chunk by chunk, emitting top-level array elements.
+
+    Emitted elements are ``(key, value)`` pairs: ``key`` is the property of
+    the root object holding the array, or None when the root is an array.
+    Text before the first ``{`` or ``[`` (e.g. a markdown fence) and after the
+    root value is ignored.
+
+    Args:
+        array_keys: Root-object properties whose array elements are emitted.
+            None emits the elements of every array directly under the root.
+    """
+
+    def __init__(self, array_keys: Optional[Iterable[str]] = None):
+        self.array_keys = set(array_keys) if array_keys is not None else None
+        self.truncated = False
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._string_start = 0
+        self._root_start: Optional[int] = None
+        self._root_end: Optional[int] = None
+        # Last position where cutting the text and closing the open containers
+        # gives valid JSON: (index, closing brackets). Elements of target arrays
+        # are kept whole or not at all.
+        self._safe: Tuple[int, str] = (0, "")
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return self._text
+
+    @property
+    def complete(self) -> bool:
+        """Whether the root value has been closed."""
+        return self._root_end is not None
+
+    def feed(self, chunk: str) -> List[Tuple[Optional[str], Any]]:
+        """Add a chunk and return the array elements completed by it."""
+        self._text += chunk
+        emitted: List[Tuple[Optional[str], Any]] = []
+        text = self._text
+        pos = self._pos
+
+        while pos < len(text) and self._root_end is None:
+            if self._in_string:
+                match = _STRING_RE.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(text):
+                        # The escaped character has not arrived yet
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                pos = match.end()
+                self._in_string = False
+                self._string_closed(text, pos)
+                continue
+
+            if self._root_start is None:
+                match = _ROOT_START_RE.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                self._root_start = match.start()
+                self._open(match.group(), match.end())
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL_RE.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            char = match.group()
+            index = match.start()
+            pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = index
+            elif char in "{[":
+                self._open(char, pos)
+            elif char in "}]":
+                self._close(text, index, emitted)
+            elif char == ",":
+                self._comma(text, index, emitted)
+            else:  # ":"
+                self._stack[-1].expect_key = False
+
+        self._pos = pos
+        return emitted
+
+    def close(self) -> Any:
+        """
+        Return the parsed document.
+
+        A document cut short is recovered from its last complete value and
+        ``truncated`` is set.
+
+        Raises:
+            ValueError: If no JSON value was found or the text is malformed
+        """
+        if self._root_start is None:
+            raise ValueError("No JSON value found in stream")
+        if self._root_end is not None:
+            return json.loads(self._text[self._root_start : self._root_end])
+
+        self.truncated = True
+        index, closers = self._safe
+        recovered = self._text[self._root_start : index] + closers
+        logger.info(
+            f"Recovered truncated JSON stream at {index} of {len(self._text)} chars"
+        )
+        return json.loads(recovered)
+
+    def _mark_safe(self, index: int) -> None:
+        if any(frame.target for frame in self._stack[:-1]):
+            # Inside an element of a target array
+            return
+        closers = "".join(
+            "}" if frame.kind == "{" else "]" for frame in reversed(self._stack)
+        )
+        self._safe = (index, closers)
+
+    def _open(self, kind: str, end: int) -> None:
+        parent = self._stack[-1] if self._stack else None
+        key = None
+        target = False
+        if parent is None:
+            target = kind == "["
+        elif kind == "[" and len(self._stack) == 1 and parent.kind == "{":
+            key = parent.last_key
+            target = self.array_keys is None or key in self.array_keys
+        frame = _Frame(kind, key, target)
+        frame.boundary = end
+        self._stack.append(frame)
+        self._mark_safe(end)
+
+    def _close(self, text: str, index: int, emitted: list) -> None:
+        frame = self._stack.pop()
+        if frame.target:
+            self._emit_pending(frame, text, index, emitted)
+        if not self._stack:
+            self._root_end = index + 1
+            return
+        parent = self._stack[-1]
+        if parent.target and not parent.emitted:
+            self._emit(parent, text[parent.boundary : index + 1], emitted)
+        self._mark_safe(index + 1)
+
+    def _comma(self, text: str, index: int, emitted: list) -> None:
+        frame = self._stack[-1]
+        if frame.target:
+            self._emit_pending(frame, text, index, emitted)
+        frame.boundary = index + 1
+        frame.emitted = False
+        frame.expect_key = frame.kind == "{"
+        self._mark_safe(index)
+
+    def _string_closed(self, text: str, end: int) -> None:
+        frame = self._stack[-1]
+        if frame.kind == "{" and frame.expect_key and len(self._stack) == 1:
+            try:
+                frame.last_key = json.loads(text[self._string_start : end])
+            except ValueError:
+                frame.last_key = None
+
+    def _emit_pending(
+        self, frame: _Frame, text: str, index: int, emitted: list
+    ) -> None:
+        """Emit a scalar or string element ended by "," or "]"."""
+        if not frame.emitted and text[frame.boundary : index].strip():
+            self._emit(frame, text[frame.boundary : index], emitted)
+
+    def _emit(self, frame: _Frame, raw: str, emitted: list) -> None:
+        frame.emitted = True
+        try:
+            emitted.append((frame.key, json.loads(raw)))
+        except ValueError as e:
+            # Left to the final parse, which reports or repairs it
+            logger.debug(f"Skipping malformed streamed element: {e}")
@@ -0,0 +1,211 @@
+"""
+Compiled term matching for fixed vocabularies.
+
+Extractors and highlighters check texts against vocabularies of keywords,
+often one ``re.search`` per term. A ``Lexicon`` compiles a whole vocabulary
+into one trie-shaped regular expression, so a text is scanned once and every
+occurrence of every term is reported with its category and span.
+
+Example:
+    >>> levels = Lexicon({"junior": ["entry level", "junior"], "senior": ["lead"]})
+    >>> [(h.category, h.term) for h in levels.scan("a junior, later lead")]
+    [('junior', 'junior'), ('senior', 'lead')]
+    >>> levels.first_category("entry level lead")
+    'junior'
+
+Lexicons built through ``get_lexicon`` are cached by vocabulary, so classes
+that declare their vocabularies per instance still compile them only once.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+_BOUNDARY_RE = re.compile(r"\b")
+
+Vocabulary = Union[Mapping[str, Iterable[str]], Iterable[str]]
+
+
+@dataclass(frozen=True)
+class LexiconHit:
+    """One occurrence of a vocabulary term in a text."""
+
+    term: str
+    category: Optional[str]
+    start: int
+    end: int
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Regex matching any of ``terms``, longest alternative first."""
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(node[char]) for char in sorted(node) if char
+        ]
+        if not branches:
+            return ""
+        # Greedy optional group: longer terms are tried before their prefixes
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return build(trie)
+
+
+class Lexicon:
+    """
+    Matcher for a fixed vocabulary of terms.
+
+    Args:
+        vocabulary: Terms, or a mapping of category to terms. Category order
+            is the priority used by ``first_category``.
+        ignore_case: Match case-insensitively (terms are lowercased)
+        whole_words: Require word boundaries around every term, like
+            ``r"\\b" + re.escape(term) + r"\\b"``
+    """
+
+    def __init__(
+        self,
+        vocabulary: Vocabulary,
+        ignore_case: bool = True,
+        whole_words: bool = True,
+    ):
+        if isinstance(vocabulary, Mapping):
+            items = [
+                (category, term)
+                for category, terms in vocabulary.items()
+                for term in terms
+            ]
+            self.categories: List[str] = list(vocabulary)
+        else:
+            items = [(None, term) for term in vocabulary]
+            self.categories = []
+        self.ignore_case = ignore_case
+        self.whole_words = whole_words
+
+        # Term key -> (term, categories in priority order)
+        self._terms: Dict[str, Tuple[str, List[Optional[str]]]] = {}
+        for category, term in items:
+            if not term:
+                continue
+            key = self._key(term)
+            _, categories = self._terms.setdefault(key, (term, []))
+            if category not in categories:
+                categories.append(category)
+        # Shorter terms that are prefixes of a term, longest first: a match of
+        # the longest term at a position also decides its prefixes there
+        self._prefixes: Dict[str, List[str]] = {
+            key: [
+                key[:i] for i in range(len(key) - 1, 0, -1) if key[:i] in self._terms
+            ]
+            for key in self._terms
+        }
+        self._priority = {category: i for i, category in enumerate(self.categories)}
+
+        self._regex: Optional[re.Pattern] = None
+        if self._terms:
+            pattern = _trie_pattern(self._terms)
+            if whole_words:
+                pattern = r"\b(?:" + pattern + r")\b"
+            # Lookahead so that overlapping occurrences are all found
+            self._regex = re.compile(
+                "(?=(" + pattern + "))", re.IGNORECASE if ignore_case else 0
+            )
+
+    def _key(self, term: str) -> str:
+        return term.lower() if self.ignore_case else term
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term: object) -> bool:
+        """Whether ``term`` itself is in the vocabulary."""
+        return isinstance(term, str) and self._key(term) in self._terms
+
+    def scan(self, text: str) -> List[LexiconHit]:
+        """All term occurrences in ``text``, ordered by start then length."""
+        hits: List[LexiconHit] = []
+        if not text or self._regex is None:
+            return hits
+        for match in self._regex.finditer(text):
+            start = match.start(1)
+            key = self._key(match.group(1))
+            if key not in self._terms:
+                continue
+            for candidate in [key] + self._prefixes[key]:
+                end = start + len(candidate)
+                if candidate != key and self.whole_words:
+                    if _BOUNDARY_RE.match(text, end) is None:
+                        continue
+                term, categories = self._terms[candidate]
+                for category in categories:
+                    hits.append(LexiconHit(term, category, start, end))
+        return hits
+
+    def search(self, text: str) -> bool:
+        """Whether any term occurs in ``text``."""
+        if not text or self._regex is None:
+            return False
+        return self._regex.search(text) is not None
+
+    def found_categories(self, text: str) -> List[Optional[str]]:
+        """Categories with at least one term in ``text``, in priority order."""
+        found = {hit.category for hit in self.scan(text)}
+        return sorted(found, key=lambda c: self._priority.get(c, len(self._priority)))
+
+    def first_category(self, text: str) -> Optional[str]:
+        """
+        The highest-priority category with a term in ``text``.
+
+        Matches checking each category's terms in declaration order and
+        returning the first category with any occurrence.
+        """
+        found = self.found_categories(text)
+        return found[0] if found else None
+
+
+def _freeze(vocabulary: Vocabulary) -> Hashable:
+    if isinstance(vocabulary, Mapping):
+        return tuple(
+            (category, tuple(terms)) for category, terms in vocabulary.items()
+        )
+    return tuple(vocabulary)
+
+
+@lru_cache(maxsize=256)
+def _cached_lexicon(
+    frozen: Hashable, is_mapping: bool, ignore_case: bool, whole_words: bool
+) -> Lexicon:
+    vocabulary = dict(frozen) if is_mapping else frozen
+    return Lexicon(vocabulary, ignore_case=ignore_case, whole_words=whole_words)
+
+
+def get_lexicon(
+    vocabulary: Vocabulary, ignore_case: bool = True, whole_words: bool = True
+) -> Lexicon:
+    """Shared compiled ``Lexicon`` for a vocabulary."""
+    return _cached_lexicon(
+        _freeze(vocabulary),
+        isinstance(vocabulary, Mapping),
+        ignore_case,
+        whole_words,
+    )
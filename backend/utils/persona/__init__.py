@@ -13,7 +13,8 @@ from .generate_personas import (
 from .nlp_processor import (
     analyze_sentiment,
     extract_keywords_and_statements,
-    perform_semantic_clustering
+    perform_semantic_clustering,
+    perform_semantic_clustering_async
 )
 
 __all__ = [
@@ -23,5 +24,6 @@ __all__ = [
     'format_persona_for_display',
     'analyze_sentiment',
     'extract_keywords_and_statements',
-    'perform_semantic_clustering'
+    'perform_semantic_clustering',
+    'perform_semantic_clustering_async'
 ]
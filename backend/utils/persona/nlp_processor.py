@@ -7,7 +7,7 @@ and semantic clustering of text data using structured LLM output with Pydantic m
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 
 logger = logging.getLogger(__name__)
@@ -182,6 +182,7 @@ def extract_keywords_with_pydantic_ai(texts: List[str]) -> List[Dict[str, Any]]:
         from pydantic_ai import Agent
         from pydantic_ai.models.google import GoogleModel
         from pydantic_ai.providers.google import GoogleProvider
+        from backend.services.llm.concurrency_governor import governed_model
 
         api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not api_key:
@@ -195,7 +196,9 @@ def extract_keywords_with_pydantic_ai(texts: List[str]) -> List[Dict[str, Any]]:
 
         # Create PydanticAI agent for keyword extraction
         provider = GoogleProvider(api_key=api_key)
-        gemini_model = GoogleModel("gemini-2.5-flash", provider=provider)
+        gemini_model = governed_model(
+            GoogleModel("gemini-2.5-flash", provider=provider)
+        )
         keyword_agent = Agent(
             model=gemini_model,
             output_type=KeywordExtractionResult,
@@ -264,6 +267,7 @@ def extract_trait_keywords_for_highlighting(
         from pydantic_ai import Agent
         from pydantic_ai.models.google import GoogleModel
         from pydantic_ai.providers.google import GoogleProvider
+        from backend.services.llm.concurrency_governor import governed_model
         from pydantic import BaseModel, Field
         from typing import List as TypingList
 
@@ -286,7 +290,9 @@ def extract_trait_keywords_for_highlighting(
 
         # Create PydanticAI agent for trait keyword extraction
         provider = GoogleProvider(api_key=api_key)
-        gemini_model = GoogleModel("gemini-2.5-flash", provider=provider)
+        gemini_model = governed_model(
+            GoogleModel("gemini-2.5-flash", provider=provider)
+        )
         trait_keyword_agent = Agent(
             model=gemini_model,
             output_type=TraitKeywords,
@@ -462,6 +468,9 @@ def perform_semantic_clustering(texts: List[str]) -> Dict[str, Any]:
     """
     Perform semantic clustering on texts using PydanticAI structured output.
 
+    Makes a blocking LLM call, so on a thread running an event loop it uses
+    the keyword fallback; coroutines use ``perform_semantic_clustering_async``.
+
     Args:
         texts: List of text strings to cluster
 
@@ -471,21 +480,82 @@ def perform_semantic_clustering(texts: List[str]) -> Dict[str, Any]:
     if not texts:
         return {"clusters": {}, "theme_summaries": {}, "representatives": {}}
 
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        logger.warning(
+            "Semantic clustering called from a running event loop, using fallback; "
+            "use perform_semantic_clustering_async"
+        )
+        return _simple_clustering_fallback(texts)
+
     try:
         # Try to use Instructor for structured output
         from backend.services.llm.instructor_gemini_client import InstructorGeminiClient
 
         instructor_client = InstructorGeminiClient()
+        prompt, system_instruction = _clustering_prompt(texts)
 
-        # Combine texts for analysis
-        combined_text = "\n\n".join(
-            [f"Text {i+1}: {text}" for i, text in enumerate(texts)]
+        # Generate structured output with temperature 0 for consistency
+        result = instructor_client.generate_with_model(
+            prompt=prompt,
+            model_class=SemanticClusteringResult,
+            system_instruction=system_instruction,
+            temperature=0.0,  # Critical: Use temperature 0 for structured consistency
+            max_output_tokens=1500,
+        )
+        return _clusters_from_result(result, texts)
+
+    except Exception as e:
+        logger.warning(f"Instructor clustering failed: {e}, using fallback")
+        return _simple_clustering_fallback(texts)
+
+
+async def perform_semantic_clustering_async(texts: List[str]) -> Dict[str, Any]:
+    """
+    Async variant of ``perform_semantic_clustering`` for coroutines.
+
+    Args:
+        texts: List of text strings to cluster
+
+    Returns:
+        Dictionary with clusters and theme summaries
+    """
+    if not texts:
+        return {"clusters": {}, "theme_summaries": {}, "representatives": {}}
+
+    try:
+        from backend.services.llm.instructor_gemini_client import InstructorGeminiClient
+
+        instructor_client = InstructorGeminiClient()
+        prompt, system_instruction = _clustering_prompt(texts)
+        result = await instructor_client.generate_with_model_async(
+            prompt=prompt,
+            model_class=SemanticClusteringResult,
+            system_instruction=system_instruction,
+            temperature=0.0,
+            max_output_tokens=1500,
         )
+        return _clusters_from_result(result, texts)
 
-        system_instruction = """You are an expert in thematic analysis and semantic clustering.
+    except Exception as e:
+        logger.warning(f"Instructor clustering failed: {e}, using fallback")
+        return _simple_clustering_fallback(texts)
+
+
+def _clustering_prompt(texts: List[str]) -> Tuple[str, str]:
+    """Prompt and system instruction for semantic clustering of ``texts``."""
+    # Combine texts for analysis
+    combined_text = "\n\n".join(
+        [f"Text {i+1}: {text}" for i, text in enumerate(texts)]
+    )
+
+    system_instruction = """You are an expert in thematic analysis and semantic clustering.
 Your task is to identify common themes, patterns, and concepts across multiple text responses and group them meaningfully."""
 
-        prompt = f"""
+    prompt = f"""
         Analyze the following texts and identify common themes or patterns. Group similar texts together and provide meaningful theme names.
 
         {combined_text}
@@ -503,42 +573,34 @@ Your task is to identify common themes, patterns, and concepts across multiple t
 
         Group texts that share similar concepts, even if they use different words.
         """
+    return prompt, system_instruction
 
-        # Generate structured output with temperature 0 for consistency
-        result = instructor_client.generate_with_model(
-            prompt=prompt,
-            model_class=SemanticClusteringResult,
-            system_instruction=system_instruction,
-            temperature=0.0,  # Critical: Use temperature 0 for structured consistency
-            max_output_tokens=1500,
-        )
 
-        # Convert to expected format
-        clusters = {}
-        theme_summaries = {}
-        representatives = {}
-
-        for i, theme in enumerate(result.themes):
-            # Build cluster
-            cluster_texts = []
-            for idx in theme.text_indices:
-                if 0 <= idx < len(texts):
-                    cluster_texts.append({"text": texts[idx], "count": 1})
-
-            if cluster_texts:
-                clusters[i] = cluster_texts
-                theme_summaries[i] = theme.name
-                representatives[i] = cluster_texts[0]["text"]
-
-        return {
-            "clusters": clusters,
-            "theme_summaries": theme_summaries,
-            "representatives": representatives,
-        }
+def _clusters_from_result(
+    result: SemanticClusteringResult, texts: List[str]
+) -> Dict[str, Any]:
+    """Convert a clustering result to the clusters/summaries dictionary."""
+    clusters = {}
+    theme_summaries = {}
+    representatives = {}
 
-    except Exception as e:
-        logger.warning(f"Instructor clustering failed: {e}, using fallback")
-        return _simple_clustering_fallback(texts)
+    for i, theme in enumerate(result.themes):
+        # Build cluster
+        cluster_texts = []
+        for idx in theme.text_indices:
+            if 0 <= idx < len(texts):
+                cluster_texts.append({"text": texts[idx], "count": 1})
+
+        if cluster_texts:
+            clusters[i] = cluster_texts
+            theme_summaries[i] = theme.name
+            representatives[i] = cluster_texts[0]["text"]
+
+    return {
+        "clusters": clusters,
+        "theme_summaries": theme_summaries,
+        "representatives": representatives,
+    }
 
 
 def _simple_clustering_fallback(texts: List[str]) -> Dict[str, Any]: